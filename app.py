@@ -9,6 +9,7 @@ This module is responsible for:
 • Registering all route blueprints
 • Registering centralized error handlers
 • Configuring API rate limiting
+• Configuring fast JSON encoding
 • Starting the Flask server
 
 Architecture Role:
@@ -46,6 +47,9 @@ from routes import register_routes
 from routes.error_handlers import register_error_handlers
 
 from limiter_config import init_limiter
+from json_provider import init_json_provider
+
+from services.ai_service import warm_cluster_cache
 
 # Creating the main Flask application instance.
 # This object serves as the central WSGI application.
@@ -81,6 +85,14 @@ register_error_handlers(app)
 
 init_limiter(app)
 
+# Encodes JSON responses with orjson when it is installed.
+init_json_provider(app)
+
+# Clusters every month in a background thread so /ai/cluster/ pages are
+# served from persisted clusters. One worker precomputes them, the others
+# read its persisted files.
+warm_cluster_cache()
+
 if __name__ == "__main__":
     """
     Application execution entry point.
@@ -0,0 +1,12 @@
+# benchmarks/__init__.py
+
+"""
+benchmarks package for the Clash of Clans – Ancient Ruins Clan Website.
+
+This package:
+- Holds offline micro-benchmarks for performance-sensitive code paths
+- Uses synthetic or fixture coc-data only, so no network access is needed
+- Is run from the repository root, e.g. `python -m benchmarks.bench_player_report`
+
+Benchmarks print their results and are not part of the application.
+"""
@@ -0,0 +1,181 @@
+# benchmarks/bench_binning.py
+
+"""
+Payload and build-time benchmark for the server-side binned figures.
+
+Builds the histograms, density heatmaps and range pies of the graph
+pages from a deterministic dataset, twice: with the raw-value builders
+(fs.histogram, fs.density_heatmap, pd.cut + fs.pie; the browser bins
+every player's values) and with the binned builders (graphs.binning
+counts). Checks first that the binned counts match the raw data:
+histogram totals equal the number of non-NaN values and range pies
+match pd.cut + value_counts. Then reports the serialized payload size
+and the build time of both variants.
+
+Usage:
+    python -m benchmarks.bench_binning [--players N] [--runs N]
+"""
+
+# Importing Libraries
+import argparse
+import json
+import time
+
+import numpy as np
+import pandas as pd
+import plotly
+
+from graphs import binning
+from graphs import figure_specs as fs
+
+METRICS = ["warattack", "clancapital", "clangames", "clangamesmaxed", "clanscore"]
+
+HEATMAP_PAIRS = [
+    ("warattack", "clancapital"),
+    ("clangames", "clangamesmaxed"),
+    ("warattack", "clanscore"),
+    ("clancapital", "clanscore"),
+]
+
+PIE_RANGES = {
+    "clancapital": [-1, 50, 100, 200, 300, float("inf")],
+    "clangames": [-1, 5, 10, 15, 20, float("inf")],
+    "clanscore": [-1, 100, 300, 500, 700, float("inf")],
+    "warattack": [-1, 50, 100, 200, 300, float("inf")],
+}
+
+SOURCE = "bench://APR-MAY_2025"
+
+def fixture_frame(players, seed=5):
+    """
+    Build a monthly-analysis-like dataset.
+
+    Args:
+        players (int): Number of rows
+        seed (int): Random seed
+
+    Returns:
+        pandas.DataFrame: Numeric metric columns (a few NaN) plus name/war
+    """
+
+    rng = np.random.default_rng(seed)
+
+    df = pd.DataFrame(
+        {
+            "name": [f"Player{i}" for i in range(players)],
+            "war": rng.choice(["IN", "OUT"], players),
+            "warattack": rng.integers(0, 400, players) * rng.integers(0, 2, players),
+            "clancapital": rng.integers(0, 350, players),
+            "clangames": rng.integers(0, 26, players),
+            "clangamesmaxed": rng.integers(0, 4, players),
+        }
+    ).astype({"warattack": float, "clancapital": float})
+
+    df["clanscore"] = df[["warattack", "clancapital", "clangames"]].sum(axis=1)
+    df.loc[df.sample(frac=0.02, random_state=seed).index, "clancapital"] = np.nan
+
+    return df
+
+def labels_for(bins):
+    """Range labels of a pie, as used by the graph pages."""
+
+    return [f"{low + 1:g}-{high:g}" for low, high in zip(bins, bins[1:])]
+
+def raw_figures(df):
+    """Figures built from raw per-player values (browser-side binning)."""
+
+    figures = [fs.histogram(df, x=col, hover_data=["name"]) for col in METRICS]
+    figures += [fs.histogram(df, x=col, color="war") for col in METRICS]
+    figures += [
+        fs.density_heatmap(df, x=x, y=y, nbinsx=20, nbinsy=20)
+        for x, y in HEATMAP_PAIRS
+    ]
+
+    for col, bins in PIE_RANGES.items():
+        ranges = df.assign(range=pd.cut(df[col], bins=bins, labels=labels_for(bins)))
+        figures.append(fs.pie(ranges, names="range"))
+
+    return figures
+
+def binned_figures(df):
+    """The same figures, binned server-side."""
+
+    figures = [fs.binned_histogram(df, x=col, source=SOURCE) for col in METRICS]
+    figures += [
+        fs.binned_histogram(df, x=col, source=SOURCE, color="war") for col in METRICS
+    ]
+    figures += [
+        fs.binned_density_heatmap(df, x=x, y=y, source=SOURCE) for x, y in HEATMAP_PAIRS
+    ]
+    figures += [
+        fs.binned_pie(df, col, bins=bins, bin_labels=labels_for(bins))
+        for col, bins in PIE_RANGES.items()
+    ]
+
+    return figures
+
+def check_counts(df):
+    """Raise SystemExit when a binned count disagrees with the raw data."""
+
+    for col in METRICS:
+        values = df[col].to_numpy(dtype=float)
+        edges = binning.get_edges(SOURCE, col, values)
+        total = int(binning.counts(values, edges).sum())
+        if total != df[col].notna().sum():
+            raise SystemExit(f"histogram {col}: {total} != {df[col].notna().sum()}")
+
+    for x, y in HEATMAP_PAIRS:
+        grid = binning.counts_2d(
+            df[x], df[y], binning.get_edges(SOURCE, x, df[x]),
+            binning.get_edges(SOURCE, y, df[y]),
+        )
+        expected = (df[x].notna() & df[y].notna()).sum()
+        if grid.sum() != expected:
+            raise SystemExit(f"heatmap {x}/{y}: {grid.sum()} != {expected}")
+
+    for col, bins in PIE_RANGES.items():
+        expected = pd.cut(df[col], bins=bins).value_counts(sort=False).to_numpy()
+        actual = binning.range_counts(df[col], bins)
+        if not np.array_equal(expected, actual):
+            raise SystemExit(f"pie {col}: {actual.tolist()} != {expected.tolist()}")
+
+def measure(build, df, runs):
+    """
+    Returns:
+        tuple[int, float]: Payload bytes and mean build + serialize ms
+    """
+
+    start = time.perf_counter()
+
+    for _ in range(runs):
+        payload = [
+            json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder) for fig in build(df)
+        ]
+
+    elapsed = (time.perf_counter() - start) / runs * 1e3
+
+    return sum(len(item) for item in payload), elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--players", type=int, nargs="+", default=[50, 500, 5000])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'players':>8} {'raw KB':>9} {'binned KB':>10} {'raw ms':>8} {'binned ms':>10}")
+
+    for players in args.players:
+        df = fixture_frame(players)
+        binning.clear_edge_cache()
+        check_counts(df)
+
+        raw_bytes, raw_ms = measure(raw_figures, df, args.runs)
+        binned_bytes, binned_ms = measure(binned_figures, df, args.runs)
+
+        print(
+            f"{players:>8} {raw_bytes / 1024:>9.1f} {binned_bytes / 1024:>10.1f} "
+            f"{raw_ms:>8.1f} {binned_ms:>10.1f}"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,329 @@
+# benchmarks/bench_chatbot.py
+
+"""
+Load test and latency benchmark for the chatbot.
+
+Replays a corpus of representative queries through
+chatbot.chat_controller.handle_chat: every example of the `help` text
+(all operation types) plus informal month spellings that are answered by
+almost_hint. Runs fully offline: the raw fetcher is replaced by a stub
+serving a deterministic fixture dataset for every domain and month,
+typed by month_store like the fetched files. One member row lacks a
+column; the replies about it are checked against the previous answers
+(a missing value counts as 0) before the timings start.
+
+Reports, per pipeline stage (normalize, route, fetch, resolve, build)
+and for the whole request, the p50/p95/p99 latency, plus the overall
+throughput. With --cold the result, dataset-index and history caches are
+cleared before every query. --max-p95-ms makes the run fail when the
+total p95 exceeds a budget, so the script can gate regressions.
+
+Usage:
+    python -m benchmarks.bench_chatbot [--runs N] [--threads N] [--cold]
+                                       [--fetch-ms MS] [--max-p95-ms MS]
+"""
+
+# Importing Libraries
+import argparse
+import random
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import chatbot.chat_controller as controller
+import chatbot.dataset_index as dataset_index
+import chatbot.history_index as history_index
+from chatbot.raw_fetcher import DOMAIN_KINDS
+from chatbot.result_cache import result_cache
+from month_store import parse_month_file
+
+STAGES = ("normalize", "route", "fetch", "resolve", "build")
+
+# Informal month spellings handled by almost_hint.suggest_month
+TYPO_QUERIES = [
+    "top 10 warattack in apr25",
+    "average clanscore in april25",
+    "list all clan members in sept24",
+    "who had the highest clanscore in dec 24",
+]
+
+PLAYERS = ["Chief", "KAI HIWATARI", "Bennie", "Grandpa1"]
+FORMER_PLAYERS = ["KING SEENU"]
+
+# Member row published without one column: (month, player, column)
+PARTIAL_ROW = ("DEC_2025", "Bennie", "clanscore")
+
+# Query about the partial row → text expected in the reply
+PARTIAL_ROW_REPLIES = {
+    "clanscore of Bennie in dec 2025": "Bennie's clanscore in DEC 2025 was 0.",
+    "compare Bennie and Chief in dec 2025": "clanscore     : Bennie = 0,",
+}
+
+def help_queries():
+    """
+    Extract the example questions of the chatbot `help` reply.
+
+    Returns:
+        list[str]: Every "- ..." example listed before SUPPORTED METRICS
+    """
+
+    examples = controller.HELP_REPLY.split("SUPPORTED METRICS")[0]
+
+    return [
+        line[2:].strip()
+        for line in examples.splitlines()
+        if line.startswith("- ")
+    ]
+
+def fixture_datasets(seed=7, players=50):
+    """
+    Build a deterministic dataset for every domain and month.
+
+    Args:
+        seed (int): Random seed
+        players (int): Number of clan members per month
+
+    Returns:
+        dict[tuple[str, str], list[dict]]: (domain, month) -> typed rows
+        (see month_store.MonthTable.records)
+    """
+
+    rng = random.Random(seed)
+    months = history_index.history_months()
+    names = PLAYERS + [f"Player{i}" for i in range(players - len(PLAYERS))]
+
+    def member(name):
+        war, capital = rng.randint(0, 8), rng.randint(0, 30)
+        games, maxed = rng.randint(0, 3), rng.randint(0, 2)
+        return {
+            "name": name,
+            "status": rng.choice(["Leader", "Co-Leader", "Elder", "Member"]),
+            "war": rng.choice(["IN", "OUT"]),
+            "warattack": war,
+            "clancapital": capital,
+            "clangames": games,
+            "clangamesmaxed": maxed,
+            "clanscore": war + capital + games + maxed,
+        }
+
+    datasets = {}
+
+    for month, following in zip(months, months[1:] + [None]):
+        members = [member(name) for name in names]
+        datasets[("CLAN_MEMBERS", month)] = members
+
+        datasets[("FORMER_CLAN_MEMBERS", month)] = [
+            {k: v for k, v in member(name).items() if k not in ("status", "war")}
+            for name in FORMER_PLAYERS + [f"Former{i}" for i in range(10)]
+        ]
+
+        top = sorted(members, key=lambda row: row["clanscore"], reverse=True)[:10]
+        datasets[("TOP_CLAN_CONTRIBUTORS", month)] = [
+            {"name": row["name"], "clanscore": row["clanscore"]} for row in top
+        ]
+
+        if following:
+            code, year = month.split("_")
+            next_code = following.split("_")[0]
+            datasets[("CLAN_MONTHLY_ANALYSIS", f"{code}-{next_code}_{year}")] = [
+                {k: v for k, v in member(name).items() if k not in ("status", "war")}
+                for name in names
+            ]
+
+    month, name, column = PARTIAL_ROW
+    for row in datasets[("CLAN_MEMBERS", month)]:
+        if row["name"] == name:
+            del row[column]
+
+    return {
+        key: parse_month_file(rows, DOMAIN_KINDS[key[0]]).records()
+        for key, rows in datasets.items()
+    }
+
+def check_partial_row():
+    """Raise SystemExit when a reply about the partial row changed."""
+
+    for message, expected in PARTIAL_ROW_REPLIES.items():
+        reply = controller.handle_chat(message)["reply"]
+
+        if expected not in reply:
+            raise SystemExit(f"{message!r}: {reply!r} lacks {expected!r}")
+
+class StageRecorder:
+    """
+    Collects per-request stage timings from instrumented functions.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.samples = {stage: [] for stage in STAGES + ("total",)}
+
+    def _current(self):
+        current = getattr(self._local, "current", None)
+        if current is None:
+            current = self._local.current = dict.fromkeys(STAGES, 0.0)
+        return current
+
+    def add(self, stage, seconds):
+        self._current()[stage] += seconds
+
+    def timed(self, stage, func):
+        """Wrap a function so its run time counts towards `stage`."""
+
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.add(stage, time.perf_counter() - start)
+
+        return wrapper
+
+    def timed_iter(self, stage, func):
+        """Wrap a generator function, timing the production of each item."""
+
+        def wrapper(*args, **kwargs):
+            iterator = func(*args, **kwargs)
+            while True:
+                start = time.perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    self.add(stage, time.perf_counter() - start)
+                    return
+                self.add(stage, time.perf_counter() - start)
+                yield item
+
+        return wrapper
+
+    def request(self, message):
+        """Answer one message and record its stage and total timings."""
+
+        self._local.current = dict.fromkeys(STAGES, 0.0)
+
+        start = time.perf_counter()
+        controller.handle_chat(message)
+        total = time.perf_counter() - start
+
+        current = self._local.current
+        with self._lock:
+            for stage in STAGES:
+                self.samples[stage].append(current[stage])
+            self.samples["total"].append(total)
+
+def instrument(recorder, datasets, fetch_ms):
+    """
+    Replace the raw fetcher by the fixture stub and time every stage.
+
+    Args:
+        recorder (StageRecorder): Timing collector
+        datasets (dict): Fixture datasets, see fixture_datasets
+        fetch_ms (float): Simulated network latency per fetch
+    """
+
+    def fetch_stub(domain, month_value):
+        if fetch_ms:
+            time.sleep(fetch_ms / 1000)
+        return datasets.get((domain, month_value))
+
+    timed = recorder.timed
+
+    controller.normalize_month = timed("normalize", controller.normalize_month)
+    controller.route_domain = timed("route", controller.route_domain)
+    controller.fetch_json_if_exists = timed("fetch", fetch_stub)
+    controller.get_history_index = timed("fetch", controller.get_history_index)
+    history_index.fetch_json_if_exists = fetch_stub
+
+    for name in (
+        "get_dataset_index",
+        "extract_intent",
+        "resolve_operation",
+        "resolve_history_operation",
+    ):
+        setattr(controller, name, timed("resolve", getattr(controller, name)))
+
+    controller.iter_response = recorder.timed_iter("build", controller.iter_response)
+
+def clear_caches():
+    """Drop every chatbot cache so the next query runs cold."""
+
+    result_cache.clear()
+    dataset_index._INDEX_CACHE.clear()
+    history_index._history = None
+
+def percentiles(values):
+    """
+    Returns:
+        tuple[float, float, float]: p50, p95 and p99 in milliseconds
+    """
+
+    if len(values) < 2:
+        value = values[0] * 1e3 if values else 0.0
+        return value, value, value
+
+    cuts = statistics.quantiles(values, n=100, method="inclusive")
+
+    return cuts[49] * 1e3, cuts[94] * 1e3, cuts[98] * 1e3
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--threads", type=int, default=1)
+    parser.add_argument("--cold", action="store_true")
+    parser.add_argument("--fetch-ms", type=float, default=0.0)
+    parser.add_argument("--max-p95-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    corpus = help_queries() + TYPO_QUERIES
+
+    recorder = StageRecorder()
+    instrument(recorder, fixture_datasets(), args.fetch_ms)
+    check_partial_row()
+
+    # Warm-up (imports, compiled patterns, first history build)
+    for message in corpus:
+        controller.handle_chat(message)
+
+    recorder.samples = {stage: [] for stage in STAGES + ("total",)}
+
+    def replay(run):
+        for message in corpus:
+            if args.cold:
+                clear_caches()
+            recorder.request(message)
+
+    start = time.perf_counter()
+
+    if args.threads > 1:
+        with ThreadPoolExecutor(max_workers=args.threads) as pool:
+            list(pool.map(replay, range(args.runs)))
+    else:
+        for run in range(args.runs):
+            replay(run)
+
+    elapsed = time.perf_counter() - start
+    requests = len(recorder.samples["total"])
+
+    print(
+        f"{len(corpus)} queries x {args.runs} runs, {args.threads} thread(s), "
+        f"{'cold' if args.cold else 'warm'} caches"
+    )
+    print(f"{'stage':<10} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+
+    for stage in STAGES + ("total",):
+        p50, p95, p99 = percentiles(recorder.samples[stage])
+        print(f"{stage:<10} {p50:>9.3f} {p95:>9.3f} {p99:>9.3f}")
+
+    print(f"throughput: {requests / elapsed:.0f} requests/s")
+
+    if args.max_p95_ms is not None:
+        p95 = percentiles(recorder.samples["total"])[1]
+        if p95 > args.max_p95_ms:
+            raise SystemExit(
+                f"total p95 {p95:.3f} ms exceeds the {args.max_p95_ms} ms budget"
+            )
+
+if __name__ == "__main__":
+    main()
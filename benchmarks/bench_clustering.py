@@ -0,0 +1,144 @@
+# benchmarks/bench_clustering.py
+
+"""
+Parity check and benchmark for the multi-k member clustering.
+
+Builds deterministic monthly analysis datasets (fixture of
+bench_figure_specs) and checks that cluster_store.silhouette_score
+matches sklearn.metrics.silhouette_score for every candidate k. Then
+reports, per dataset size, the time to select k with sklearn's
+silhouette (distances recomputed for every k) and with the vectorized
+one (one distance matrix shared by every k), and the time to precompute
+every month plus the joint player × month clustering, as done by the
+background job.
+
+Usage:
+    python -m benchmarks.bench_clustering [--players N] [--months N]
+"""
+
+# Importing Libraries
+import argparse
+import time
+
+import numpy as np
+from sklearn.cluster import KMeans
+from sklearn.metrics import silhouette_score as sklearn_silhouette
+
+import cluster_store
+from benchmarks.bench_figure_specs import fixture_rows
+from month_store import parse_month_file
+from performance_store import METRIC_KEYS
+
+def month_values(players, seed):
+    """Standardized features of one fixture month."""
+
+    frame = parse_month_file(fixture_rows("mag", seed, players), "analysis").frame()
+    values = frame[list(METRIC_KEYS)].fillna(0).to_numpy(dtype=float)
+
+    return cluster_store.standardize(values)[0]
+
+def check(scaled, ks):
+    """Raise SystemExit when the vectorized silhouette disagrees with sklearn."""
+
+    distances = cluster_store.pairwise_distances(scaled)
+
+    for k in ks:
+        labels = KMeans(n_clusters=k, random_state=42).fit_predict(scaled)
+        ours = cluster_store.silhouette_score(distances, labels, k)
+        theirs = sklearn_silhouette(scaled, labels)
+
+        if abs(ours - theirs) > 1e-9:
+            raise SystemExit(f"k={k}: {ours!r} != {theirs!r}")
+
+def select_sklearn(scaled, ks):
+    """k selection with sklearn.metrics.silhouette_score."""
+
+    for k in ks:
+        labels = KMeans(n_clusters=k, random_state=42).fit_predict(scaled)
+        sklearn_silhouette(scaled, labels)
+
+def select_vectorized(scaled, ks):
+    """k selection with the shared distance matrix."""
+
+    distances = cluster_store.pairwise_distances(scaled)
+
+    for k in ks:
+        labels = KMeans(n_clusters=k, random_state=42).fit_predict(scaled)
+        cluster_store.silhouette_score(distances, labels, k)
+
+def silhouettes_sklearn(scaled, labels):
+    return [sklearn_silhouette(scaled, label) for label in labels]
+
+def silhouettes_vectorized(scaled, labels):
+    distances = cluster_store.pairwise_distances(scaled)
+
+    return [
+        cluster_store.silhouette_score(distances, label, k)
+        for k, label in zip(cluster_store.CLUSTER_KS, labels)
+    ]
+
+def timed(build, *args):
+    """Milliseconds of one call of `build`."""
+
+    start = time.perf_counter()
+    build(*args)
+
+    return (time.perf_counter() - start) * 1e3
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--players", type=int, nargs="+", default=[50, 500, 2000])
+    parser.add_argument("--months", type=int, default=12)
+    args = parser.parse_args()
+
+    ks = cluster_store.CLUSTER_KS
+
+    print(
+        f"{'rows':>6} {'silh sklearn ms':>16} {'silh ours ms':>13} "
+        f"{'select sklearn ms':>18} {'select ours ms':>15}"
+    )
+
+    for players in args.players:
+        scaled = month_values(players, seed=5)
+        check(scaled, ks)
+
+        labels = [KMeans(n_clusters=k, random_state=42).fit_predict(scaled) for k in ks]
+
+        print(
+            f"{players:>6} {timed(silhouettes_sklearn, scaled, labels):>16.1f} "
+            f"{timed(silhouettes_vectorized, scaled, labels):>13.1f} "
+            f"{timed(select_sklearn, scaled, ks):>18.1f} "
+            f"{timed(select_vectorized, scaled, ks):>15.1f}"
+        )
+
+    # Background job: every month, then all months jointly
+    players = args.players[0]
+    months = [f"M{i}" for i in range(args.months)]
+    values = [month_values(players, seed=i) for i in range(args.months)]
+    names = [f"Player{i}" for i in range(players)]
+
+    start = time.perf_counter()
+
+    for month, scaled in zip(months, values):
+        cluster_store.fit_clusters(month, names, METRIC_KEYS, scaled, ks)
+
+    monthly_ms = (time.perf_counter() - start) * 1e3
+
+    joint = cluster_store.fit_clusters(
+        "JOINT",
+        names * args.months,
+        METRIC_KEYS,
+        np.vstack(values),
+        ks,
+        [month for month in months for _ in names],
+    )
+    joint_ms = (time.perf_counter() - start) * 1e3 - monthly_ms
+
+    print(
+        f"\nprecompute {args.months} months x {players} players: "
+        f"{monthly_ms:.0f} ms monthly + {joint_ms:.0f} ms joint "
+        f"({len(joint.names)} rows, k = {joint.k})"
+    )
+
+if __name__ == "__main__":
+    main()
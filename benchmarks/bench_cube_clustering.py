@@ -0,0 +1,181 @@
+# benchmarks/bench_cube_clustering.py
+
+"""
+Parity check and benchmark for the cross-month trajectory clustering.
+
+Builds a deterministic Clan Monthly Performance table with four planted
+contribution trajectories (steady, rising, fading and casual players)
+and players joining and leaving, so most rows have missing (-1) periods.
+Checks that the masked KMeans matches a regular KMeans when every period
+is recorded, then compares, per cube size, cluster_store.fit_cube_clusters
+with sklearn KMeans on the zero-filled cube (missing periods counted as
+no contribution): fit time and agreement with the planted trajectories
+(adjusted Rand index).
+
+Usage:
+    python -m benchmarks.bench_cube_clustering [--players N] [--periods N]
+"""
+
+# Importing Libraries
+import argparse
+import random
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.cluster import KMeans
+from sklearn.metrics import adjusted_rand_score
+from sklearn.metrics import silhouette_score as sklearn_silhouette
+
+import cluster_store
+from performance_store import METRIC_KEYS, MISSING_VALUE, MONTH_MAP, PerformanceCube
+
+MONTHS = list(MONTH_MAP)
+
+# Typical value of every metric for an active player
+SCALE = {
+    "warattack": 300,
+    "clancapital": 250,
+    "clangames": 20,
+    "clangamesmaxed": 3,
+    "clanscore": 600,
+}
+
+# Planted trajectory → activity share at the start and at the end
+TRAJECTORIES = {
+    "steady": (0.9, 0.9),
+    "rising": (0.1, 0.9),
+    "fading": (0.9, 0.1),
+    "casual": (0.1, 0.1),
+}
+
+def period_names(count):
+    """Two-month periods, oldest first (e.g. JAN-FEB_2024)."""
+
+    return [
+        f"{MONTHS[i % 12]}-{MONTHS[(i + 1) % 12]}_{2024 + (i + 1) // 12}"
+        for i in range(count)
+    ]
+
+def fixture_frame(players, periods, seed=7, full=False):
+    """
+    Build a wide performance table.
+
+    Args:
+        players (int): Number of rows
+        periods (int): Number of periods
+        seed (int): Random seed
+        full (bool): Record every period (no joins or departures)
+
+    Returns:
+        tuple[pandas.DataFrame, list[str]]: Table and the planted
+        trajectory of every player
+    """
+
+    rng = random.Random(seed)
+    names = period_names(periods)
+    rows, planted = [], []
+
+    for i in range(players):
+        trajectory = rng.choice(list(TRAJECTORIES))
+        start, end = TRAJECTORIES[trajectory]
+        joined = 0 if full else rng.randrange(periods // 2)
+        left = periods if full else rng.randrange(joined + periods // 3, periods + 1)
+
+        row = {"name": f"Player{i}"}
+
+        for p, period in enumerate(names):
+            share = start + (end - start) * p / max(periods - 1, 1)
+
+            for metric in METRIC_KEYS:
+                if joined <= p < left:
+                    value = SCALE[metric] * share * rng.uniform(0.7, 1.3)
+                    row[f"{metric}_{period}"] = int(value)
+                else:
+                    row[f"{metric}_{period}"] = MISSING_VALUE
+
+        rows.append(row)
+        planted.append(trajectory)
+
+    return pd.DataFrame(rows), planted
+
+def check():
+    """Raise SystemExit when the masked KMeans disagrees with KMeans on full data."""
+
+    frame, _ = fixture_frame(120, 8, full=True)
+    _, values, mask = cluster_store.trajectory_features(PerformanceCube(frame))
+
+    if not np.allclose(
+        cluster_store.masked_distances(values, mask),
+        cluster_store.pairwise_distances(values),
+    ):
+        raise SystemExit("masked distances differ on fully recorded rows")
+
+    for k in cluster_store.CLUSTER_KS:
+        ours, _, inertia = cluster_store.masked_kmeans(values, mask, k)
+        theirs = KMeans(n_clusters=k, random_state=42, n_init=4).fit(values)
+
+        # Inertias are mean squared distances per feature for the masked
+        # KMeans and plain squared distances for sklearn
+        if inertia * values.shape[1] > theirs.inertia_ * 1.01:
+            raise SystemExit(f"k={k}: masked KMeans inertia above sklearn's")
+
+        # Beyond the planted trajectories the split of a group is arbitrary
+        if k <= len(TRAJECTORIES) and adjusted_rand_score(ours, theirs.labels_) < 0.99:
+            raise SystemExit(f"k={k}: masked KMeans clusters differ from sklearn's")
+
+def zero_filled(cube, ks):
+    """sklearn KMeans on the zero-filled cube, k chosen by silhouette."""
+
+    values = cube.contributions().reshape(len(cube.names), -1).astype(float)
+    values = (values - values.mean(axis=0)) / np.where(
+        values.std(axis=0) > 0, values.std(axis=0), 1.0
+    )
+
+    best = None
+
+    for k in ks:
+        labels = KMeans(n_clusters=k, random_state=42).fit_predict(values)
+        score = sklearn_silhouette(values, labels)
+
+        if best is None or score > best[0]:
+            best = (score, labels)
+
+    return best[1]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--players", type=int, nargs="+", default=[60, 200, 1000])
+    parser.add_argument("--periods", type=int, default=12)
+    args = parser.parse_args()
+
+    check()
+
+    ks = cluster_store.CLUSTER_KS
+
+    print(
+        f"{'players':>8} {'zero-fill ms':>13} {'masked ms':>10} "
+        f"{'zero-fill ARI':>14} {'masked ARI':>11} {'k':>3}"
+    )
+
+    for players in args.players:
+        frame, planted = fixture_frame(players, args.periods)
+        cube = PerformanceCube(frame)
+
+        start = time.perf_counter()
+        baseline = zero_filled(cube, ks)
+        baseline_ms = (time.perf_counter() - start) * 1e3
+
+        start = time.perf_counter()
+        clusters = cluster_store.fit_cube_clusters(cube, ks)
+        masked_ms = (time.perf_counter() - start) * 1e3
+
+        print(
+            f"{players:>8} {baseline_ms:>13.1f} {masked_ms:>10.1f} "
+            f"{adjusted_rand_score(planted, baseline):>14.2f} "
+            f"{adjusted_rand_score(planted, clusters.assignments):>11.2f} "
+            f"{clusters.k:>3}"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+# benchmarks/bench_figure_specs.py
+
+"""
+Parity check and benchmark for the graph-page figure specs.
+
+Runs every chart family of ClanMemberGraph, FormerMemberGraph and
+MonthlyAnalysisGraph (one per route graph type) on a deterministic
+fixture dataset, twice: once with graphs.figure_specs and once with a
+plotly backend exposing the same calls through plotly.express /
+plotly.graph_objects (the previous implementation). The serialized JSON
+of both must match; the benchmark then reports the time to build and
+serialize the figures, as done by the graph route.
+
+Runs offline: coc-data requests are answered from the fixture.
+
+Usage:
+    python -m benchmarks.bench_figure_specs [--runs N]
+"""
+
+# Importing Libraries
+import argparse
+import base64
+import json
+import math
+import random
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import plotly
+import plotly.express as px
+import plotly.graph_objects as go
+import requests
+
+import month_store
+from graphs import figure_specs, graph_engine
+from graphs.clan_member_graph import ClanMemberGraph
+from graphs.former_member_graph import FormerMemberGraph
+from graphs.monthly_analysis_graph import MonthlyAnalysisGraph
+
+# Same calls as graphs.figure_specs, answered by plotly objects
+PLOTLY_BACKEND = SimpleNamespace(
+    FigureSpec=go.Figure,
+    trace=lambda trace_type, **props: {"type": trace_type, **props},
+    pie=px.pie,
+    scatter=px.scatter,
+    histogram=px.histogram,
+    box=px.box,
+    violin=px.violin,
+    density_heatmap=px.density_heatmap,
+    treemap=px.treemap,
+    sunburst=px.sunburst,
+    scatter_3d=px.scatter_3d,
+    # Pre-binned figures have no plotly.express equivalent: validate them
+    # by loading the specs into plotly objects
+    binned_histogram=lambda *a, **k: go.Figure(figure_specs.binned_histogram(*a, **k)),
+    binned_density_heatmap=lambda *a, **k: go.Figure(
+        figure_specs.binned_density_heatmap(*a, **k)
+    ),
+    binned_pie=lambda *a, **k: go.Figure(figure_specs.binned_pie(*a, **k)),
+)
+
+GRAPHS = {
+    "mem": ClanMemberGraph,
+    "fmem": FormerMemberGraph,
+    "mag": MonthlyAnalysisGraph,
+}
+
+def fixture_rows(obj, seed=11, players=50):
+    """
+    Build the coc-data rows of one dataset.
+
+    Args:
+        obj (str): Dataset type ("mem", "fmem" or "mag")
+        seed (int): Random seed
+        players (int): Number of rows
+
+    Returns:
+        list[dict]: JSON rows, numbers as strings like the published files
+    """
+
+    rng = random.Random(seed)
+    rows = []
+
+    for i in range(players):
+        war = rng.choice([0, 0, rng.randint(1, 400)])
+        capital = rng.choice([0, rng.randint(1, 350)])
+        games = rng.choice([0, rng.randint(1, 25)])
+        maxed = rng.randint(0, 3)
+        row = {
+            "srno": str(i + 1),
+            "name": f"Player{i}",
+            "warattack": str(war),
+            "clancapital": str(capital),
+            "clangames": str(games),
+            "clangamesmaxed": str(maxed),
+            "clanscore": str(war + capital + games + maxed * 10),
+        }
+
+        if obj == "mem":
+            row["status"] = rng.choice(["Leader", "Co-Leader", "Elder", "Member"])
+            row["war"] = rng.choice(["IN", "OUT"])
+
+        rows.append(row)
+
+    return rows
+
+def offline_requests(datasets):
+    """
+    Stand-in for the requests module answering from fixture rows.
+
+    Args:
+        datasets (dict[str, list[dict]]): URL prefix -> rows
+    """
+
+    def get(url, **kwargs):
+        rows = next(rows for prefix, rows in datasets.items() if url.startswith(prefix))
+        return SimpleNamespace(status_code=200, json=lambda: rows)
+
+    return SimpleNamespace(get=get, exceptions=requests.exceptions)
+
+def decode(value):
+    """Decode Plotly's base64 typed arrays ({"dtype", "bdata"}) into lists."""
+
+    if isinstance(value, dict):
+        if "bdata" in value and "dtype" in value:
+            raw = base64.b64decode(value["bdata"])
+            array = np.frombuffer(raw, dtype=value["dtype"])
+            if "shape" in value:
+                array = array.reshape([int(n) for n in value["shape"].split(",")])
+            return array.tolist()
+        return {key: decode(item) for key, item in value.items()}
+
+    if isinstance(value, list):
+        return [decode(item) for item in value]
+
+    return value
+
+def mismatch(expected, actual, path="figure"):
+    """
+    Compare two decoded figures.
+
+    Returns:
+        str | None: Path of the first difference, or None if they match
+    """
+
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        if expected.keys() != actual.keys():
+            return f"{path} keys {sorted(expected.keys() ^ actual.keys())}"
+        for key in expected:
+            found = mismatch(expected[key], actual[key], f"{path}.{key}")
+            if found:
+                return found
+        return None
+
+    if isinstance(expected, list) and isinstance(actual, list):
+        if len(expected) != len(actual):
+            return f"{path} length {len(expected)} != {len(actual)}"
+        for i, (a, b) in enumerate(zip(expected, actual)):
+            found = mismatch(a, b, f"{path}[{i}]")
+            if found:
+                return found
+        return None
+
+    if isinstance(expected, float) or isinstance(actual, float):
+        if isinstance(expected, (int, float)) and isinstance(actual, (int, float)):
+            if math.isclose(expected, actual, rel_tol=1e-9, abs_tol=1e-12):
+                return None
+
+    return None if expected == actual else f"{path}: {expected!r} != {actual!r}"
+
+def render(obj, method, backend):
+    """
+    Build and serialize the figures of one graph method with a backend.
+
+    Returns:
+        list[str]: Serialized figures, as sent by the graph route
+    """
+
+    graph_engine.fs = backend
+
+    graph = GRAPHS[obj]()
+    graph.update_and_load_data("APR_2025")
+    figures = getattr(graph, method)()
+
+    return [json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder) for fig in figures]
+
+def timed(obj, method, backend, runs):
+    """Mean milliseconds per call of `render`."""
+
+    start = time.perf_counter()
+
+    for _ in range(runs):
+        render(obj, method, backend)
+
+    return (time.perf_counter() - start) / runs * 1e3
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    month_store.requests = offline_requests(
+        {
+            graph.schema.url.split("{")[0]: fixture_rows(obj)
+            for obj, graph in GRAPHS.items()
+        }
+    )
+
+    cases = [
+        (obj, family, f"create_{family}")
+        for obj, graph in GRAPHS.items()
+        for family in graph.schema.families
+    ]
+
+    for obj, gtype, method in cases:
+        expected = render(obj, method, PLOTLY_BACKEND)
+        actual = render(obj, method, figure_specs)
+
+        if len(expected) != len(actual):
+            raise SystemExit(f"{obj} {gtype}: {len(expected)} != {len(actual)} figures")
+
+        for i, (a, b) in enumerate(zip(expected, actual)):
+            found = mismatch(decode(json.loads(a)), decode(json.loads(b)))
+            if found:
+                raise SystemExit(f"{obj} {gtype} figure {i}: {found}")
+
+    print(f"{'graph':<26} {'plotly ms':>10} {'specs ms':>10} {'speedup':>8}")
+
+    totals = [0.0, 0.0]
+
+    for obj, gtype, method in cases:
+        legacy = timed(obj, method, PLOTLY_BACKEND, args.runs)
+        specs = timed(obj, method, figure_specs, args.runs)
+        totals[0] += legacy
+        totals[1] += specs
+        print(
+            f"{obj + ' ' + gtype:<26} {legacy:>10.1f} {specs:>10.1f} "
+            f"{legacy / specs:>7.1f}x"
+        )
+
+    print(
+        f"{'total':<26} {totals[0]:>10.1f} {totals[1]:>10.1f} "
+        f"{totals[0] / totals[1]:>7.1f}x"
+    )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+# benchmarks/bench_heatmaps.py
+
+"""
+Parity check and benchmark for the all month analysis heatmaps.
+
+Builds deterministic Clan Monthly Performance tables (fixture of
+bench_cube_clustering: players joining and leaving, so most rows have
+missing periods) and checks that graphs.heatmap_engine, over every player
+and period, shows the same players, periods and values as the former
+px.imshow heatmaps (missing periods as MISSING_VALUE instead of null),
+and that the quarterly sums match pandas. Then reports, per table size,
+the encoded size of the five heatmaps and the time to build and encode
+them: former heatmaps, every player, current members only, and current
+members summed per quarter.
+
+Usage:
+    python -m benchmarks.bench_heatmaps [--players N] [--periods N]
+"""
+
+# Importing Libraries
+import argparse
+import json
+import time
+
+import plotly.express as px
+
+from benchmarks.bench_cube_clustering import fixture_frame
+from benchmarks.bench_figure_specs import decode
+from graphs import heatmap_engine
+from json_provider import dumps_figure
+from performance_store import METRIC_KEYS, MISSING_VALUE, PerformanceCube
+
+# Engine selections compared with the former heatmaps
+VARIANTS = {
+    "all": {"players": "all"},
+    "active": {"players": "active"},
+    "quarter": {"players": "active", "aggregate": "quarter"},
+}
+
+def legacy_heatmaps(frame):
+    """Former AllMonthGraph.generate_heatmap_figures on a fetched table."""
+
+    figures = []
+
+    for metric in METRIC_KEYS:
+        heatmap_df = frame.set_index("name")[
+            [col for col in frame.columns if col.startswith(metric + "_")]
+        ]
+        heatmap_df = heatmap_df.replace(-1, None)
+        label = metric.replace("clangamesmaxed", "Clan Games Maxed").capitalize()
+
+        fig = px.imshow(
+            heatmap_df,
+            labels=dict(x="Month", y="Player", color=label),
+            x=[col.replace(f"{metric}_", "") for col in heatmap_df.columns],
+            y=heatmap_df.index,
+            title=f"Heatmap of {label} per Month",
+            aspect="auto",
+            color_continuous_scale="Plasma",
+        )
+
+        fig.update_yaxes(tickfont=dict(size=10))
+        figures.append(fig)
+
+    return figures
+
+def heatmap_data(figure):
+    """(x, y, z) of a heatmap figure, missing values as MISSING_VALUE."""
+
+    trace = decode(json.loads(dumps_figure(figure)))["data"][0]
+    z = [
+        [MISSING_VALUE if value is None else int(value) for value in row]
+        for row in trace["z"]
+    ]
+
+    return list(trace["x"]), list(trace["y"]), z
+
+def check(frame):
+    """Raise SystemExit when the engine disagrees with the former heatmaps."""
+
+    cube = PerformanceCube(frame)
+    selection = heatmap_engine.select_heatmaps(cube, players="all")
+    figures = [
+        heatmap_engine.heatmap_figure(selection, metric) for metric in METRIC_KEYS
+    ]
+
+    for metric, legacy, figure in zip(METRIC_KEYS, legacy_heatmaps(frame), figures):
+        if heatmap_data(legacy) != heatmap_data(figure):
+            raise SystemExit(f"{metric}: heatmap differs from px.imshow")
+
+    # Quarterly sums with pandas, on the long table
+    quarters = heatmap_engine.select_heatmaps(cube, players="all", aggregate="quarter")
+    long = frame.melt(id_vars="name", var_name="column")
+    long = long[long["value"] != MISSING_VALUE]
+    long[["metric", "period"]] = long["column"].str.split("_", n=1, expand=True)
+    long["quarter"] = long["period"].map(heatmap_engine.quarter_of)
+    sums = long.groupby(["name", "metric", "quarter"])["value"].sum()
+
+    for (name, metric, quarter), value in sums.items():
+        row = quarters.names.index(name)
+        column = quarters.columns.index(quarter)
+
+        if quarters.matrix(metric)[row, column] != value:
+            raise SystemExit(f"{name} {metric} {quarter}: quarterly sum differs")
+
+    recorded = int((quarters.values != MISSING_VALUE).sum())
+
+    if recorded != len(sums):
+        raise SystemExit(f"{recorded} recorded quarters, pandas has {len(sums)}")
+
+def timed(build):
+    """
+    Returns:
+        tuple[float, int]: Milliseconds to build and encode, encoded bytes
+    """
+
+    start = time.perf_counter()
+    encoded = [dumps_figure(figure) for figure in build()]
+    elapsed = (time.perf_counter() - start) * 1e3
+
+    return elapsed, sum(len(text.encode()) for text in encoded)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--players", type=int, nargs="+", default=[100, 400, 1500])
+    parser.add_argument("--periods", type=int, default=24)
+    args = parser.parse_args()
+
+    check(fixture_frame(60, 10)[0])
+
+    print(f"{'players':>8} {'heatmaps':<10} {'rows':>6} {'KB':>9} {'ms':>8}")
+
+    for players in args.players:
+        frame, _ = fixture_frame(players, args.periods)
+        cube = PerformanceCube(frame, version=players)
+
+        elapsed, size = timed(lambda: legacy_heatmaps(frame))
+        print(
+            f"{players:>8} {'px.imshow':<10} {len(frame):>6} "
+            f"{size / 1024:>9.1f} {elapsed:>8.1f}"
+        )
+
+        for name, options in VARIANTS.items():
+            elapsed, size = timed(
+                lambda: heatmap_engine.heatmap_figures(cube, **options)
+            )
+            rows = len(heatmap_engine.cached_selection(cube, **options).names)
+
+            print(
+                f"{players:>8} {name:<10} {rows:>6} "
+                f"{size / 1024:>9.1f} {elapsed:>8.1f}"
+            )
+
+if __name__ == "__main__":
+    main()
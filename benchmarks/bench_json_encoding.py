@@ -0,0 +1,136 @@
+# benchmarks/bench_json_encoding.py
+
+"""
+Parity check and benchmark for the JSON encoders of json_provider.
+
+Encodes the figures of every chart family of the member, former member
+and monthly analysis graphs (fixture datasets of bench_figure_specs), as
+figure specs and as plotly figures (the player dashboard and the AI
+pages), with the standard library (PlotlyJSONEncoder) and with orjson.
+Then encodes /api/github/* payloads (typed month file rows) with Flask's
+default provider and with FastJSONProvider. Checks that both encoders
+produce the same JSON values, then reports the encoding time.
+
+Runs offline: coc-data requests are answered from the fixture.
+
+Usage:
+    python -m benchmarks.bench_json_encoding [--players N] [--runs N]
+"""
+
+# Importing Libraries
+import argparse
+import json
+import time
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+import json_provider
+import month_store
+from benchmarks.bench_figure_specs import (
+    GRAPHS,
+    PLOTLY_BACKEND,
+    decode,
+    fixture_rows,
+    mismatch,
+    offline_requests,
+)
+from benchmarks.bench_month_store import fixture_rows as month_rows
+from graphs import figure_specs, graph_engine
+
+def figures(backend):
+    """Every figure of every chart family, built with a backend."""
+
+    graph_engine.fs = backend
+    built = []
+
+    for graph_class in GRAPHS.values():
+        graph = graph_class()
+        graph.update_and_load_data("APR_2025")
+
+        for family in graph.schema.families:
+            built.extend(graph.render(family))
+
+    graph_engine.fs = figure_specs
+
+    return built
+
+def check(name, items, expected_dumps, actual_dumps):
+    """Raise SystemExit when two encoders disagree on a payload."""
+
+    for i, item in enumerate(items):
+        found = mismatch(
+            decode(json.loads(expected_dumps(item))),
+            decode(json.loads(actual_dumps(item))),
+        )
+
+        if found:
+            raise SystemExit(f"{name} {i}: {found}")
+
+def timed(dumps, items, runs):
+    """
+    Returns:
+        tuple[float, int]: Mean milliseconds per pass and encoded bytes
+    """
+
+    start = time.perf_counter()
+
+    for _ in range(runs):
+        encoded = [dumps(item) for item in items]
+
+    elapsed = (time.perf_counter() - start) / runs * 1e3
+
+    return elapsed, sum(len(text.encode()) for text in encoded)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--players", type=int, nargs="+", default=[50, 500, 5000])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    if json_provider.orjson is None:
+        raise SystemExit("orjson is not installed")
+
+    month_store.requests = offline_requests(
+        {
+            graph.schema.url.split("{")[0]: fixture_rows(obj)
+            for obj, graph in GRAPHS.items()
+        }
+    )
+
+    app = Flask(__name__)
+    default = DefaultJSONProvider(app)
+    fast = json_provider.FastJSONProvider(app)
+
+    payloads = [
+        ("figure specs", figures(figure_specs),
+         json_provider.dumps_figure_json, json_provider.dumps_figure_orjson),
+        ("plotly figures", figures(PLOTLY_BACKEND),
+         json_provider.dumps_figure_json, json_provider.dumps_figure_orjson),
+    ]
+
+    for players in args.players:
+        records = month_store.parse_month_file(month_rows(players), "members")
+        payloads.append(
+            (f"api rows x{players}", [records.records()], default.dumps, fast.dumps)
+        )
+
+    print(
+        f"{'payload':<20} {'items':>6} {'KB':>8} {'json ms':>9} "
+        f"{'orjson ms':>10} {'speedup':>8}"
+    )
+
+    with app.app_context():
+        for name, items, expected_dumps, actual_dumps in payloads:
+            check(name, items, expected_dumps, actual_dumps)
+
+            legacy, size = timed(expected_dumps, items, args.runs)
+            fast_ms, _ = timed(actual_dumps, items, args.runs)
+
+            print(
+                f"{name:<20} {len(items):>6} {size / 1024:>8.1f} {legacy:>9.1f} "
+                f"{fast_ms:>10.1f} {legacy / fast_ms:>7.1f}x"
+            )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# benchmarks/bench_lazy_figures.py
+
+"""
+Page payload and server time of eager versus lazily loaded graph pages.
+
+Runs every chart family of the member, former member and monthly
+analysis graphs on the fixture datasets of bench_figure_specs. Compares
+building and embedding every figure in the page (the previous graph
+route) with the lazy page: the page only carries the figure URLs, then
+the browser fetches the figures that scroll into view. Checks first that
+the figures served one at a time match the eagerly built ones.
+
+Runs offline: coc-data requests are answered from the fixture.
+
+Usage:
+    python -m benchmarks.bench_lazy_figures [--viewed N] [--runs N]
+"""
+
+# Importing Libraries
+import argparse
+import json
+import time
+
+import plotly
+
+import month_store
+from benchmarks.bench_figure_specs import GRAPHS, fixture_rows, offline_requests
+
+def serialize(fig):
+    return json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)
+
+def eager_page(graph, family):
+    """Serialized figures embedded by the eager page."""
+
+    return [serialize(fig) for fig in graph.render(family)]
+
+def lazy_page(graph, family):
+    """Figure URLs embedded by the lazy page."""
+
+    return json.dumps(
+        [f"/graph/x/{family}/figure/{i}/" for i in range(graph.figure_count(family))]
+    )
+
+def lazy_views(graph, family, viewed):
+    """Serialized figures fetched for the first `viewed` figures."""
+
+    count = min(viewed, graph.figure_count(family))
+
+    return [serialize(graph.render_figure(family, i)) for i in range(count)]
+
+def timed(build, runs, *args):
+    """
+    Returns:
+        tuple[object, float]: Result and mean milliseconds per call
+    """
+
+    start = time.perf_counter()
+
+    for _ in range(runs):
+        result = build(*args)
+
+    return result, (time.perf_counter() - start) / runs * 1e3
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--viewed", type=int, default=2)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    month_store.requests = offline_requests(
+        {
+            graph.schema.url.split("{")[0]: fixture_rows(obj)
+            for obj, graph in GRAPHS.items()
+        }
+    )
+
+    print(
+        f"{'graph':<26} {'figs':>5} {'eager KB':>9} {'lazy KB':>8} "
+        f"{'eager ms':>9} {'lazy ms':>8}"
+    )
+
+    totals = [0, 0, 0.0, 0.0]
+
+    for obj, graph_class in GRAPHS.items():
+        graph = graph_class()
+        graph.update_and_load_data("APR_2025")
+
+        for family in graph.schema.families:
+            eager, eager_ms = timed(eager_page, args.runs, graph, family)
+            page, page_ms = timed(lazy_page, args.runs, graph, family)
+            views, views_ms = timed(lazy_views, args.runs, graph, family, args.viewed)
+
+            if views != eager[: len(views)]:
+                raise SystemExit(f"{obj} {family}: lazy figures differ")
+
+            # Eager payload is the page; lazy payload is the page plus the
+            # figures fetched for the viewed ones
+            eager_bytes = sum(len(item) for item in eager)
+            lazy_bytes = len(page) + sum(len(item) for item in views)
+            lazy_ms = page_ms + views_ms
+
+            totals[0] += eager_bytes
+            totals[1] += lazy_bytes
+            totals[2] += eager_ms
+            totals[3] += lazy_ms
+
+            print(
+                f"{obj + ' ' + family:<26} {len(eager):>5} "
+                f"{eager_bytes / 1024:>9.1f} {lazy_bytes / 1024:>8.1f} "
+                f"{eager_ms:>9.1f} {lazy_ms:>8.1f}"
+            )
+
+    print(
+        f"{'total':<26} {'':>5} {totals[0] / 1024:>9.1f} {totals[1] / 1024:>8.1f} "
+        f"{totals[2]:>9.1f} {totals[3]:>8.1f}"
+    )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# benchmarks/bench_month_parser.py
+
+"""
+Micro-benchmark for the chatbot month / month-range parser.
+
+Compares chatbot.month_normalizer.normalize_month (one precompiled
+pattern, single pass) against the previous implementation, which tried
+every month and every pair of months with its own regex search. Both are
+run over the same corpus of chatbot-style messages; the benchmark first
+checks that they return identical results.
+
+Usage:
+    python -m benchmarks.bench_month_parser [--runs N]
+"""
+
+# Importing Libraries
+import argparse
+import re
+import time
+
+from chatbot.month_normalizer import MONTH_MAP, YEAR_PATTERN, normalize_month
+
+CORPUS = [
+    "what is Chief's warattack in APR 2025",
+    "display coc-data of KAI HIWATARI in april 2025",
+    "top 10 clanscore in Sept 2024",
+    "who had the lowest non-zero warattack in december 2024",
+    "group warattack in APR-MAY 2025",
+    "average clanscore in apr may 2025",
+    "compare Bennie vs Grandpa1 in Dec-Jan 2025",
+    "total clancapital in november-december 2024",
+    "list all former members in DEC 2024",
+    "is Bennie in top contributors for APR 2025",
+    "who had the highest warattack",
+    "apr25 stats please",
+    "hello",
+    "dec 2024 vs jan 2025 warattack",
+    "what does clanscore mean",
+    "show march april 2026 analysis and also may 2026",
+]
+
+def legacy_normalize_month(text):
+    """
+    Previous normalize_month implementation (per-pair regex searches).
+
+    Kept here as the reference for correctness and speed comparisons.
+    """
+
+    lowered = text.lower()
+
+    for w1, c1 in MONTH_MAP.items():
+        for w2, c2 in MONTH_MAP.items():
+            pattern = rf"\b{w1}\b[\s\-]+\b{w2}\b\s+{YEAR_PATTERN}"
+            match = re.search(pattern, lowered)
+            if match:
+                return {"type": "range", "value": f"{c1}-{c2}_{match.group(1)}"}
+
+    for word, code in MONTH_MAP.items():
+        match = re.search(rf"\b{word}\b\s+{YEAR_PATTERN}", lowered)
+        if match:
+            return {"type": "single", "value": f"{code}_{match.group(1)}"}
+
+    return {"type": None, "value": None}
+
+def run(parser, runs):
+    """
+    Parse the whole corpus `runs` times.
+
+    Returns:
+        float: Mean microseconds per message
+    """
+
+    start = time.perf_counter()
+
+    for _ in range(runs):
+        for text in CORPUS:
+            parser(text)
+
+    return (time.perf_counter() - start) / (runs * len(CORPUS)) * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    for text in CORPUS:
+        expected = legacy_normalize_month(text)
+        actual = normalize_month(text)
+        if expected != actual:
+            raise SystemExit(f"Mismatch for {text!r}: {expected} != {actual}")
+
+    print(f"{'parser':<10} {'us/message':>12}")
+
+    for name, func in (("legacy", legacy_normalize_month), ("compiled", normalize_month)):
+        print(f"{name:<10} {run(func, args.runs):>12.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+# benchmarks/bench_month_store.py
+
+"""
+Parity check and benchmark for the typed month file loader.
+
+Converts a deterministic members file (numbers as strings, a few blank
+values) twice: with the previous per-consumer conversions (pd.DataFrame
+plus pd.to_numeric per metric for the graphs, an isdigit() walk over
+every value for the GitHub API) and with month_store.parse_month_file
+(frame() for the graphs, records() for the API and the chatbot). Checks
+that both produce the same numbers, then reports the conversion time
+and the memory of the graph DataFrame.
+
+Usage:
+    python -m benchmarks.bench_month_store [--players N] [--runs N]
+"""
+
+# Importing Libraries
+import argparse
+import random
+import time
+
+import numpy as np
+import pandas as pd
+
+from month_store import parse_month_file
+from performance_store import METRIC_KEYS
+
+def fixture_rows(players, seed=3):
+    """
+    Build a members file.
+
+    Args:
+        players (int): Number of rows
+        seed (int): Random seed
+
+    Returns:
+        list[dict]: JSON rows, numbers as strings like the published files
+    """
+
+    rng = random.Random(seed)
+    rows = []
+
+    for i in range(players):
+        row = {
+            "srno": str(i + 1),
+            "name": f"Player{i}",
+            "status": rng.choice(["Leader", "Co-Leader", "Elder", "Member"]),
+            "war": rng.choice(["IN", "OUT"]),
+        }
+
+        for metric in METRIC_KEYS:
+            row[metric] = str(rng.randint(0, 900)) if rng.random() > 0.01 else ""
+
+        rows.append(row)
+
+    return rows
+
+def legacy_frame(rows):
+    """DataFrame conversion of the previous graph loader."""
+
+    df = pd.DataFrame(rows)
+
+    for column in METRIC_KEYS:
+        df[column] = pd.to_numeric(df[column], errors="coerce")
+
+    return df
+
+def legacy_records(rows):
+    """Normalization of the previous GitHub API fetcher."""
+
+    return [
+        {
+            key: int(value) if isinstance(value, str) and value.isdigit() else value
+            for key, value in player.items()
+        }
+        for player in rows
+    ]
+
+def check(rows):
+    """Raise SystemExit when the typed loader disagrees with the previous one."""
+
+    table = parse_month_file(rows, "members")
+    frame, expected = table.frame(), legacy_frame(rows)
+
+    for column in METRIC_KEYS:
+        if not np.array_equal(
+            frame[column].to_numpy(dtype=float),
+            expected[column].to_numpy(dtype=float),
+            equal_nan=True,
+        ):
+            raise SystemExit(f"frame {column} differs")
+
+    for typed, legacy in zip(table.records(), legacy_records(rows)):
+        for key, value in legacy.items():
+            if typed[key] != (None if value == "" else value):
+                raise SystemExit(f"{legacy['name']} {key}: {typed[key]!r} != {value!r}")
+
+def timed(build, rows, runs):
+    """Mean milliseconds per call of `build`."""
+
+    start = time.perf_counter()
+
+    for _ in range(runs):
+        build(rows)
+
+    return (time.perf_counter() - start) / runs * 1e3
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--players", type=int, nargs="+", default=[50, 500, 5000])
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    print(
+        f"{'players':>8} {'legacy ms':>10} {'typed ms':>9} "
+        f"{'legacy KB':>10} {'typed KB':>9}"
+    )
+
+    for players in args.players:
+        rows = fixture_rows(players)
+        check(rows)
+
+        legacy = timed(lambda r: (legacy_frame(r), legacy_records(r)), rows, args.runs)
+        typed = timed(
+            lambda r: (lambda t: (t.frame(), t.records()))(
+                parse_month_file(r, "members")
+            ),
+            rows,
+            args.runs,
+        )
+
+        legacy_kb = legacy_frame(rows).memory_usage(deep=True).sum() / 1024
+        typed_kb = (
+            parse_month_file(rows, "members").frame().memory_usage(deep=True).sum()
+            / 1024
+        )
+
+        print(
+            f"{players:>8} {legacy:>10.1f} {typed:>9.1f} "
+            f"{legacy_kb:>10.1f} {typed_kb:>9.1f}"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# benchmarks/bench_player_report.py
+
+"""
+Benchmark for the player PDF report chart backends.
+
+Compares the vector backend (ReportLab drawings embedded in the PDF)
+against the raster backend (Matplotlib PNG images on a reused Agg figure)
+by generating the same synthetic report repeatedly and reporting the
+mean generation time and the resulting PDF size.
+
+Usage:
+    python -m benchmarks.bench_player_report [--runs N] [--periods N]
+"""
+
+# Importing Libraries
+import argparse
+import io
+import random
+import time
+
+from graphs.player_report import METRICS, build_report_pdf
+
+MONTHS = ["JAN", "FEB", "MAR", "APR", "MAY", "JUN",
+          "JUL", "AUG", "SEP", "OCT", "NOV", "DEC"]
+
+def synthetic_report_data(period_count, seed=42):
+    """
+    Build deterministic periods and metric values for one player.
+
+    Args:
+        period_count (int): Number of month-range periods
+        seed (int): Random seed
+
+    Returns:
+        tuple[list[str], dict[str, list[int]]]: Periods and metric values
+    """
+
+    rng = random.Random(seed)
+    periods = []
+
+    for i in range(period_count):
+        start = (6 + i) % 12
+        year = 2024 + (6 + i + 1) // 12
+        periods.append(f"{MONTHS[start]}-{MONTHS[(start + 1) % 12]}_{year}")
+
+    metric_values = {
+        metric: [rng.randint(0, 400) for _ in periods] for metric in METRICS
+    }
+
+    return periods, metric_values
+
+def run(backend, runs, periods, metric_values):
+    """
+    Generate the report `runs` times with one backend.
+
+    Returns:
+        tuple[float, int]: Mean seconds per report and PDF size in bytes
+    """
+
+    # Warm-up (font loading, figure creation)
+    build_report_pdf(io.BytesIO(), "Benchmark", periods, metric_values, backend)
+
+    size = 0
+    start = time.perf_counter()
+
+    for _ in range(runs):
+        buf = io.BytesIO()
+        build_report_pdf(buf, "Benchmark", periods, metric_values, backend)
+        size = buf.tell()
+
+    return (time.perf_counter() - start) / runs, size
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--periods", type=int, default=25)
+    args = parser.parse_args()
+
+    periods, metric_values = synthetic_report_data(args.periods)
+
+    print(f"{'backend':<8} {'ms/report':>10} {'pdf size (KB)':>14}")
+
+    for backend in ("raster", "vector"):
+        seconds, size = run(backend, args.runs, periods, metric_values)
+        print(f"{backend:<8} {seconds * 1000:>10.1f} {size / 1024:>14.1f}")
+
+if __name__ == "__main__":
+    main()
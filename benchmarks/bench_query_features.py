@@ -0,0 +1,117 @@
+# benchmarks/bench_query_features.py
+
+"""
+Micro-benchmark for chatbot keyword detection.
+
+Compares the previous keyword checks (one substring scan per keyword, as
+done by the controller, classifier, router and resolver for every
+message) against chatbot.query_features.extract_features (one compiled
+scan per message, memoized). Both are run over a corpus of typical
+chatbot queries; the benchmark first checks that they agree.
+
+Usage:
+    python -m benchmarks.bench_query_features [--runs N]
+"""
+
+# Importing Libraries
+import argparse
+import re
+import time
+
+from chatbot.query_features import FEATURE_KEYWORDS, extract_features
+
+CORPUS = [
+    "help",
+    "hi",
+    "who are you",
+    "what can you do",
+    "what metrics can I ask about",
+    "what does warattack mean",
+    "what does clanscore mean",
+    "thanks",
+    "display coc-data of Chief in APR 2025",
+    "display coc-data of KAI HIWATARI in APR 2025",
+    "what is Chief's warattack in APR 2025",
+    "what is Chief's clancapital in APR 2025",
+    "what is the status of Chief in APR 2025",
+    "list all clan members in APR 2025",
+    "is Chief a clan member in APR 2025",
+    "list all former members in DEC 2024",
+    "display coc-data of KING SEENU in DEC 2024",
+    "is KING SEENU a former member in DEC 2024",
+    "who had the highest clanscore in APR 2025",
+    "top 10 clanscore in APR 2025",
+    "is Bennie in top contributors for APR 2025",
+    "who had the highest warattack in APR 2025",
+    "who had the lowest warattack in APR 2025",
+    "who had the lowest non-zero warattack in APR 2025",
+    "top 10 warattack in APR 2025",
+    "top 5 lowest clanscore in APR 2025",
+    "average warattack in APR 2025",
+    "total clanscore in APR 2025",
+    "group non-zero warattack in APR 2025",
+    "compare Chief vs KAI HIWATARI in APR 2025",
+    "Chief's warattack trend from JAN 2025 to JUN 2025",
+    "best month for clanscore",
+]
+
+def legacy_scan(text):
+    """
+    Previous keyword checks, one substring scan per keyword.
+
+    Returns the same feature names as extract_features so both can be
+    compared.
+    """
+
+    text = text.lower()
+
+    features = {
+        feature
+        for feature, keywords in FEATURE_KEYWORDS.items()
+        if any(keyword in text for keyword in keywords)
+    }
+
+    # The classifier used its own month regex on top of the keyword checks
+    if re.search(r"(apr|may|jun|jul|aug|sep|oct|nov|dec|jan|feb)", text):
+        features.add("MONTH_ABBREVIATION")
+
+    return frozenset(features)
+
+def run(scan, runs):
+    """
+    Scan the whole corpus `runs` times.
+
+    Returns:
+        float: Mean microseconds per message
+    """
+
+    start = time.perf_counter()
+
+    for _ in range(runs):
+        for text in CORPUS:
+            scan(text)
+
+    return (time.perf_counter() - start) / (runs * len(CORPUS)) * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=2000)
+    args = parser.parse_args()
+
+    for text in CORPUS:
+        if legacy_scan(text) != extract_features(text):
+            raise SystemExit(f"Mismatch for {text!r}")
+
+    scanners = (
+        ("legacy", legacy_scan),
+        ("compiled", extract_features.__wrapped__),
+        ("memoized", extract_features),
+    )
+
+    print(f"{'scanner':<10} {'us/message':>12}")
+
+    for name, scan in scanners:
+        print(f"{name:<10} {run(scan, args.runs):>12.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -15,6 +15,8 @@ The package is organized into focused modules that handle:
 - Month and range normalization
 - Dataset domain routing
 - Operation resolution and analytics
+- Indexed dataset views for fast lookups
+- Compiled player name matching
 - Data retrieval from GitHub raw JSON
 - Human-readable response generation
 
@@ -30,10 +32,15 @@ This package forms the core reasoning and analytics layer of Ancient Ruins STATS
 __all__ = [
     "almost_hint",
     "chat_controller",
+    "dataset_index",
     "domain_router",
+    "history_index",
     "input_classifier",
     "month_normalizer",
+    "name_matcher",
     "operation_resolver",
+    "query_features",
     "raw_fetcher",
-    "response_builder"
+    "response_builder",
+    "result_cache"
 ]
\ No newline at end of file
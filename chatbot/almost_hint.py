@@ -17,6 +17,7 @@ when exact month or player resolution fails.
 
 # Importing Libraries
 import re
+from chatbot.name_matcher import get_name_matcher
 
 MONTHS = {
     "jan": "JAN",
@@ -80,8 +81,11 @@ def suggest_player(text: str, players: list[str]) -> str | None:
 
     Matching rules:
     - Case-insensitive comparison
-    - Matches if the player name starts with the input text
     - Matches if the input text appears anywhere in the player name
+      (which includes names starting with it)
+
+    All names are searched at once through the cached name matcher of
+    the roster.
 
     Parameters:
         text (str): Raw user input text.
@@ -93,8 +97,7 @@ def suggest_player(text: str, players: list[str]) -> str | None:
             - None if no matches or multiple matches are found.
     """
 
-    t = text.lower()
-    matches = [p for p in players if p.lower().startswith(t) or t in p.lower()]
+    matches = get_name_matcher(players).names_containing(text)
 
     if len(matches) == 1:
         return matches[0]
@@ -25,12 +25,28 @@ single entry point for all chatbot interactions.
 from chatbot.month_normalizer import normalize_month
 from chatbot.domain_router import route_domain
 from chatbot.raw_fetcher import fetch_json_if_exists, build_raw_url
-from chatbot.operation_resolver import resolve_operation
-from chatbot.response_builder import build_response
+from chatbot.operation_resolver import (
+    resolve_operation,
+    extract_intent,
+    detect_history_query,
+    resolve_history_operation,
+)
+from chatbot.history_index import get_history_index
+from chatbot.dataset_index import get_dataset_index
+from chatbot.result_cache import result_cache
+from chatbot.response_builder import iter_response
 from chatbot.input_classifier import classify_input
+from chatbot.query_features import extract_features
 from chatbot.almost_hint import suggest_month
+from concurrent.futures import ThreadPoolExecutor
 import random
 
+# Maximum number of messages accepted in one batch
+BATCH_MAX_MESSAGES = 20
+
+# Maximum number of datasets fetched concurrently for a batch
+BATCH_FETCH_WORKERS = 4
+
 # STATIC METRIC EXPLANATIONS
 METRIC_EXPLANATIONS = {
     "warattack": "Number of times attacked in war.",
@@ -40,6 +56,194 @@ METRIC_EXPLANATIONS = {
     "clanscore": "Total sum of warattack, clancapital, clangames and clangamesmaxed",
 }
 
+# HELP COMMANDS (matched against the whole message)
+HELP_COMMANDS = {"help", "/help", "commands"}
+
+# STATIC REPLIES
+HELP_REPLY = (
+    "Here’s what I can help you with (Ancient Ruins clan only):\n\n"
+
+    "GENERAL\n"
+    "- who are you\n"
+    "- what can you do\n"
+    "- what metrics can I ask about\n"
+    "- what does warattack mean\n"
+    "- what does clanscore mean\n\n"
+
+    "PLAYER INFORMATION\n"
+    "- display coc-data of Chief in APR 2025\n"
+    "- display coc-data of KAI HIWATARI in APR 2025\n"
+    "- what is Chief's warattack in APR 2025\n"
+    "- what is Chief's clancapital in APR 2025\n"
+    "- what is the status of Chief in APR 2025\n\n"
+
+    "CLAN MEMBERS\n"
+    "- list all clan members in APR 2025\n"
+    "- is Chief a clan member in APR 2025\n\n"
+
+    "FORMER CLAN MEMBERS\n"
+    "- list all former members in DEC 2024\n"
+    "- display coc-data of KING SEENU in DEC 2024\n"
+    "- is KING SEENU a former member in DEC 2024\n\n"
+
+    "TOP CLAN CONTRIBUTORS\n"
+    "- who had the highest clanscore in APR 2025\n"
+    "- top 10 clanscore in APR 2025\n"
+    "- is Bennie in top contributors for APR 2025\n\n"
+
+    "RANKINGS\n"
+    "- who had the highest warattack in APR 2025\n"
+    "- who had the lowest warattack in APR 2025\n"
+    "- who had the lowest non-zero warattack in APR 2025\n"
+    "- top 10 warattack in APR 2025\n"
+    "- top 5 lowest clanscore in APR 2025\n"
+    "- who had the highest clancapital in APR 2025\n\n"
+
+    "STATISTICS\n"
+    "- average warattack in APR 2025\n"
+    "- average clanscore in APR 2025\n"
+    "- total warattack in APR 2025\n"
+    "- total clanscore in APR 2025\n"
+    "- total clancapital in APR 2025\n\n"
+
+    "GROUPING\n"
+    "- group warattack in APR 2025\n"
+    "- group clanscore in APR 2025\n"
+    "- group non-zero warattack in APR 2025\n\n"
+
+    "PLAYER COMPARISON\n"
+    "- compare Chief vs KAI HIWATARI in APR 2025\n"
+    "- compare Bennie vs Grandpa1 in APR 2025\n\n"
+
+    "HISTORY (ACROSS MONTHS)\n"
+    "- Chief's warattack trend from JAN 2025 to JUN 2025\n"
+    "- Chief's best month for clanscore\n"
+    "- best month for clanscore\n"
+    "- clancapital trend from NOV 2024 to MAR 2025\n\n"
+
+    "SUPPORTED METRICS\n"
+    "- warattack\n"
+    "- clancapital\n"
+    "- clangames\n"
+    "- clangamesmaxed\n"
+    "- clanscore\n"
+    "- status (Clan Members only)\n\n"
+
+    "SUPPORTED DATE FORMAT\n"
+    "- APR 2025\n"
+    "- DEC 2024\n"
+    "- APR-MAY 2025 (Monthly Analysis)\n\n"
+
+    "NOTES\n"
+    "- Every clan query must include a month (history queries may use a span or none).\n"
+    "- Rankings automatically handle ties.\n"
+    "- 'Top N' refers to the top N unique values, not the number of players.\n"
+    "- Month ranges are supported only for Monthly Analysis.\n"
+    "- I only answer questions about the Ancient Ruins clan."
+)
+
+CATEGORY_REPLIES = {
+    "GREETING": (
+        "Hello! I am kARsb, Clan Data Assistant for the Ancient Ruins clan.\n\n"
+        "I specialize only in Ancient Ruins clan coc-data and can help you with:\n"
+        "- Monthly clan member statistics\n"
+        "- Performance analysis\n"
+        "- Rankings and comparisons\n\n"
+        "Type `help` to see example questions."
+    ),
+    "GIBBERISH": (
+        "I couldn’t understand your message.\n"
+        "Please ask something related to the Ancient Ruins clan "
+        "or type `help` to see example questions."
+    ),
+}
+
+def _metric_meaning_reply(features: frozenset) -> str | None:
+    """
+    Reply to "what does <metric> mean", if a metric is mentioned.
+    """
+
+    for metric, explanation in METRIC_EXPLANATIONS.items():
+        if metric in features:
+            return f"**{metric}** means:\n{explanation}"
+
+    return None
+
+# STATIC DISPATCH TABLE
+# (required features, reply text or reply builder), tried in order.
+# A builder returning None lets the next rule (and then the clan
+# pipeline) handle the message.
+STATIC_RULES = (
+    # Who are you
+    (
+        frozenset({"WHO_ARE_YOU"}),
+        "I am KARSB, Clan Data Assistant for the Ancient Ruins clan.\n\n"
+        "I specialize only in Ancient Ruins clan coc-data. "
+        "I can help you with monthly stats, performance, and rankings.",
+    ),
+    # What can you do
+    (
+        frozenset({"WHAT_CAN_YOU_DO"}),
+        "I can help you with:\n"
+        "- Clan member statistics by month\n"
+        "- Former clan member coc-data\n"
+        "- Top clan contributors\n"
+        "- Rankings (top, lowest, averages, totals)\n"
+        "- Player comparisons\n"
+        "- Grouped performance analysis\n\n"
+        "All coc-data is specific to the Ancient Ruins clan.",
+    ),
+    # What metrics can I ask about
+    (
+        frozenset({"WHAT_METRICS"}),
+        "You can ask about the following metrics:\n"
+        + ", ".join(sorted(METRIC_EXPLANATIONS.keys())),
+    ),
+    # What does <metric> mean
+    (frozenset({"WHAT_DOES", "MEAN"}), _metric_meaning_reply),
+    # Thanks / Thank you
+    (
+        frozenset({"THANKS"}),
+        "You're welcome! If you need more clan insights, just ask.",
+    ),
+)
+
+def static_reply(text: str) -> str | None:
+    """
+    Returns the fixed reply of a help, greeting or informational message.
+
+    The message is scanned once (see query_features) and its features are
+    matched against STATIC_RULES in order.
+
+    Parameters:
+        text (str): Stripped user input text.
+
+    Returns:
+        str | None:
+            - The static reply if the message is not a clan query.
+            - None if the message must go through the clan pipeline.
+    """
+
+    # HELP COMMAND (MUST BE FIRST)
+    if text.lower() in HELP_COMMANDS:
+        return HELP_REPLY
+
+    # INPUT CLASSIFICATION
+    reply = CATEGORY_REPLIES.get(classify_input(text))
+    if reply:
+        return reply
+
+    # STATIC / INFORMATIONAL QUERIES
+    features = extract_features(text)
+
+    for required, reply in STATIC_RULES:
+        if required <= features:
+            reply = reply(features) if callable(reply) else reply
+            if reply:
+                return reply
+
+    return None
+
 def build_suggestions(result: dict, domain: str, month_value: str) -> list[str]:
     """
     Build contextual follow-up suggestions.
@@ -170,54 +374,52 @@ def build_suggestions(result: dict, domain: str, month_value: str) -> list[str]:
 
     return pick(pool)
 
-def handle_chat(user_text: str) -> dict:
+def build_history_suggestions(result: dict) -> list[str]:
+    """
+    Build follow-up suggestions for cross-month (history) answers.
     """
-    Main chatbot entry point.
 
-    This function processes a single user query end-to-end and returns
-    a structured response for consumption by a UI or API client.
+    metric = result.get("metric") or "warattack"
+    player = result.get("player")
 
-    High-level responsibilities:
-    - Enforce input constraints (length, emptiness)
-    - Handle help, greeting, and informational queries
-    - Normalize and validate month or month-range expressions
-    - Determine the correct coc-data domain to query
-    - Fetch structured clan coc-data from GitHub-hosted JSON
-    - Resolve the analytical operation requested by the user
-    - Convert structured results into a human-readable response
-    - Attach source links and contextual follow-up suggestions
+    pool = [
+        f"best month for {metric}",
+        f"worst month for {metric}",
+        f"{metric} trend",
+        "clanscore trend",
+    ]
 
-    The function is fully deterministic: given the same input and coc-data,
-    it will always produce the same output.
+    if player:
+        pool += [
+            f"{player}'s {metric} trend",
+            f"{player}'s best month for {metric}",
+            f"{player}'s best month for clanscore",
+        ]
 
-    Processing flow:
-        1. Validate raw input
-        2. Handle static and conversational queries
-        3. Normalize month information
-        4. Route to the appropriate dataset domain
-        5. Fetch dataset for the resolved month
-        6. Resolve the requested operation
-        7. Build a formatted response
-        8. Attach source metadata and suggestions
+    pool = list(dict.fromkeys(pool))
+    return random.sample(pool, min(3, len(pool)))
 
-    Parameters:
-        user_text (str): Raw input text provided by the user.
+def _build_sections(cache_key: tuple | None, operation_result: dict, month_value: str):
+    """
+    Yields the reply sections and caches the full reply once complete.
+    """
 
-    Returns:
-        dict:
-            A structured response object with the following keys:
-            - reply (str): Human-readable chatbot response
-            - source (str | None): GitHub raw URL of the dataset used
-            - suggestions (list[str]): Contextual follow-up questions
+    parts = []
 
-    Error handling:
-        - Gracefully handles invalid input, missing coc-data, unsupported
-          operations, and ambiguous queries.
-        - Provides helpful clarification prompts instead of failing silently.
+    for section in iter_response(operation_result, month_value):
+        parts.append(section)
+        yield section
 
-    This function represents the public conversational interface of
-    AR STATS BOT and should be treated as the system’s primary control
-    surface.
+    if cache_key is not None:
+        result_cache.put(cache_key, operation_result, "".join(parts))
+
+def _handle_chat(user_text: str, datasets: dict | None = None) -> dict:
+    """
+    Runs the chatbot pipeline shared by handle_chat and handle_chat_stream.
+
+    Returns a response dict in which the reply is given either as text
+    ("reply") or, for resolved operations, as an iterator of reply
+    sections ("sections") that is consumed by the caller.
     """
 
     if len(user_text) > 500:
@@ -228,7 +430,6 @@ def handle_chat(user_text: str) -> dict:
         }
 
     text = user_text.strip()
-    text_lower = text.lower()
 
     # EMPTY INPUT
     if not text:
@@ -238,171 +439,31 @@ def handle_chat(user_text: str) -> dict:
             "suggestions": [],
         }
 
-    # HELP COMMAND (MUST BE FIRST)
-    if text_lower in {"help", "/help", "commands"}:
+    # HELP, GREETINGS AND STATIC / INFORMATIONAL QUERIES
+    reply = static_reply(text)
+    if reply:
         return {
-            "reply": (
-                "Here’s what I can help you with (Ancient Ruins clan only):\n\n"
-
-                "GENERAL\n"
-                "- who are you\n"
-                "- what can you do\n"
-                "- what metrics can I ask about\n"
-                "- what does warattack mean\n"
-                "- what does clanscore mean\n\n"
-
-                "PLAYER INFORMATION\n"
-                "- display coc-data of Chief in APR 2025\n"
-                "- display coc-data of KAI HIWATARI in APR 2025\n"
-                "- what is Chief's warattack in APR 2025\n"
-                "- what is Chief's clancapital in APR 2025\n"
-                "- what is the status of Chief in APR 2025\n\n"
-
-                "CLAN MEMBERS\n"
-                "- list all clan members in APR 2025\n"
-                "- is Chief a clan member in APR 2025\n\n"
-
-                "FORMER CLAN MEMBERS\n"
-                "- list all former members in DEC 2024\n"
-                "- display coc-data of KING SEENU in DEC 2024\n"
-                "- is KING SEENU a former member in DEC 2024\n\n"
-
-                "TOP CLAN CONTRIBUTORS\n"
-                "- who had the highest clanscore in APR 2025\n"
-                "- top 10 clanscore in APR 2025\n"
-                "- is Bennie in top contributors for APR 2025\n\n"
-
-                "RANKINGS\n"
-                "- who had the highest warattack in APR 2025\n"
-                "- who had the lowest warattack in APR 2025\n"
-                "- who had the lowest non-zero warattack in APR 2025\n"
-                "- top 10 warattack in APR 2025\n"
-                "- top 5 lowest clanscore in APR 2025\n"
-                "- who had the highest clancapital in APR 2025\n\n"
-
-                "STATISTICS\n"
-                "- average warattack in APR 2025\n"
-                "- average clanscore in APR 2025\n"
-                "- total warattack in APR 2025\n"
-                "- total clanscore in APR 2025\n"
-                "- total clancapital in APR 2025\n\n"
-
-                "GROUPING\n"
-                "- group warattack in APR 2025\n"
-                "- group clanscore in APR 2025\n"
-                "- group non-zero warattack in APR 2025\n\n"
-
-                "PLAYER COMPARISON\n"
-                "- compare Chief vs KAI HIWATARI in APR 2025\n"
-                "- compare Bennie vs Grandpa1 in APR 2025\n\n"
-
-                "SUPPORTED METRICS\n"
-                "- warattack\n"
-                "- clancapital\n"
-                "- clangames\n"
-                "- clangamesmaxed\n"
-                "- clanscore\n"
-                "- status (Clan Members only)\n\n"
-
-                "SUPPORTED DATE FORMAT\n"
-                "- APR 2025\n"
-                "- DEC 2024\n"
-                "- APR-MAY 2025 (Monthly Analysis)\n\n"
-
-                "NOTES\n"
-                "- Every clan query must include a month.\n"
-                "- Rankings automatically handle ties.\n"
-                "- 'Top N' refers to the top N unique values, not the number of players.\n"
-                "- Month ranges are supported only for Monthly Analysis.\n"
-                "- I only answer questions about the Ancient Ruins clan."
-            ),
+            "reply": reply,
             "source": None,
             "suggestions": [],
         }
 
-    # INPUT CLASSIFICATION
-    category = classify_input(text)
-
-    if category == "GREETING":
-        return {
-            "reply": (
-                "Hello! I am kARsb, Clan Data Assistant for the Ancient Ruins clan.\n\n"
-                "I specialize only in Ancient Ruins clan coc-data and can help you with:\n"
-                "- Monthly clan member statistics\n"
-                "- Performance analysis\n"
-                "- Rankings and comparisons\n\n"
-                "Type `help` to see example questions."
-            ),
-            "source": None,
-            "suggestions": [],
-        }
-
-    if category == "GIBBERISH":
-        return {
-            "reply": (
-                "I couldn’t understand your message.\n"
-                "Please ask something related to the Ancient Ruins clan "
-                "or type `help` to see example questions."
-            ),
-            "source": None,
-            "suggestions": [],
-        }
-
-    # STATIC / INFORMATIONAL QUERIES
-    # Who are you
-    if "who are you" in text_lower:
-        return {
-            "reply": (
-                "I am KARSB, Clan Data Assistant for the Ancient Ruins clan.\n\n"
-                "I specialize only in Ancient Ruins clan coc-data. "
-                "I can help you with monthly stats, performance, and rankings."
-            ),
-            "source": None,
-            "suggestions": [],
-        }
-
-    # What can you do
-    if "what can you do" in text_lower:
-        return {
-            "reply": (
-                "I can help you with:\n"
-                "- Clan member statistics by month\n"
-                "- Former clan member coc-data\n"
-                "- Top clan contributors\n"
-                "- Rankings (top, lowest, averages, totals)\n"
-                "- Player comparisons\n"
-                "- Grouped performance analysis\n\n"
-                "All coc-data is specific to the Ancient Ruins clan."
-            ),
-            "source": None,
-            "suggestions": [],
-        }
-
-    # What metrics can I ask about
-    if "what metrics" in text_lower:
-        metrics = ", ".join(sorted(METRIC_EXPLANATIONS.keys()))
-        return {
-            "reply": ("You can ask about the following metrics:\n" f"{metrics}"),
-            "source": None,
-            "suggestions": [],
-        }
+    # CROSS-MONTH (HISTORY) QUERIES
+    if detect_history_query(text):
+        history = get_history_index()
+        if history is None:
+            return {
+                "reply": "No monthly coc-data is available right now.",
+                "source": None,
+                "suggestions": [],
+            }
 
-    # What does <metric> mean
-    if "what does" in text_lower and "mean" in text_lower:
-        for metric, explanation in METRIC_EXPLANATIONS.items():
-            if metric in text_lower:
-                return {
-                    "reply": f"**{metric}** means:\n{explanation}",
-                    "source": None,
-                    "suggestions": [],
-                }
+        operation_result = resolve_history_operation(text, history)
 
-    # Thanks / Thank you
-    if any(k in text_lower for k in ("thanks", "thank you", "thnx")):
         return {
-            "reply": "You're welcome! If you need more clan insights, just ask.",
+            "sections": iter_response(operation_result, ""),
             "source": None,
-            "suggestions": [],
+            "suggestions": build_history_suggestions(operation_result),
         }
 
     # CLAN LOGIC
@@ -442,7 +503,10 @@ def handle_chat(user_text: str) -> dict:
         }
 
     # STEP C: Fetch coc-data
-    data = fetch_json_if_exists(domain, month_value)
+    if datasets is not None and (domain, month_value) in datasets:
+        data = datasets[(domain, month_value)]
+    else:
+        data = fetch_json_if_exists(domain, month_value)
     if data is None:
         return {
             "reply": f"No coc-data available for {month_value.replace('_', ' ')}.",
@@ -450,17 +514,41 @@ def handle_chat(user_text: str) -> dict:
             "suggestions": [],
         }
 
-    # STEP D: Resolve operation
-    operation_result = resolve_operation(text, domain, data)
-    if not operation_result:
-        return {
-            "reply": "I could not understand the requested operation.",
-            "source": None,
-            "suggestions": [],
-        }
+    # STEP D: Resolve operation (on the cached dataset index)
+    index = (
+        get_dataset_index(domain, month_value, data)
+        if isinstance(data, list) and data
+        else None
+    )
+
+    cache_key = None
+    cached = None
+
+    if index is not None:
+        cache_key = (
+            domain,
+            month_value,
+            index.version,
+            extract_intent(text, index),
+        )
+        cached = result_cache.get(cache_key)
+
+    if cached:
+        operation_result, reply_text = cached
+        sections = [reply_text]
+    else:
+        operation_result = resolve_operation(
+            text, domain, index if index is not None else data
+        )
+        if not operation_result:
+            return {
+                "reply": "I could not understand the requested operation.",
+                "source": None,
+                "suggestions": [],
+            }
 
-    # STEP E: Build response
-    reply_text = build_response(operation_result, month_value)
+        # STEP E: Build response (section by section)
+        sections = _build_sections(cache_key, operation_result, month_value)
 
     source_url = build_raw_url(domain, month_value)
 
@@ -470,4 +558,164 @@ def handle_chat(user_text: str) -> dict:
         month_value
     )
 
-    return {"reply": reply_text, "source": source_url, "suggestions": suggestions}
\ No newline at end of file
+    return {"sections": sections, "source": source_url, "suggestions": suggestions}
+
+def handle_chat(user_text: str, datasets: dict | None = None) -> dict:
+    """
+    Main chatbot entry point.
+
+    This function processes a single user query end-to-end and returns
+    a structured response for consumption by a UI or API client.
+
+    High-level responsibilities:
+    - Enforce input constraints (length, emptiness)
+    - Handle help, greeting, and informational queries
+    - Normalize and validate month or month-range expressions
+    - Determine the correct coc-data domain to query
+    - Fetch structured clan coc-data from GitHub-hosted JSON
+    - Resolve the analytical operation requested by the user
+    - Convert structured results into a human-readable response
+    - Attach source links and contextual follow-up suggestions
+
+    The function is fully deterministic: given the same input and coc-data,
+    it will always produce the same output.
+
+    Processing flow:
+        1. Validate raw input
+        2. Handle static and conversational queries
+        3. Normalize month information
+        4. Route to the appropriate dataset domain
+        5. Fetch dataset for the resolved month
+        6. Resolve the requested operation (or reuse a cached result)
+        7. Build a formatted response
+        8. Attach source metadata and suggestions
+
+    Parameters:
+        user_text (str): Raw input text provided by the user.
+        datasets (dict | None): Datasets already fetched for this request,
+            keyed by (domain, month). Used by batch requests so a dataset
+            shared by several messages is fetched only once.
+
+    Returns:
+        dict:
+            A structured response object with the following keys:
+            - reply (str): Human-readable chatbot response
+            - source (str | None): GitHub raw URL of the dataset used
+            - suggestions (list[str]): Contextual follow-up questions
+
+    Error handling:
+        - Gracefully handles invalid input, missing coc-data, unsupported
+          operations, and ambiguous queries.
+        - Provides helpful clarification prompts instead of failing silently.
+
+    This function represents the public conversational interface of
+    AR STATS BOT and should be treated as the system’s primary control
+    surface.
+    """
+
+    response = _handle_chat(user_text, datasets)
+
+    if "sections" in response:
+        response["reply"] = "".join(response.pop("sections"))
+
+    return {
+        "reply": response["reply"],
+        "source": response["source"],
+        "suggestions": response["suggestions"],
+    }
+
+def handle_chat_stream(user_text: str):
+    """
+    Streaming variant of handle_chat.
+
+    The query is classified, fetched and resolved exactly as in
+    handle_chat, but the reply is produced section by section (see
+    response_builder.iter_response), so large replies such as member
+    lists or grouped values can be displayed before they are complete.
+
+    Parameters:
+        user_text (str): Raw input text provided by the user.
+
+    Yields:
+        tuple[str, dict]:
+            - ("chunk", {"text": str}) for every reply section, in order
+            - ("done", {"source": str | None, "suggestions": list[str]})
+              once the reply is complete
+    """
+
+    response = _handle_chat(user_text)
+
+    sections = response.get("sections", [response.get("reply", "")])
+
+    for section in sections:
+        yield "chunk", {"text": section}
+
+    yield "done", {
+        "source": response["source"],
+        "suggestions": response["suggestions"],
+    }
+
+def _dataset_key(text: str) -> tuple[str, str] | None:
+    """
+    Returns the (domain, month) dataset a message will query, if any.
+
+    Mirrors the month normalization and domain routing steps of
+    handle_chat without fetching anything.
+    """
+
+    text = text.strip()
+
+    if not text or len(text) > 500 or detect_history_query(text.lower()):
+        return None
+
+    month_info = normalize_month(text)
+    month_value = month_info.get("value")
+    if not month_value:
+        return None
+
+    domain = route_domain(text, month_info)
+    if not domain:
+        return None
+
+    return domain, month_value
+
+def _load_dataset(key: tuple[str, str]) -> list | None:
+    """Fetches and indexes one (domain, month) dataset."""
+
+    domain, month_value = key
+
+    data = fetch_json_if_exists(domain, month_value)
+    if isinstance(data, list) and data:
+        get_dataset_index(domain, month_value, data)
+
+    return data
+
+def handle_chat_batch(messages: list[str]) -> list[dict]:
+    """
+    Answers several chatbot messages at once.
+
+    Messages are first grouped by the dataset (domain and month) they
+    query. Every distinct dataset is fetched and indexed exactly once,
+    with independent datasets loaded concurrently, and then each message
+    is answered by handle_chat from the preloaded datasets.
+
+    Parameters:
+        messages (list[str]): Raw user messages.
+
+    Returns:
+        list[dict]:
+            One response per message, in the same order, each with the
+            same keys as handle_chat (reply, source, suggestions).
+    """
+
+    keys = list(dict.fromkeys(
+        key for key in map(_dataset_key, messages) if key is not None
+    ))
+
+    if len(keys) > 1:
+        with ThreadPoolExecutor(max_workers=BATCH_FETCH_WORKERS) as pool:
+            datasets = dict(zip(keys, pool.map(_load_dataset, keys)))
+    else:
+        datasets = {key: _load_dataset(key) for key in keys}
+
+    return [handle_chat(message, datasets) for message in messages]
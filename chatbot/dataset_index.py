@@ -0,0 +1,262 @@
+# chatbot/dataset_index.py
+
+"""
+This module provides an indexed, read-only view over a fetched chatbot
+dataset so that the operation resolver can answer queries with direct
+lookups instead of rescanning every row.
+
+A dataset (one JSON file for a domain and month) is indexed once and the
+index is cached alongside the fetched JSON. The index precomputes:
+- A name → row hash map for player lookups
+- Per-metric sorted arrays of distinct numeric values
+- Value → player name buckets for rankings and grouping
+- Totals, counts and averages for aggregate statistics
+- A compiled player name matcher (see name_matcher)
+
+Per-metric structures are built lazily the first time a metric is
+queried, so datasets are never indexed for metrics nobody asks about.
+
+The index never modifies the underlying rows. Values are parsed with the
+same integer rules the resolver has always used, so results are
+identical to a linear scan of the raw dataset.
+"""
+
+# Importing Libraries
+from bisect import bisect_left
+from collections import OrderedDict
+from itertools import count
+import threading
+from chatbot.name_matcher import get_name_matcher
+
+# Maximum number of indexed datasets kept in memory
+INDEX_CACHE_SIZE = 64
+
+# Source of unique index versions
+_VERSIONS = count(1)
+
+class MetricIndex:
+    """
+    Precomputed view of a single metric across all rows of a dataset.
+
+    Rows whose value cannot be parsed as an integer are skipped, exactly
+    as the resolver skips them when scanning.
+
+    Attributes:
+        values (list[int]): Distinct parsed values in ascending order.
+        buckets (dict[int, list[str]]): Value → player names, in row order.
+        total (int): Sum of all parsed values.
+        count (int): Number of rows with a parseable value.
+        average (float | None): Mean value rounded to 2 decimals.
+        numeric (bool): Whether the first non-empty value is numeric.
+    """
+
+    def __init__(self, rows: list, metric: str):
+        """
+        Builds the metric index from the raw dataset rows.
+
+        Parameters:
+            rows (list): Dataset rows (dictionaries).
+            metric (str): Metric field to index.
+        """
+
+        buckets = {}
+        total = 0
+        count = 0
+        numeric = None
+
+        for row in rows:
+            raw = row.get(metric, 0)
+
+            try:
+                value = int(raw)
+            except (TypeError, ValueError):
+                if numeric is None and raw not in (None, ""):
+                    numeric = False
+                continue
+
+            if numeric is None:
+                numeric = True
+
+            buckets.setdefault(value, []).append(row.get("name"))
+            total += value
+            count += 1
+
+        self.values = sorted(buckets)
+        self.buckets = buckets
+        self.total = total
+        self.count = count
+        self.average = round(total / count, 2) if count else None
+        self.numeric = numeric is not False
+
+    def unique_values(self, highest: bool, non_zero: bool = False) -> list[int]:
+        """
+        Returns the distinct values of the metric in ranking order.
+
+        Parameters:
+            highest (bool): Sort descending when True, ascending otherwise.
+            non_zero (bool): Exclude the value 0 when True.
+
+        Returns:
+            list[int]: Distinct values in the requested order.
+        """
+
+        values = self.values
+
+        if non_zero:
+            i = bisect_left(values, 0)
+            if i < len(values) and values[i] == 0:
+                values = values[:i] + values[i + 1:]
+
+        return values[::-1] if highest else list(values)
+
+    def names_with(self, value: int) -> list[str]:
+        """
+        Returns the names of all players having exactly the given value.
+
+        Parameters:
+            value (int): Metric value.
+
+        Returns:
+            list[str]: Player names in dataset order.
+        """
+
+        return list(self.buckets.get(value, []))
+
+    def groups(self, non_zero: bool = False) -> dict[int, list[str]]:
+        """
+        Returns every value bucket, ordered by ascending value.
+
+        Parameters:
+            non_zero (bool): Exclude the value 0 when True.
+
+        Returns:
+            dict[int, list[str]]: Value → player names.
+        """
+
+        return {
+            value: list(self.buckets[value])
+            for value in self.values
+            if not (non_zero and value == 0)
+        }
+
+class DatasetIndex:
+    """
+    Indexed view of one dataset (a single domain and month).
+
+    Attributes:
+        rows (list): The original dataset rows.
+        names (list[str]): Name of every row, in dataset order.
+        by_name (dict[str, dict]): Player name → first matching row.
+        matcher (NameMatcher): Compiled matcher for the dataset's players.
+        version (int): Unique number of this index; a refreshed dataset
+            gets a new index and therefore a new version.
+    """
+
+    def __init__(self, rows: list):
+        """
+        Builds the name index for the given dataset rows.
+
+        Parameters:
+            rows (list): Dataset rows (dictionaries).
+        """
+
+        self.rows = rows
+        self.names = [row.get("name") for row in rows]
+
+        by_name = {}
+        for row in rows:
+            by_name.setdefault(row.get("name"), row)
+
+        self.by_name = by_name
+
+        self.matcher = get_name_matcher(self.names)
+
+        self.version = next(_VERSIONS)
+
+        self._metrics = {}
+
+    def row(self, player: str) -> dict | None:
+        """
+        Returns the first row of the given player, if present.
+
+        Parameters:
+            player (str): Exact player name.
+
+        Returns:
+            dict | None: The player's row, or None when not found.
+        """
+
+        return self.by_name.get(player)
+
+    def has_player(self, player: str) -> bool:
+        """
+        Checks whether the given player appears in the dataset.
+
+        Parameters:
+            player (str): Exact player name.
+
+        Returns:
+            bool: True if the player exists in the dataset.
+        """
+
+        return player in self.by_name
+
+    def metric(self, metric: str) -> MetricIndex:
+        """
+        Returns the metric index, building it on first use.
+
+        Parameters:
+            metric (str): Metric field name.
+
+        Returns:
+            MetricIndex: Precomputed metric view.
+        """
+
+        index = self._metrics.get(metric)
+
+        if index is None:
+            index = MetricIndex(self.rows, metric)
+            self._metrics[metric] = index
+
+        return index
+
+# (domain, month) → DatasetIndex, most recently used last
+_INDEX_CACHE = OrderedDict()
+_INDEX_LOCK = threading.Lock()
+
+def get_dataset_index(domain: str, month_value: str, data: list) -> DatasetIndex:
+    """
+    Returns the cached index of a dataset, building it when needed.
+
+    Indexes are cached per (domain, month). A cached index is reused only
+    while it still wraps the very same dataset object returned by the
+    fetcher, so a refreshed dataset is always re-indexed.
+
+    Parameters:
+        domain (str): Dataset domain identifier.
+        month_value (str): Normalized month or month-range identifier.
+        data (list): Fetched dataset rows.
+
+    Returns:
+        DatasetIndex: Index of the dataset.
+    """
+
+    key = (domain, month_value)
+
+    with _INDEX_LOCK:
+        index = _INDEX_CACHE.get(key)
+
+        if index is not None and index.rows is data:
+            _INDEX_CACHE.move_to_end(key)
+            return index
+
+    index = DatasetIndex(data)
+
+    with _INDEX_LOCK:
+        _INDEX_CACHE[key] = index
+        _INDEX_CACHE.move_to_end(key)
+
+        while len(_INDEX_CACHE) > INDEX_CACHE_SIZE:
+            _INDEX_CACHE.popitem(last=False)
+
+    return index
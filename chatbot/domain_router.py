@@ -18,6 +18,9 @@ This module does not inspect or manipulate the coc-data itself; it only selects
 the correct dataset domain identifier to be used by downstream components.
 """
 
+# Importing Libraries
+from chatbot.query_features import extract_features
+
 def route_domain(text: str, month_info: dict) -> str | None:
     """
     Determines the appropriate dataset domain for a user query.
@@ -54,11 +57,11 @@ def route_domain(text: str, month_info: dict) -> str | None:
     it prefers explicit routing rules and otherwise falls back to safe defaults.
     """
 
-    text = text.lower()
+    features = extract_features(text)
     month_type = month_info.get("type")
 
     # Former Clan Members
-    if "former" in text or "ex member" in text:
+    if "FORMER" in features:
         if month_type == "single":
             return "FORMER_CLAN_MEMBERS"
 
@@ -68,7 +71,7 @@ def route_domain(text: str, month_info: dict) -> str | None:
 
     # Top Clan Contributors (ONLY clanscore)
     if month_type == "single":
-        if "clanscore" in text and ("top" in text or "most" in text):
+        if "clanscore" in features and ("TOP" in features or "MOST" in features):
             return "TOP_CLAN_CONTRIBUTORS"
 
     # Clan Members (default)
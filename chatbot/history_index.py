@@ -0,0 +1,265 @@
+# chatbot/history_index.py
+
+"""
+This module provides a preloaded player × month view over the Clan Members
+monthly datasets, so the chatbot can answer cross-month questions such as
+"Chief's warattack trend from JAN 2025 to JUN 2025" or
+"best month for clanscore".
+
+Every monthly Clan Members file from the first tracked month up to the
+latest published month is fetched once (in parallel, through the cached
+raw fetcher) and merged into per-metric integer matrices with one row
+per player and one column per month. Queries then slice these matrices,
+so answering a question costs the same whether it spans two months or
+two years.
+
+The index is rebuilt only when one of the underlying monthly datasets
+changes (the raw fetcher returns a new object after revalidation).
+Months that are not published are simply absent from the index.
+"""
+
+# Importing Libraries
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import numpy as np
+from constants import CLAN_MONTHLY_PERFORMANCE_RANGE, LATEST_MONTH
+from chatbot.name_matcher import get_name_matcher
+from chatbot.raw_fetcher import POOL_SIZE, fetch_json_if_exists
+
+# Dataset domain the history is built from
+HISTORY_DOMAIN = "CLAN_MEMBERS"
+
+# First and last month of the history (e.g. "JUL_2024", "JUL_2026")
+HISTORY_START = CLAN_MONTHLY_PERFORMANCE_RANGE.split("_to_")[0]
+HISTORY_END = LATEST_MONTH
+
+# Metrics kept in the history matrices
+HISTORY_METRICS = (
+    "warattack",
+    "clancapital",
+    "clangames",
+    "clangamesmaxed",
+    "clanscore",
+)
+
+# Value stored for months a player has no (numeric) coc-data
+MISSING_VALUE = -1
+
+MONTH_CODES = (
+    "JAN", "FEB", "MAR", "APR", "MAY", "JUN",
+    "JUL", "AUG", "SEP", "OCT", "NOV", "DEC",
+)
+
+def month_key(month_value: str) -> tuple[int, int] | None:
+    """
+    Converts a normalized month into a sortable (year, month) key.
+
+    Parameters:
+        month_value (str): Normalized month, e.g. "APR_2025".
+
+    Returns:
+        tuple[int, int] | None:
+            - (year, month number) for a valid month.
+            - None if the value is not a single normalized month.
+    """
+
+    code, _, year = month_value.partition("_")
+
+    if code not in MONTH_CODES or not year.isdigit():
+        return None
+
+    return int(year), MONTH_CODES.index(code) + 1
+
+def history_months(start: str = HISTORY_START, end: str = HISTORY_END) -> list[str]:
+    """
+    Lists every month between two normalized months, oldest first.
+
+    Parameters:
+        start (str): First month, e.g. "JUL_2024".
+        end (str): Last month (inclusive).
+
+    Returns:
+        list[str]: Normalized months, e.g. ["JUL_2024", "AUG_2024", ...].
+    """
+
+    first = month_key(start)
+    last = month_key(end)
+
+    if first is None or last is None:
+        return []
+
+    year, month = first
+    months = []
+
+    while (year, month) <= last:
+        months.append(f"{MONTH_CODES[month - 1]}_{year}")
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+    return months
+
+class HistoryIndex:
+    """
+    Player × month matrices of the Clan Members metrics.
+
+    Attributes:
+        datasets (dict[str, list]): Monthly datasets the index was built from.
+        months (list[str]): Months with published coc-data, oldest first.
+        names (list[str]): Every player seen in any month.
+        player_index (dict[str, int]): Player name → matrix row.
+        values (dict[str, numpy.ndarray]): Metric → int32 array of shape
+            (players, months), MISSING_VALUE where a player has no value.
+        matcher (NameMatcher): Compiled matcher for all known players.
+    """
+
+    def __init__(self, datasets: dict):
+        """
+        Merges monthly datasets into the history matrices.
+
+        Parameters:
+            datasets (dict[str, list]): Normalized month → dataset rows.
+        """
+
+        self.datasets = datasets
+        self.months = sorted(datasets, key=month_key)
+        self._keys = [month_key(m) for m in self.months]
+
+        player_index = {}
+        for month in self.months:
+            for row in datasets[month]:
+                player_index.setdefault(row.get("name"), len(player_index))
+
+        player_index.pop(None, None)
+
+        self.player_index = player_index
+        self.names = list(player_index)
+        self.matcher = get_name_matcher(self.names)
+
+        shape = (len(player_index), len(self.months))
+        self.values = {
+            metric: np.full(shape, MISSING_VALUE, dtype=np.int32)
+            for metric in HISTORY_METRICS
+        }
+
+        for col, month in enumerate(self.months):
+            for row in datasets[month]:
+                i = player_index.get(row.get("name"))
+                if i is None:
+                    continue
+
+                for metric, matrix in self.values.items():
+                    # Keep the first row of duplicated names
+                    if matrix[i, col] != MISSING_VALUE:
+                        continue
+                    try:
+                        matrix[i, col] = int(row.get(metric))
+                    except (TypeError, ValueError):
+                        pass
+
+    def span(self, start: str | None = None, end: str | None = None) -> slice:
+        """
+        Returns the month columns between two months (both inclusive).
+
+        Parameters:
+            start (str | None): First month, or None for the oldest one.
+            end (str | None): Last month, or None for the latest one.
+
+        Returns:
+            slice: Column slice of the history matrices.
+        """
+
+        lo = 0 if start is None else bisect_left(self._keys, month_key(start))
+        hi = len(self.months) if end is None else bisect_right(self._keys, month_key(end))
+
+        return slice(lo, max(lo, hi))
+
+    def player_series(self, player: str, metric: str, columns: slice) -> list:
+        """
+        Returns a player's monthly values of one metric.
+
+        Parameters:
+            player (str): Exact player name.
+            metric (str): History metric.
+            columns (slice): Month columns (see span).
+
+        Returns:
+            list[tuple[str, int | None]]:
+                (month, value) pairs; value is None when the player has no
+                coc-data for that month.
+        """
+
+        row = self.values[metric][self.player_index[player], columns]
+
+        return [
+            (month, None if value == MISSING_VALUE else int(value))
+            for month, value in zip(self.months[columns], row)
+        ]
+
+    def clan_series(self, metric: str, columns: slice) -> list:
+        """
+        Returns the clan total of one metric for every month.
+
+        Parameters:
+            metric (str): History metric.
+            columns (slice): Month columns (see span).
+
+        Returns:
+            list[tuple[str, int]]: (month, total) pairs.
+        """
+
+        matrix = self.values[metric][:, columns]
+        totals = np.where(matrix == MISSING_VALUE, 0, matrix).sum(axis=0, dtype=np.int64)
+
+        return [(month, int(total)) for month, total in zip(self.months[columns], totals)]
+
+# Currently loaded history (built on first use)
+_history = None
+_history_lock = threading.Lock()
+
+# Worker threads used to fetch the monthly datasets concurrently
+_executor = ThreadPoolExecutor(max_workers=POOL_SIZE, thread_name_prefix="history")
+
+def _fetch_months(months: list[str]) -> dict:
+    """Fetches the Clan Members dataset of every month in parallel."""
+
+    results = _executor.map(lambda m: fetch_json_if_exists(HISTORY_DOMAIN, m), months)
+
+    return {
+        month: data
+        for month, data in zip(months, results)
+        if isinstance(data, list) and data
+    }
+
+def get_history_index() -> HistoryIndex | None:
+    """
+    Returns the history index, building it when needed.
+
+    Monthly datasets come from the raw fetcher's cache, so checking them
+    is cheap once loaded. The index is reused while every month still
+    returns the very same dataset object; otherwise it is rebuilt.
+
+    Returns:
+        HistoryIndex | None:
+            - The history index.
+            - None if no monthly coc-data could be retrieved.
+    """
+
+    global _history
+
+    datasets = _fetch_months(history_months())
+
+    if not datasets:
+        return None
+
+    with _history_lock:
+        history = _history
+
+        if (
+            history is None
+            or history.datasets.keys() != datasets.keys()
+            or any(history.datasets[m] is not datasets[m] for m in datasets)
+        ):
+            history = HistoryIndex(datasets)
+            _history = history
+
+        return history
@@ -14,7 +14,7 @@ rule-based to keep performance overhead low and behavior predictable.
 """
 
 # Importing Libraries
-import re
+from chatbot.query_features import extract_features
 
 # Greetings string
 GREETINGS = {
@@ -68,7 +68,7 @@ def classify_input(text: str) -> str:
     if (
         len(text) <= 8
         and text.isalpha()
-        and not re.search(r"(apr|may|jun|jul|aug|sep|oct|nov|dec|jan|feb)", text)
+        and "MONTH_ABBREVIATION" not in extract_features(text)
     ):
         return "GIBBERISH"
 
@@ -13,6 +13,10 @@ The normalization process is fully deterministic and rule-based, relying
 on regular expressions and predefined month mappings. No assumptions are
 made beyond explicit patterns found in the input text.
 
+All month names, abbreviations and year forms are compiled once into a
+single pattern, so each message is scanned in one pass instead of trying
+every month (and every pair of months) with its own search.
+
 This module plays a critical role in ensuring consistent coc-data access and
 preventing ambiguity when resolving time-based clan queries.
 """
@@ -49,6 +53,57 @@ MONTH_MAP = {
 
 YEAR_PATTERN = r"(20\d{2})"
 
+# Priority of each month word. When a message contains several candidate
+# dates, the one whose month words come first in MONTH_MAP wins (ties go
+# to the earliest position in the text).
+MONTH_RANK = {word: rank for rank, word in enumerate(MONTH_MAP)}
+
+# Longest words first so "september" is tried before "sep"
+_MONTH_WORDS = "|".join(sorted(MONTH_MAP, key=len, reverse=True))
+
+# "<month> <year>"
+SINGLE_MONTH_RE = re.compile(rf"\b({_MONTH_WORDS})\b\s+{YEAR_PATTERN}")
+
+# "<month>[-/space]<month> <year>"
+MONTH_RANGE_RE = re.compile(
+    rf"\b({_MONTH_WORDS})\b[\s\-]+\b({_MONTH_WORDS})\b\s+{YEAR_PATTERN}"
+)
+
+# Ranges and single months in one pass; the optional second month is
+# greedy, so a range is preferred wherever one starts
+MONTH_EXPRESSION_RE = re.compile(
+    rf"\b({_MONTH_WORDS})\b(?:[\s\-]+\b({_MONTH_WORDS})\b)?\s+{YEAR_PATTERN}"
+)
+
+# "<month> <year> to <month> <year>" (cross-month history queries)
+MONTH_SPAN_RE = re.compile(
+    rf"\b({_MONTH_WORDS})\b\s+{YEAR_PATTERN}\s*"
+    rf"(?:to|till|until|through|thru|-)\s*"
+    rf"\b({_MONTH_WORDS})\b\s+{YEAR_PATTERN}"
+)
+
+def _format_single(match_key: tuple) -> str:
+    """Formats a (month word, year) pair as "APR_2025"."""
+
+    word, year = match_key
+    return f"{MONTH_MAP[word]}_{year}"
+
+def _format_range(match_key: tuple) -> str:
+    """Formats a (month word, month word, year) triple as "APR-MAY_2025"."""
+
+    w1, w2, year = match_key
+    return f"{MONTH_MAP[w1]}-{MONTH_MAP[w2]}_{year}"
+
+def _best(candidates: list) -> tuple | None:
+    """
+    Picks the highest priority candidate.
+
+    Candidates are (rank, position, match groups) tuples; the lowest rank
+    wins and the earliest position breaks ties.
+    """
+
+    return min(candidates)[2] if candidates else None
+
 def extract_single_month(text: str) -> str | None:
     """
     Extracts and normalizes a single month reference from user input.
@@ -73,13 +128,13 @@ def extract_single_month(text: str) -> str | None:
 
     text = text.lower()
 
-    for word, code in MONTH_MAP.items():
-        match = re.search(rf"\b{word}\b\s+{YEAR_PATTERN}", text)
-        if match:
-            year = match.group(1)
-            return f"{code}_{year}"
+    candidates = [
+        (MONTH_RANK[m.group(1)], m.start(), m.groups())
+        for m in SINGLE_MONTH_RE.finditer(text)
+    ]
 
-    return None
+    best = _best(candidates)
+    return _format_single(best) if best else None
 
 def extract_month_range(text: str) -> str | None:
     """
@@ -104,23 +159,22 @@ def extract_month_range(text: str) -> str | None:
 
     text = text.lower()
 
-    for w1, c1 in MONTH_MAP.items():
-        for w2, c2 in MONTH_MAP.items():
-            pattern = rf"\b{w1}\b[\s\-]+\b{w2}\b\s+{YEAR_PATTERN}"
-            match = re.search(pattern, text)
-            if match:
-                year = match.group(1)
-                return f"{c1}-{c2}_{year}"
+    candidates = [
+        ((MONTH_RANK[m.group(1)], MONTH_RANK[m.group(2)]), m.start(), m.groups())
+        for m in MONTH_RANGE_RE.finditer(text)
+    ]
 
-    return None
+    best = _best(candidates)
+    return _format_range(best) if best else None
 
 def normalize_month(text: str) -> dict:
     """
     Performs unified month normalization for user queries.
 
-    This function serves as the public interface of the module. It attempts
-    to extract a month range first, followed by a single month if no range
-    is found. This priority avoids ambiguous interpretations.
+    This function serves as the public interface of the module. It scans
+    the text once for both month ranges and single months; a month range
+    takes priority, and a single month is used only if no range is found.
+    This priority avoids ambiguous interpretations.
 
     The returned structure clearly indicates whether the query refers to a
     single month, a range of months, or no recognizable time reference.
@@ -138,12 +192,52 @@ def normalize_month(text: str) -> dict:
     fetch datasets, and enforce time-based constraints consistently.
     """
 
-    month_range = extract_month_range(text)
-    if month_range:
-        return {"type": "range", "value": month_range}
+    text = text.lower()
+
+    ranges = []
+    singles = []
+
+    for m in MONTH_EXPRESSION_RE.finditer(text):
+        w1, w2, year = m.groups()
+
+        if w2:
+            ranges.append(((MONTH_RANK[w1], MONTH_RANK[w2]), m.start(), (w1, w2, year)))
+        else:
+            singles.append((MONTH_RANK[w1], m.start(), (w1, year)))
+
+    if ranges:
+        return {"type": "range", "value": _format_range(_best(ranges))}
+
+    if singles:
+        return {"type": "single", "value": _format_single(_best(singles))}
+
+    return {"type": None, "value": None}
+
+def extract_month_span(text: str) -> tuple[str, str] | None:
+    """
+    Extracts a span between two dated months from user input.
+
+    This function detects patterns such as:
+    - "from JAN 2025 to JUN 2025"
+    - "Nov 2024 - March 2025"
+
+    Unlike a month range ("APR-MAY 2025"), which names a single
+    Monthly Analysis dataset, a span covers every monthly dataset between
+    its two ends and is used for cross-month (history) queries.
+
+    Parameters:
+        text (str): Raw user input text.
+
+    Returns:
+        tuple[str, str] | None:
+            - (start, end) normalized months, e.g. ("JAN_2025", "JUN_2025"),
+              for the first span found in the text.
+            - None if no span is detected.
+    """
 
-    single = extract_single_month(text)
-    if single:
-        return {"type": "single", "value": single}
+    m = MONTH_SPAN_RE.search(text.lower())
+    if not m:
+        return None
 
-    return {"type": None, "value": None}
\ No newline at end of file
+    w1, y1, w2, y2 = m.groups()
+    return _format_single((w1, y1)), _format_single((w2, y2))
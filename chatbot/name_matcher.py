@@ -0,0 +1,212 @@
+# chatbot/name_matcher.py
+
+"""
+This module detects player names inside free-form chatbot queries.
+
+Instead of checking every known player name as a substring of the
+message, the roster is compiled once into a single regular expression.
+The expression is built from a character trie of the lower-cased names,
+so alternatives sharing a prefix are tested together and the scan costs
+one pass over the message regardless of roster size.
+
+Matching rules:
+- Case-insensitive (names and text are compared in lower case)
+- Longest match first: "KAI HIWATARI" wins over a player named "KAI"
+- Mentions never overlap and are reported in order of appearance
+
+Compiled matchers are cached per roster, so every dataset (domain and
+month) sharing the same players reuses the same automaton.
+
+The module also answers the reverse question used by fuzzy hints:
+which player names contain a given fragment of text.
+"""
+
+# Importing Libraries
+import re
+from bisect import bisect_right
+from functools import lru_cache
+
+def _trie_pattern(node: dict) -> str:
+    """
+    Converts a character trie into an equivalent regular expression.
+
+    A node that terminates a name and also has longer continuations is
+    emitted as a greedy optional group, so the regex engine always tries
+    the longest name first and backtracks to the shorter one.
+
+    Parameters:
+        node (dict): Trie node mapping characters to child nodes. The
+            empty-string key marks the end of a name.
+
+    Returns:
+        str: Regular expression fragment matching every name in the node.
+    """
+
+    alternatives = [
+        re.escape(char) + _trie_pattern(child)
+        for char, child in sorted(node.items())
+        if char
+    ]
+
+    if not alternatives:
+        return ""
+
+    if "" in node:
+        return "(?:" + "|".join(alternatives) + ")?"
+
+    if len(alternatives) == 1:
+        return alternatives[0]
+
+    return "(?:" + "|".join(alternatives) + ")"
+
+class NameMatcher:
+    """
+    Compiled multi-pattern matcher for a fixed roster of player names.
+
+    Attributes:
+        names (list[str]): Distinct player names in roster order.
+    """
+
+    def __init__(self, names):
+        """
+        Compiles the matcher for the given player names.
+
+        Empty names are ignored. When several names only differ in case,
+        the first one in roster order is reported.
+
+        Parameters:
+            names (Iterable[str]): Player names in roster order.
+        """
+
+        by_lower = {}
+        for name in names:
+            if name and isinstance(name, str):
+                by_lower.setdefault(name.lower(), name)
+
+        self.names = list(by_lower.values())
+        self._by_lower = by_lower
+
+        trie = {}
+        for lowered in by_lower:
+            node = trie
+            for char in lowered:
+                node = node.setdefault(char, {})
+            node[""] = {}
+
+        self._pattern = re.compile(_trie_pattern(trie)) if trie else None
+
+        # All names joined into one searchable string, with the offset of
+        # each name, for reverse (fragment → names) lookups
+        self._haystack = "\n".join(by_lower)
+        self._offsets = []
+        offset = 0
+        for lowered in by_lower:
+            self._offsets.append(offset)
+            offset += len(lowered) + 1
+
+    def find_all(self, text: str) -> list[tuple[str, int, int]]:
+        """
+        Finds every player mention in the text in a single pass.
+
+        Parameters:
+            text (str): Raw user input text.
+
+        Returns:
+            list[tuple[str, int, int]]:
+                (player name, start, end) for each mention, in order of
+                appearance. Positions refer to the lower-cased text.
+        """
+
+        if self._pattern is None:
+            return []
+
+        return [
+            (self._by_lower[m.group()], m.start(), m.end())
+            for m in self._pattern.finditer(text.lower())
+        ]
+
+    def first(self, text: str) -> str | None:
+        """
+        Returns the first player mentioned in the text.
+
+        Parameters:
+            text (str): Raw user input text.
+
+        Returns:
+            str | None: The player name, or None if no player is mentioned.
+        """
+
+        if self._pattern is None:
+            return None
+
+        m = self._pattern.search(text.lower())
+        return self._by_lower[m.group()] if m else None
+
+    def distinct(self, text: str) -> list[str]:
+        """
+        Returns the distinct players mentioned in the text.
+
+        Parameters:
+            text (str): Raw user input text.
+
+        Returns:
+            list[str]: Player names in order of first appearance.
+        """
+
+        return list(dict.fromkeys(name for name, _, _ in self.find_all(text)))
+
+    def names_containing(self, fragment: str) -> list[str]:
+        """
+        Returns every player name that contains the given fragment.
+
+        The comparison is case-insensitive and scans all names at once.
+
+        Parameters:
+            fragment (str): Partial player name.
+
+        Returns:
+            list[str]: Matching player names in roster order.
+        """
+
+        fragment = fragment.lower()
+
+        if not fragment:
+            return list(self.names)
+
+        if "\n" in fragment:
+            return []
+
+        matches = []
+        haystack = self._haystack
+        pos = haystack.find(fragment)
+
+        while pos != -1:
+            i = bisect_right(self._offsets, pos) - 1
+            matches.append(self.names[i])
+
+            # Continue with the next name
+            if i + 1 == len(self._offsets):
+                break
+
+            pos = haystack.find(fragment, self._offsets[i + 1])
+
+        return matches
+
+@lru_cache(maxsize=64)
+def _cached_matcher(names: tuple) -> NameMatcher:
+    """Builds and caches the matcher of one roster."""
+
+    return NameMatcher(names)
+
+def get_name_matcher(names) -> NameMatcher:
+    """
+    Returns the cached matcher for a roster of player names.
+
+    Parameters:
+        names (Iterable[str]): Player names in roster order.
+
+    Returns:
+        NameMatcher: Compiled matcher shared by identical rosters.
+    """
+
+    return _cached_matcher(tuple(names))
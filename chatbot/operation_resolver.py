@@ -27,6 +27,11 @@ expert-system–style inference engine.
 
 # Importing Libraries
 import re
+from chatbot.dataset_index import DatasetIndex
+from chatbot.history_index import HistoryIndex
+from chatbot.month_normalizer import extract_month_span
+from chatbot.query_features import extract_features
+from chatbot.name_matcher import get_name_matcher
 
 # DOMAIN → ALLOWED METRICS
 DOMAIN_ALLOWED_FIELDS = {
@@ -56,6 +61,25 @@ DOMAIN_ALLOWED_FIELDS = {
     "TOP_CLAN_CONTRIBUTORS": {"clanscore"},
 }
 
+# KEYWORD FEATURES READ BY resolve_operation (see query_features)
+RESOLVER_FEATURES = frozenset({
+    "LOWEST",
+    "TOP",
+    "MOST",
+    "NON_ZERO",
+    "TOTAL",
+    "AVERAGE",
+    "GROUP",
+    "MEMBERSHIP",
+    "COMPARE",
+    "STATUS",
+    "LIST",
+    "OF_WORD",
+    "OF",
+    "DISPLAY",
+    "SHOW",
+})
+
 # SUPPORTED METRICS
 SUPPORTED_METRICS = {
     "warattack",
@@ -82,24 +106,40 @@ def detect_metric(text: str) -> str | None:
             - None if no supported metric is referenced.
     """
 
-    text = text.lower()
+    features = extract_features(text)
     for m in SUPPORTED_METRICS:
-        if m in text:
+        if m in features:
             return m
     return None
 
-def detect_two_players(text: str, data: list) -> list[str]:
+def _get_matcher(data: "list | DatasetIndex"):
+    """
+    Returns the compiled player name matcher for a dataset.
+
+    Parameters:
+        data (list | DatasetIndex): Dataset rows or their index.
+
+    Returns:
+        NameMatcher: Cached matcher for the dataset's players.
+    """
+
+    if isinstance(data, DatasetIndex):
+        return data.matcher
+
+    return get_name_matcher(row.get("name", "") for row in data)
+
+def detect_two_players(text: str, data: "list | DatasetIndex") -> list[str]:
     """
     Detects exactly two distinct player names from the user query.
 
-    This function scans the input text against known player names present
-    in the dataset. It preserves the order of appearance and removes
-    duplicates. A valid result is returned only when exactly two unique
-    players are found.
+    All player mentions are found in one pass of the compiled name
+    matcher, longest name first. Players are returned in the order they
+    appear in the text, with duplicates removed. A valid result is
+    returned only when exactly two unique players are found.
 
     Parameters:
         text (str): Raw user input text.
-        data (list): Dataset containing player records.
+        data (list | DatasetIndex): Dataset rows or their index.
 
     Returns:
         list[str]:
@@ -107,19 +147,7 @@ def detect_two_players(text: str, data: list) -> list[str]:
             - An empty list otherwise.
     """
 
-    found = []
-    text_lower = text.lower()
-
-    for row in data:
-        name = row.get("name", "")
-        if name and name.lower() in text_lower:
-            found.append(name)
-
-    # remove duplicates while preserving order
-    unique = []
-    for n in found:
-        if n not in unique:
-            unique.append(n)
+    unique = _get_matcher(data).distinct(text)
 
     return unique if len(unique) == 2 else []
 
@@ -135,7 +163,7 @@ def detect_group_by(text: str) -> bool:
             True if the query contains grouping intent, False otherwise.
     """
 
-    return "group" in text.lower()
+    return "GROUP" in extract_features(text)
 
 def detect_average(text: str) -> bool:
     """
@@ -149,8 +177,7 @@ def detect_average(text: str) -> bool:
             True if average-related keywords are detected, False otherwise.
     """
 
-    text = text.lower()
-    return "average" in text or "avg" in text or "mean" in text
+    return "AVERAGE" in extract_features(text)
 
 def detect_total(text: str) -> bool:
     """
@@ -164,8 +191,7 @@ def detect_total(text: str) -> bool:
             True if total-related keywords are detected, False otherwise.
     """
 
-    text = text.lower()
-    return "total" in text or "sum" in text
+    return "TOTAL" in extract_features(text)
 
 def detect_top_n(text: str) -> int | None:
     """
@@ -202,8 +228,7 @@ def detect_membership_query(text: str) -> bool:
             True if membership-related intent is detected, False otherwise.
     """
 
-    text = text.lower()
-    return any(k in text for k in ("a member", "a former", "in top"))
+    return "MEMBERSHIP" in extract_features(text)
 
 def detect_non_zero(text: str) -> bool:
     """
@@ -217,19 +242,19 @@ def detect_non_zero(text: str) -> bool:
             True if non-zero filtering is requested, False otherwise.
     """
 
-    text = text.lower()
-    return "non-zero" in text or "non zero" in text
+    return "NON_ZERO" in extract_features(text)
 
-def detect_player_name(text: str, data: list) -> str | None:
+def detect_player_name(text: str, data: "list | DatasetIndex") -> str | None:
     """
     Detects a single player name referenced in the user query.
 
-    The function matches player names present in the dataset using a
-    case-insensitive substring search.
+    The function uses the compiled name matcher of the dataset
+    (case-insensitive, longest name first) and returns the first player
+    mentioned in the text.
 
     Parameters:
         text (str): Raw user input text.
-        data (list): Dataset containing player records.
+        data (list | DatasetIndex): Dataset rows or their index.
 
     Returns:
         str | None:
@@ -237,14 +262,41 @@ def detect_player_name(text: str, data: list) -> str | None:
             - None if no player name is detected.
     """
 
-    text_lower = text.lower()
-    for row in data:
-        name = row.get("name", "")
-        if name.lower() in text_lower:
-            return name
-    return None
+    return _get_matcher(data).first(text)
 
-def resolve_operation(text: str, domain: str, data: list) -> dict | None:
+def extract_intent(text: str, index: DatasetIndex) -> tuple:
+    """
+    Reduces a user query to the canonical intent read by the resolver.
+
+    The intent lists everything resolve_operation reads from the text:
+    metric, players, top-N and the keyword features in RESOLVER_FEATURES. Two queries with the same intent resolve to the same result
+    on the same dataset, whatever their wording, casing or spacing, so
+    the intent can be used as a result cache key.
+
+    Any new keyword feature read by resolve_operation must be added to
+    RESOLVER_FEATURES.
+
+    Parameters:
+        text (str): Raw user input text.
+        index (DatasetIndex): Index of the dataset being queried.
+
+    Returns:
+        tuple: Hashable canonical intent.
+    """
+
+    features = extract_features(text)
+
+    return (
+        detect_metric(text),
+        detect_player_name(text, index),
+        tuple(detect_two_players(text, index)) if "COMPARE" in features else (),
+        detect_top_n(text),
+        features & RESOLVER_FEATURES,
+    )
+
+def resolve_operation(
+    text: str, domain: str, data: "list | DatasetIndex"
+) -> dict | None:
     """
     Resolves the exact analytical operation requested by the user.
 
@@ -264,10 +316,16 @@ def resolve_operation(text: str, domain: str, data: list) -> dict | None:
     that more specific intents (such as player metrics) are handled before
     more general analytical operations.
 
+    All lookups go through the dataset index: player rows are fetched by
+    name, and rankings, groups, totals and averages come from precomputed
+    per-metric structures instead of rescanning the rows.
+
     Parameters:
         text (str): Raw user input text.
         domain (str): Resolved dataset domain identifier.
-        data (list): Structured dataset for the selected domain and month.
+        data (list | DatasetIndex): Structured dataset for the selected
+            domain and month, or its prebuilt index. A plain list is
+            indexed on the fly.
 
     Returns:
         dict | None:
@@ -284,19 +342,26 @@ def resolve_operation(text: str, domain: str, data: list) -> dict | None:
     """
 
     # Defensive guard
-    if not data or not isinstance(data, list):
+    if isinstance(data, DatasetIndex):
+        index = data
+    elif data and isinstance(data, list):
+        index = DatasetIndex(data)
+    else:
         return None
 
-    text_lower = text.lower()
+    if not index.rows:
+        return None
+
+    features = extract_features(text)
 
     # intent flags
-    is_lowest = any(k in text_lower for k in ("lowest", "least", "minimum", "min"))
-    is_highest = (("top" in text_lower) or ("most" in text_lower)) and not is_lowest
-    non_zero_only = detect_non_zero(text_lower)
-    top_n = detect_top_n(text_lower)
+    is_lowest = "LOWEST" in features
+    is_highest = ("TOP" in features or "MOST" in features) and not is_lowest
+    non_zero_only = "NON_ZERO" in features
+    top_n = detect_top_n(text)
 
     metric = detect_metric(text)
-    player = detect_player_name(text, data)
+    player = detect_player_name(text, index)
 
     # METRIC VALIDATION
     if metric:
@@ -309,80 +374,65 @@ def resolve_operation(text: str, domain: str, data: list) -> dict | None:
             }
 
         # numeric safety check
-        for row in data:
-            val = row.get(metric, 0)
-            if val in (None, ""):
-                continue
-            try:
-                int(val)
-            except (TypeError, ValueError):
-                return {
-                    "type": "ERROR_UNSUPPORTED_METRIC",
-                    "allowed": sorted(SUPPORTED_METRICS),
-                }
-            break
+        if not index.metric(metric).numeric:
+            return {
+                "type": "ERROR_UNSUPPORTED_METRIC",
+                "allowed": sorted(SUPPORTED_METRICS),
+            }
 
     # PLAYER METRIC (ABSOLUTE PRIORITY)
     if player and metric:
-        row = next(r for r in data if r.get("name") == player)
+        row = index.row(player)
         return {
             "type": "PLAYER_METRIC",
             "player": player,
             "metric": metric,
-            "value": int(row.get(metric, 0)),
+            # Typed rows carry None for a column the row lacks
+            "value": int(row.get(metric) or 0),
         }
 
-    if "status" in text_lower and domain != "CLAN_MEMBERS":
+    if "STATUS" in features and domain != "CLAN_MEMBERS":
         return {
             "type": "ERROR_FIELD_NOT_SUPPORTED",
             "field": "status",
             "allowed": sorted(DOMAIN_ALLOWED_FIELDS.get(domain, [])),
         }
 
-    if "most" in text_lower and not metric:
+    if "MOST" in features and not metric:
         return {
             "type": "ERROR_UNSUPPORTED_METRIC",
             "allowed": sorted(SUPPORTED_METRICS),
         }
 
-    if player and metric:
-        row = next(r for r in data if r.get("name") == player)
-        return {
-            "type": "PLAYER_METRIC",
-            "player": player,
-            "metric": metric,
-            "value": int(row.get(metric, 0)),
-        }
-
     # LIST NAMES
-    if "list" in text_lower:
+    if "LIST" in features:
         return {
             "type": "LIST_NAMES",
             "domain": domain,
-            "names": [row.get("name") for row in data],
+            "names": list(index.names),
         }
 
     # PLAYER INTENT GUARARD
-    if metric and " of " in text_lower and not player:
+    if metric and "OF_WORD" in features and not player:
         return {
             "type": "ERROR_PLAYER_NOT_FOUND",
-            "players": [row.get("name") for row in data],
+            "players": list(index.names),
         }
 
     # COMPARE TWO PLAYERS
-    if "compare" in text_lower:
-        players = detect_two_players(text, data)
+    if "COMPARE" in features:
+        players = detect_two_players(text, index)
 
         if not players:
             return {
                 "type": "ERROR_COMPARE_PLAYERS_NOT_FOUND",
-                "players": [row.get("name") for row in data],
+                "players": list(index.names),
             }
 
         p1, p2 = players
 
-        row1 = next(r for r in data if r.get("name") == p1)
-        row2 = next(r for r in data if r.get("name") == p2)
+        row1 = index.row(p1)
+        row2 = index.row(p2)
 
         # numeric metrics only
         metrics = DOMAIN_ALLOWED_FIELDS.get(domain, set()) - {"status"}
@@ -390,8 +440,8 @@ def resolve_operation(text: str, domain: str, data: list) -> dict | None:
         comparison = {}
         for m in metrics:
             try:
-                v1 = int(row1.get(m, 0))
-                v2 = int(row2.get(m, 0))
+                v1 = int(row1.get(m) or 0)
+                v2 = int(row2.get(m) or 0)
             except (TypeError, ValueError):
                 continue
 
@@ -406,105 +456,57 @@ def resolve_operation(text: str, domain: str, data: list) -> dict | None:
         return result
 
     # TOTAL OF METRIC
-    if metric and detect_total(text_lower):
-        total = 0
-        count = 0
+    if metric and "TOTAL" in features:
+        metric_index = index.metric(metric)
 
-        for row in data:
-            try:
-                v = int(row.get(metric, 0))
-            except (TypeError, ValueError):
-                continue
-
-            total += v
-            count += 1
-
-        if count == 0:
+        if metric_index.count == 0:
             return {"type": "ERROR_NO_DATA_FOR_TOTAL", "metric": metric}
 
         return {
             "type": "TOTAL_METRIC",
             "metric": metric,
-            "total": total,
-            "count": count,
+            "total": metric_index.total,
+            "count": metric_index.count,
         }
 
     # AVERAGE OF METRIC
-    if metric and detect_average(text_lower):
-        values = []
-        for row in data:
-            try:
-                v = int(row.get(metric, 0))
-            except (TypeError, ValueError):
-                continue
-            values.append(v)
+    if metric and "AVERAGE" in features:
+        metric_index = index.metric(metric)
 
-        if not values:
+        if metric_index.count == 0:
             return {"type": "ERROR_NO_DATA_FOR_AVERAGE", "metric": metric}
 
-        avg = sum(values) / len(values)
-
         return {
             "type": "AVERAGE_METRIC",
             "metric": metric,
-            "average": round(avg, 2),
-            "count": len(values),
+            "average": metric_index.average,
+            "count": metric_index.count,
         }
 
     # METRIC-BASED OPERATIONS
     if metric:
-        values = []
-        for row in data:
-            try:
-                v = int(row.get(metric, 0))
-            except (TypeError, ValueError):
-                continue
+        metric_index = index.metric(metric)
 
-            if non_zero_only and v == 0:
-                continue
-
-            values.append(v)
+        unique_values = metric_index.unique_values(is_highest, non_zero_only)
 
-        if not values:
+        if not unique_values:
             if non_zero_only:
                 return {"type": "ERROR_NO_NON_ZERO_VALUES", "metric": metric}
             return None
 
-        unique_values = sorted(set(values), reverse=is_highest)
-
         # GROUP BY VALUE (STAND-ALONE)
-        if detect_group_by(text_lower) and not top_n:
-            groups = {}
-            for row in data:
-                try:
-                    v = int(row.get(metric, 0))
-                except (TypeError, ValueError):
-                    continue
-
-                if non_zero_only and v == 0:
-                    continue
-
-                groups.setdefault(v, []).append(row.get("name"))
-
-            if not groups:
-                if non_zero_only:
-                    return {"type": "ERROR_NO_NON_ZERO_VALUES", "metric": metric}
-                return None
-
+        if "GROUP" in features and not top_n:
             return {
                 "type": "GROUP_BY_VALUE",
                 "metric": metric,
-                "groups": dict(sorted(groups.items())),
+                "groups": metric_index.groups(non_zero_only),
             }
 
         # TOP N (WITH TIES)
         if top_n:
             selected = unique_values[:top_n]
 
-            groups = {
-                v: [row.get("name") for row in data if int(row.get(metric, 0)) == v]
-                for v in selected
-            }
+            groups = {v: metric_index.names_with(v) for v in selected}
 
             return {
                 "type": "TOP_N_METRIC",
@@ -516,7 +518,7 @@ def resolve_operation(text: str, domain: str, data: list) -> dict | None:
 
         # SINGLE HIGHEST / LOWEST
         extreme = unique_values[0]
-        names = [row.get("name") for row in data if int(row.get(metric, 0)) == extreme]
+        names = metric_index.names_with(extreme)
 
         return {
             "type": "LEAST_OF_METRIC" if is_lowest else "MOST_OF_METRIC",
@@ -526,34 +528,129 @@ def resolve_operation(text: str, domain: str, data: list) -> dict | None:
         }
 
     # MEMBERSHIP / EXISTENCE CHECK
-    if detect_membership_query(text_lower) and player:
-        exists = any(row.get("name") == player for row in data)
-
+    if "MEMBERSHIP" in features and player:
         return {
             "type": "PLAYER_MEMBERSHIP_CHECK",
             "player": player,
             "domain": domain,
-            "exists": exists,
+            "exists": index.has_player(player),
         }
 
     # PLAYER-SPECIFIC QUERIES
     if player is None and (
-        "status" in text_lower
-        or "display" in text_lower
-        or ("of" in text_lower and metric)
+        "STATUS" in features
+        or "DISPLAY" in features
+        or ("OF" in features and metric)
     ):
         return {
             "type": "ERROR_PLAYER_NOT_FOUND",
-            "players": [row.get("name") for row in data],
+            "players": list(index.names),
         }
 
-    if domain == "CLAN_MEMBERS" and "status" in text_lower and player:
-        row = next(r for r in data if r.get("name") == player)
+    if domain == "CLAN_MEMBERS" and "STATUS" in features and player:
+        row = index.row(player)
         return {"type": "PLAYER_STATUS", "player": player, "status": row.get("status")}
 
-    if player and ("display" in text_lower or "show" in text_lower):
-        row = next(r for r in data if r.get("name") == player)
+    if player and ("DISPLAY" in features or "SHOW" in features):
+        row = index.row(player)
         return {"type": "PLAYER_FULL_DATA", "player": player, "coc-data": row}
 
     # FALLBACK
-    return {"type": "ERROR_UNCLEAR_OPERATION"}
\ No newline at end of file
+    return {"type": "ERROR_UNCLEAR_OPERATION"}
+
+def detect_history_query(text: str) -> bool:
+    """
+    Detects whether the user asks a cross-month (history) question.
+
+    History questions look at one metric over many months, e.g.
+    "Chief's warattack trend from JAN 2025 to JUN 2025" or
+    "best month for clanscore".
+
+    Parameters:
+        text (str): Normalized (lowercase) user input.
+
+    Returns:
+        bool: True if a history keyword is present.
+    """
+
+    return "HISTORY" in extract_features(text)
+
+def resolve_history_operation(text: str, history: HistoryIndex) -> dict:
+    """
+    Resolves a cross-month operation on the preloaded history index.
+
+    Supported operations:
+    - Trend: monthly values of one metric for a player, or the clan
+      total when no player is mentioned
+    - Best / worst month: the month with the highest (or lowest) value
+      of one metric for a player, or for the clan total
+
+    An optional span ("from JAN 2025 to JUN 2025") limits the months;
+    otherwise every available month is used. The work done is a slice of
+    the history matrices, independent of the span length.
+
+    Parameters:
+        text (str): Raw user input text.
+        history (HistoryIndex): Player × month history index.
+
+    Returns:
+        dict:
+            A structured result object of type HISTORY_TREND,
+            HISTORY_BEST_MONTH or an ERROR_* type.
+    """
+
+    features = extract_features(text)
+
+    metric = detect_metric(text)
+    if metric is None:
+        return {
+            "type": "ERROR_UNSUPPORTED_METRIC",
+            "allowed": sorted(SUPPORTED_METRICS),
+        }
+
+    player = history.matcher.first(text)
+
+    span = extract_month_span(text)
+    columns = history.span(*span) if span else history.span()
+
+    if player:
+        series = history.player_series(player, metric, columns)
+        series = [(month, value) for month, value in series if value is not None]
+    else:
+        series = history.clan_series(metric, columns)
+
+    if not series:
+        return {
+            "type": "ERROR_NO_HISTORY",
+            "metric": metric,
+            "player": player,
+            "months": history.months,
+        }
+
+    start, end = series[0][0], series[-1][0]
+
+    # BEST / WORST MONTH
+    if "BEST_MONTH" in features:
+        lowest = "WORST_MONTH" in features
+        value = (min if lowest else max)(v for _, v in series)
+
+        return {
+            "type": "HISTORY_BEST_MONTH",
+            "metric": metric,
+            "player": player,
+            "mode": "lowest" if lowest else "highest",
+            "value": value,
+            "months": [month for month, v in series if v == value],
+            "start": start,
+            "end": end,
+        }
+
+    # TREND
+    return {
+        "type": "HISTORY_TREND",
+        "metric": metric,
+        "player": player,
+        "series": series,
+        "start": start,
+        "end": end,
+    }
@@ -0,0 +1,143 @@
+# chatbot/query_features.py
+
+"""
+This module turns a user message into the set of keyword features used by
+the chatbot to choose a reply.
+
+The controller, classifier, router and resolver all ask the same kind of
+question about a message: does it mention "top", "average", "compare",
+"thanks", a metric name, and so on. Instead of each of them scanning the
+text for its own keywords, every keyword is compiled into one regular
+expression and the message is scanned once. The result is a frozen set
+of feature names that can be tested with constant-time lookups.
+
+Matching rules are exactly those of the original substring checks: a
+feature is present when any of its keywords occurs anywhere in the
+lowercase message (so "min" also matches inside "minimum").
+
+Features are memoized per message, so the scan happens once per request
+no matter how many components consult the features.
+"""
+
+# Importing Libraries
+import re
+from functools import lru_cache
+
+# CROSS-MONTH (HISTORY) KEYWORDS
+HISTORY_KEYWORDS = (
+    "trend",
+    "history",
+    "over time",
+    "month by month",
+    "best month",
+    "worst month",
+    "highest month",
+    "lowest month",
+)
+
+# Metric names (a metric name is its own feature)
+METRIC_KEYWORDS = (
+    "warattack",
+    "clancapital",
+    "clangames",
+    "clangamesmaxed",
+    "clanscore",
+)
+
+# FEATURE → KEYWORDS
+FEATURE_KEYWORDS = {
+    # Static / conversational queries
+    "WHO_ARE_YOU": ("who are you",),
+    "WHAT_CAN_YOU_DO": ("what can you do",),
+    "WHAT_METRICS": ("what metrics",),
+    "WHAT_DOES": ("what does",),
+    "MEAN": ("mean",),
+    "THANKS": ("thanks", "thank you", "thnx"),
+    "MONTH_ABBREVIATION": (
+        "jan", "feb", "apr", "may", "jun", "jul",
+        "aug", "sep", "oct", "nov", "dec",
+    ),
+
+    # Domain routing
+    "FORMER": ("former", "ex member"),
+
+    # Operation selection
+    "LOWEST": ("lowest", "least", "minimum", "min"),
+    "TOP": ("top",),
+    "MOST": ("most",),
+    "NON_ZERO": ("non-zero", "non zero"),
+    "TOTAL": ("total", "sum"),
+    "AVERAGE": ("average", "avg", "mean"),
+    "GROUP": ("group",),
+    "MEMBERSHIP": ("a member", "a former", "in top"),
+    "COMPARE": ("compare",),
+    "STATUS": ("status",),
+    "LIST": ("list",),
+    "OF_WORD": (" of ",),
+    "OF": ("of",),
+    "DISPLAY": ("display",),
+    "SHOW": ("show",),
+
+    # Cross-month queries
+    "HISTORY": HISTORY_KEYWORDS,
+    "BEST_MONTH": ("best month", "worst month", "highest month", "lowest month"),
+    "WORST_MONTH": ("worst month", "lowest month"),
+
+    **{metric: (metric,) for metric in METRIC_KEYWORDS},
+}
+
+def _compile(feature_keywords: dict):
+    """
+    Compiles the keyword table into one scanning pattern.
+
+    The pattern is a zero-width lookahead tried at every position of the
+    text, matching the longest keyword that starts there. Since every
+    keyword that is a prefix of the matched one also occurs at that
+    position, each keyword maps to the features of all its prefixes.
+
+    Parameters:
+        feature_keywords (dict[str, tuple[str]]): Feature → keywords.
+
+    Returns:
+        tuple[re.Pattern, dict[str, frozenset]]:
+            The compiled pattern and keyword → implied features.
+    """
+
+    features_of = {}
+    for feature, keywords in feature_keywords.items():
+        for keyword in keywords:
+            features_of.setdefault(keyword, set()).add(feature)
+
+    keywords = sorted(features_of, key=len, reverse=True)
+
+    implied = {
+        keyword: frozenset().union(
+            *(features_of[k] for k in features_of if keyword.startswith(k))
+        )
+        for keyword in keywords
+    }
+
+    pattern = re.compile(
+        "(?=(" + "|".join(re.escape(k) for k in keywords) + "))"
+    )
+
+    return pattern, implied
+
+_PATTERN, _IMPLIED = _compile(FEATURE_KEYWORDS)
+
+@lru_cache(maxsize=1024)
+def extract_features(text: str) -> frozenset:
+    """
+    Scans a message once and returns every keyword feature it contains.
+
+    Parameters:
+        text (str): Raw user input text (case is ignored).
+
+    Returns:
+        frozenset[str]:
+            Names of the features present, e.g. {"TOP", "clanscore"}.
+    """
+
+    found = {m.group(1) for m in _PATTERN.finditer(text.lower())}
+
+    return frozenset().union(*(_IMPLIED[k] for k in found))
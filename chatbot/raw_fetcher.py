@@ -10,17 +10,27 @@ Its primary role is to abstract away all details related to:
 - Fetching JSON content safely
 - Caching network requests for efficiency
 
+Each dataset is fetched with one GET over a pooled session. Results are
+cached with a time-to-live: found datasets for an hour (then revalidated
+with a conditional request), missing or failed ones for a minute.
+
 By isolating coc-data access logic in this module, the chatbot ensures that
 all network interaction is centralized, predictable, and optimized for
 low-resource environments.
 
-This module does not interpret or modify the coc-data it fetches. It simply
-retrieves raw structured content for downstream processing.
+Fetched files are parsed by the shared typed loader (month_store), the
+same one used by the graphs and the GitHub API: files are validated,
+numbers arrive as ints and missing values as None. The content is
+otherwise passed on unchanged for downstream processing.
 """
 
 # Importing Libraries
+import threading
+import time
+from collections import OrderedDict
 import requests
-from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from month_store import parse_month_file
 
 # Base RAW GitHub URL
 RAW_BASE = (
@@ -37,6 +47,26 @@ DOMAIN_PATHS = {
     "TOP_CLAN_CONTRIBUTORS": "Top%20Clan%20Contributors/JSON",
 }
 
+# Domain → month file kind (see month_store)
+DOMAIN_KINDS = {
+    "CLAN_MEMBERS": "members",
+    "CLAN_MONTHLY_ANALYSIS": "analysis",
+    "FORMER_CLAN_MEMBERS": "former",
+    "TOP_CLAN_CONTRIBUTORS": "contributors",
+}
+
+# Seconds a fetched dataset is served before it is revalidated
+POSITIVE_TTL = 3600
+
+# Seconds a missing file or failed request is remembered
+NEGATIVE_TTL = 60
+
+# Maximum number of URLs kept in the cache
+CACHE_SIZE = 128
+
+# Maximum number of pooled connections to GitHub
+POOL_SIZE = 8
+
 def _build_filename(domain: str, month_value: str) -> str:
     """
     Constructs the dataset filename based on domain and time context.
@@ -87,40 +117,88 @@ def build_raw_url(domain: str, month_value: str) -> str | None:
     filename = _build_filename(domain, month_value)
     return f"{RAW_BASE}/{path}/{filename}"
 
-@lru_cache(maxsize=128)
-def raw_file_exists(url: str) -> bool:
+class _CacheEntry:
     """
-    Checks whether a dataset file exists at the given URL.
+    Cached outcome of fetching one dataset URL.
 
-    This function performs an HTTP HEAD request to verify file existence
-    without downloading the full content. Results are cached to minimize
-    repeated network calls.
+    Attributes:
+        data (list | None): Parsed JSON content, or None when missing.
+        etag (str | None): ETag validator returned by the server.
+        last_modified (str | None): Last-Modified validator.
+        expires (float): Monotonic time after which the entry is stale.
+    """
 
-    Parameters:
-        url (str): Raw GitHub URL of the dataset.
+    __slots__ = ("data", "etag", "last_modified", "expires")
 
-    Returns:
-        bool:
-            True if the file exists and is accessible, False otherwise.
+    def __init__(self, data, etag=None, last_modified=None, ttl=0):
+        self.data = data
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires = time.monotonic() + ttl
 
-    Caching:
-        Results are cached using an LRU cache to improve performance and
-        reduce network overhead.
+# URL → _CacheEntry, most recently used last
+_CACHE = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
+# Shared HTTP session (created on first request)
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+def _get_session() -> requests.Session:
     """
+    Returns the shared HTTP session, creating it on first use.
 
-    try:
-        response = requests.head(url, timeout=3)
-        return response.status_code == 200
-    except requests.RequestException:
-        return False
+    The session keeps TCP/TLS connections to GitHub alive between
+    requests, so only the first query pays for the handshake.
+    """
+
+    global _SESSION
+
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=POOL_SIZE,
+                )
+                session.mount("https://", adapter)
+                _SESSION = session
+
+    return _SESSION
+
+def _store(url: str, entry: _CacheEntry) -> _CacheEntry:
+    """Stores a cache entry, evicting the least recently used ones."""
+
+    with _CACHE_LOCK:
+        _CACHE[url] = entry
+        _CACHE.move_to_end(url)
+
+        while len(_CACHE) > CACHE_SIZE:
+            _CACHE.popitem(last=False)
+
+    return entry
+
+def _url_kind(url: str) -> str | None:
+    """Returns the month file kind of a dataset URL, None if unknown."""
+
+    for domain, path in DOMAIN_PATHS.items():
+        if f"/{path}/" in url:
+            return DOMAIN_KINDS[domain]
+
+    return None
 
-@lru_cache(maxsize=64)
 def _fetch_json(url: str) -> list | None:
     """
     Fetches and parses JSON content from a raw GitHub URL.
 
-    This function performs an HTTP GET request and parses the response as
-    JSON. Results are cached to avoid repeated downloads of the same file.
+    Fresh cache entries are returned without any network access. Once an
+    entry expires, a single conditional GET revalidates it: a 304 reply
+    keeps the cached content (the very same object), a 200 reply replaces
+    it and a 404 reply records the dataset as missing, dropping any cached
+    copy. Network errors and other failed replies keep serving the cached
+    copy, if any. Month files are validated and typed by month_store
+    before they are cached.
 
     Parameters:
         url (str): Raw GitHub URL of the dataset.
@@ -128,26 +206,106 @@ def _fetch_json(url: str) -> list | None:
     Returns:
         list | None:
             - Parsed JSON content as a list if successful.
-            - None if the request fails or the content cannot be parsed.
+            - None if the file does not exist, the request fails or the
+              content cannot be parsed or validated.
 
     Caching:
-        Uses an LRU cache to store recently fetched datasets.
+        Datasets are cached for POSITIVE_TTL seconds. Missing files and
+        failures are cached for NEGATIVE_TTL seconds only, so newly
+        published months appear quickly and a transient error is retried
+        instead of being remembered as "missing".
     """
 
+    with _CACHE_LOCK:
+        entry = _CACHE.get(url)
+        if entry is not None:
+            _CACHE.move_to_end(url)
+
+    if entry is not None and time.monotonic() < entry.expires:
+        return entry.data
+
+    headers = {}
+    if entry is not None and entry.data is not None:
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+
     try:
-        response = requests.get(url, timeout=5)
+        response = _get_session().get(url, headers=headers, timeout=5)
+
+        if response.status_code == 304 and headers:
+            entry = _CacheEntry(
+                entry.data,
+                response.headers.get("ETag", entry.etag),
+                response.headers.get("Last-Modified", entry.last_modified),
+                POSITIVE_TTL,
+            )
+            return _store(url, entry).data
+
+        # A deleted or renamed file is missing, even if a copy is cached
+        if response.status_code == 404:
+            return _store(url, _CacheEntry(None, ttl=NEGATIVE_TTL)).data
+
         response.raise_for_status()
-        return response.json()
-    except requests.RequestException:
-        return None
+        data = response.json()
+
+        kind = _url_kind(url)
+        if kind is not None:
+            data = parse_month_file(data, kind).records()
+
+    except (requests.RequestException, ValueError):
+        # Keep serving the last good copy while the source is unavailable
+        # (network errors, 5xx or unparseable replies)
+        if entry is not None and entry.data is not None:
+            entry.expires = time.monotonic() + NEGATIVE_TTL
+            return entry.data
+
+        return _store(url, _CacheEntry(None, ttl=NEGATIVE_TTL)).data
+
+    entry = _CacheEntry(
+        data,
+        response.headers.get("ETag"),
+        response.headers.get("Last-Modified"),
+        POSITIVE_TTL,
+    )
+    return _store(url, entry).data
+
+def raw_file_exists(url: str) -> bool:
+    """
+    Checks whether a dataset file exists at the given URL.
+
+    Existence is derived from the same cached GET used to fetch datasets,
+    so checking a file and then reading it costs a single request.
+
+    Parameters:
+        url (str): Raw GitHub URL of the dataset.
+
+    Returns:
+        bool:
+            True if the file exists and is accessible, False otherwise.
+    """
+
+    return _fetch_json(url) is not None
+
+def clear_fetch_cache() -> None:
+    """
+    Drops every cached dataset and missing-file result.
+
+    The next query for any dataset goes back to the network.
+    """
+
+    with _CACHE_LOCK:
+        _CACHE.clear()
 
 def fetch_json_if_exists(domain: str, month_value: str) -> list | None:
     """
     Safely retrieves a dataset if it exists.
 
     This function serves as the public interface for coc-data retrieval. It
-    first constructs the expected dataset URL, verifies its existence,
-    and then fetches and returns the parsed JSON content.
+    constructs the expected dataset URL and fetches it with a single GET;
+    a missing file is detected from the response itself, so no separate
+    existence check is needed.
 
     If the dataset does not exist or cannot be accessed, the function
     returns None without raising exceptions.
@@ -169,7 +327,4 @@ def fetch_json_if_exists(domain: str, month_value: str) -> list | None:
     if not url:
         return None
 
-    if not raw_file_exists(url):
-        return None
-
-    return _fetch_json(url)
\ No newline at end of file
+    return _fetch_json(url)
@@ -39,6 +39,83 @@ def _safe_names(names: list) -> list[str]:
 
     return [str(n) for n in names if n is not None and str(n).strip()]
 
+def _list_title(domain: str, month_readable: str) -> str:
+    """
+    Return the title of a LIST_NAMES reply for the given domain.
+    """
+
+    if domain == "FORMER_CLAN_MEMBERS":
+        return f"Former clan members for {month_readable}"
+
+    if domain == "TOP_CLAN_CONTRIBUTORS":
+        return f"Top clan contributors for {month_readable}"
+
+    return f"Clan members for {month_readable}"
+
+# Operation types whose reply is a title followed by one line per entry
+LINE_TYPES = {"TOP_N_METRIC", "GROUP_BY_VALUE", "HISTORY_TREND"}
+
+# Number of lines (or names) sent per streamed section
+STREAM_CHUNK_SIZE = 25
+
+def _iter_lines(result: dict, month_readable: str):
+    """
+    Yield the reply lines of a line-based operation result.
+
+    Used by both build_response (joined at once) and iter_response
+    (streamed in sections), so the two always produce the same text.
+
+    Parameters:
+        result (dict):
+            Structured result of one of the LINE_TYPES.
+        month_readable (str):
+            Month identifier formatted for display (e.g., "APR 2025").
+
+    Yields:
+        str:
+            The title line, then one line per value or month.
+    """
+
+    rtype = result["type"]
+
+    # TOP N METRIC
+    if rtype == "TOP_N_METRIC":
+        metric = result["metric"]
+        limit = result["limit"]
+        mode = result["mode"]
+        groups = result["groups"]
+
+        yield f"Top {limit} {mode} {metric} in {month_readable}:"
+
+        for value in sorted(groups.keys(), reverse=(mode == "highest")):
+            names = _safe_names(groups[value])
+            yield f"{value}: {', '.join(names)}"
+
+    # GROUP BY VALUE
+    elif rtype == "GROUP_BY_VALUE":
+        metric = result["metric"]
+        groups = result["groups"]
+
+        yield f"{metric.capitalize()} grouped by value in {month_readable}:"
+
+        for value, names in groups.items():
+            safe = _safe_names(names)
+            yield f"{value}: {', '.join(safe)}"
+
+    # HISTORY TREND
+    elif rtype == "HISTORY_TREND":
+        metric = result["metric"]
+        player = result["player"]
+        period = f"{result['start']} to {result['end']}".replace("_", " ")
+
+        if player:
+            yield f"{player}'s {metric} from {period}:"
+        else:
+            yield f"Total clan {metric} from {period}:"
+
+        for month, value in result["series"]:
+            yield f"{month.replace('_', ' ')}: {value}"
+
 def build_response(result: dict, month_value: str) -> str:
     """
     Convert a structured operation result into a readable response string.
@@ -82,6 +159,10 @@ def build_response(result: dict, month_value: str) -> str:
         Displays aggregate statistics with player counts.
     - PLAYER_MEMBERSHIP_CHECK:
         Confirms whether a player exists in a given dataset.
+    - HISTORY_TREND:
+        Lists a player's (or the clan's) metric month by month.
+    - HISTORY_BEST_MONTH:
+        Names the month(s) with the highest or lowest metric value.
     - ERROR_*:
         Returns informative, user-friendly error messages.
 
@@ -106,14 +187,7 @@ def build_response(result: dict, month_value: str) -> str:
         if not names:
             return f"No coc-data found for {month_readable}."
 
-        if domain == "FORMER_CLAN_MEMBERS":
-            title = f"Former clan members for {month_readable}"
-        elif domain == "TOP_CLAN_CONTRIBUTORS":
-            title = f"Top clan contributors for {month_readable}"
-        else:
-            title = f"Clan members for {month_readable}"
-
-        return title + ":\n" + ", ".join(names)
+        return _list_title(domain, month_readable) + ":\n" + ", ".join(names)
 
     # TOTAL METRIC
     if rtype == "TOTAL_METRIC":
@@ -172,33 +246,9 @@ def build_response(result: dict, month_value: str) -> str:
 
         return "\n".join(lines)
 
-    # TOP N METRIC
-    if rtype == "TOP_N_METRIC":
-        metric = result["metric"]
-        limit = result["limit"]
-        mode = result["mode"]
-        groups = result["groups"]
-
-        lines = [f"Top {limit} {mode} {metric} in {month_readable}:"]
-
-        for value in sorted(groups.keys(), reverse=(mode == "highest")):
-            names = _safe_names(groups[value])
-            lines.append(f"{value}: {', '.join(names)}")
-
-        return "\n".join(lines)
-
-    # GROUP BY VALUE
-    if rtype == "GROUP_BY_VALUE":
-        metric = result["metric"]
-        groups = result["groups"]
-
-        lines = [f"{metric.capitalize()} grouped by value in {month_readable}:"]
-
-        for value, names in groups.items():
-            safe = _safe_names(names)
-            lines.append(f"{value}: {', '.join(safe)}")
-
-        return "\n".join(lines)
+    # TOP N METRIC / GROUP BY VALUE / HISTORY TREND
+    if rtype in LINE_TYPES:
+        return "\n".join(_iter_lines(result, month_readable))
 
     # PLAYER STATUS
     if rtype == "PLAYER_STATUS":
@@ -252,6 +302,19 @@ def build_response(result: dict, month_value: str) -> str:
         else:
             return f"No, {player} was not {domain_label} " f"in {month_readable}."
 
+    # HISTORY BEST / WORST MONTH
+    if rtype == "HISTORY_BEST_MONTH":
+        metric = result["metric"]
+        player = result["player"]
+        period = f"{result['start']} to {result['end']}".replace("_", " ")
+        months = ", ".join(m.replace("_", " ") for m in result["months"])
+        if player:
+            subject = f"{player}'s {result['mode']} {metric}"
+        else:
+            subject = f"The {result['mode']} total clan {metric}"
+
+        return f"{subject} from {period} was {result['value']}, in {months}."
+
     # ERRORS
     if rtype == "ERROR_UNSUPPORTED_METRIC":
         metrics = ", ".join(result["allowed"])
@@ -311,4 +374,72 @@ def build_response(result: dict, month_value: str) -> str:
             f"for {result['metric']} in {month_readable}."
         )
 
-    return "I could not process the request."
\ No newline at end of file
+    if rtype == "ERROR_NO_HISTORY":
+        months = result["months"]
+        available = (
+            f"{months[0]} to {months[-1]}".replace("_", " ") if months else "none"
+        )
+        subject = f"for {result['player']} " if result["player"] else ""
+        return (
+            f"No {result['metric']} coc-data {subject}in the requested months. "
+            f"Available months: {available}."
+        )
+
+    return "I could not process the request."
+
+def iter_response(result: dict, month_value: str, chunk_size: int = STREAM_CHUNK_SIZE):
+    """
+    Convert an operation result into a readable response, section by section.
+
+    This is the streaming counterpart of build_response. Large replies
+    (name lists, rankings, groups and trends) are yielded in sections of
+    `chunk_size` lines or names as soon as each section is formatted, so
+    a client can start rendering before the whole reply is built. Every
+    other result is yielded as a single section.
+
+    Joining all sections gives exactly the text of build_response.
+
+    Parameters:
+        result (dict):
+            Structured output from the operation_resolver module.
+        month_value (str):
+            Normalized month identifier (e.g., "APR_2025").
+        chunk_size (int):
+            Number of lines (or names) per section.
+
+    Yields:
+        str:
+            Consecutive pieces of the reply text.
+    """
+
+    rtype = result.get("type") if result else None
+    month_readable = month_value.replace("_", " ")
+
+    # LIST NAMES: title, then the comma-separated names in batches
+    if rtype == "LIST_NAMES" and _safe_names(result.get("names", [])):
+        names = _safe_names(result["names"])
+
+        yield _list_title(result.get("domain"), month_readable) + ":\n"
+
+        for i in range(0, len(names), chunk_size):
+            yield (", " if i else "") + ", ".join(names[i:i + chunk_size])
+
+        return
+
+    if rtype not in LINE_TYPES:
+        yield build_response(result, month_value)
+        return
+
+    batch = []
+    first = True
+
+    for line in _iter_lines(result, month_readable):
+        batch.append(line)
+
+        if len(batch) == chunk_size:
+            yield ("" if first else "\n") + "\n".join(batch)
+            batch = []
+            first = False
+
+    if batch:
+        yield ("" if first else "\n") + "\n".join(batch)
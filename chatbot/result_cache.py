@@ -0,0 +1,122 @@
+# chatbot/result_cache.py
+
+"""
+This module memoizes resolved chatbot queries.
+
+Many users ask the same questions ("top 10 clanscore in APR 2025"), often
+with different wording, casing or spacing. The chat controller reduces a
+query to its canonical intent (see operation_resolver.extract_intent) and
+uses it, together with the domain, month and dataset version, as the key
+of this cache. A hit returns the structured operation result and the
+built reply text without resolving the operation again.
+
+Keys include the version of the dataset index, so results computed from
+an outdated dataset are never served once the dataset is refreshed; they
+simply age out of the LRU.
+
+Only deterministic output is cached. Follow-up suggestions are randomized
+and are still generated for every request.
+"""
+
+# Importing Libraries
+from collections import OrderedDict
+import threading
+
+# Maximum number of cached query results
+RESULT_CACHE_SIZE = 512
+
+class ResultCache:
+    """
+    Thread-safe LRU cache of resolved queries with hit-rate counters.
+
+    Attributes:
+        maxsize (int): Maximum number of entries kept.
+        hits (int): Number of successful lookups.
+        misses (int): Number of lookups that found nothing.
+    """
+
+    def __init__(self, maxsize: int = RESULT_CACHE_SIZE):
+        """
+        Creates an empty cache.
+
+        Parameters:
+            maxsize (int): Maximum number of entries kept.
+        """
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> tuple | None:
+        """
+        Looks up a cached result and updates the counters.
+
+        Parameters:
+            key (tuple): Canonical query key.
+
+        Returns:
+            tuple | None:
+                - (operation result, reply text) if cached.
+                - None otherwise.
+        """
+
+        with self._lock:
+            value = self._entries.get(key)
+
+            if value is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: tuple, operation_result: dict, reply_text: str) -> None:
+        """
+        Stores a resolved query, evicting the least recently used ones.
+
+        Parameters:
+            key (tuple): Canonical query key.
+            operation_result (dict): Structured resolver output.
+            reply_text (str): Reply built from the result.
+        """
+
+        with self._lock:
+            self._entries[key] = (operation_result, reply_text)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        """
+        Returns the cache counters.
+
+        Returns:
+            dict:
+                - hits (int), misses (int), size (int)
+                - hit_rate (float): Share of lookups served from the cache.
+        """
+
+        with self._lock:
+            lookups = self.hits + self.misses
+
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def clear(self) -> None:
+        """Drops every entry and resets the counters."""
+
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+# Shared cache used by the chat controller
+result_cache = ResultCache()
@@ -0,0 +1,864 @@
+# cluster_store.py
+
+"""
+Persisted KMeans activity clusters of the monthly member datasets.
+
+The member cluster graph used to refit KMeans on every /ai/cluster/
+request. This module fits the clusters of a month once, stores the
+assignments, centroids and activity labels as JSON and serves them
+until the month file changes: results are keyed by a digest of the
+clustered content (player names and feature values), so an updated file
+is re-clustered and an unchanged one never is.
+
+Responsibilities:
+- Standardize the performance features and fit KMeans for every k of
+  CLUSTER_KS, keeping the k with the best silhouette score
+- Score the candidates with a vectorized silhouette sharing one distance
+  matrix between every k
+- Label clusters by activity tier ("Highly Active" ... "Less Active")
+- Cluster several months jointly (one row per player and month), so the
+  tiers of a player can be followed from month to month
+- Persist results as JSON files under CLUSTER_DIR and keep them in memory
+- Let a single process of a deployment precompute the clusters (lock
+  file in CLUSTER_DIR)
+- Provide the results as typed arrays (graphs) and as JSON (API)
+- Cluster players by their whole contribution trajectory (every metric
+  of every period of the performance cube) with a NumPy KMeans that
+  skips the periods a player was not in the clan, cached per cube
+  version
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from sklearn.cluster import KMeans
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory file locks
+    fcntl = None
+
+# Directory of the persisted cluster files
+CLUSTER_DIR = os.environ.get("CLUSTER_DIR", "cluster-cache")
+
+# Lock file (in CLUSTER_DIR) of the process precomputing the clusters
+WARMUP_LOCK = ".warmup.lock"
+
+# Activity labels per number of clusters, most active first
+ACTIVITY_LABELS = {
+    1: ("Highly Active",),
+    2: ("Highly Active", "Less Active"),
+    3: ("Highly Active", "Moderately Active", "Less Active"),
+    4: ("Highly Active", "Active", "Moderately Active", "Less Active"),
+    5: ("Highly Active", "Active", "Moderately Active", "Less Active", "Least Active"),
+}
+
+# Numbers of clusters evaluated, e.g. CLUSTER_KS=2,3,4,5
+CLUSTER_KS = tuple(
+    int(k) for k in os.environ.get("CLUSTER_KS", "2,3,4,5").split(",") if k.strip()
+)
+
+if not CLUSTER_KS or not set(CLUSTER_KS) <= set(ACTIVITY_LABELS) - {1}:
+    raise ValueError(f"CLUSTER_KS must be numbers from 2 to {max(ACTIVITY_LABELS)}")
+
+# Identifies the clustering method; part of every digest so that results
+# of a previous method are not reused
+CLUSTER_MODEL = "kmeans-standardized-silhouette"
+
+# Maximum number of results kept in memory
+CLUSTER_CACHE_SIZE = 64
+
+# Random initializations and iteration limit of the masked KMeans
+MASKED_KMEANS_RESTARTS = 4
+MASKED_KMEANS_MAX_ITER = 100
+
+
+class MonthClusters:
+    """
+    MonthClusters
+
+    KMeans clusters of one month dataset, or of several months clustered
+    jointly (one row per player and month).
+
+    Attributes:
+        month (str): Month (or month range) of the dataset, or the label
+            of the joint months
+        digest (str): Digest of the clustered content
+        features (list[str]): Feature columns, in centroid order
+        names (list[str]): Player name of every row
+        assignments (numpy.ndarray): Cluster of every row (int8)
+        centroids (numpy.ndarray): Cluster means in feature units
+            (clusters, features)
+        labels (list[str]): Activity label of every cluster
+        scores (dict): Silhouette score of every evaluated k
+        row_months (list[str] | None): Month of every row (joint months)
+    """
+
+    def __init__(
+        self,
+        month,
+        digest,
+        features,
+        names,
+        assignments,
+        centroids,
+        labels,
+        scores=None,
+        row_months=None,
+    ):
+        self.month = month
+        self.digest = digest
+        self.features = list(features)
+        self.names = list(names)
+        self.assignments = np.asarray(assignments, dtype=np.int8)
+        self.centroids = np.asarray(centroids, dtype=float).reshape(
+            len(labels), len(self.features)
+        )
+        self.labels = list(labels)
+        self.scores = dict(scores or {})
+        self.row_months = None if row_months is None else list(row_months)
+
+    @property
+    def k(self):
+        """Number of clusters."""
+
+        return len(self.labels)
+
+    def activity(self):
+        """Activity label of every row."""
+
+        return np.asarray(self.labels, dtype=object)[self.assignments]
+
+    def to_dict(self):
+        """
+        The clusters as a JSON-ready dictionary.
+
+        Returns:
+            dict: month, digest, model, k, silhouette score per evaluated
+            k, features, clusters (label and centroid per cluster) and
+            assignments (name, month for joint months, cluster and label
+            per row)
+        """
+
+        rows = zip(
+            self.names,
+            self.row_months or [None] * len(self.names),
+            self.assignments.tolist(),
+        )
+
+        return {
+            "month": self.month,
+            "digest": self.digest,
+            "model": CLUSTER_MODEL,
+            "k": self.k,
+            "silhouette": [
+                {"k": k, "score": score} for k, score in sorted(self.scores.items())
+            ],
+            "features": self.features,
+            "clusters": [
+                {
+                    "cluster": cluster,
+                    "label": label,
+                    "centroid": dict(zip(self.features, centroid)),
+                }
+                for cluster, (label, centroid) in enumerate(
+                    zip(self.labels, self.centroids.tolist())
+                )
+            ],
+            "assignments": [
+                {
+                    "name": name,
+                    **({"month": month} if month is not None else {}),
+                    "cluster": cluster,
+                    "label": self.labels[cluster],
+                }
+                for name, month, cluster in rows
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild clusters from the dictionary of to_dict."""
+
+        assignments = data["assignments"]
+        joint = bool(assignments) and "month" in assignments[0]
+
+        return cls(
+            data["month"],
+            data["digest"],
+            data["features"],
+            [row["name"] for row in assignments],
+            [row["cluster"] for row in assignments],
+            [
+                [cluster["centroid"][feature] for feature in data["features"]]
+                for cluster in data["clusters"]
+            ],
+            [cluster["label"] for cluster in data["clusters"]],
+            {row["k"]: row["score"] for row in data["silhouette"]},
+            [row["month"] for row in assignments] if joint else None,
+        )
+
+
+def content_digest(names, features, values, ks=CLUSTER_KS, row_months=None):
+    """
+    Digest of the content clustered for a month.
+
+    Args:
+        names (list[str]): Player name of every row
+        features (list[str]): Feature columns
+        values (numpy.ndarray): Feature values (rows, features)
+        ks (tuple[int]): Numbers of clusters evaluated
+        row_months (list[str] | None): Month of every row (joint months)
+
+    Returns:
+        str: Hexadecimal SHA-256 digest
+    """
+
+    digest = hashlib.sha256(CLUSTER_MODEL.encode())
+    digest.update(repr(tuple(ks)).encode())
+    digest.update("\x1f".join(features).encode())
+    digest.update("\x1f".join(map(str, names)).encode())
+    digest.update("\x1f".join(row_months or ()).encode())
+    digest.update(np.ascontiguousarray(values, dtype=np.float64).tobytes())
+
+    return digest.hexdigest()
+
+
+def standardize(values):
+    """
+    Scale every feature to zero mean and unit variance.
+
+    Constant features are only centred; an empty table is returned as is.
+
+    Args:
+        values (numpy.ndarray): Feature values (rows, features)
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: Scaled values,
+        feature means and feature scales
+    """
+
+    if not len(values):
+        return values, np.zeros(values.shape[1]), np.ones(values.shape[1])
+
+    mean = values.mean(axis=0)
+    scale = values.std(axis=0)
+    scale[scale == 0] = 1.0
+
+    return (values - mean) / scale, mean, scale
+
+
+def pairwise_distances(values):
+    """
+    Euclidean distances between every pair of rows.
+
+    Args:
+        values (numpy.ndarray): Feature values (rows, features)
+
+    Returns:
+        numpy.ndarray: Distance matrix (rows, rows)
+    """
+
+    squared = np.einsum("ij,ij->i", values, values)
+    distances = squared[:, None] + squared[None, :] - 2.0 * (values @ values.T)
+
+    np.maximum(distances, 0.0, out=distances)
+    np.fill_diagonal(distances, 0.0)
+
+    return np.sqrt(distances, out=distances)
+
+
+def silhouette_score(distances, assignments, k):
+    """
+    Mean silhouette coefficient of a clustering.
+
+    Vectorized: the distances of every row to every cluster are summed
+    with one matrix product, so a distance matrix computed once serves
+    every candidate k. Rows of single-row clusters score 0, as in
+    sklearn.metrics.silhouette_score.
+
+    Args:
+        distances (numpy.ndarray): Distance matrix (rows, rows)
+        assignments (numpy.ndarray): Cluster of every row, in [0, k)
+        k (int): Number of clusters
+
+    Returns:
+        float: Mean silhouette coefficient, from -1 to 1
+    """
+
+    rows = np.arange(len(assignments))
+    members = np.zeros((len(assignments), k))
+    members[rows, assignments] = 1.0
+
+    sizes = members.sum(axis=0)
+    totals = distances @ members
+
+    own_sizes = sizes[assignments]
+    inner = totals[rows, assignments] / np.maximum(own_sizes - 1, 1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        outer = totals / sizes
+        outer[:, sizes == 0] = np.inf
+        outer[rows, assignments] = np.inf
+        nearest = outer.min(axis=1)
+
+        coefficients = (nearest - inner) / np.maximum(inner, nearest)
+
+    coefficients[own_sizes == 1] = 0.0
+
+    return float(np.nan_to_num(coefficients).mean())
+
+
+def fit_clusters(
+    month, names, features, values, ks=CLUSTER_KS, row_months=None, digest=None
+):
+    """
+    Fit the activity clusters of a month (or of joint months).
+
+    Features are standardized so that every metric weighs the same. KMeans
+    is fitted for every k of `ks` that the rows allow, and the k with the
+    best silhouette score is kept (the smallest on ties). Clusters are then
+    ranked by the sum of their standardized means: the first is "Highly
+    Active". Fewer than three distinct rows give a single cluster.
+
+    Args:
+        month (str): Month (or month range) of the dataset
+        names (list[str]): Player name of every row
+        features (list[str]): Feature columns
+        values (numpy.ndarray): Feature values (rows, features), no NaN
+        ks (tuple[int]): Numbers of clusters evaluated
+        row_months (list[str] | None): Month of every row (joint months)
+        digest (str | None): Content digest, computed when omitted
+
+    Returns:
+        MonthClusters: Fitted clusters
+    """
+
+    values = np.asarray(values, dtype=np.float64)
+
+    if digest is None:
+        digest = content_digest(names, features, values, ks, row_months)
+
+    scaled, mean, scale = standardize(values)
+    distinct = len(np.unique(scaled, axis=0)) if len(scaled) else 0
+
+    scores = {}
+    assignments = np.zeros(len(values), dtype=np.int64)
+    k = 1 if len(values) else 0
+
+    candidates = [n for n in ks if n < distinct]
+
+    if candidates:
+        distances = pairwise_distances(scaled)
+        best = None
+
+        for n in candidates:
+            labels = KMeans(n_clusters=n, random_state=42).fit_predict(scaled)
+            scores[n] = silhouette_score(distances, labels, n)
+
+            if best is None or scores[n] > scores[best[0]]:
+                best = (n, labels)
+
+        k, assignments = best
+
+    centroids = np.array(
+        [values[assignments == cluster].mean(axis=0) for cluster in range(k)]
+    ).reshape(k, len(features))
+
+    # Most active cluster first
+    activity = ((centroids - mean) / scale).sum(axis=1)
+    ranks = np.empty(k, dtype=np.int64)
+    ranks[np.argsort(-activity, kind="stable")] = np.arange(k)
+
+    labels = [ACTIVITY_LABELS[k][rank] for rank in ranks] if k else []
+
+    return MonthClusters(
+        month,
+        digest,
+        features,
+        names,
+        assignments,
+        centroids,
+        labels,
+        scores,
+        row_months,
+    )
+
+
+class TrajectoryClusters:
+    """
+    TrajectoryClusters
+
+    Clusters of the players of the performance cube by contribution
+    trajectory.
+
+    Attributes:
+        version (int): Version of the cube the clusters were fitted on
+        names (list[str]): Player name of every clustered row (players
+            without any recorded period are left out)
+        metrics (tuple[str]): Metric keys of the profiles
+        periods (list[str]): Periods of the profiles, oldest first
+        assignments (numpy.ndarray): Cluster of every row (int8)
+        labels (list[str]): Activity label of every cluster
+        scores (dict): Silhouette score of every evaluated k
+        profiles (numpy.ndarray): Mean recorded value of every cluster,
+            metric and period (clusters, metrics, periods); NaN where no
+            member of the cluster has a value
+        sizes (numpy.ndarray): Number of players of every cluster
+    """
+
+    def __init__(
+        self, version, names, metrics, periods, assignments, labels, scores, profiles
+    ):
+        self.version = version
+        self.names = list(names)
+        self.metrics = tuple(metrics)
+        self.periods = list(periods)
+        self.assignments = np.asarray(assignments, dtype=np.int8)
+        self.labels = list(labels)
+        self.scores = dict(scores)
+        self.profiles = profiles
+        self.sizes = np.bincount(self.assignments, minlength=len(self.labels))
+
+    @property
+    def k(self):
+        """Number of clusters."""
+
+        return len(self.labels)
+
+
+def trajectory_features(cube):
+    """
+    Standardized contribution trajectories of the cube players.
+
+    Every metric is standardized over all recorded values (every player
+    and period), so the metrics weigh the same while each trajectory keeps
+    its shape over time.
+
+    Args:
+        cube (PerformanceCube): Performance cube
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: Cube rows of the
+        players with at least one recorded period, their trajectories
+        (rows, metrics × periods; 0 where missing) and the mask of
+        recorded values
+    """
+
+    rows = np.flatnonzero(cube.valid.any(axis=(1, 2)))
+    values = cube.values[rows].astype(np.float64)
+    mask = cube.valid[rows]
+
+    counts = mask.sum(axis=(0, 2))
+    totals = np.where(mask, values, 0.0).sum(axis=(0, 2))
+    mean = totals / np.maximum(counts, 1)
+
+    deviations = np.where(mask, values - mean[None, :, None], 0.0)
+    scale = np.sqrt((deviations**2).sum(axis=(0, 2)) / np.maximum(counts, 1))
+    scale[scale == 0] = 1.0
+
+    scaled = deviations / scale[None, :, None]
+
+    return rows, scaled.reshape(len(rows), -1), mask.reshape(len(rows), -1)
+
+
+def masked_distances(values, mask):
+    """
+    Distances between every pair of rows over the values both recorded.
+
+    The squared differences are averaged over the co-recorded values (and
+    scaled back to the full width), so rows recorded over different
+    periods stay comparable. Pairs without any common value are compared
+    as if their missing values were the mean (0).
+
+    Args:
+        values (numpy.ndarray): Standardized values, 0 where missing
+        mask (numpy.ndarray): Mask of recorded values
+
+    Returns:
+        numpy.ndarray: Distance matrix (rows, rows)
+    """
+
+    weights = mask.astype(np.float64)
+    squared = values**2
+
+    common = weights @ weights.T
+    sums = squared @ weights.T + weights @ squared.T - 2.0 * (values @ values.T)
+
+    np.maximum(sums, 0.0, out=sums)
+
+    fallback = pairwise_distances(values) ** 2
+    width = values.shape[1]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        distances = np.where(common > 0, sums / common * width, fallback)
+
+    np.fill_diagonal(distances, 0.0)
+
+    return np.sqrt(distances, out=distances)
+
+
+def _masked_sq_distances(values, weights, counts, centroids):
+    """
+    Mean squared distance of every row to every centroid, over the
+    recorded values of the row.
+    """
+
+    distances = (
+        (values**2).sum(axis=1)[:, None]
+        - 2.0 * (values @ centroids.T)
+        + weights @ (centroids**2).T
+    ) / counts[:, None]
+
+    return np.maximum(distances, 0.0, out=distances)
+
+
+def masked_kmeans(
+    values,
+    mask,
+    k,
+    restarts=MASKED_KMEANS_RESTARTS,
+    max_iter=MASKED_KMEANS_MAX_ITER,
+    seed=42,
+):
+    """
+    KMeans over partially recorded rows.
+
+    Distances and centroid updates only use the recorded values of every
+    row; all rows are processed at once with matrix products. Seeds are
+    chosen with k-means++, and the restart with the lowest inertia is kept.
+
+    Args:
+        values (numpy.ndarray): Standardized values (rows, features), 0
+            where missing
+        mask (numpy.ndarray): Mask of recorded values; every row must have
+            at least one
+        k (int): Number of clusters
+        restarts (int): Number of random initializations
+        max_iter (int): Maximum number of iterations per initialization
+        seed (int): Random seed
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray, float]: Cluster of every row,
+        centroids (k, features) and inertia
+    """
+
+    rng = np.random.default_rng(seed)
+    weights = mask.astype(np.float64)
+    counts = weights.sum(axis=1)
+    rows = np.arange(len(values))
+    best = None
+
+    for _ in range(restarts):
+        # k-means++ seeding; a seed row's missing values are the mean (0)
+        centroids = values[[rng.integers(len(values))]]
+
+        while len(centroids) < k:
+            nearest = _masked_sq_distances(values, weights, counts, centroids)
+            nearest = nearest.min(axis=1)
+            total = nearest.sum()
+            pick = (
+                rng.choice(len(values), p=nearest / total)
+                if total > 0
+                else rng.integers(len(values))
+            )
+            centroids = np.vstack([centroids, values[pick]])
+
+        assignments = None
+
+        for _ in range(max_iter):
+            distances = _masked_sq_distances(values, weights, counts, centroids)
+            updated = distances.argmin(axis=1)
+
+            if assignments is not None and np.array_equal(updated, assignments):
+                break
+
+            assignments = updated
+
+            members = np.zeros((len(values), k))
+            members[rows, assignments] = 1.0
+
+            sums = members.T @ values
+            recorded = members.T @ weights
+
+            # Features no member recorded keep their previous centre
+            centroids = np.where(
+                recorded > 0, sums / np.maximum(recorded, 1.0), centroids
+            )
+
+        inertia = float(distances[rows, updated].sum())
+
+        if best is None or inertia < best[2]:
+            best = (updated, centroids, inertia)
+
+    return best
+
+
+def fit_cube_clusters(cube, ks=CLUSTER_KS):
+    """
+    Cluster the players of the performance cube by contribution trajectory.
+
+    The masked KMeans is fitted for every k of `ks` the players allow, and
+    the k with the best silhouette score (on masked_distances) is kept.
+    Clusters are ranked by the mean of their standardized recorded values:
+    the first is "Highly Active".
+
+    Args:
+        cube (PerformanceCube): Performance cube
+        ks (tuple[int]): Numbers of clusters evaluated
+
+    Returns:
+        TrajectoryClusters: Clusters of the cube players
+    """
+
+    rows, values, mask = trajectory_features(cube)
+
+    scores = {}
+    k = 1 if len(rows) else 0
+    assignments = np.zeros(len(rows), dtype=np.int64)
+
+    distinct = len(np.unique(np.hstack([values, mask]), axis=0))
+    candidates = [n for n in ks if n < distinct]
+
+    if candidates:
+        distances = masked_distances(values, mask)
+        best = None
+
+        for n in candidates:
+            labels = masked_kmeans(values, mask, n)[0]
+
+            # A restart can leave a cluster empty: compact the labels
+            used, labels = np.unique(labels, return_inverse=True)
+            if len(used) < 2:
+                continue
+
+            scores[n] = silhouette_score(distances, labels, len(used))
+
+            if best is None or scores[n] > scores[best[0]]:
+                best = (n, labels, len(used))
+
+        if best is not None:
+            _, assignments, k = best
+
+    members = np.zeros((len(rows), k))
+    members[np.arange(len(rows)), assignments] = 1.0
+
+    weights = mask.astype(np.float64)
+    activity = (members.T @ values).sum(axis=1) / np.maximum(
+        (members.T @ weights).sum(axis=1), 1.0
+    )
+
+    # Renumber the clusters from the most to the least active
+    order = np.argsort(-activity, kind="stable")
+    ranks = np.empty(k, dtype=np.int64)
+    ranks[order] = np.arange(k)
+    assignments = ranks[assignments] if k else assignments
+
+    raw = cube.values[rows].astype(np.float64)
+    valid = cube.valid[rows]
+    profiles = np.full((k, len(cube.metrics), len(cube.periods)), np.nan)
+
+    for cluster in range(k):
+        selected = assignments == cluster
+        recorded = valid[selected].sum(axis=0)
+        totals = np.where(valid[selected], raw[selected], 0.0).sum(axis=0)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            profiles[cluster] = np.where(recorded > 0, totals / recorded, np.nan)
+
+    return TrajectoryClusters(
+        cube.version,
+        [cube.names[row] for row in rows],
+        cube.metrics,
+        cube.periods,
+        assignments,
+        list(ACTIVITY_LABELS[k]) if k else [],
+        scores,
+        profiles,
+    )
+
+
+# (cube version, ks) → TrajectoryClusters of the current cube version
+_cube_clusters = {}
+
+_cube_lock = threading.Lock()
+
+
+def cube_clusters(cube, ks=CLUSTER_KS):
+    """
+    Trajectory clusters of a cube, fitted once per cube version.
+
+    Args:
+        cube (PerformanceCube): Performance cube
+        ks (tuple[int]): Numbers of clusters evaluated
+
+    Returns:
+        TrajectoryClusters: Clusters of the cube players
+    """
+
+    key = (cube.version, tuple(ks))
+
+    with _cube_lock:
+        clusters = _cube_clusters.get(key)
+
+        if clusters is None:
+            clusters = fit_cube_clusters(cube, ks)
+
+            # Results of replaced cube versions are not needed anymore
+            for stale in [other for other in _cube_clusters if other[0] != cube.version]:
+                del _cube_clusters[stale]
+
+            _cube_clusters[key] = clusters
+
+    return clusters
+
+
+def _cluster_path(month, digest):
+    return os.path.join(CLUSTER_DIR, f"{month}_{digest[:16]}.json")
+
+
+def _read_clusters(month, digest):
+    """Persisted clusters of a month, or None when absent or stale."""
+
+    try:
+        with open(_cluster_path(month, digest), encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if data.get("digest") != digest or data.get("model") != CLUSTER_MODEL:
+        return None
+
+    return MonthClusters.from_dict(data)
+
+
+def _write_clusters(clusters):
+    """
+    Persist clusters and remove the files of previous versions of the
+    month. Persisting is best effort: a read-only disk only costs refits.
+    """
+
+    path = _cluster_path(clusters.month, clusters.digest)
+
+    try:
+        os.makedirs(CLUSTER_DIR, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=CLUSTER_DIR, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(clusters.to_dict(), f)
+        os.replace(tmp_path, path)
+
+        prefix = f"{clusters.month}_"
+        for entry in os.listdir(CLUSTER_DIR):
+            stale = os.path.join(CLUSTER_DIR, entry)
+            if entry.startswith(prefix) and entry.endswith(".json") and stale != path:
+                os.remove(stale)
+
+    except OSError:
+        pass
+
+
+# (month, digest) → MonthClusters, most recently used last
+_clusters = OrderedDict()
+
+_lock = threading.Lock()
+
+
+def month_clusters(month, names, features, values, ks=CLUSTER_KS, row_months=None):
+    """
+    Clusters of a month dataset: from memory, from disk, or fitted (and
+    persisted) when the content has not been clustered yet.
+
+    Args:
+        month (str): Month (or month range) of the dataset, or the label
+            of joint months
+        names (list[str]): Player name of every row
+        features (list[str]): Feature columns
+        values (numpy.ndarray): Feature values (rows, features), no NaN
+        ks (tuple[int]): Numbers of clusters evaluated
+        row_months (list[str] | None): Month of every row (joint months)
+
+    Returns:
+        MonthClusters: Clusters of the dataset
+    """
+
+    names = list(names)
+    features = list(features)
+    digest = content_digest(names, features, values, ks, row_months)
+    key = (month, digest)
+
+    with _lock:
+        clusters = _clusters.get(key)
+
+    if clusters is None:
+        clusters = _read_clusters(month, digest)
+
+    # Fitted outside the lock: a background precompute must not block
+    # requests for other months
+    if clusters is None:
+        clusters = fit_clusters(month, names, features, values, ks, row_months, digest)
+        _write_clusters(clusters)
+
+    with _lock:
+        _clusters[key] = clusters
+        _clusters.move_to_end(key)
+
+        while len(_clusters) > CLUSTER_CACHE_SIZE:
+            _clusters.popitem(last=False)
+
+    return clusters
+
+
+# Open WARMUP_LOCK file of this process, once claimed
+_warmup_file = None
+
+
+def claim_warmup():
+    """
+    Claim the cluster precomputation for this process.
+
+    The workers of a deployment share CLUSTER_DIR: the first process to
+    lock WARMUP_LOCK precomputes the clusters and holds the lock until it
+    exits, the others read the persisted results. Without fcntl every
+    process claims it; without a writable CLUSTER_DIR none does
+    (clusters are then fitted on request).
+
+    Returns:
+        bool: True when this process should precompute the clusters
+    """
+
+    global _warmup_file
+
+    if _warmup_file is not None or fcntl is None:
+        return True
+
+    try:
+        os.makedirs(CLUSTER_DIR, exist_ok=True)
+        handle = open(os.path.join(CLUSTER_DIR, WARMUP_LOCK), "a")
+    except OSError:
+        return False
+
+    try:
+        fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        handle.close()
+        return False
+
+    _warmup_file = handle
+
+    return True
+
+
+def clear_cluster_cache():
+    """Drop every in-memory result (persisted files are kept)."""
+
+    with _lock:
+        _clusters.clear()
+
+    with _cube_lock:
+        _cube_clusters.clear()
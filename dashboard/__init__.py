@@ -1,9 +1,15 @@
 from .player_dashboard import (
     get_players,
     build_dashboard,
+    get_dashboard_payload,
+    warm_dashboard_cache,
+    warm_dashboard_cache_async,
 )
 
 __all__ = [
     "get_players",
     "build_dashboard",
+    "get_dashboard_payload",
+    "warm_dashboard_cache",
+    "warm_dashboard_cache_async",
 ]
\ No newline at end of file
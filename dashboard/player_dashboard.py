@@ -2,12 +2,25 @@
 player_dashboard.py
 
 Main controller for the Interactive Player Dashboard.
+
+Built dashboards are cached per player for the current dataset version,
+together with their serialized JSON, and warmed in the background
+whenever a new dataset version is seen: on the first dashboard request
+of the process and right after every dataset reload (performance_store
+revalidates the dataset once its TTL has expired).
 """
 
+import threading
+
+from jinja2.utils import htmlsafe_json_dumps
+
+from performance_store import on_cube_reload
+
 from .player_data import (
     get_players,
     get_player,
     get_metric_values,
+    get_data_version,
 )
 
 from .player_statistics import (
@@ -62,7 +75,128 @@ def build_dashboard(player_name):
     return make_json_serializable(dashboard)
 
 
+# Dashboard payloads of the current dataset version
+_cache = {
+    "version": None,
+    "payloads": {},
+}
+
+_cache_lock = threading.Lock()
+
+
+def _get_payloads(warm=True):
+    """
+    Returns the payload cache of the current dataset version.
+
+    A new dataset version empties the cache and, unless warm is False,
+    starts warming it in the background.
+    """
+
+    global _cache
+
+    version = get_data_version()
+
+    cache = _cache
+
+    if cache["version"] == version:
+        return version, cache["payloads"]
+
+    with _cache_lock:
+
+        if _cache["version"] != version:
+
+            _cache = {
+                "version": version,
+                "payloads": {},
+            }
+
+            if warm:
+                warm_dashboard_cache_async()
+
+        return version, _cache["payloads"]
+
+
+@on_cube_reload
+def _reset_on_reload(cube):
+    """
+    Drops the dashboards of the replaced dataset and re-warms the cache.
+    """
+
+    _get_payloads()
+
+
+def get_dashboard_payload(player_name):
+    """
+    Returns the cached dashboard of one player.
+
+    Returns
+    -------
+    dict or None
+        data : dashboard dictionary (see build_dashboard)
+        json : HTML-safe serialized dashboard
+    """
+
+    version, payloads = _get_payloads()
+
+    payload = payloads.get(player_name)
+
+    if payload is not None:
+        return payload
+
+    dashboard = build_dashboard(player_name)
+
+    if dashboard is None:
+        return None
+
+    payload = {
+        "data": dashboard,
+        "json": htmlsafe_json_dumps(dashboard),
+    }
+
+    # Skip storing results of a dataset that was replaced meanwhile
+    if get_data_version() == version:
+        payloads[player_name] = payload
+
+    return payload
+
+
+def warm_dashboard_cache():
+    """
+    Builds the cached dashboard of every player.
+
+    Stops early when the dataset version changes.
+    """
+
+    version, _ = _get_payloads(warm=False)
+
+    for player_name in get_players():
+
+        if get_data_version() != version:
+            return
+
+        get_dashboard_payload(player_name)
+
+
+def warm_dashboard_cache_async():
+    """
+    Warms the dashboard cache in a background thread.
+    """
+
+    thread = threading.Thread(
+        target=warm_dashboard_cache,
+        name="dashboard-cache-warmup",
+        daemon=True,
+    )
+
+    thread.start()
+
+    return thread
+
+
 __all__ = [
     "get_players",
     "build_dashboard",
+    "get_dashboard_payload",
+    "warm_dashboard_cache",
+    "warm_dashboard_cache_async",
 ]
\ No newline at end of file
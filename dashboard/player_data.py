@@ -5,7 +5,7 @@ Data access layer for the Player Dashboard.
 
 Responsibilities
 ----------------
-• Load clan performance dataset
+• Load clan performance dataset (shared performance_store cube)
 • Retrieve players
 • Retrieve player data
 • Extract performance periods
@@ -14,24 +14,16 @@ Responsibilities
 This module contains NO graph generation and NO statistics.
 """
 
-from datetime import datetime
-
-import pandas as pd
-
-from constants import CLAN_MONTHLY_PERFORMANCE_RANGE
-
-# Dataset
-JSON_URL = (
-    "https://raw.githubusercontent.com/"
-    "Lightning-President-9/ClanDataRepo/"
-    "refs/heads/main/"
-    "Clan%20Members/"
-    "Clan%20Monthly%20Performance%20JSON/"
-    f"clan_monthly_performance_{CLAN_MONTHLY_PERFORMANCE_RANGE}.json"
+# Dataset location, month map and period ordering are shared with the
+# other performance consumers through performance_store
+from performance_store import (
+    JSON_URL,
+    MONTH_MAP,
+    period_sort_key,
+    get_performance_cube,
+    load_performance_cube,
 )
 
-df = pd.read_json(JSON_URL)
-
 # Metrics
 METRICS = {
     "War Attack": "warattack_",
@@ -41,71 +33,58 @@ METRICS = {
     "Clan Score": "clanscore_",
 }
 
-MONTH_MAP = {
-    "JAN": 1,
-    "FEB": 2,
-    "MAR": 3,
-    "APR": 4,
-    "MAY": 5,
-    "JUN": 6,
-    "JUL": 7,
-    "AUG": 8,
-    "SEP": 9,
-    "OCT": 10,
-    "NOV": 11,
-    "DEC": 12,
-}
+# Dataset (loaded on startup)
+get_performance_cube()
 
 
-def get_dataframe():
+def load_dataframe():
     """
-    Returns the complete dashboard dataframe.
+    Reloads the dataset and bumps the data version.
     """
 
-    return df.copy()
+    return load_performance_cube().frame
 
 
-def get_players():
+def get_dataframe():
     """
-    Returns all available player names.
+    Returns the complete dashboard dataframe.
     """
 
-    return df["name"].tolist()
+    return get_performance_cube().frame.copy()
 
 
-def get_player(player_name):
-    """
-    Returns a player's data as dictionary.
+def get_data_version():
     """
+    Returns the version of the currently loaded dataset.
 
-    player = df[df["name"] == player_name]
-
-    if player.empty:
-        return None
+    Incremented on every (re)load so derived results (rankings,
+    cached payloads) can tell when they are stale.
+    """
 
-    return player.iloc[0].to_dict()
+    return get_performance_cube().version
 
 
-def period_sort_key(period):
+def get_players():
     """
-    Sorts period chronologically.
+    Returns all available player names.
     """
 
-    try:
+    return list(get_performance_cube().names)
 
-        part, year = period.split("_")
 
-        start_month, end_month = part.split("-")
+def get_player(player_name):
+    """
+    Returns a player's data as dictionary.
+    """
 
-        year = int(year)
+    cube = get_performance_cube()
 
-        if start_month == "DEC" and end_month == "JAN":
-            year -= 1
+    row = cube.player_row(player_name)
 
-        return datetime(year, MONTH_MAP[start_month], 1)
+    if row is None:
+        return None
 
-    except Exception:
-        return datetime.max
+    return cube.frame.iloc[row].to_dict()
 
 
 def extract_periods():
@@ -113,94 +92,59 @@ def extract_periods():
     Returns every available period.
     """
 
-    periods = set()
-
-    for column in df.columns:
-
-        for prefix in METRICS.values():
-
-            if column.startswith(prefix):
-
-                periods.add(column.replace(prefix, ""))
-
-    return sorted(periods, key=period_sort_key)
+    return list(get_performance_cube().periods)
 
 
 def get_metric_values(player):
     """
     Returns metric values for all periods.
 
+    Periods before the player joined and after the player left are
+    trimmed; missing months inside that range are None.
+
     Returns
     -------
     periods
     metrics
     """
 
-    periods = extract_periods()
-
-    metric_values = {}
-
-    # Build all metric values while keeping -1
-    for metric, prefix in METRICS.items():
-
-        values = []
-
-        for period in periods:
-
-            value = player.get(prefix + period, -1)
-
-            if pd.isna(value):
-                value = -1
-
-            values.append(value)
+    cube = get_performance_cube()
 
-        metric_values[metric] = values
+    matrix = cube.player_matrix(player["name"])
 
-    # Find first month the player joined
-    first_valid = None
-
-    for values in metric_values.values():
-
-        for i, value in enumerate(values):
-
-            if value != -1:
-
-                if first_valid is None or i < first_valid:
-                    first_valid = i
-
-                break
-
-    # Find last month the player was in the clan
-    last_valid = None
+    if matrix is None:
+        return [], {}
 
-    for values in metric_values.values():
+    values, valid = matrix
 
-        for i in range(len(values) - 1, -1, -1):
+    # First and last month the player was in the clan
+    active = valid.any(axis=0).nonzero()[0]
 
-            if values[i] != -1:
+    # Player has no valid history
+    if not len(active):
+        return [], {}
 
-                if last_valid is None or i > last_valid:
-                    last_valid = i
+    first_valid, last_valid = active[0], active[-1] + 1
 
-                break
+    periods = cube.periods[first_valid:last_valid]
 
-    # Player has no valid history
-    if first_valid is None:
-        return [], {}
+    metric_values = {}
 
-    # Trim periods
-    periods = periods[first_valid : last_valid + 1]
+    for metric, prefix in METRICS.items():
 
-    # Trim every metric
-    for metric in metric_values:
-        metric_values[metric] = metric_values[metric][first_valid : last_valid + 1]
+        position = cube.metric_index[prefix.rstrip("_")]
 
-        # Replace remaining -1 with None
-        metric_values[metric] = [None if v == -1 else v for v in metric_values[metric]]
+        metric_values[metric] = [
+            value if present else None
+            for value, present in zip(
+                values[position, first_valid:last_valid].tolist(),
+                valid[position, first_valid:last_valid].tolist(),
+            )
+        ]
 
     return periods, metric_values
 
 
 def get_dashboard_players():
 
-    return df["name"].unique()
\ No newline at end of file
+    return get_performance_cube().frame["name"].unique()
\ No newline at end of file
@@ -11,8 +11,7 @@ Responsibilities
 
 import plotly.graph_objects as go
 import plotly.express as px
-from plotly.utils import PlotlyJSONEncoder
-import json
+from json_provider import dumps_figure
 from .player_rankings import compare_with_clan
 
 
@@ -21,7 +20,7 @@ def figure_to_json(fig):
     Convert Plotly figure to JSON.
     """
 
-    return json.dumps(fig, cls=PlotlyJSONEncoder)
+    return dumps_figure(fig)
 
 
 def comparison_chart(player_name):
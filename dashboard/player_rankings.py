@@ -8,81 +8,167 @@ Responsibilities
 • Calculate clan rankings
 • Calculate percentiles
 • Compare player against clan
+
+Rankings for the whole clan are computed once per dataset version and
+kept in an index, so looking up a single player is a dictionary access.
 """
 
+import threading
+
 import pandas as pd
 
-from .player_data import (
-    get_dataframe,
-    METRICS,
-)
+from performance_store import get_performance_cube
+
+from .player_data import METRICS
+
+# Rankings index of the current dataset version (built on first use)
+_index = None
 
+_index_lock = threading.Lock()
 
-def calculate_player_totals(df):
+
+def calculate_player_totals(cube):
     """
     Calculate total contribution of every player.
     """
 
     totals = pd.DataFrame()
 
-    totals["name"] = df["name"]
+    totals["name"] = cube.names
 
-    for metric, prefix in METRICS.items():
+    contributions = cube.contributions().sum(axis=2, dtype="int64")
 
-        columns = [c for c in df.columns if c.startswith(prefix)]
+    for metric, prefix in METRICS.items():
 
-        totals[metric] = df[columns].fillna(0).clip(lower=0).sum(axis=1)
+        totals[metric] = contributions[:, cube.metric_index[prefix.rstrip("_")]]
 
     return totals
 
 
-def get_player_ranks(player_name):
-    """
-    Returns player's rank for every metric.
+def build_rankings_index(cube):
     """
+    Build the clan-wide rankings index.
 
-    df = get_dataframe()
+    Ranks are computed for every metric at once: competition rank
+    (ties share the best rank, e.g. 1, 2, 2, 4) and dense rank
+    (1, 2, 2, 3). Percentiles follow the competition rank.
+
+    Returns
+    -------
+    dict
+        players        : name -> totals, ranks and percentiles
+        clan_average   : metric -> clan average
+        total_players  : number of ranked players
+    """
 
-    totals = calculate_player_totals(df)
+    totals = calculate_player_totals(cube)
 
-    rankings = {}
+    metrics = list(METRICS)
 
     total_players = len(totals)
 
-    for metric in METRICS:
+    values = totals[metrics]
+
+    ranks = values.rank(method="min", ascending=False).astype(int)
+
+    dense_ranks = values.rank(method="dense", ascending=False).astype(int)
 
-        ordered = totals.sort_values(metric, ascending=False).reset_index(drop=True)
+    if total_players:
+        percentiles = ((total_players - ranks) / total_players * 100).round(1)
+    else:
+        percentiles = ranks.astype(float)
 
-        rank = ordered.index[ordered["name"] == player_name][0] + 1
+    clan_average = {
+        metric: round(float(values[metric].mean()), 2) for metric in metrics
+    }
 
-        rankings[metric] = {
-            "rank": rank,
-            "total_players": total_players,
+    players = {}
+
+    rows = zip(
+        totals["name"],
+        values.itertuples(index=False),
+        ranks.itertuples(index=False),
+        dense_ranks.itertuples(index=False),
+        percentiles.itertuples(index=False),
+    )
+
+    for name, total, rank, dense_rank, percentile in rows:
+
+        # Keep the first row of duplicated names, like get_player
+        if name in players:
+            continue
+
+        players[name] = {
+            "totals": dict(zip(metrics, total)),
+            "ranks": {
+                metric: {
+                    "rank": int(rank[i]),
+                    "dense_rank": int(dense_rank[i]),
+                    "total_players": total_players,
+                }
+                for i, metric in enumerate(metrics)
+            },
+            "percentiles": dict(zip(metrics, map(float, percentile))),
         }
 
-    return rankings
+    return {
+        "players": players,
+        "clan_average": clan_average,
+        "total_players": total_players,
+    }
 
 
-def get_player_percentiles(player_name):
+def get_rankings_index():
     """
-    Returns percentile for every metric.
+    Returns the rankings index of the current dataset version.
     """
 
-    rankings = get_player_ranks(player_name)
+    global _index
 
-    percentiles = {}
+    cube = get_performance_cube()
 
-    for metric, value in rankings.items():
+    version = cube.version
 
-        rank = value["rank"]
+    index = _index
 
-        total = value["total_players"]
+    if index is not None and index["version"] == version:
+        return index
 
-        percentile = ((total - rank) / total) * 100
+    with _index_lock:
 
-        percentiles[metric] = round(percentile, 1)
+        if _index is None or _index["version"] != version:
 
-    return percentiles
+            index = build_rankings_index(cube)
+
+            index["version"] = version
+
+            _index = index
+
+        return _index
+
+
+def _get_player_entry(player_name):
+    """
+    Returns a player's entry of the rankings index.
+    """
+
+    return get_rankings_index()["players"].get(player_name)
+
+
+def get_player_ranks(player_name):
+    """
+    Returns player's rank for every metric.
+    """
+
+    return _get_player_entry(player_name)["ranks"]
+
+
+def get_player_percentiles(player_name):
+    """
+    Returns percentile for every metric.
+    """
+
+    return _get_player_entry(player_name)["percentiles"]
 
 
 def get_player_rating(player_name):
@@ -112,17 +198,7 @@ def get_clan_average():
     Average contribution of the clan.
     """
 
-    df = get_dataframe()
-
-    totals = calculate_player_totals(df)
-
-    averages = {}
-
-    for metric in METRICS:
-
-        averages[metric] = round(totals[metric].mean(), 2)
-
-    return averages
+    return get_rankings_index()["clan_average"]
 
 
 def get_player_totals(player_name):
@@ -130,24 +206,12 @@ def get_player_totals(player_name):
     Total contribution of one player.
     """
 
-    df = get_dataframe()
+    entry = _get_player_entry(player_name)
 
-    totals = calculate_player_totals(df)
-
-    player = totals[totals["name"] == player_name]
-
-    if player.empty:
+    if entry is None:
         return {}
 
-    player = player.iloc[0]
-
-    data = {}
-
-    for metric in METRICS:
-
-        data[metric] = player[metric]
-
-    return data
+    return entry["totals"]
 
 
 def compare_with_clan(player_name):
@@ -180,4 +244,4 @@ def get_ranking_summary(player_name):
         "rating": get_player_rating(player_name),
         "ranks": get_player_ranks(player_name),
         "comparison": compare_with_clan(player_name),
-    }
\ No newline at end of file
+    }
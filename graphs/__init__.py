@@ -20,7 +20,13 @@ from .clan_member_graph import ClanMemberGraph
 from .former_member_graph import FormerMemberGraph
 from .monthly_analysis_graph import MonthlyAnalysisGraph
 from .member_cluster_graph import MemberClusterGraph
-from .player_report import get_players, generate_player_report
+from .player_report import (
+    get_players,
+    generate_player_report,
+    iter_clan_report_zip,
+    iter_clan_report_pdf,
+    CLAN_PDF_MAX_PLAYERS,
+)
 from constants import (
     LATEST_MONTH,
     PREDICTED_MONTH,
@@ -37,6 +43,9 @@ __all__ = [
     "get_players",
     "MemberClusterGraph",
     "generate_player_report",
+    "iter_clan_report_zip",
+    "iter_clan_report_pdf",
+    "CLAN_PDF_MAX_PLAYERS",
     "LATEST_MONTH",
     "PREDICTED_MONTH",
     "LATEST_MONTH_RANGE",
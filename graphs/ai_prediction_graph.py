@@ -5,7 +5,8 @@ Provides AI-based performance prediction graphs for the
 Clash of Clans – Ancient Ruins Clan Website.
 
 This module:
-- Fetches historical monthly performance coc-data from a GitHub-hosted JSON source
+- Reads historical monthly performance coc-data from the shared
+  performance_store cube (GitHub-hosted JSON source)
 - Filters coc-data to include only currently active clan members
 - Applies linear regression to forecast future performance metrics
 - Generates interactive Plotly graphs with member-level selection
@@ -19,10 +20,11 @@ Technologies used:
 # importing libraries
 import pandas as pd
 import plotly.graph_objects as go
-import requests
 import warnings
 from sklearn.linear_model import LinearRegression
-from constants import LATEST_MONTH, PREDICTED_MONTH, CLAN_MONTHLY_PERFORMANCE_RANGE
+from constants import LATEST_MONTH, PREDICTED_MONTH
+from performance_store import get_performance_cube
+from month_store import load_month_file
 
 warnings.simplefilter(action="ignore", category=FutureWarning)
 
@@ -43,107 +45,53 @@ class AIPredictionGraph:
         """
         Initialize the AI prediction graph generator.
 
-        - Defines remote coc-data source URLs
-        - Builds a month-to-integer mapping for chronological sorting
-        - Loads and filters historical coc-data for active clan members
+        - Defines the active member list URL
+        - Loads the shared performance cube and selects active clan members
         """
 
-        self.main_data_url = (
-            "https://raw.githubusercontent.com/Lightning-President-9/ClanDataRepo/refs/heads/main/Clan%20Members/Clan%20Monthly%20Performance%20JSON/clan_monthly_performance_"
-            + CLAN_MONTHLY_PERFORMANCE_RANGE
-            + ".json"
-        )
         self.filter_names_url = (
             "https://raw.githubusercontent.com/Lightning-President-9/ClanDataRepo/refs/heads/main/Clan%20Members/JSON/"
             + LATEST_MONTH
             + ".json"
         )
 
-        self.month_map = {
-            "jan": 1,
-            "feb": 2,
-            "mar": 3,
-            "apr": 4,
-            "may": 5,
-            "jun": 6,
-            "jul": 7,
-            "aug": 8,
-            "sep": 9,
-            "oct": 10,
-            "nov": 11,
-            "dec": 12,
-        }
-
-        self.df_filtered = self._load_and_filter_data()
+        self.cube, self.active_rows = self._load_and_filter_data()
 
     def _load_and_filter_data(self):
         """
         Load historical performance coc-data and filter by active clan members.
 
-        - Fetches multi-month performance coc-data
-        - Replaces placeholder values with zero
+        - Takes the multi-month performance cube (periods already sorted)
         - Filters players based on the latest month member list
 
         Returns:
-            pandas.DataFrame: Filtered performance dataset
-        """
-
-        main_data = requests.get(self.main_data_url).json()
-        df = pd.DataFrame(main_data)
-        # df.replace(-1, 0, inplace=True)
-
-        may_data = requests.get(self.filter_names_url).json()
-        valid_names_upper = {entry["name"].strip().upper() for entry in may_data}
-
-        df_filtered = df[
-            df["name"].str.strip().str.upper().isin(valid_names_upper)
-        ].copy()
-        df_filtered.reset_index(drop=True, inplace=True)
-        return df_filtered
-
-    def _period_sort_key(self, col_name, prefix):
-        """
-        Generate a sortable key for period-based column names.
-
-        Converts column names such as 'warattack_dec-jan_2025' into a
-        chronologically sortable tuple accounting for year crossover.
-
-        Args:
-            col_name (str): Full column name containing period information
-            prefix (str): Metric prefix used in column naming
-
-        Returns:
-            tuple: Chronological sorting key
+            tuple[PerformanceCube, list[int]]: Performance cube and the
+            cube rows of active members
         """
 
-        period = col_name.replace(prefix, "").lower()  # e.g., "dec-jan_2025"
-        range_part, year_str = period.split("_")  # "dec-jan", "2025"
-        start_m, end_m = range_part.split("-")
+        cube = get_performance_cube()
 
-        # Year correction:
-        # "dec-jan_2025" means Dec 2024 to Jan 2025
-        y_end = int(year_str)
-        y_start = (
-            y_end if self.month_map[start_m] < self.month_map[end_m] else y_end - 1
-        )
+        members = load_month_file(self.filter_names_url, "members")
+        valid_names_upper = {name.strip().upper() for name in members.names if name}
 
-        return (y_start, self.month_map[start_m], y_end, self.month_map[end_m])
+        active_rows = [
+            row
+            for row, name in enumerate(cube.names)
+            if str(name).strip().upper() in valid_names_upper
+        ]
+        return cube, active_rows
 
     def forecast_plot(self, prefix):
         """
         Generate a forecast graph for a specific performance metric.
         """
 
-        df = self.df_filtered
-
-        metric_cols = [col for col in df.columns if col.startswith(prefix)]
+        cube = self.cube
 
-        sorted_cols = sorted(
-            metric_cols,
-            key=lambda col: self._period_sort_key(col, prefix)
-        )
+        # Player × period slice of the metric, with its -1 mask
+        metric_values, metric_valid = cube.metric_matrix(prefix)
 
-        periods = [col.replace(prefix, "").upper() for col in sorted_cols]
+        periods = [period.upper() for period in cube.periods]
 
         fig = go.Figure()
 
@@ -153,16 +101,14 @@ class AIPredictionGraph:
         # -----------------------
         # Add all player traces
         # -----------------------
-        for name in df["name"]:
-
-            row = df[df["name"] == name]
+        for row in self.active_rows:
 
-            values = row[sorted_cols].values.flatten().astype(float)
+            name = cube.names[row]
 
             # Remove months before joining
-            valid_mask = values != -1
+            valid_mask = metric_valid[row]
 
-            values = values[valid_mask]
+            values = metric_values[row][valid_mask].astype(float)
 
             if len(values) == 0:
                 continue
@@ -9,6 +9,8 @@ This module:
 - Aggregates clan-wide performance metrics across months
 - Produces multiple Plotly visualizations including line, bar, area,
   treemap, and heatmap charts
+- Builds the player heatmaps from the shared performance cube, for the
+  current members or every player, over a window of periods or quarters
 - Supports historical trend analysis and long-range performance insights
 
 Data is sourced from GitHub-hosted JSON files and processed using pandas.
@@ -21,7 +23,8 @@ import requests
 import warnings
 import re
 from datetime import datetime
-from constants import CLAN_MONTHLY_PERFORMANCE_RANGE
+from month_store import load_month_file
+from .heatmap_engine import heatmap_figures
 
 warnings.simplefilter(action="ignore", category=FutureWarning)
 
@@ -140,18 +143,17 @@ class AllMonthGraph:
 
         For each discovered month range, this method:
         - Constructs the appropriate GitHub raw JSON URL
-        - Downloads and parses the JSON coc-data
+        - Loads the typed month file through month_store (cached)
 
         Returns:
-            dict[str, list[dict]]: Mapping of month-range identifiers to raw records
+            dict[str, MonthTable]: Mapping of month-range identifiers to
+            typed month files
         """
 
         all_data = {}
         for month in self.months:
             url = f"{self.base_url}data_{month}.json"
-            response = requests.get(url)
-            response.raise_for_status()
-            all_data[month] = response.json()
+            all_data[month] = load_month_file(url, "analysis")
         return all_data
 
     def process_data(self, all_data):
@@ -164,7 +166,7 @@ class AllMonthGraph:
         - Preserves chronological month ordering
 
         Args:
-            all_data (dict): Raw monthly analysis coc-data keyed by month range
+            all_data (dict): Typed monthly analysis files keyed by month range
 
         Returns:
             pandas.DataFrame: Aggregated monthly performance totals
@@ -172,23 +174,16 @@ class AllMonthGraph:
 
         monthly_totals = []
 
-        for month, records in all_data.items():
+        for month, table in all_data.items():
             totals = {
                 "month": month,
-                "warattack": 0,
-                "clancapital": 0,
-                "clangames": 0,
-                "clangamesmaxed": 0,
-                "clanscore": 0,
+                "warattack": table.total("warattack"),
+                "clancapital": table.total("clancapital"),
+                "clangames": table.total("clangames"),
+                "clangamesmaxed": table.total("clangamesmaxed"),
+                "clanscore": table.total("clanscore"),
             }
 
-            for r in records:
-                totals["warattack"] += int(r.get("warattack", 0))
-                totals["clancapital"] += int(r.get("clancapital", 0))
-                totals["clangames"] += int(r.get("clangames", 0))
-                totals["clangamesmaxed"] += int(r.get("clangamesmaxed", 0))
-                totals["clanscore"] += int(r.get("clanscore", 0))
-
             monthly_totals.append(totals)
 
         df = pd.DataFrame(monthly_totals)
@@ -199,64 +194,36 @@ class AllMonthGraph:
 
         return df
 
-    def generate_heatmap_figures(self):
+    def generate_heatmap_figures(
+        self, players="active", start=None, end=None, last=None, aggregate="period"
+    ):
         """
         Generate heatmap visualizations for player-level monthly performance.
 
         This method:
-        - Fetches long-range clan performance coc-data
+        - Reads the shared performance cube (no request per call)
+        - Keeps the current members only, unless players is "all"
+        - Restricts the periods to a window and optionally sums them per
+          quarter (see graphs.heatmap_engine)
         - Creates one heatmap per performance metric
-        - Displays player vs. month intensity patterns
+
+        Args:
+            players (str): "active" or "all"
+            start (str, optional): First period of the window
+            end (str, optional): Last period of the window
+            last (int, optional): Keep only the last N periods
+            aggregate (str): "period" or "quarter"
 
         Returns:
-            list[plotly.graph_objects.Figure]: Heatmap figures for each metric
+            list[FigureSpec]: Heatmap figures for each metric
+
+        Raises:
+            ValueError: Unknown selection, aggregation or period
         """
 
-        url = (
-            "https://raw.githubusercontent.com/Lightning-President-9/ClanDataRepo/"
-            "refs/heads/main/Clan%20Members/Clan%20Monthly%20Performance%20JSON/"
-            "clan_monthly_performance_" + CLAN_MONTHLY_PERFORMANCE_RANGE + ".json"
+        return heatmap_figures(
+            players=players, start=start, end=end, last=last, aggregate=aggregate
         )
-        response = requests.get(url)
-        response.raise_for_status()
-
-        df = pd.DataFrame(response.json())
-
-        metrics = [
-            "warattack",
-            "clancapital",
-            "clangames",
-            "clangamesmaxed",
-            "clanscore",
-        ]
-        figures = []
-
-        for metric in metrics:
-            heatmap_df = df.set_index("name")[
-                [col for col in df.columns if col.startswith(metric + "_")]
-            ]
-            heatmap_df.replace(-1, None, inplace=True)
-
-            fig = px.imshow(
-                heatmap_df,
-                labels=dict(
-                    x="Month",
-                    y="Player",
-                    color=metric.replace("clangamesmaxed", "Clan Games Maxed")
-                    .capitalize()
-                    .replace("_", " "),
-                ),
-                x=[col.replace(f"{metric}_", "") for col in heatmap_df.columns],
-                y=heatmap_df.index,
-                title=f"Heatmap of {metric.replace('clangamesmaxed', 'Clan Games Maxed').capitalize()} per Month",
-                aspect="auto",
-                color_continuous_scale="Plasma",
-            )
-
-            fig.update_yaxes(tickfont=dict(size=10))
-            figures.append(fig)
-
-        return figures
 
     def plot_graphs(self, df):
         """
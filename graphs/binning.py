@@ -0,0 +1,245 @@
+# graphs/binning.py
+
+"""
+Server-side binning engine for the graph pages of the
+Clash of Clans – Ancient Ruins Clan Website.
+
+This module:
+- Computes "nice" histogram bin edges for a metric (round bin sizes,
+  integer metrics centred on whole numbers) and caches them per dataset
+  (metric and month)
+- Counts values per bin with numpy.histogram / numpy.histogram2d
+- Counts values per explicit range (pd.cut semantics) for the binned
+  pie charts
+- Encodes count arrays as Plotly typed arrays
+
+Histograms and density heatmaps used to ship every player's raw values
+and let the browser bin them; with this module the figures carry only
+the per-bin counts, so payloads are smaller and the browser draws the
+bins directly.
+"""
+
+# Importing Libraries
+import base64
+import math
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+# Number of bins used when a chart does not ask for a specific one
+DEFAULT_BINS = 20
+
+# Maximum number of cached bin-edge arrays
+EDGE_CACHE_SIZE = 256
+
+# Multipliers of a power of ten allowed as bin sizes
+NICE_STEPS = (1, 2, 2.5, 5, 10)
+
+_EDGES = OrderedDict()
+_EDGES_LOCK = threading.Lock()
+
+def _finite(values):
+    """Return the finite values of an array-like as float64."""
+
+    array = np.asarray(values, dtype=float)
+
+    return array[np.isfinite(array)]
+
+def nice_edges(values, nbins=DEFAULT_BINS):
+    """
+    Compute round bin edges covering every value.
+
+    The bin size is the smallest 1/2/2.5/5 × 10^k step giving at most
+    `nbins` bins. For integer metrics the size is a whole number and the
+    edges sit on half units, so every integer falls inside a bin.
+
+    Args:
+        values (array-like): Metric values (NaN ignored)
+        nbins (int): Maximum number of bins
+
+    Returns:
+        numpy.ndarray: Increasing bin edges (at least two)
+    """
+
+    finite = _finite(values)
+
+    if not finite.size:
+        return np.array([0.0, 1.0])
+
+    low, high = float(finite.min()), float(finite.max())
+    integer = bool(np.all(finite == np.round(finite)))
+
+    raw = (high - low) / nbins if high > low else 1.0
+    magnitude = 10 ** math.floor(math.log10(raw))
+    size = next(step * magnitude for step in NICE_STEPS if step * magnitude >= raw)
+
+    if integer:
+        size = float(max(1, math.ceil(size)))
+
+    start = math.floor(low / size) * size - (0.5 if integer else 0.0)
+    count = int(math.floor((high - start) / size)) + 1
+
+    return start + size * np.arange(count + 1)
+
+def get_edges(source, metric, values, nbins=DEFAULT_BINS):
+    """
+    Return the bin edges of a metric, cached per dataset.
+
+    Cached edges are reused only while they still cover every value, so
+    a republished dataset never loses values outside the old range.
+
+    Args:
+        source (str): Dataset identifier (e.g. its coc-data URL, which
+            names the dataset type and month)
+        metric (str): Metric column
+        values (array-like): Metric values
+        nbins (int): Maximum number of bins
+
+    Returns:
+        numpy.ndarray: Bin edges
+    """
+
+    key = (source, metric, nbins)
+    finite = _finite(values)
+
+    with _EDGES_LOCK:
+        edges = _EDGES.get(key)
+
+        if edges is not None and (
+            not finite.size
+            or (edges[0] <= finite.min() and finite.max() < edges[-1])
+        ):
+            _EDGES.move_to_end(key)
+            return edges
+
+    edges = nice_edges(finite, nbins)
+    edges.flags.writeable = False
+
+    with _EDGES_LOCK:
+        _EDGES[key] = edges
+        while len(_EDGES) > EDGE_CACHE_SIZE:
+            _EDGES.popitem(last=False)
+
+    return edges
+
+def clear_edge_cache():
+    """Drop every cached bin-edge array."""
+
+    with _EDGES_LOCK:
+        _EDGES.clear()
+
+def counts(values, edges):
+    """
+    Count values per bin.
+
+    Args:
+        values (array-like): Values (NaN ignored)
+        edges (numpy.ndarray): Bin edges
+
+    Returns:
+        numpy.ndarray: int64 count per bin
+    """
+
+    return np.histogram(_finite(values), bins=edges)[0]
+
+def counts_2d(x, y, xedges, yedges):
+    """
+    Count (x, y) pairs per 2D bin.
+
+    Args:
+        x (array-like): Values binned along x
+        y (array-like): Values binned along y
+        xedges (numpy.ndarray): x bin edges
+        yedges (numpy.ndarray): y bin edges
+
+    Returns:
+        numpy.ndarray: int64 counts of shape (y bins, x bins), rows
+        ordered like a Plotly heatmap's z
+    """
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    keep = np.isfinite(x) & np.isfinite(y)
+
+    grid = np.histogram2d(x[keep], y[keep], bins=(xedges, yedges))[0]
+
+    return grid.T.astype(np.int64)
+
+def range_counts(values, bins):
+    """
+    Count values per explicit range, with pd.cut semantics.
+
+    Ranges are right-closed (bins[i], bins[i + 1]]; values outside every
+    range (and NaN) are not counted.
+
+    Args:
+        values (array-like): Values
+        bins (list[float]): Range boundaries
+
+    Returns:
+        numpy.ndarray: int64 count per range
+    """
+
+    finite = _finite(values)
+    index = np.searchsorted(np.asarray(bins, dtype=float), finite, side="left")
+    inside = (index > 0) & (index < len(bins))
+
+    return np.bincount(index[inside] - 1, minlength=len(bins) - 1)
+
+def centers(edges):
+    """Return the midpoint of every bin."""
+
+    return (edges[:-1] + edges[1:]) / 2
+
+def bin_labels(edges):
+    """
+    Describe every bin as a value range.
+
+    Integer bins (edges on half units) are labelled by the whole numbers
+    they contain, e.g. "0-19" or "7"; other bins by their edges.
+
+    Args:
+        edges (numpy.ndarray): Bin edges
+
+    Returns:
+        list[str]: One label per bin
+    """
+
+    if np.all(edges % 1 == 0.5):
+        labels = []
+        for low, high in zip(edges[:-1] + 0.5, edges[1:] - 0.5):
+            low, high = int(low), int(high)
+            labels.append(str(low) if low == high else f"{low}-{high}")
+        return labels
+
+    return [f"{low:g}-{high:g}" for low, high in zip(edges[:-1], edges[1:])]
+
+def typed_array(array):
+    """
+    Encode an integer count array as a Plotly typed array.
+
+    Uses the narrowest unsigned type holding the largest count and
+    base64-encodes the raw bytes, as done by Plotly's own JSON encoder.
+
+    Args:
+        array (numpy.ndarray): Non-negative integer counts (1D or 2D)
+
+    Returns:
+        dict: {"dtype", "bdata"} (plus "shape" for 2D arrays)
+    """
+
+    peak = int(array.max()) if array.size else 0
+    dtype = next(t for t in ("u1", "u2", "u4") if peak <= np.iinfo(t).max)
+
+    spec = {
+        "dtype": dtype,
+        "bdata": base64.b64encode(
+            np.ascontiguousarray(array, dtype=f"<{dtype}").tobytes()
+        ).decode("ascii"),
+    }
+
+    if array.ndim > 1:
+        spec["shape"] = ", ".join(str(n) for n in array.shape)
+
+    return spec
@@ -0,0 +1,942 @@
+# graphs/figure_specs.py
+
+"""
+Lightweight figure-spec builder for the graph pages of the
+Clash of Clans – Ancient Ruins Clan Website.
+
+This module:
+- Emits figures as plain Plotly JSON dicts ({"data": [...], "layout": {...}})
+  built directly from NumPy arrays, with the add_trace / update_layout
+  interface of plotly figures
+- Mirrors the plotly.express / plotly.graph_objects calls used by the
+  member, former member and monthly analysis graphs, with the same
+  arguments and the same resulting JSON
+- Covers every chart family used by the graph pages: bar, pie, line,
+  scatter, histogram, box, violin, density heatmap, treemap, sunburst,
+  3D scatter, area, polar, funnel and waterfall
+- Provides pre-binned histograms, density heatmaps and range pies whose
+  counts are computed server-side (see graphs.binning)
+
+Building plotly figure objects validates every property and merges the
+template on each assignment, only for the route to serialize the figure
+to JSON right away. Specs skip that work entirely: routes serialize them
+exactly like figures, and the browser receives the same JSON.
+"""
+
+# Importing Libraries
+from functools import lru_cache
+
+import numpy as np
+from plotly.colors import sequential
+
+from . import binning
+
+# Domain covering the whole plotting area
+FULL_DOMAIN = {"x": [0.0, 1.0], "y": [0.0, 1.0]}
+
+# Layout properties whose names contain an underscore
+UNDERSCORE_PROPERTIES = {"plot_bgcolor", "paper_bgcolor"}
+
+@lru_cache(maxsize=1)
+def default_template():
+    """
+    Return the active Plotly template as a plain dict.
+
+    Figures built by plotly embed the default template in their layout;
+    specs reference the same dict, converted once per process.
+
+    Returns:
+        dict: Template JSON ({"data": ..., "layout": ...})
+    """
+
+    import plotly.io as pio
+
+    return pio.templates[pio.templates.default].to_plotly_json()
+
+def _colorway():
+    """Qualitative colour sequence of the default template."""
+
+    return default_template()["layout"]["colorway"]
+
+def _colorscale(scale):
+    """
+    Resolve a colour scale name (e.g. "Viridis") into Plotly's
+    [[position, colour], ...] form; lists are returned unchanged.
+    """
+
+    if not isinstance(scale, str):
+        return scale
+
+    colors = getattr(sequential, scale)
+    last = len(colors) - 1
+
+    return [[i / last, color] for i, color in enumerate(colors)]
+
+def _values(data):
+    """
+    Convert a Series, Index or array into a JSON-ready list.
+
+    Missing values (NaN) become None, as in Plotly's JSON encoding.
+    """
+
+    array = np.asarray(data)
+
+    if array.dtype.kind == "f":
+        missing = np.isnan(array)
+        if missing.any():
+            array = array.astype(object)
+            array[missing] = None
+
+    elif array.dtype.kind == "O":
+        return [None if value != value else value for value in array.tolist()]
+
+    return array.tolist()
+
+def _label(labels, column):
+    """Display name of a column (px `labels` argument)."""
+
+    return (labels or {}).get(column, column)
+
+def _set_path(target, key, value):
+    """Apply one magic-underscore property (e.g. xaxis_title) to a dict."""
+
+    *parents, leaf = [key] if key in UNDERSCORE_PROPERTIES else key.split("_")
+
+    for parent in parents:
+        node = target.get(parent)
+        if not isinstance(node, dict):
+            node = target[parent] = {} if node is None else {"text": node}
+        target = node
+
+    if leaf == "title" and not isinstance(value, dict):
+        value = {"text": value}
+
+    if isinstance(value, dict) and isinstance(target.get(leaf), dict):
+        target[leaf].update(value)
+    else:
+        target[leaf] = value
+
+def trace(trace_type, **props):
+    """
+    Build one trace dict, equivalent to a plotly.graph_objects trace.
+
+    Args:
+        trace_type (str): Plotly trace type (e.g. "bar", "scatter")
+        **props: Trace properties; array-likes are converted to lists and
+            colour scale names are resolved
+
+    Returns:
+        dict: Trace JSON
+    """
+
+    spec = {"type": trace_type}
+
+    for key, value in props.items():
+        if key == "colorscale":
+            value = _colorscale(value)
+        elif hasattr(value, "__array__") or isinstance(value, (list, tuple)):
+            value = _values(value)
+
+        spec[key] = value
+
+    return spec
+
+class FigureSpec(dict):
+    """
+    FigureSpec
+
+    Plain figure dict ({"data": [...], "layout": {...}}) exposing the
+    add_trace / update_layout methods of plotly.graph_objects.Figure, so
+    it can be built the same way and serialized like a figure.
+    """
+
+    def __init__(self, data=None, layout=None):
+        """
+        Initialize the figure spec.
+
+        Args:
+            data (dict | list[dict]): Initial trace(s) built with `trace`
+            layout (dict): Initial layout (the default template is added)
+        """
+
+        if isinstance(data, dict):
+            data = [data]
+
+        super().__init__(
+            data=list(data or []),
+            layout={**(layout or {}), "template": default_template()},
+        )
+
+    def add_trace(self, trace):
+        """
+        Append a trace.
+
+        Args:
+            trace (dict): Trace built with `trace`
+
+        Returns:
+            FigureSpec: self
+        """
+
+        self["data"].append(trace)
+
+        return self
+
+    def update_layout(self, **props):
+        """
+        Update layout properties.
+
+        Args:
+            **props: Layout properties, accepting Plotly's magic underscores
+                (e.g. xaxis_title="Name", title_text="Maxed Clan Games")
+
+        Returns:
+            FigureSpec: self
+        """
+
+        for key, value in props.items():
+            _set_path(self["layout"], key, value)
+
+        return self
+
+def _px_figure(data, title, **layout):
+    """Figure spec with the layout defaults applied by plotly.express."""
+
+    layout.setdefault("legend", {"tracegroupgap": 0})
+    layout["title"] = {"text": title}
+
+    return FigureSpec(data, layout)
+
+def _cartesian(x_title=None, y_title=None):
+    """Axis layout of a single-panel plotly.express figure."""
+
+    xaxis = {"anchor": "y", "domain": [0.0, 1.0]}
+    yaxis = {"anchor": "x", "domain": [0.0, 1.0]}
+
+    if x_title is not None:
+        xaxis["title"] = {"text": x_title}
+    if y_title is not None:
+        yaxis["title"] = {"text": y_title}
+
+    return {"xaxis": xaxis, "yaxis": yaxis}
+
+def _legend(color, labels):
+    """plotly.express legend layout, titled by the colour column."""
+
+    legend = {"tracegroupgap": 0}
+
+    if color:
+        legend["title"] = {"text": _label(labels, color)}
+
+    return legend
+
+def _groups(df, color):
+    """
+    Split rows by the distinct values of a column, in order of appearance.
+
+    Yields:
+        tuple[str, numpy.ndarray | slice, str]: Group name, row selector
+        and marker colour
+    """
+
+    colors = _colorway()
+
+    if not color:
+        yield "", slice(None), colors[0]
+        return
+
+    column = df[color].to_numpy()
+    keys = dict.fromkeys(column.tolist())
+
+    for i, key in enumerate(keys):
+        yield str(key), column == key, colors[i % len(colors)]
+
+def _hover_prefix(color, labels, name):
+    """Hover line naming the colour group of a trace."""
+
+    return f"{_label(labels, color)}={name}<br>" if color else ""
+
+def pie(data_frame, names, title=None, labels=None):
+    """
+    Pie chart of category counts, equivalent to px.pie(df, names=...).
+
+    Args:
+        data_frame (pandas.DataFrame): Source rows
+        names (str): Category column
+        title (str): Figure title
+        labels (dict): Column display names
+
+    Returns:
+        FigureSpec: Figure JSON
+    """
+
+    data = [
+        {
+            "type": "pie",
+            "domain": FULL_DOMAIN,
+            "hovertemplate": f"{_label(labels, names)}=%{{label}}<extra></extra>",
+            "labels": _values(data_frame[names]),
+            "legendgroup": "",
+            "name": "",
+            "showlegend": True,
+        }
+    ]
+
+    return _px_figure(data, title)
+
+def scatter(
+    data_frame,
+    x,
+    y,
+    color=None,
+    hover_name=None,
+    title=None,
+    labels=None,
+    size=None,
+    size_max=20,
+):
+    """
+    Scatter plot, equivalent to px.scatter with optional marker sizes.
+
+    Args:
+        data_frame (pandas.DataFrame): Source rows
+        x (str): Column on the x axis
+        y (str): Column on the y axis
+        color (str): Column splitting the rows into coloured traces
+        hover_name (str): Column shown in bold on hover
+        title (str): Figure title
+        labels (dict): Column display names
+        size (str): Column encoded as marker area
+        size_max (int): Largest marker size in pixels
+
+    Returns:
+        FigureSpec: Figure JSON
+    """
+
+    # One hover line per column; a column used twice shows its last role
+    hover = {x: "%{x}", y: "%{y}"}
+    marker = {"symbol": "circle"}
+    xs, ys = data_frame[x].to_numpy(), data_frame[y].to_numpy()
+    sizes = data_frame[size].to_numpy() if size else None
+    names = data_frame[hover_name].to_numpy() if hover_name else None
+    legend = _legend(color, labels)
+
+    if size:
+        hover[size] = "%{marker.size}"
+        marker.update(sizemode="area", sizeref=float(sizes.max()) / size_max**2)
+        legend["itemsizing"] = "constant"
+
+    hover = "<br>".join(
+        f"{_label(labels, column)}={value}" for column, value in hover.items()
+    )
+    hover_head = "<b>%{hovertext}</b><br><br>" if hover_name else ""
+
+    data = []
+
+    for name, rows, marker_color in _groups(data_frame, color):
+        spec = {
+            "type": "scatter",
+            "hovertemplate": hover_head
+            + _hover_prefix(color, labels, name)
+            + hover
+            + "<extra></extra>",
+            "legendgroup": name,
+            "marker": {"color": marker_color, **marker},
+            "mode": "markers",
+            "name": name,
+            "orientation": "v",
+            "showlegend": bool(color),
+            "x": _values(xs[rows]),
+            "xaxis": "x",
+            "y": _values(ys[rows]),
+            "yaxis": "y",
+        }
+
+        if size:
+            spec["marker"]["size"] = _values(sizes[rows])
+
+        if hover_name:
+            spec["hovertext"] = _values(names[rows])
+
+        data.append(spec)
+
+    layout = _cartesian(_label(labels, x), _label(labels, y))
+    layout["legend"] = legend
+
+    return _px_figure(data, title, **layout)
+
+def histogram(data_frame, x, color=None, hover_data=None, title=None, labels=None):
+    """
+    Histogram binned by the browser, equivalent to px.histogram.
+
+    Args:
+        data_frame (pandas.DataFrame): Source rows
+        x (str): Binned column
+        color (str): Column splitting the rows into coloured traces
+        hover_data (list[str]): Accepted for parity; px.histogram does not
+            show per-row hover data
+        title (str): Figure title
+        labels (dict): Column display names
+
+    Returns:
+        FigureSpec: Figure JSON
+    """
+
+    column = data_frame[x].to_numpy()
+    hover = f"{_label(labels, x)}=%{{x}}<br>count=%{{y}}<extra></extra>"
+
+    data = [
+        {
+            "type": "histogram",
+            "bingroup": "x",
+            "hovertemplate": _hover_prefix(color, labels, name) + hover,
+            "legendgroup": name,
+            "marker": {"color": marker_color, "pattern": {"shape": ""}},
+            "name": name,
+            "orientation": "v",
+            "showlegend": bool(color),
+            "x": _values(column[rows]),
+            "xaxis": "x",
+            "yaxis": "y",
+        }
+        for name, rows, marker_color in _groups(data_frame, color)
+    ]
+
+    layout = _cartesian(_label(labels, x), "count")
+    layout["legend"] = _legend(color, labels)
+    layout["barmode"] = "relative"
+
+    return _px_figure(data, title, **layout)
+
+def _distribution(
+    trace_type, data_frame, y, color, hover_data, labels, extra
+):
+    """Traces shared by box and violin plots (one per colour group)."""
+
+    column = data_frame[y].to_numpy()
+    hover_data = list(hover_data or [])
+    custom = data_frame[hover_data].to_numpy() if hover_data else None
+
+    hover = f"{_label(labels, y)}=%{{y}}" + "".join(
+        f"<br>{_label(labels, col)}=%{{customdata[{i}]}}"
+        for i, col in enumerate(hover_data)
+    )
+
+    data = []
+
+    for name, rows, marker_color in _groups(data_frame, color):
+        spec = {
+            "type": trace_type,
+            "alignmentgroup": "True",
+            "hovertemplate": _hover_prefix(color, labels, name)
+            + hover
+            + "<extra></extra>",
+            "legendgroup": name,
+            "marker": {"color": marker_color},
+            "name": name,
+            "offsetgroup": name,
+            "orientation": "v",
+            "showlegend": bool(color),
+            "x0": " ",
+            "xaxis": "x",
+            "y": _values(column[rows]),
+            "y0": " ",
+            "yaxis": "y",
+            **extra,
+        }
+
+        if custom is not None:
+            spec["customdata"] = custom[rows].tolist()
+
+        data.append(spec)
+
+    return data
+
+def box(
+    data_frame, y, color=None, points=None, hover_data=None, title=None, labels=None
+):
+    """
+    Vertical box plot, equivalent to px.box(df, y=...).
+
+    Args:
+        data_frame (pandas.DataFrame): Source rows
+        y (str): Distributed column
+        color (str): Column splitting the rows into coloured boxes
+        points (str): Underlying points shown ("all", "outliers", ...)
+        hover_data (list[str]): Columns added to the hover text
+        title (str): Figure title
+        labels (dict): Column display names
+
+    Returns:
+        FigureSpec: Figure JSON
+    """
+
+    extra = {"notched": False}
+    if points is not None:
+        extra["boxpoints"] = points
+
+    data = _distribution("box", data_frame, y, color, hover_data, labels, extra)
+
+    layout = _cartesian(None, _label(labels, y))
+    layout["legend"] = _legend(color, labels)
+    layout["boxmode"] = "group"
+
+    return _px_figure(data, title, **layout)
+
+def violin(
+    data_frame,
+    y,
+    color=None,
+    box=False,
+    points=None,
+    hover_data=None,
+    title=None,
+    labels=None,
+):
+    """
+    Vertical violin plot, equivalent to px.violin(df, y=...).
+
+    Args:
+        data_frame (pandas.DataFrame): Source rows
+        y (str): Distributed column
+        color (str): Column splitting the rows into coloured violins
+        box (bool): Draw a box plot inside each violin
+        points (str): Underlying points shown ("all", "outliers", ...)
+        hover_data (list[str]): Columns added to the hover text
+        title (str): Figure title
+        labels (dict): Column display names
+
+    Returns:
+        FigureSpec: Figure JSON
+    """
+
+    extra = {"box": {"visible": box}, "scalegroup": "True"}
+    if points is not None:
+        extra["points"] = points
+
+    data = _distribution("violin", data_frame, y, color, hover_data, labels, extra)
+
+    layout = _cartesian(None, _label(labels, y))
+    layout["legend"] = _legend(color, labels)
+    layout["violinmode"] = "group"
+
+    return _px_figure(data, title, **layout)
+
+def density_heatmap(
+    data_frame, x, y, nbinsx=None, nbinsy=None, title=None, labels=None
+):
+    """
+    2D histogram heatmap, equivalent to px.density_heatmap.
+
+    Args:
+        data_frame (pandas.DataFrame): Source rows
+        x (str): Column binned along the x axis
+        y (str): Column binned along the y axis
+        nbinsx (int): Maximum number of x bins
+        nbinsy (int): Maximum number of y bins
+        title (str): Figure title
+        labels (dict): Column display names
+
+    Returns:
+        FigureSpec: Figure JSON
+    """
+
+    spec = {
+        "type": "histogram2d",
+        "coloraxis": "coloraxis",
+        "hovertemplate": (
+            f"{_label(labels, x)}=%{{x}}<br>{_label(labels, y)}=%{{y}}"
+            "<br>count=%{z}<extra></extra>"
+        ),
+        "name": "",
+        "x": _values(data_frame[x]),
+        "xaxis": "x",
+        "xbingroup": "x",
+        "y": _values(data_frame[y]),
+        "yaxis": "y",
+        "ybingroup": "y",
+    }
+
+    if nbinsx is not None:
+        spec["nbinsx"] = nbinsx
+    if nbinsy is not None:
+        spec["nbinsy"] = nbinsy
+
+    layout = _cartesian(_label(labels, x), _label(labels, y))
+    layout["coloraxis"] = _count_coloraxis()
+
+    return _px_figure([spec], title, **layout)
+
+def _count_coloraxis():
+    """Colour axis of density heatmaps (default sequential scale)."""
+
+    return {
+        "colorbar": {"title": {"text": "count"}},
+        "colorscale": default_template()["layout"]["colorscale"]["sequential"],
+    }
+
+def binned_histogram(
+    data_frame,
+    x,
+    source,
+    nbins=binning.DEFAULT_BINS,
+    color=None,
+    title=None,
+    labels=None,
+):
+    """
+    Histogram binned server-side, drawn as bars of per-bin counts.
+
+    Bins are shared by every colour group (stacked like px.histogram);
+    empty bins are left out of each trace.
+
+    Args:
+        data_frame (pandas.DataFrame): Source rows
+        x (str): Binned column
+        source (str): Dataset identifier used to cache the bin edges
+        nbins (int): Maximum number of bins
+        color (str): Column splitting the rows into coloured traces
+        title (str): Figure title
+        labels (dict): Column display names
+
+    Returns:
+        FigureSpec: Figure JSON
+    """
+
+    column = data_frame[x].to_numpy(dtype=float)
+    edges = binning.get_edges(source, x, column, nbins)
+    mids = binning.centers(edges)
+    ranges = np.array(binning.bin_labels(edges))
+    count = _label(labels, "count")
+    hover = f"{_label(labels, x)}=%{{customdata}}<br>{count}=%{{y}}<extra></extra>"
+
+    data = []
+
+    for name, rows, marker_color in _groups(data_frame, color):
+        counts = binning.counts(column[rows], edges)
+        filled = counts > 0
+
+        data.append(
+            {
+                "type": "bar",
+                "customdata": ranges[filled].tolist(),
+                "hovertemplate": _hover_prefix(color, labels, name) + hover,
+                "legendgroup": name,
+                "marker": {"color": marker_color},
+                "name": name,
+                "showlegend": bool(color),
+                "width": float(edges[1] - edges[0]),
+                "x": mids[filled].tolist(),
+                "y": counts[filled].tolist(),
+            }
+        )
+
+    layout = _cartesian(_label(labels, x), count)
+    layout["legend"] = _legend(color, labels)
+    layout["barmode"] = "relative"
+    layout["bargap"] = 0
+
+    return _px_figure(data, title, **layout)
+
+def binned_density_heatmap(
+    data_frame,
+    x,
+    y,
+    source,
+    nbinsx=binning.DEFAULT_BINS,
+    nbinsy=binning.DEFAULT_BINS,
+    title=None,
+    labels=None,
+):
+    """
+    Density heatmap binned server-side, drawn as a heatmap of counts.
+
+    Args:
+        data_frame (pandas.DataFrame): Source rows
+        x (str): Column binned along the x axis
+        y (str): Column binned along the y axis
+        source (str): Dataset identifier used to cache the bin edges
+        nbinsx (int): Maximum number of x bins
+        nbinsy (int): Maximum number of y bins
+        title (str): Figure title
+        labels (dict): Column display names
+
+    Returns:
+        FigureSpec: Figure JSON
+    """
+
+    xs = data_frame[x].to_numpy(dtype=float)
+    ys = data_frame[y].to_numpy(dtype=float)
+    xedges = binning.get_edges(source, x, xs, nbinsx)
+    yedges = binning.get_edges(source, y, ys, nbinsy)
+
+    spec = {
+        "type": "heatmap",
+        "coloraxis": "coloraxis",
+        "hovertemplate": (
+            f"{_label(labels, x)}=%{{x}}<br>{_label(labels, y)}=%{{y}}"
+            "<br>count=%{z}<extra></extra>"
+        ),
+        "name": "",
+        "x": binning.centers(xedges).tolist(),
+        "xaxis": "x",
+        "y": binning.centers(yedges).tolist(),
+        "yaxis": "y",
+        "z": binning.typed_array(binning.counts_2d(xs, ys, xedges, yedges)),
+    }
+
+    layout = _cartesian(_label(labels, x), _label(labels, y))
+    layout["coloraxis"] = _count_coloraxis()
+
+    return _px_figure([spec], title, **layout)
+
+def binned_pie(data_frame, x, bins, bin_labels, title=None, labels=None):
+    """
+    Pie chart of value ranges, counted server-side.
+
+    Replaces pd.cut + px.pie: ranges are right-closed like pd.cut, values
+    outside every range are left out, and empty ranges get no slice.
+
+    Args:
+        data_frame (pandas.DataFrame): Source rows
+        x (str): Binned column
+        bins (list[float]): Range boundaries
+        bin_labels (list[str]): One label per range
+        title (str): Figure title
+        labels (dict): Column display names
+
+    Returns:
+        FigureSpec: Figure JSON
+    """
+
+    counts = binning.range_counts(data_frame[x].to_numpy(dtype=float), bins)
+    filled = counts > 0
+
+    spec = {
+        "type": "pie",
+        "domain": FULL_DOMAIN,
+        "hovertemplate": (
+            f"{_label(labels, x)}=%{{label}}<br>count=%{{value}}<extra></extra>"
+        ),
+        "labels": np.array(bin_labels)[filled].tolist(),
+        "legendgroup": "",
+        "name": "",
+        "showlegend": True,
+        "values": counts[filled].tolist(),
+    }
+
+    return _px_figure([spec], title)
+
+def _hierarchy(
+    trace_type,
+    data_frame,
+    path,
+    values,
+    title,
+    labels,
+    color,
+    hover_data,
+    color_continuous_scale,
+):
+    """
+    Treemap / sunburst figure of `values` summed along `path`.
+
+    Nodes are emitted leaves first, then each parent level, in order of
+    first appearance. Node colours are the `values`-weighted mean of the
+    `color` column, as computed by plotly.express.
+    """
+
+    keys = data_frame[path].astype(str).to_numpy().tolist()
+    amounts = data_frame[values].to_numpy(dtype=float)
+    colors = data_frame[color].to_numpy(dtype=float)
+
+    ids, names, parents, sums, weighted = [], [], [], [], []
+
+    for depth in range(len(path), 0, -1):
+        level = {}
+        for key, amount, shade in zip(keys, amounts, colors):
+            node = level.setdefault(tuple(key[:depth]), [0.0, 0.0])
+            node[0] += amount
+            node[1] += shade * amount
+
+        for node, (total, mix) in level.items():
+            ids.append("/".join(node))
+            names.append(node[-1])
+            parents.append("/".join(node[:-1]))
+            sums.append(total)
+            weighted.append(mix / total)
+
+    value_name = f"{values}_sum" if color == values else _label(labels, values)
+    node_colors = _values(np.array(weighted))
+
+    spec = {
+        "type": trace_type,
+        "branchvalues": "total",
+        "domain": FULL_DOMAIN,
+        "hovertemplate": (
+            f"labels=%{{label}}<br>{value_name}=%{{value}}"
+            f"<br>parent=%{{parent}}<br>id=%{{id}}"
+            f"<br>{_label(labels, color)}=%{{color}}<extra></extra>"
+        ),
+        "ids": ids,
+        "labels": names,
+        "marker": {"coloraxis": "coloraxis", "colors": node_colors},
+        "name": "",
+        "parents": parents,
+        "values": sums,
+    }
+
+    if hover_data:
+        spec["customdata"] = [[shade] for shade in node_colors]
+
+    layout = {
+        "coloraxis": {
+            "colorbar": {"title": {"text": _label(labels, color)}},
+            "colorscale": _colorscale(color_continuous_scale),
+            "autocolorscale": False,
+        }
+    }
+
+    return _px_figure([spec], title, **layout)
+
+def treemap(
+    data_frame,
+    path,
+    values,
+    title=None,
+    labels=None,
+    color=None,
+    hover_data=None,
+    color_continuous_scale="Viridis",
+):
+    """
+    Treemap of a metric along a category path, equivalent to px.treemap.
+
+    Args:
+        data_frame (pandas.DataFrame): Source rows (values must be non-zero)
+        path (list[str]): Category columns, outermost first
+        values (str): Summed column
+        title (str): Figure title
+        labels (dict): Column display names
+        color (str): Continuous colour column (defaults to `values`)
+        hover_data (list[str]): Hover columns; the colour column is shown
+        color_continuous_scale (str | list): Colour scale
+
+    Returns:
+        FigureSpec: Figure JSON
+    """
+
+    return _hierarchy(
+        "treemap",
+        data_frame,
+        path,
+        values,
+        title,
+        labels,
+        color or values,
+        hover_data,
+        color_continuous_scale,
+    )
+
+def sunburst(
+    data_frame,
+    path,
+    values,
+    title=None,
+    labels=None,
+    color=None,
+    hover_data=None,
+    color_continuous_scale="Viridis",
+):
+    """
+    Sunburst of a metric along a category path, equivalent to px.sunburst.
+
+    Args:
+        data_frame (pandas.DataFrame): Source rows (values must be non-zero)
+        path (list[str]): Category columns, innermost ring first
+        values (str): Summed column
+        title (str): Figure title
+        labels (dict): Column display names
+        color (str): Continuous colour column (defaults to `values`)
+        hover_data (list[str]): Hover columns; the colour column is shown
+        color_continuous_scale (str | list): Colour scale
+
+    Returns:
+        FigureSpec: Figure JSON
+    """
+
+    return _hierarchy(
+        "sunburst",
+        data_frame,
+        path,
+        values,
+        title,
+        labels,
+        color or values,
+        hover_data,
+        color_continuous_scale,
+    )
+
+def scatter_3d(
+    data_frame, x, y, z, color=None, hover_name=None, title=None, labels=None
+):
+    """
+    3D scatter plot, equivalent to px.scatter_3d.
+
+    Args:
+        data_frame (pandas.DataFrame): Source rows
+        x (str): Column on the x axis
+        y (str): Column on the y axis
+        z (str): Column on the z axis
+        color (str): Column splitting the rows into coloured traces
+        hover_name (str): Column shown in bold on hover
+        title (str): Figure title
+        labels (dict): Column display names
+
+    Returns:
+        FigureSpec: Figure JSON
+    """
+
+    columns = {axis: data_frame[col].to_numpy() for axis, col in zip("xyz", (x, y, z))}
+    names = data_frame[hover_name].to_numpy() if hover_name else None
+
+    hover = (
+        f"{_label(labels, x)}=%{{x}}<br>{_label(labels, y)}=%{{y}}"
+        f"<br>{_label(labels, z)}=%{{z}}<extra></extra>"
+    )
+    if hover_name:
+        hover_head = "<b>%{hovertext}</b><br><br>"
+    else:
+        hover_head = ""
+
+    data = []
+
+    for name, rows, marker_color in _groups(data_frame, color):
+        spec = {
+            "type": "scatter3d",
+            "hovertemplate": hover_head + _hover_prefix(color, labels, name) + hover,
+            "legendgroup": name,
+            "marker": {"color": marker_color, "symbol": "circle"},
+            "mode": "markers",
+            "name": name,
+            "scene": "scene",
+            "showlegend": bool(color),
+            **{axis: _values(values[rows]) for axis, values in columns.items()},
+        }
+
+        if names is not None:
+            spec["hovertext"] = _values(names[rows])
+
+        data.append(spec)
+
+    layout = {
+        "scene": {
+            "domain": FULL_DOMAIN,
+            "xaxis": {"title": {"text": _label(labels, x)}},
+            "yaxis": {"title": {"text": _label(labels, y)}},
+            "zaxis": {"title": {"text": _label(labels, z)}},
+        },
+        "legend": _legend(color, labels),
+    }
+
+    return _px_figure(data, title, **layout)
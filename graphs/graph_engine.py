@@ -0,0 +1,999 @@
+# graphs/graph_engine.py
+
+"""
+Declarative chart engine shared by the member, former member, monthly
+analysis and member cluster graphs of the
+Clash of Clans – Ancient Ruins Clan Website.
+
+This module:
+- Describes every graph dataset (coc-data URL, fallback month, categorical
+  columns and dataset-specific chart settings) as a DatasetSchema
+  registered in SCHEMAS
+- Loads a dataset through the shared typed month file loader
+  (load_dataset, month_store)
+- Registers one builder per chart family in CHART_FAMILIES; builders read
+  the schema to decide segmenting (war IN/OUT, player status), titles
+  and bins, and return one factory per figure so that a single figure
+  can be counted and built without building the others
+- Provides GraphEngine, the base class of the graph classes, which serves
+  the create_* methods and the per-figure rendering used by the graph
+  routes
+
+Graph generation is implemented once here: the graph modules only bind a
+schema (and, for clustering, a preparation step).
+"""
+
+# Importing Libraries
+import threading
+import warnings
+from functools import partial
+from itertools import combinations
+
+import pandas as pd
+import requests
+
+from constants import LATEST_MONTH, LATEST_MONTH_RANGE
+from month_store import load_month_file
+from . import figure_specs as fs
+
+warnings.simplefilter(action="ignore", category=FutureWarning)
+
+# coc-data raw URL prefix
+DATA_ROOT = "https://raw.githubusercontent.com/Lightning-President-9/ClanDataRepo"
+
+# Performance metrics, in their canonical order
+METRICS = ["warattack", "clancapital", "clangames", "clangamesmaxed", "clanscore"]
+
+METRIC_LABELS = {
+    "warattack": "War Attack",
+    "clancapital": "Clan Capital",
+    "clangames": "Clan Games",
+    "clangamesmaxed": "Clan Games Maxed",
+    "clanscore": "Clan Score",
+}
+
+# Order of the per-metric area, polar, funnel and waterfall charts
+SERIES_METRICS = [
+    "clancapital",
+    "clangames",
+    "clangamesmaxed",
+    "clanscore",
+    "warattack",
+]
+
+# Treemap / sunburst metrics and the category grouping them (members only)
+HIERARCHY_METRICS = [
+    ("warattack", "status"),
+    ("clancapital", "war"),
+    ("clanscore", "status"),
+    ("clangames", "war"),
+    ("clangamesmaxed", "war"),
+]
+
+HEATMAP_PAIRS = [
+    ("warattack", "clancapital"),
+    ("clangames", "clangamesmaxed"),
+    ("warattack", "clanscore"),
+    ("clancapital", "clanscore"),
+]
+
+DENSITY_PAIRS = [
+    ("clancapital", "clangames"),
+    ("clanscore", "warattack"),
+    ("clangames", "warattack"),
+    ("clancapital", "clanscore"),
+]
+
+# Categorical column → (legend label, title wording)
+CATEGORY_NAMES = {
+    "war": ("War Status", "War Status"),
+    "status": ("Player Status", "Status"),
+}
+
+# Chart family name → builder(graph) returning one zero-argument factory
+# per figure, in page order
+CHART_FAMILIES = {}
+
+class DatasetSchema:
+    """
+    Shape and chart settings of one graph dataset.
+
+    Attributes:
+        name (str): Dataset type (e.g. "mem")
+        kind (str): Month file kind of the dataset (see month_store)
+        url (str): coc-data URL template with a {month_year} field
+        latest (str): Month (or month range) shown when one is missing
+        families (tuple[str]): Chart families offered by the dataset
+        categories (tuple[str]): Categorical columns charts are segmented
+            by; "war" also splits per-player charts into IN / OUT traces
+        pies (list[tuple]): (metric, bins, bin labels, title) per range
+            pie; bins None for a pie of distinct values
+        scatter (dict): Extra fs.scatter arguments; "title" is a template
+            with {x}/{y} (columns) and {X}/{Y} (capitalized) fields
+        scatter_labels (dict): Extra scatter column display names
+        metrics (list[str] | None): Fixed metric columns; None uses every
+            numeric column of the dataset, in file order
+        fill_missing (bool): Replace missing metric values with 0
+    """
+
+    def __init__(
+        self,
+        name,
+        kind,
+        url,
+        latest,
+        families=None,
+        categories=(),
+        pies=(),
+        scatter=None,
+        scatter_labels=None,
+        metrics=None,
+        fill_missing=False,
+    ):
+        self.name = name
+        self.kind = kind
+        self.url = url
+        self.latest = latest
+        self.families = tuple(families or CHART_FAMILIES)
+        self.categories = tuple(categories)
+        self.pies = list(pies)
+        self.scatter = scatter or {}
+        self.scatter_labels = scatter_labels or {}
+        self.metrics = metrics
+        self.fill_missing = fill_missing
+
+def chart_family(name):
+    """Register the decorated builder as the chart family `name`."""
+
+    def register(builder):
+        CHART_FAMILIES[name] = builder
+        return builder
+
+    return register
+
+def load_dataset(schema, month_year):
+    """
+    Load the dataset of a month as a DataFrame.
+
+    Falls back to the schema's latest month when the requested one cannot
+    be loaded. Datasets come from the month_store cache and are shared
+    between requests: callers must not modify them.
+
+    Args:
+        schema (DatasetSchema): Dataset description
+        month_year (str): Month identifier (e.g. 'DEC_2025' or
+            'NOV-DEC_2025')
+
+    Returns:
+        tuple[pandas.DataFrame, str, str | None]: DataFrame, coc-data URL
+        and the fallback message (None when the month was found)
+    """
+
+    url = schema.url.format(month_year=month_year)
+
+    try:
+        table = load_month_file(url, schema.kind)
+    except (requests.exceptions.RequestException, ValueError):
+        if month_year == schema.latest:
+            raise
+
+        df, url, _ = load_dataset(schema, schema.latest)
+        message = (
+            f"No data available for {month_year}. "
+            f"Showing {schema.latest} (Latest)"
+        )
+
+        return df, url, message
+
+    df = table.frame()
+
+    if schema.fill_missing:
+        df = df.fillna({column: 0 for column in METRICS})
+
+    return df, url, None
+
+class GraphEngine:
+    """
+    GraphEngine
+
+    Base class of the graph classes: loads the dataset described by the
+    class `schema` and serves one create_<family> method per chart family
+    of the schema (e.g. create_bar_graphs), built by CHART_FAMILIES.
+    Single figures are served by figure_count and render_figure.
+    """
+
+    schema = None
+
+    def __init__(self):
+        """
+        Initialize the graph with empty placeholders for the data source
+        URL, the loaded DataFrame and the fallback message.
+        """
+
+        self.data_url = ""
+        self.month_year = None
+        self.df = None
+        self.numerical_df = None
+        self.message = ""
+
+        # Graph instances are shared between requests: hold the lock from
+        # update_and_load_data until the figures are built
+        self.lock = threading.RLock()
+
+    def update_and_load_data(self, month_year):
+        """
+        Load the dataset of a month (or month range) through load_dataset.
+
+        Sets:
+        - df: Converted dataset
+        - month_year: Month actually loaded (the schema's latest month
+          after a fallback)
+        - numerical_df: Metric columns used by the charts
+        - df_in / df_out: Members IN / OUT of war (datasets segmented by war)
+        - message: Fallback message when the month is unavailable
+
+        Args:
+            month_year (str): Month identifier (e.g., 'DEC_2025')
+        """
+
+        self.df, self.data_url, self.message = load_dataset(self.schema, month_year)
+        self.month_year = month_year if self.message is None else self.schema.latest
+
+        if self.schema.metrics:
+            self.numerical_df = self.df[self.schema.metrics]
+        else:
+            numeric = self.df.select_dtypes(include=["number"])
+            self.numerical_df = numeric.drop(columns="srno", errors="ignore")
+
+        if "war" in self.schema.categories:
+            self.df_in = self.df[self.df["war"] == "IN"]
+            self.df_out = self.df[self.df["war"] == "OUT"]
+
+        self.prepare()
+
+    def prepare(self):
+        """Hook run after every load (e.g. to derive model columns)."""
+
+    @property
+    def numerical_columns(self):
+        """Metric columns charted for the loaded dataset."""
+
+        return self.numerical_df.columns
+
+    def figure_factories(self, family):
+        """
+        Factories of the figures of one chart family for the loaded dataset.
+
+        Args:
+            family (str): Chart family (e.g. "bar_graphs")
+
+        Returns:
+            list[callable]: One zero-argument figure factory per figure
+        """
+
+        return CHART_FAMILIES[family](self)
+
+    def figure_count(self, family):
+        """Number of figures of one chart family, without building them."""
+
+        return len(self.figure_factories(family))
+
+    def render(self, family):
+        """
+        Build the figures of one chart family for the loaded dataset.
+
+        Args:
+            family (str): Chart family (e.g. "bar_graphs")
+
+        Returns:
+            list[FigureSpec]: Figures of the family
+        """
+
+        return [make() for make in self.figure_factories(family)]
+
+    def render_figure(self, family, index):
+        """
+        Build a single figure of one chart family for the loaded dataset.
+
+        Args:
+            family (str): Chart family (e.g. "bar_graphs")
+            index (int): Position of the figure on the graph page
+
+        Returns:
+            FigureSpec: The figure
+
+        Raises:
+            IndexError: When the family has no figure at `index`
+        """
+
+        factories = self.figure_factories(family)
+
+        if not 0 <= index < len(factories):
+            raise IndexError(f"{family} has no figure {index}")
+
+        return factories[index]()
+
+    def __getattr__(self, name):
+        family = name[len("create_"):] if name.startswith("create_") else None
+
+        if family in self.schema.families:
+            return lambda: self.render(family)
+
+        raise AttributeError(f"{type(self).__name__!r} has no attribute {name!r}")
+
+def _by_war(graph, trace_type, metric, **props):
+    """
+    Traces of one metric: IN / OUT of war for segmented datasets, a single
+    trace otherwise.
+
+    Args:
+        graph (GraphEngine): Loaded graph
+        trace_type (str): "bar" or "scatter" (x = name, y = metric), or
+            "scatterpolar" (theta = name, r = metric)
+        metric (str): Metric column
+        **props: Extra trace properties
+
+    Returns:
+        list[dict]: Traces
+    """
+
+    if "war" in graph.schema.categories:
+        frames = [(graph.df_in, "War IN"), (graph.df_out, "War OUT")]
+    else:
+        frames = [(graph.df, METRIC_LABELS[metric])]
+
+    axes = ("theta", "r") if trace_type == "scatterpolar" else ("x", "y")
+
+    return [
+        fs.trace(
+            trace_type,
+            **{axes[0]: df["name"], axes[1]: df[metric]},
+            **props,
+            name=name,
+        )
+        for df, name in frames
+    ]
+
+def _war_suffix(graph):
+    """Title suffix of the charts split into IN / OUT traces."""
+
+    return " (IN/OUT)" if "war" in graph.schema.categories else ""
+
+@chart_family("bar_graphs")
+def bar_graphs(graph):
+    """Per-metric bars, stacked metrics and (members) category counts."""
+
+    def metric_bars(metric):
+        fig = fs.FigureSpec(data=_by_war(graph, "bar", metric))
+        fig.update_layout(
+            barmode="group",
+            title=f"Vertical Bar Chart of {METRIC_LABELS[metric]}",
+            xaxis_title="Name",
+            yaxis_title=METRIC_LABELS[metric],
+        )
+        return fig
+
+    def stacked():
+        fig = fs.FigureSpec()
+        for column in graph.numerical_columns:
+            fig.add_trace(
+                fs.trace("bar", name=column, x=graph.df["name"], y=graph.df[column])
+            )
+        fig.update_layout(
+            barmode="stack",
+            title="Stacked Bar Chart of Numerical Values",
+            xaxis_title="Names",
+            yaxis_title="Values",
+        )
+        return fig
+
+    def counts():
+        fig = fs.FigureSpec()
+        for column, name in (("war", "War Status"), ("status", "Status Count")):
+            values = graph.df[column].value_counts()
+            fig.add_trace(fs.trace("bar", name=name, x=values.index, y=values.values))
+        fig.update_layout(
+            barmode="stack",
+            title="Count of War Status and Status Count",
+            xaxis_title="Category",
+            yaxis_title="Count",
+        )
+        return fig
+
+    figures = [partial(metric_bars, metric) for metric in METRICS]
+    figures.append(stacked)
+
+    if graph.schema.categories == ("war", "status"):
+        figures.append(counts)
+
+    return figures
+
+def _value_pie(df, column, title):
+    """Pie of the distinct values of a column."""
+
+    values = df[column].value_counts()
+    fig = fs.FigureSpec(
+        data=[fs.trace("pie", labels=values.index, values=values.values)]
+    )
+    fig.update_layout(title_text=title)
+
+    return fig
+
+@chart_family("pie_charts")
+def pie_charts(graph):
+    """Category pies (members) and the schema's metric range pies."""
+
+    figures = []
+
+    if "status" in graph.schema.categories:
+        figures.append(
+            partial(
+                fs.pie, graph.df, names="status", title="Player Status Distribution"
+            )
+        )
+
+    if "war" in graph.schema.categories:
+        figures.append(partial(_value_pie, graph.df, "war", "War Participation Status"))
+
+    for metric, bins, bin_labels, title in graph.schema.pies:
+        if bins is None:
+            figures.append(partial(_value_pie, graph.df, metric, title))
+        else:
+            figures.append(
+                partial(
+                    fs.binned_pie,
+                    graph.df,
+                    metric,
+                    bins=bins,
+                    bin_labels=bin_labels,
+                    title=title,
+                )
+            )
+
+    return figures
+
+@chart_family("line_charts")
+def line_charts(graph):
+    """One line chart per metric and a combined multi-metric chart."""
+
+    def line(column):
+        return fs.trace(
+            "scatter",
+            x=graph.df["name"],
+            y=graph.df[column],
+            mode="lines+markers",
+            name=column,
+        )
+
+    def single(column):
+        fig = fs.FigureSpec(data=[line(column)])
+        fig.update_layout(
+            title=f"Line Chart of {column} by Name",
+            xaxis_title="Name",
+            yaxis_title=column,
+        )
+        return fig
+
+    def combined():
+        fig = fs.FigureSpec(data=[line(column) for column in graph.numerical_columns])
+        fig.update_layout(
+            title="Line Chart of Multiple Metrics by Name",
+            xaxis_title="Name",
+            yaxis_title="Values",
+        )
+        return fig
+
+    return [partial(single, column) for column in graph.numerical_columns] + [combined]
+
+@chart_family("scatter_plots")
+def scatter_plots(graph):
+    """Pairwise metric scatter plots, sized by clan score."""
+
+    settings = dict(graph.schema.scatter)
+    title = settings.pop("title")
+    names = graph.schema.scatter_labels
+
+    if "clanscore" in graph.df.columns:
+        settings["size"] = "clanscore"
+
+    return [
+        partial(
+            fs.scatter,
+            graph.df,
+            x=x,
+            y=y,
+            hover_name="name",
+            title=title.format(x=x, y=y, X=x.capitalize(), Y=y.capitalize()),
+            labels={x: x.capitalize(), y: y.capitalize(), **names},
+            **settings,
+        )
+        for x, y in combinations(graph.numerical_columns, 2)
+    ]
+
+def _segments(graph):
+    """
+    Colour segments of the distribution charts: none, then one per
+    category of the schema.
+
+    Yields:
+        tuple[str | None, str, dict]: Colour column, title suffix and
+        extra labels
+    """
+
+    yield None, "", {}
+
+    for category in graph.schema.categories:
+        label, wording = CATEGORY_NAMES[category]
+        yield category, f" by {wording}", {category: label}
+
+@chart_family("histograms")
+def histograms(graph):
+    """Server-binned histograms per metric and category segment."""
+
+    return [
+        partial(
+            fs.binned_histogram,
+            graph.df,
+            x=col,
+            source=graph.data_url,
+            **({"color": color} if color else {}),
+            title=f"Histogram of {col}{suffix}",
+            labels={col: col, **labels, "count": "Player Count"},
+        )
+        for color, suffix, labels in _segments(graph)
+        for col in graph.numerical_columns
+    ]
+
+def _distributions(graph, builder, name, **props):
+    """Box or violin plots per metric and category segment."""
+
+    return [
+        partial(
+            builder,
+            graph.df,
+            y=col,
+            **({"color": color} if color else {}),
+            **props,
+            points="all",
+            hover_data=["name"],
+            title=f"{name} of {col}{suffix}",
+            labels={col: col, **labels, "name": "Player Name"},
+        )
+        for color, suffix, labels in _segments(graph)
+        for col in graph.numerical_columns
+    ]
+
+@chart_family("box_plots")
+def box_plots(graph):
+    """Box plots per metric and category segment."""
+
+    return _distributions(graph, fs.box, "Box Plot")
+
+@chart_family("violin_plots")
+def violin_plots(graph):
+    """Violin plots (with inner box) per metric and category segment."""
+
+    return _distributions(graph, fs.violin, "Violin Plot", box=True)
+
+@chart_family("heatmaps")
+def heatmaps(graph):
+    """Server-binned density heatmaps and (members) war vs status counts."""
+
+    def crosstab():
+        counts = pd.crosstab(graph.df["war"], graph.df["status"])
+        fig = fs.FigureSpec(
+            data=fs.trace(
+                "heatmap",
+                z=counts.values,
+                x=counts.columns,
+                y=counts.index,
+                colorscale="Viridis",
+            )
+        )
+        fig.update_layout(
+            title="Heatmap of War Status vs Player Status",
+            xaxis_title="Player Status",
+            yaxis_title="War Status",
+        )
+        return fig
+
+    figures = [
+        partial(
+            fs.binned_density_heatmap,
+            graph.df,
+            x=x,
+            y=y,
+            source=graph.data_url,
+            nbinsx=20,
+            nbinsy=20,
+            title=f"Heatmap of {METRIC_LABELS[x]} vs {METRIC_LABELS[y]}",
+            labels={x: METRIC_LABELS[x], y: METRIC_LABELS[y]},
+        )
+        for x, y in HEATMAP_PAIRS
+    ]
+
+    if graph.schema.categories == ("war", "status"):
+        figures.append(crosstab)
+
+    return figures
+
+def _hierarchies(graph, builder, name):
+    """
+    Treemaps or sunbursts of every non-zero metric, grouped by category
+    for members and by player otherwise. Metrics without a non-zero value
+    get no figure.
+    """
+
+    def hierarchy(metric, nonzero, path, group):
+        return builder(
+            graph.df[nonzero],
+            path=path,
+            values=metric,
+            title=f"{name} of {METRIC_LABELS[metric]} by {group}",
+            labels={metric: METRIC_LABELS[metric], "name": "Player Name"},
+            color=metric,
+            hover_data=[metric],
+            color_continuous_scale="Viridis",
+        )
+
+    figures = []
+
+    for metric, category in HIERARCHY_METRICS:
+        nonzero = graph.df[metric].fillna(0).to_numpy() != 0
+
+        if not nonzero.any():
+            continue
+
+        if category in graph.schema.categories:
+            path = [category, "name"]
+            group = CATEGORY_NAMES[category][0]
+        else:
+            path = ["name"]
+            group = "Player Name"
+
+        figures.append(partial(hierarchy, metric, nonzero, path, group))
+
+    return figures
+
+@chart_family("treemaps")
+def treemaps(graph):
+    """Treemaps of every non-zero metric."""
+
+    return _hierarchies(graph, fs.treemap, "Treemap")
+
+@chart_family("sunburst_charts")
+def sunburst_charts(graph):
+    """Sunburst charts of every non-zero metric."""
+
+    return _hierarchies(graph, fs.sunburst, "Sunburst")
+
+@chart_family("density_plots")
+def density_plots(graph):
+    """Density contour plots of metric pairs."""
+
+    def density(x, y):
+        fig = fs.FigureSpec()
+        fig.add_trace(
+            fs.trace(
+                "histogram2dcontour",
+                x=graph.df[x],
+                y=graph.df[y],
+                colorscale="Viridis",
+                contours=dict(showlabels=True),
+            )
+        )
+        fig.update_layout(
+            title=f"Density Plot of {METRIC_LABELS[x]} vs. {METRIC_LABELS[y]}",
+            xaxis_title=METRIC_LABELS[x],
+            yaxis_title=METRIC_LABELS[y],
+        )
+        return fig
+
+    return [partial(density, x, y) for x, y in DENSITY_PAIRS]
+
+@chart_family("3d_scatter_plots")
+def scatter_3d_plots(graph):
+    """3D scatter plots of every metric triple, coloured by war status."""
+
+    color = {"color": "war"} if "war" in graph.schema.categories else {}
+
+    return [
+        partial(
+            fs.scatter_3d,
+            graph.df,
+            x=x,
+            y=y,
+            z=z,
+            **color,
+            hover_name="name",
+            title=f"3D Scatter Plot: {x}, {y}, {z}",
+        )
+        for x, y, z in combinations(METRICS, 3)
+    ]
+
+@chart_family("area_graphs")
+def area_graphs(graph):
+    """Per-metric area charts and a stacked area chart."""
+
+    def area(metric):
+        fig = fs.FigureSpec(data=_by_war(graph, "scatter", metric, fill="tozeroy"))
+        fig.update_layout(
+            title=(
+                f"Area Chart of {METRIC_LABELS[metric]} Over Players"
+                f"{_war_suffix(graph)}"
+            ),
+            xaxis_title="Name",
+            yaxis_title=METRIC_LABELS[metric],
+        )
+        return fig
+
+    def stacked():
+        fig = fs.FigureSpec()
+        for column in graph.numerical_columns:
+            fig.add_trace(
+                fs.trace(
+                    "scatter",
+                    x=graph.df["name"],
+                    y=graph.df[column],
+                    fill="tonexty",
+                    name=column,
+                )
+            )
+        fig.update_layout(
+            title="Stacked Area Chart of Numerical Values",
+            xaxis_title="Name",
+            yaxis_title="Values",
+        )
+        return fig
+
+    return [partial(area, metric) for metric in SERIES_METRICS] + [stacked]
+
+@chart_family("polar_charts")
+def polar_charts(graph):
+    """Per-metric polar charts, a stacked one and (members) score by status."""
+
+    polar = dict(radialaxis=dict(visible=True))
+
+    def metric_polar(metric):
+        fig = fs.FigureSpec(data=_by_war(graph, "scatterpolar", metric, fill="toself"))
+        fig.update_layout(
+            title=(
+                f"Polar Chart of {METRIC_LABELS[metric]} Over Players"
+                f"{_war_suffix(graph)}"
+            ),
+            polar=polar,
+        )
+        return fig
+
+    def stacked():
+        fig = fs.FigureSpec()
+        for column in graph.numerical_columns:
+            fig.add_trace(
+                fs.trace(
+                    "scatterpolar",
+                    r=graph.df[column],
+                    theta=graph.df["name"],
+                    fill="toself",
+                    name=column,
+                )
+            )
+        fig.update_layout(title="Stacked Polar Chart of Numerical Values", polar=polar)
+        return fig
+
+    def score_by_status():
+        fig = fs.FigureSpec()
+        fig.add_trace(
+            fs.trace(
+                "scatterpolar",
+                r=graph.df["clanscore"],
+                theta=graph.df["status"],
+                fill="toself",
+                name="Clan Score by Status",
+            )
+        )
+        fig.update_layout(title="Clan Score by Status", polar=polar)
+        return fig
+
+    figures = [partial(metric_polar, metric) for metric in SERIES_METRICS]
+    figures.append(stacked)
+
+    if "status" in graph.schema.categories:
+        figures.append(score_by_status)
+
+    return figures
+
+@chart_family("funnel_charts")
+def funnel_charts(graph):
+    """Per-metric funnels (players ranked by value) and a stacked funnel."""
+
+    def funnel(column, **props):
+        ranked = graph.df.sort_values(by=column, ascending=False)
+        return fs.trace(
+            "funnel",
+            **props,
+            y=ranked["name"],
+            x=ranked[column],
+            textinfo="value+percent initial",
+        )
+
+    def metric_funnel(metric):
+        fig = fs.FigureSpec(data=[funnel(metric)])
+        fig.update_layout(
+            title=f"Funnel Chart for {METRIC_LABELS[metric]}",
+            yaxis_title="Name",
+            xaxis_title=METRIC_LABELS[metric],
+        )
+        return fig
+
+    def stacked():
+        fig = fs.FigureSpec(
+            data=[funnel(column, name=column) for column in graph.numerical_columns]
+        )
+        fig.update_layout(
+            title="Stacked Funnel Chart of Numerical Values",
+            yaxis_title="Name",
+            xaxis_title="Values",
+        )
+        return fig
+
+    return [partial(metric_funnel, metric) for metric in SERIES_METRICS] + [stacked]
+
+@chart_family("waterfall_charts")
+def waterfall_charts(graph):
+    """Per-metric waterfalls, a stacked one and (members) war attack by status."""
+
+    def waterfall(metric):
+        fig = fs.FigureSpec()
+        fig.add_trace(
+            fs.trace(
+                "waterfall",
+                x=graph.df["name"],
+                y=graph.df[metric],
+                textposition="outside",
+            )
+        )
+        fig.update_layout(
+            title=f"Waterfall Chart for {METRIC_LABELS[metric]}",
+            xaxis_title="Name",
+            yaxis_title=METRIC_LABELS[metric],
+        )
+        return fig
+
+    def stacked():
+        fig = fs.FigureSpec()
+        for column in graph.numerical_columns:
+            fig.add_trace(
+                fs.trace(
+                    "waterfall",
+                    name=column,
+                    x=graph.df["name"],
+                    y=graph.df[column],
+                    textposition="outside",
+                )
+            )
+        fig.update_layout(
+            title="Stacked Waterfall Chart of Numerical Values",
+            xaxis_title="Name",
+            yaxis_title="Values",
+        )
+        return fig
+
+    def war_attack_by_status():
+        fig = fs.FigureSpec()
+        fig.add_trace(
+            fs.trace(
+                "waterfall",
+                x=graph.df["status"],
+                y=graph.df.groupby("status")["warattack"].sum(),
+                textposition="outside",
+            )
+        )
+        fig.update_layout(
+            title="Incremental Changes in War Attack by Status",
+            xaxis_title="Status",
+            yaxis_title="Total War Attack",
+        )
+        return fig
+
+    figures = [partial(waterfall, metric) for metric in SERIES_METRICS]
+    figures.append(stacked)
+
+    if "status" in graph.schema.categories:
+        figures.append(war_attack_by_status)
+
+    return figures
+
+# Range pies as (metric, bins, bin labels, title); ranges are right-closed
+CAPITAL_PIE = (
+    "clancapital",
+    [-1, 50, 100, 200, 300],
+    ["0-50", "51-100", "101-200", "201-300"],
+    "Clan Capital Contribution",
+)
+GAMES_PIE = (
+    "clangames",
+    [-1, 5, 10, 15, 20],
+    ["0-5", "6-10", "11-15", "16-20"],
+    "Clan Games Participation",
+)
+MAXED_PIE = ("clangamesmaxed", None, None, "Maxed Clan Games")
+SCORE_PIE = (
+    "clanscore",
+    [-1, 100, 300, 500, 700],
+    ["0-100", "101-300", "301-500", "501-700"],
+    "Clan Score Distribution",
+)
+WAR_PIE = (
+    "warattack",
+    [-1, 50, 100, 200, 300],
+    ["0-50", "51-100", "101-200", "201-300"],
+    "War Attacks Distribution",
+)
+
+def _open_ended(pie, label):
+    """Add a last, unbounded range to a range pie."""
+
+    metric, bins, bin_labels, title = pie
+
+    return metric, [*bins, float("inf")], [*bin_labels, label], title
+
+MONTHLY_ANALYSIS_URL = (
+    f"{DATA_ROOT}/refs/heads/main/Clan%20Members/"
+    "Monthly%20Analysis%20JSON/data_{month_year}.json"
+)
+
+# Dataset type → schema
+SCHEMAS = {
+    "mem": DatasetSchema(
+        "mem",
+        "members",
+        f"{DATA_ROOT}/main/Clan%20Members/JSON/{{month_year}}.json",
+        LATEST_MONTH,
+        categories=("war", "status"),
+        pies=[
+            _open_ended(CAPITAL_PIE, "300+"),
+            _open_ended(GAMES_PIE, "20+"),
+            MAXED_PIE,
+            _open_ended(SCORE_PIE, "700+"),
+            _open_ended(WAR_PIE, "300+"),
+        ],
+        scatter={"title": "{X} vs {Y}", "size_max": 20},
+        scatter_labels={"clanscore": "Clan Score"},
+    ),
+    "fmem": DatasetSchema(
+        "fmem",
+        "former",
+        f"{DATA_ROOT}/main/Former%20Clan%20Members/JSON/{{month_year}}.json",
+        LATEST_MONTH,
+        pies=[
+            _open_ended(CAPITAL_PIE, "300+"),
+            GAMES_PIE,
+            MAXED_PIE,
+            SCORE_PIE,
+            WAR_PIE,
+        ],
+        scatter={"title": "{X} vs {Y}", "size_max": 15},
+        scatter_labels={"clanscore": "Clan Score"},
+    ),
+    "mag": DatasetSchema(
+        "mag",
+        "analysis",
+        MONTHLY_ANALYSIS_URL,
+        LATEST_MONTH_RANGE,
+        pies=[CAPITAL_PIE, GAMES_PIE, MAXED_PIE, SCORE_PIE, WAR_PIE],
+        scatter={"title": "Scatter Plot of {X} vs {Y}", "size_max": 15},
+        scatter_labels={"clanscore": "Clan Score"},
+    ),
+    "cluster": DatasetSchema(
+        "cluster",
+        "analysis",
+        MONTHLY_ANALYSIS_URL,
+        LATEST_MONTH_RANGE,
+        # trajectory_plots is registered by member_cluster_graph
+        families=["scatter_plots", "trajectory_plots"],
+        scatter={"title": "Member Cluster Scatter: {x} vs {y}", "color": "cluster"},
+        scatter_labels={"cluster": "Cluster"},
+        metrics=METRICS,
+        fill_missing=True,
+    ),
+}
@@ -0,0 +1,326 @@
+# graphs/heatmap_engine.py
+
+"""
+Player × period heatmaps of the Clan Monthly Performance dataset for the
+all month analysis page.
+
+This module:
+- Reads the shared performance cube (performance_store) instead of
+  fetching the dataset on every page view
+- Selects the players (current members or everyone) and a window of
+  periods, optionally summed per quarter on the server
+- Emits one heatmap per metric with a compact `z` matrix: a Plotly
+  base64 typed array of int16 values (int32 when a value does not fit),
+  MISSING_VALUE marking the periods a player was not in the clan
+- Draws missing cells in grey: the colour scale starts with a grey band
+  covering MISSING_VALUE, followed by the Plasma scale from 0
+- Caches the selected matrices per cube version and selection; the
+  version changes whenever performance_store reloads a changed dataset
+
+The former heatmaps sent every player of the history as nested lists of
+floats with null for missing periods, which made them the largest
+payloads of the site as the history grows by one period every month.
+"""
+
+# Importing Libraries
+import base64
+import threading
+
+import numpy as np
+from plotly.colors import sequential
+
+from performance_store import MISSING_VALUE, get_performance_cube, period_sort_key
+from . import figure_specs as fs
+from .graph_engine import METRIC_LABELS
+
+# Player selections: players recorded in the last period of the window
+# (current members), or every player of the dataset
+PLAYER_SELECTIONS = ("active", "all")
+
+# Period aggregations: one column per period, or one per quarter
+AGGREGATIONS = ("period", "quarter")
+
+# Axis title of the columns of every aggregation
+COLUMN_TITLES = {"period": "Month", "quarter": "Quarter"}
+
+# Colour of the periods a player was not in the clan
+MISSING_COLOR = "lightgrey"
+
+# Largest value encoded as int16
+INT16_MAX = np.iinfo(np.int16).max
+
+def quarter_of(period):
+    """
+    Quarter of the start month of a period.
+
+    Args:
+        period (str): Period identifier (e.g. 'NOV-DEC_2024')
+
+    Returns:
+        str: Quarter identifier (e.g. 'Q4_2024')
+    """
+
+    start = period_sort_key(period)
+
+    return f"Q{(start.month - 1) // 3 + 1}_{start.year}"
+
+class HeatmapSelection:
+    """
+    HeatmapSelection
+
+    Players and columns of the heatmaps, cut from the performance cube.
+
+    Attributes:
+        names (list[str]): Player of every row
+        metrics (tuple[str]): Metric keys along the second axis
+        columns (list[str]): Period or quarter of every column, oldest first
+        aggregate (str): Aggregation of the columns ("period" or "quarter")
+        values (numpy.ndarray): int32 array (players, metrics, columns),
+            MISSING_VALUE where a player has no data
+    """
+
+    def __init__(self, names, metrics, columns, aggregate, values):
+        self.names = names
+        self.metrics = metrics
+        self.columns = columns
+        self.aggregate = aggregate
+        self.values = values
+
+    def matrix(self, metric):
+        """
+        Return the (players, columns) values of one metric.
+        """
+
+        return self.values[:, self.metrics.index(metric), :]
+
+def _window(cube, start, end, last):
+    """Slice of the cube periods selected by start / end / last."""
+
+    for period in (start, end):
+        if period is not None and period not in cube.period_index:
+            raise ValueError(f"Unknown period: {period}")
+
+    first = cube.period_index[start] if start else 0
+    stop = cube.period_index[end] + 1 if end else len(cube.periods)
+
+    if last is not None:
+        if last < 1:
+            raise ValueError("last must be a positive number of periods")
+        first = max(first, stop - last)
+
+    if first >= stop:
+        raise ValueError("Empty period window")
+
+    return slice(first, stop)
+
+def _quarter_sums(values, valid, periods):
+    """
+    Sum values per quarter; a quarter without any recorded period is missing.
+
+    Returns:
+        tuple[list[str], numpy.ndarray]: Quarters and summed values
+    """
+
+    labels = [quarter_of(period) for period in periods]
+    quarters = list(dict.fromkeys(labels))
+    groups = np.array([quarters.index(label) for label in labels])
+
+    summed = np.zeros(values.shape[:2] + (len(quarters),), dtype=np.int64)
+    recorded = np.zeros(summed.shape, dtype=bool)
+
+    np.add.at(summed, (slice(None), slice(None), groups), np.where(valid, values, 0))
+    np.logical_or.at(recorded, (slice(None), slice(None), groups), valid)
+
+    return quarters, np.where(recorded, summed, MISSING_VALUE)
+
+def select_heatmaps(
+    cube, players="active", start=None, end=None, last=None, aggregate="period"
+):
+    """
+    Cut the heatmap rows and columns from a performance cube.
+
+    Args:
+        cube (PerformanceCube): Performance cube
+        players (str): "active" (recorded in the last period of the
+            window) or "all"
+        start (str, optional): First period of the window
+        end (str, optional): Last period of the window
+        last (int, optional): Keep only the last N periods of the window
+        aggregate (str): "period" or "quarter" (sum of the periods
+            starting in each quarter)
+
+    Returns:
+        HeatmapSelection: Selected values
+
+    Raises:
+        ValueError: Unknown selection, aggregation or period, or an
+            empty window
+    """
+
+    if players not in PLAYER_SELECTIONS:
+        raise ValueError(f"Unknown player selection: {players}")
+
+    if aggregate not in AGGREGATIONS:
+        raise ValueError(f"Unknown aggregation: {aggregate}")
+
+    window = _window(cube, start, end, last)
+    values = cube.values[:, :, window]
+    valid = cube.valid[:, :, window]
+    columns = cube.periods[window]
+
+    if players == "active":
+        rows = np.flatnonzero(valid[:, :, -1].any(axis=1))
+        values, valid = values[rows], valid[rows]
+    else:
+        rows = np.arange(len(cube.names))
+
+    if aggregate == "quarter":
+        columns, values = _quarter_sums(values, valid, columns)
+
+    return HeatmapSelection(
+        [cube.names[row] for row in rows],
+        cube.metrics,
+        list(columns),
+        aggregate,
+        np.ascontiguousarray(values, dtype=np.int32),
+    )
+
+# (cube version, selection options) → HeatmapSelection of the current cube
+_selections = {}
+
+_lock = threading.Lock()
+
+def cached_selection(cube, **options):
+    """
+    Heatmap selection of a cube, computed once per cube version.
+
+    Args:
+        cube (PerformanceCube): Performance cube
+        **options: Arguments of select_heatmaps
+
+    Returns:
+        HeatmapSelection: Selected values
+    """
+
+    key = (cube.version, tuple(sorted(options.items())))
+
+    with _lock:
+        selection = _selections.get(key)
+
+        if selection is None:
+            selection = select_heatmaps(cube, **options)
+
+            # Selections of replaced cube versions are not needed anymore
+            for stale in [other for other in _selections if other[0] != cube.version]:
+                del _selections[stale]
+
+            _selections[key] = selection
+
+    return selection
+
+def compact_matrix(matrix):
+    """
+    Encode an integer matrix as a Plotly base64 typed array.
+
+    int16 is used when every value fits, int32 otherwise.
+
+    Args:
+        matrix (numpy.ndarray): 2D integer array
+
+    Returns:
+        dict: Typed array JSON ({"dtype", "bdata", "shape"})
+    """
+
+    dtype = np.int16 if matrix.size == 0 or matrix.max() <= INT16_MAX else np.int32
+    array = np.ascontiguousarray(matrix, dtype=dtype)
+
+    return {
+        "dtype": array.dtype.str.lstrip("<|"),
+        "bdata": base64.b64encode(array.tobytes()).decode("ascii"),
+        "shape": ",".join(str(n) for n in array.shape),
+    }
+
+def missing_colorscale(zmax):
+    """
+    Plasma colour scale from 0 to zmax, preceded by a grey band for
+    MISSING_VALUE (zmin).
+
+    Args:
+        zmax (int): Largest value of the heatmap
+
+    Returns:
+        list[list]: Plotly colour scale
+    """
+
+    colors = sequential.Plasma
+    last = len(colors) - 1
+
+    # Position of 0 when the colour axis spans MISSING_VALUE..zmax
+    zero = -MISSING_VALUE / (zmax - MISSING_VALUE)
+
+    return [[0.0, MISSING_COLOR], [zero, MISSING_COLOR]] + [
+        [zero + (1.0 - zero) * i / last, color] for i, color in enumerate(colors)
+    ]
+
+def heatmap_figure(selection, metric):
+    """
+    Build the heatmap of one metric.
+
+    Args:
+        selection (HeatmapSelection): Selected values
+        metric (str): Metric key
+
+    Returns:
+        FigureSpec: Heatmap figure
+    """
+
+    matrix = selection.matrix(metric)
+    zmax = max(int(matrix.max()) if matrix.size else 0, 1)
+    label = METRIC_LABELS[metric]
+    column_title = COLUMN_TITLES[selection.aggregate]
+
+    fig = fs.FigureSpec(
+        data=fs.trace(
+            "heatmap",
+            z=compact_matrix(matrix),
+            x=selection.columns,
+            y=selection.names,
+            zmin=MISSING_VALUE,
+            zmax=zmax,
+            colorscale=missing_colorscale(zmax),
+            colorbar={"title": {"text": label}},
+            hovertemplate=(
+                f"{column_title}: %{{x}}<br>Player: %{{y}}<br>{label}: %{{z}}"
+                "<extra></extra>"
+            ),
+        )
+    )
+    fig.update_layout(
+        title=f"Heatmap of {label} per {column_title}",
+        xaxis={"title": {"text": column_title}, "type": "category"},
+        yaxis={
+            "title": {"text": "Player"},
+            "type": "category",
+            "autorange": "reversed",
+            "tickfont": {"size": 10},
+        },
+    )
+
+    return fig
+
+def heatmap_figures(cube=None, **options):
+    """
+    Build the heatmap of every metric.
+
+    Args:
+        cube (PerformanceCube, optional): Performance cube (defaults to
+            the shared cube)
+        **options: Arguments of select_heatmaps
+
+    Returns:
+        list[FigureSpec]: One heatmap per metric
+    """
+
+    selection = cached_selection(cube or get_performance_cube(), **options)
+
+    return [heatmap_figure(selection, metric) for metric in selection.metrics]
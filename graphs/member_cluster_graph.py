@@ -5,150 +5,210 @@ Generates KMeans-based cluster scatter plots for clan members
 across a selected month range.
 
 This module:
-- Loads month-range-based member coc-data from GitHub
-- Applies KMeans clustering (k = 2)
+- Loads month-range-based member coc-data through the shared chart
+  engine (SCHEMAS["cluster"]: missing metrics count as 0)
+- Labels members with the activity clusters of the month (standardized
+  features, k chosen by silhouette score), fitted once per month file
+  and persisted by cluster_store
+- Clusters several months jointly (player × month trajectories) and
+  precomputes the clusters of every month for background jobs
 - Generates scatter plots for each pair of numerical features
 - Uses clan score as marker size
+- Registers the trajectory_plots chart family: players of the whole
+  performance history clustered by contribution trajectory
+  (cluster_store.cube_clusters), one line chart per metric
 
 Designed to align closely with MonthlyAnalysisGraph.
 """
 
 # Importing Libraries
-import pandas as pd
-import plotly.express as px
+from functools import partial
+
+import numpy as np
 import requests
-import warnings
-from sklearn.cluster import KMeans
-from constants import LATEST_MONTH_RANGE
 
-warnings.simplefilter(action="ignore", category=FutureWarning)
+from cluster_store import CLUSTER_KS, cube_clusters, month_clusters
+from performance_store import get_performance_cube
+from . import figure_specs as fs
+from .graph_engine import (
+    METRIC_LABELS,
+    GraphEngine,
+    SCHEMAS,
+    chart_family,
+    load_dataset,
+)
+
+def dataset_clusters(month_year, df, ks=CLUSTER_KS):
+    """
+    Clusters of a loaded cluster dataset, from cluster_store.
+
+    Args:
+        month_year (str): Month range of the dataset
+        df (pandas.DataFrame): Dataset of SCHEMAS["cluster"]
+        ks (tuple[int]): Numbers of clusters evaluated
 
-class MemberClusterGraph:
+    Returns:
+        MonthClusters: Clusters of the month
     """
-    MemberClusterGraph
 
-    Handles loading, clustering, and visualization of clan member coc-data
-    using KMeans clustering.
+    metrics = SCHEMAS["cluster"].metrics
+
+    return month_clusters(
+        month_year, df["name"], metrics, df[metrics].to_numpy(dtype=float), ks
+    )
+
+def _available_datasets(months):
+    """Yield (month, DataFrame) for every month whose file is available."""
+
+    for month in months:
+        try:
+            df, _, message = load_dataset(SCHEMAS["cluster"], month)
+        except (requests.exceptions.RequestException, ValueError):
+            continue
+
+        # A fallback message means the month itself is missing
+        if message is None:
+            yield month, df
+
+def trajectory_clusters(months, ks=CLUSTER_KS):
     """
+    Cluster several months jointly: one row per player and month, one
+    model for all rows, so the activity tier of a player is comparable
+    from month to month.
 
-    def __init__(self):
-        """
-        Initialize the MemberClusterGraph instance.
-        """
-        self.data_url = ""
-        self.df = None
-        self.numerical_df = None
-        self.message = ""
-
-        self.features = [
-            "warattack",
-            "clancapital",
-            "clangames",
-            "clangamesmaxed",
-            "clanscore",
-        ]
+    Months without a file are skipped.
 
-    def update_and_load_data(self, month_year):
-        """
-        Load and preprocess clan performance coc-data for a given month range.
+    Args:
+        months (list[str]): Month ranges, oldest first
+        ks (tuple[int]): Numbers of clusters evaluated
 
-        This method:
-        - Dynamically builds the GitHub coc-data URL
-        - Fetches and parses JSON coc-data
-        - Falls back to the latest available month range if coc-data is unavailable
-        - Converts performance fields to numeric values
-        - Extracts numerical columns for analytics
+    Returns:
+        MonthClusters | None: Joint clusters (row_months gives the month
+        of every row), or None when no month is available
+    """
 
-        Args:
-            month_year (str): Month-range identifier (e.g., 'NOV-DEC_2025')
-        """
+    loaded = list(_available_datasets(months))
 
-        self.message = None
+    if not loaded:
+        return None
 
-        # Update the coc-data URL dynamically based on month and year
-        self.data_url = (
-            "https://raw.githubusercontent.com/Lightning-President-9/"
-            "ClanDataRepo/refs/heads/main/Clan%20Members/"
-            "Monthly%20Analysis%20JSON/"
-            f"data_{month_year}.json"
-        )
+    metrics = SCHEMAS["cluster"].metrics
 
-        # Fetch the updated coc-data
-        self.response = requests.get(self.data_url)
+    names = [name for _, df in loaded for name in df["name"]]
+    row_months = [month for month, df in loaded for _ in range(len(df))]
+    values = np.vstack([df[metrics].to_numpy(dtype=float) for _, df in loaded])
 
-        try:
-            self.json_data = self.response.json()
-        except requests.exceptions.RequestException:
-            fallback_message = (
-                f"No data available for {month_year}. "
-                f"Showing {LATEST_MONTH_RANGE} (Latest)"
-            )
+    return month_clusters(
+        f"JOINT_{loaded[0][0]}_{loaded[-1][0]}",
+        names,
+        metrics,
+        values,
+        ks,
+        row_months,
+    )
+
+def precompute_clusters(months, ks=CLUSTER_KS):
+    """
+    Fit (or load) the clusters of every month and of the joint months.
 
-            self.update_and_load_data(LATEST_MONTH_RANGE)
+    Args:
+        months (list[str]): Month ranges, oldest first
+        ks (tuple[int]): Numbers of clusters evaluated
 
-            self.message = fallback_message
+    Returns:
+        list[str]: Months whose clusters are available
+    """
+
+    done = []
+
+    for month, df in _available_datasets(months):
+        dataset_clusters(month, df, ks)
+        done.append(month)
+
+    trajectory_clusters(done, ks)
+
+    return done
+
+def _trajectory_figure(clusters, metric):
+    """Mean value per period of one metric, one line per cluster."""
+
+    position = clusters.metrics.index(metric)
+
+    fig = fs.FigureSpec(
+        data=[
+            fs.trace(
+                "scatter",
+                x=clusters.periods,
+                y=clusters.profiles[cluster, position],
+                mode="lines+markers",
+                name=f"{label} ({clusters.sizes[cluster]} players)",
+            )
+            for cluster, label in enumerate(clusters.labels)
+        ]
+    )
+    fig.update_layout(
+        title=f"Contribution Trajectory Clusters: {METRIC_LABELS[metric]}",
+        xaxis_title="Period",
+        yaxis_title=f"Mean {METRIC_LABELS[metric]}",
+        legend_title="Cluster",
+    )
+
+    return fig
+
+# Registered here rather than in graph_engine so that it stays out of the
+# default families of the other datasets
+@chart_family("trajectory_plots")
+def trajectory_plots(graph):
+    """
+    One line chart per metric of the trajectory clusters of the whole
+    performance history (independent of the loaded month).
+    """
 
-        # Load JSON coc-data into a DataFrame
-        self.df = pd.DataFrame(self.json_data)
+    clusters = cube_clusters(get_performance_cube(), graph.ks)
 
-        # Convert string columns to numeric
-        for column in self.features:
-            self.df[column] = pd.to_numeric(self.df[column], errors="coerce").fillna(0)
+    return [
+        partial(_trajectory_figure, clusters, metric) for metric in clusters.metrics
+    ]
 
-        # Extract numerical columns
-        self.numerical_df = self.df[self.features]
+class MemberClusterGraph(GraphEngine):
+    """
+    MemberClusterGraph
+
+    Handles loading, clustering, and visualization of clan member coc-data
+    using KMeans clustering.
 
-        # Apply KMeans clustering (k = 2)
-        # Apply KMeans clustering (k = 2)
-        kmeans = KMeans(n_clusters=2, random_state=42)
-        self.df["cluster"] = kmeans.fit_predict(self.numerical_df)
+    Attributes:
+        ks (tuple[int]): Numbers of clusters evaluated for every month
+    """
 
-        # Find which cluster is more active
-        cluster_activity = self.df.groupby("cluster")[self.features].mean().sum(axis=1)
+    schema = SCHEMAS["cluster"]
 
-        # Cluster with higher total activity → Highly Active (0)
-        high_activity_cluster = cluster_activity.idxmax()
-        low_activity_cluster = cluster_activity.idxmin()
+    ks = CLUSTER_KS
 
-        # Create mapping dictionary
-        cluster_mapping = {
-            high_activity_cluster: "Highly Active",
-            low_activity_cluster: "Less Active",
-        }
+    def __init__(self):
+        """
+        Initialize the MemberClusterGraph instance.
+        """
 
-        # Apply mapping
-        self.df["cluster"] = self.df["cluster"].map(cluster_mapping)
+        super().__init__()
+        self.features = list(self.schema.metrics)
+        self.clusters = None
 
-    def create_scatter_plots(self):
+    def prepare(self):
         """
-        Generate KMeans cluster scatter plots for each pair of features.
+        Label every member with its KMeans activity cluster.
+
+        - Fetches the clusters of the loaded month from cluster_store,
+          which fits them only when the month file changed
+        - Clusters are ranked by activity: "Highly Active" first
 
-        - Color indicates cluster
-        - Marker size is based on clan score
+        Sets:
+        - clusters: MonthClusters of the loaded month
 
-        Returns:
-            list[plotly.graph_objects.Figure]
+        The shared dataset is copied before the cluster column is added.
         """
 
-        figures = []
-
-        for i, x_col in enumerate(self.features):
-            for y_col in self.features[i + 1 :]:
-                fig = px.scatter(
-                    data_frame=self.df,
-                    x=x_col,
-                    y=y_col,
-                    color="cluster",
-                    size="clanscore",
-                    hover_name="name",
-                    title=f"Member Cluster Scatter: {x_col} vs {y_col}",
-                    labels={
-                        x_col: x_col.capitalize(),
-                        y_col: y_col.capitalize(),
-                        "cluster": "Cluster",
-                    },
-                )
-
-                figures.append(fig)
-
-        return figures
\ No newline at end of file
+        self.clusters = dataset_clusters(self.month_year, self.df, self.ks)
+
+        self.df = self.df.copy()
+        self.df["cluster"] = self.clusters.activity()
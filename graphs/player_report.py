@@ -6,8 +6,10 @@ clan members in the Clash of Clans – Ancient Ruins Clan Website.
 
 This module:
 - Loads long-range monthly performance coc-data from a GitHub-hosted JSON source
-- Dynamically extracts and sorts performance periods
-- Produces multiple visualizations using Matplotlib and Seaborn
+  (through the shared performance_store cube)
+- Slices each player's chronologically sorted metrics from the cube
+- Produces multiple visualizations through the report chart backends
+  (vector ReportLab drawings by default, Matplotlib/Seaborn images optionally)
 - Builds a professional multi-page PDF report using ReportLab
 
 The report includes:
@@ -18,14 +20,15 @@ The report includes:
 """
 
 # Importing Libraries
-import pandas as pd
-import matplotlib
-import matplotlib.pyplot as plt
-import seaborn as sns
 import io
 import os
+import tempfile
+import zipfile
 from datetime import datetime
+import numpy as np
 from reportlab.platypus import (
+    Frame,
+    LayoutError,
     SimpleDocTemplate,
     Paragraph,
     Spacer,
@@ -37,94 +40,47 @@ from reportlab.lib.pagesizes import A4
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.pdfgen.canvas import Canvas
-from constants import CLAN_MONTHLY_PERFORMANCE_RANGE
-
-matplotlib.use("Agg")
+from performance_store import get_performance_cube
+from .report_charts import get_chart_renderer, COLOR_PALETTE
 
 # CONFIG
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-JSON_URL = f"https://raw.githubusercontent.com/Lightning-President-9/ClanDataRepo/refs/heads/main/Clan%20Members/Clan%20Monthly%20Performance%20JSON/clan_monthly_performance_{CLAN_MONTHLY_PERFORMANCE_RANGE}.json"
 CLAN_LOGO = os.path.join(BASE_DIR, "static", "clan-badge_18.png")
 WEBSITE_LINK = "https://coc-ancient-ruins-website.onrender.com/"
 
-# Load coc-data
-df = pd.read_json(JSON_URL)
+# Chart backend used for report visuals: "vector" (ReportLab drawings)
+# or "raster" (Matplotlib PNG images)
+CHART_BACKEND = os.environ.get("REPORT_CHART_BACKEND", "vector")
 
-METRICS = {
-    "War Attacks": "warattack_",
-    "Clan Capital": "clancapital_",
-    "Clan Games": "clangames_",
-    "Clan Games Maxed": "clangamesmaxed_",
-    "Clan Score": "clanscore_",
-}
+# Streaming settings for clan-wide reports: bytes held in memory before the
+# combined PDF spills to a temporary file, and size of each streamed chunk
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+STREAM_CHUNK_SIZE = 64 * 1024
 
-plt.style.use("seaborn-v0_8")
-
-# MONTH MAPPING
-MONTH_MAP = {
-    "JAN": 1,
-    "FEB": 2,
-    "MAR": 3,
-    "APR": 4,
-    "MAY": 5,
-    "JUN": 6,
-    "JUL": 7,
-    "AUG": 8,
-    "SEP": 9,
-    "OCT": 10,
-    "NOV": 11,
-    "DEC": 12,
-}
+# Largest number of players in a combined clan PDF: the canvas keeps every
+# finished page until the document is saved, so larger exports use the ZIP
+# format, which is written one report at a time
+CLAN_PDF_MAX_PLAYERS = int(os.environ.get("CLAN_PDF_MAX_PLAYERS", "20"))
 
-def extract_all_periods(df):
+def get_dataframe():
     """
-    Extract all unique period identifiers from the dataset.
+    Return the clan performance dataset, loading it on first use.
 
-    Scans DataFrame columns to dynamically identify all available
-    month-range periods associated with performance metrics.
-
-    Args:
-        df (pandas.DataFrame): Clan performance dataset
+    The dataset is shared with the dashboard through performance_store.
 
     Returns:
-        list[str]: List of unique period identifiers
-    """
-
-    periods = set()
-    for col in df.columns:
-        if "_" in col and any(col.startswith(prefix) for prefix in METRICS.values()):
-            period = col.split("_", 1)[1]  # take part after prefix
-            periods.add(period)
-    return list(periods)
-
-def period_sort_key(period):
+        pandas.DataFrame: Clan performance dataset
     """
-    Generate a chronological sorting key for period identifiers.
 
-    Handles cross-year month ranges such as DEC-JAN by adjusting
-    the associated year for accurate ordering.
+    return get_performance_cube().frame
 
-    Args:
-        period (str): Period identifier (e.g., 'NOV-DEC_2024')
-
-    Returns:
-        datetime.datetime: Sorting key for chronological ordering
-    """
-
-    try:
-        part, year = period.split("_")
-        start_m, end_m = part.split("-")
-
-        year = int(year)
-
-        # Critical fix: DEC-JAN belongs to previous year
-        if start_m == "DEC" and end_m == "JAN":
-            year -= 1
-
-        return datetime(year, MONTH_MAP[start_m], 1)
-
-    except Exception:
-        return datetime(9999, 12, 31)
+METRICS = {
+    "War Attacks": "warattack_",
+    "Clan Capital": "clancapital_",
+    "Clan Games": "clangames_",
+    "Clan Games Maxed": "clangamesmaxed_",
+    "Clan Score": "clanscore_",
+}
 
 # Footer
 def add_footer(canvas: Canvas, doc):
@@ -155,9 +111,36 @@ def get_players():
         list[str]: List of player names present in the dataset
     """
 
-    return df["name"].tolist()
+    return list(get_performance_cube().names)
+
+def get_player_metric_values(player_name):
+    """
+    Extract the chronologically sorted metric values of one player.
+
+    Missing or negative (not in clan) values are reported as 0.
+
+    Args:
+        player_name (str): Name of the player
+
+    Returns:
+        tuple[list[str], dict[str, list[int]]]: Sorted periods and
+        metric values for each period
+    """
+
+    cube = get_performance_cube()
+
+    # Chronologically sorted periods and the player's slice of the cube
+    periods = list(cube.periods)
+    values = np.clip(cube.values[cube.player_row(player_name)], 0, None)
+
+    # Metric Data Extraction
+    metric_values = {}
+    for metric, prefix in METRICS.items():
+        metric_values[metric] = values[cube.metric_index[prefix.rstrip("_")]].tolist()
+
+    return periods, metric_values
 
-def generate_player_report(player_name):
+def generate_player_report(player_name, backend=None):
     """
     Generate a complete PDF performance report for a specific player.
 
@@ -165,32 +148,76 @@ def generate_player_report(player_name):
     - Extracts player-specific coc-data
     - Dynamically identifies and sorts all time periods
     - Computes metric trends, totals, and peak performance
-    - Generates multiple visual charts
-    - Assembles a styled multi-page PDF report
+    - Delegates PDF assembly to build_report_pdf
 
     Args:
         player_name (str): Name of the player
+        backend (str, optional): Chart backend, defaults to CHART_BACKEND
 
     Returns:
         io.BytesIO: In-memory PDF file buffer
     """
 
-    player_data = df[df["name"] == player_name].to_dict(orient="records")[0]
+    periods, metric_values = get_player_metric_values(player_name)
 
-    # DYNAMIC PERIOD EXTRACTION & SORTING
-    periods = extract_all_periods(df)
-    periods.sort(key=period_sort_key)
+    pdf_buf = io.BytesIO()
+    build_report_pdf(pdf_buf, player_name, periods, metric_values, backend)
+    pdf_buf.seek(0)
+    return pdf_buf
 
-    # Metric Data Extraction
-    metric_values = {}
-    for metric, prefix in METRICS.items():
-        vals = []
-        for period in periods:
-            val = player_data.get(f"{prefix}{period}", 0)
-            if val is None or pd.isna(val) or val < 0:
-                val = 0
-            vals.append(val)
-        metric_values[metric] = vals
+def build_report_pdf(output, player_name, periods, metric_values, backend=None):
+    """
+    Assemble the styled multi-page PDF report for one player.
+
+    Args:
+        output (file-like): Binary stream receiving the PDF
+        player_name (str): Name of the player
+        periods (list[str]): Sorted period identifiers
+        metric_values (dict[str, list[int]]): Values per metric and period
+        backend (str, optional): Chart backend, defaults to CHART_BACKEND
+    """
+
+    doc = _report_document(output, f"{player_name} Performance Report")
+    elements = build_report_elements(player_name, periods, metric_values, backend)
+    doc.build(elements, onFirstPage=add_footer, onLaterPages=add_footer)
+
+def _report_document(output, title):
+    """
+    Create the A4 document template shared by every report.
+
+    Args:
+        output (file-like): Binary stream receiving the PDF
+        title (str): PDF document title
+
+    Returns:
+        reportlab.platypus.SimpleDocTemplate: Document template
+    """
+
+    return SimpleDocTemplate(
+        output,
+        pagesize=A4,
+        title=title,
+        author="coc-ancient-ruins-website",
+    )
+
+def build_report_elements(player_name, periods, metric_values, backend=None):
+    """
+    Build the report flowables (cover, tables and charts) for one player.
+
+    This function:
+    - Builds the peak performance and summary tables
+    - Renders every chart through the selected chart backend
+    - Lays out the cover page and visual insights section
+
+    Args:
+        player_name (str): Name of the player
+        periods (list[str]): Sorted period identifiers
+        metric_values (dict[str, list[int]]): Values per metric and period
+        backend (str, optional): Chart backend, defaults to CHART_BACKEND
+
+    Returns:
+        list[reportlab.platypus.Flowable]: Report flowables
+    """
 
     # Peak Performance Table
     peak_data = [["Metric", "Peak Value", "Peak Period"]]
@@ -199,120 +226,24 @@ def generate_player_report(player_name):
         peak_data.append([metric, max(vals), periods[peak_idx]])
 
     # Generate Charts
-    img_buffers = []
-
-    def create_metric_chart(values, title, color):
-        fig, ax = plt.subplots(figsize=(8, 4))
-        ax.plot(periods, values, marker="o", color=color, linewidth=2)
-        avg = sum(values) / len(values) if values else 0
-        ax.axhline(
-            avg, linestyle="--", color="gray", alpha=0.7, label=f"Avg: {avg:.1f}"
-        )
-        ax.set_title(title, fontsize=14, fontweight="bold", color=color)
-        ax.set_xlabel("Period")
-        ax.set_ylabel(title)
-        ax.grid(True, linestyle="--", alpha=0.6)
-        plt.xticks(rotation=45)
-        for i, val in enumerate(values):
-            ax.text(i, val + (max(values) * 0.05), str(val), ha="center", fontsize=8)
-        ax.legend()
-        plt.tight_layout()
-        buf = io.BytesIO()
-        plt.savefig(buf, format="PNG")
-        buf.seek(0)
-        img_buffers.append(buf)
-        plt.close()
-
-    color_palette = ["#1f77b4", "#2ca02c", "#ff7f0e", "#d62728", "#9467bd"]
-
-    for (metric, vals), color in zip(metric_values.items(), color_palette):
-        create_metric_chart(vals, metric, color)
+    renderer = get_chart_renderer(backend or CHART_BACKEND)
+    charts = []
+
+    for (metric, vals), color in zip(metric_values.items(), COLOR_PALETTE):
+        charts.append(renderer.metric_chart(periods, vals, metric, color))
 
     # Combined Line Chart
-    fig, ax = plt.subplots(figsize=(8, 4))
-    for (metric, vals), color in zip(metric_values.items(), color_palette):
-        ax.plot(periods, vals, marker="o", linewidth=2, label=metric, color=color)
-    ax.set_title("All Metrics Combined", fontsize=14, fontweight="bold")
-    ax.set_xlabel("Period")
-    ax.set_ylabel("Value")
-    ax.grid(True, linestyle="--", alpha=0.6)
-    plt.xticks(rotation=45)
-    ax.legend(bbox_to_anchor=(1.05, 1), loc="upper left")
-    plt.tight_layout(rect=[0, 0, 0.8, 1])
-    buf = io.BytesIO()
-    plt.savefig(buf, format="PNG")
-    buf.seek(0)
-    img_buffers.append(buf)
-    plt.close()
+    charts.append(renderer.combined_chart(periods, metric_values))
 
     # Stacked Bar Chart
-    fig, ax = plt.subplots(figsize=(8, 4))
-    bottom_vals = [0] * len(periods)
-    for (metric, vals), color in zip(metric_values.items(), color_palette):
-        ax.bar(periods, vals, bottom=bottom_vals, label=metric, color=color)
-        bottom_vals = [b + v for b, v in zip(bottom_vals, vals)]
-    ax.set_title("Monthly Contribution Breakdown", fontsize=14, fontweight="bold")
-    ax.legend(bbox_to_anchor=(1.05, 1), loc="upper left")
-    plt.xticks(rotation=45)
-    plt.tight_layout(rect=[0, 0, 0.8, 1])
-    buf = io.BytesIO()
-    plt.savefig(buf, format="PNG")
-    buf.seek(0)
-    img_buffers.append(buf)
-    plt.close()
+    charts.append(renderer.stacked_chart(periods, metric_values))
 
     # Pie Chart
-    totals = [sum(vals) for vals in metric_values.values()]
-    fig, ax = plt.subplots(figsize=(6, 6))
-    if sum(totals) > 0:
-        ax.pie(
-            totals,
-            labels=list(metric_values.keys()),
-            autopct="%1.1f%%",
-            colors=color_palette,
-            startangle=140,
-        )
-        ax.set_title("Overall Contribution Share", fontsize=14, fontweight="bold")
-    else:
-        ax.text(
-            0.5,
-            0.5,
-            "No Data Available",
-            ha="center",
-            va="center",
-            fontsize=14,
-            color="gray",
-        )
-        ax.set_title("Overall Contribution Share", fontsize=14, fontweight="bold")
-        ax.axis("off")
-    buf = io.BytesIO()
-    plt.savefig(buf, format="PNG")
-    buf.seek(0)
-    img_buffers.append(buf)
-    plt.close()
+    charts.append(renderer.share_chart(metric_values))
 
     # Heatmap
-    heatmap_data = pd.DataFrame(metric_values, index=periods).T
-    fig, ax = plt.subplots(figsize=(8, 4))
-    sns.heatmap(heatmap_data, annot=True, fmt="g", cmap="YlGnBu", ax=ax)
-    ax.set_title("Activity Intensity Heatmap", fontsize=14, fontweight="bold")
-    plt.xticks(rotation=45)
-    plt.yticks(rotation=0)
-    plt.tight_layout()
-    buf = io.BytesIO()
-    plt.savefig(buf, format="PNG")
-    buf.seek(0)
-    img_buffers.append(buf)
-    plt.close()
-
-    # PDF BUILD
-    pdf_buf = io.BytesIO()
-    doc = SimpleDocTemplate(
-        pdf_buf,
-        pagesize=A4,
-        title=f"{player_name} Performance Report",
-        author="coc-ancient-ruins-website",
-    )
+    charts.append(renderer.heatmap_chart(periods, metric_values))
+
     styles = getSampleStyleSheet()
     elements = []
 
@@ -391,10 +322,157 @@ def generate_player_report(player_name):
 
     # Charts
     elements.append(Paragraph("<b>Visual Insights</b>", styles["Heading2"]))
-    for img in img_buffers:
-        elements.append(Image(img, width=400, height=250))
+    for chart in charts:
+        elements.append(chart)
         elements.append(Spacer(1, 12))
 
-    doc.build(elements, onFirstPage=add_footer, onLaterPages=add_footer)
-    pdf_buf.seek(0)
-    return pdf_buf
\ No newline at end of file
+    return elements
+
+class _StreamBuffer:
+    """
+    Write-only byte sink used to stream archives as they are written.
+
+    The ZIP writer sees an unseekable stream and emits data descriptors,
+    so each member can be yielded as soon as it is complete.
+    """
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        """Return and forget every byte written since the last drain."""
+
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+def _draw_section(canvas, doc, elements):
+    """
+    Lay out one player's flowables on new pages of a shared canvas.
+
+    Every page gets one frame with the geometry of the document template
+    and the report footer, as SimpleDocTemplate.build draws them; a
+    flowable that does not fit is split or moved to the next page.
+
+    Args:
+        canvas (reportlab.pdfgen.canvas.Canvas): Canvas of the PDF
+        doc (SimpleDocTemplate): Template providing the page geometry
+        elements (list[reportlab.platypus.Flowable]): Flowables of the
+            section, consumed as they are drawn
+
+    Raises:
+        LayoutError: A flowable does not fit on an empty page
+    """
+
+    while elements:
+        add_footer(canvas, doc)
+        frame = Frame(doc.leftMargin, doc.bottomMargin, doc.width, doc.height)
+        placed = False
+
+        while elements:
+            if frame.add(elements[0], canvas):
+                elements.pop(0)
+                placed = True
+                continue
+
+            parts = frame.split(elements[0], canvas)
+
+            if len(parts) < 2:
+                break
+
+            elements[0:1] = parts
+
+        if not placed:
+            raise LayoutError(f"{elements[0].identity(30)} does not fit on a page")
+
+        canvas.showPage()
+
+def _archive_name(player_name):
+    """Return a safe ZIP member name for a player's report."""
+
+    return f"{player_name.replace('/', '_').replace(chr(92), '_')}_report.pdf"
+
+def iter_clan_report_zip(players, backend=None):
+    """
+    Stream a ZIP archive containing one PDF report per player.
+
+    Each report is generated, written into the archive and yielded
+    before the next player is processed, so memory use is bounded by a
+    single report regardless of clan size.
+
+    Args:
+        players (list[str]): Player names to include
+        backend (str, optional): Chart backend, defaults to CHART_BACKEND
+
+    Yields:
+        bytes: Consecutive chunks of the ZIP archive
+    """
+
+    sink = _StreamBuffer()
+
+    # PDFs are already compressed, so members are stored as-is
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_STORED) as archive:
+        for player in players:
+            periods, metric_values = get_player_metric_values(player)
+
+            with archive.open(_archive_name(player), mode="w") as member:
+                build_report_pdf(member, player, periods, metric_values, backend)
+
+            yield sink.drain()
+
+    yield sink.drain()
+
+def iter_clan_report_pdf(players, backend=None):
+    """
+    Stream a single combined PDF report covering several players.
+
+    Each player's charts and tables are built and drawn on their own
+    pages before the next player's, but the canvas keeps every finished
+    page until the document is saved: memory grows with the number of
+    players and nothing is sent before the last section is drawn. The
+    saved PDF is written to a spooled temporary file (in memory up to
+    SPOOL_MAX_SIZE, on disk beyond) and then streamed in fixed-size
+    chunks. Callers limit it to CLAN_PDF_MAX_PLAYERS players; larger
+    exports use iter_clan_report_zip, whose memory use is bounded by a
+    single report.
+
+    Args:
+        players (list[str]): Player names to include
+        backend (str, optional): Chart backend, defaults to CHART_BACKEND
+
+    Yields:
+        bytes: Consecutive chunks of the PDF document
+    """
+
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as spool:
+        doc = _report_document(spool, "Ancient Ruins Clan Performance Report")
+        canvas = Canvas(spool, pagesize=doc.pagesize)
+        canvas.setTitle(doc.title)
+        canvas.setAuthor(doc.author)
+
+        for player in players:
+            periods, metric_values = get_player_metric_values(player)
+            _draw_section(
+                canvas,
+                doc,
+                build_report_elements(player, periods, metric_values, backend),
+            )
+
+        canvas.save()
+
+        spool.seek(0)
+
+        while True:
+            chunk = spool.read(STREAM_CHUNK_SIZE)
+
+            if not chunk:
+                break
+
+            yield chunk
\ No newline at end of file
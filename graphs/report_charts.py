@@ -0,0 +1,598 @@
+# graphs/report_charts.py
+
+"""
+Chart rendering backends for the downloadable player PDF reports of the
+Clash of Clans – Ancient Ruins Clan Website.
+
+This module:
+- Provides a vector backend that builds ReportLab drawings
+  (reportlab.graphics) which are embedded directly into the PDF story
+- Provides a raster backend that renders Matplotlib/Seaborn PNG images,
+  reusing a single Agg figure and canvas per worker thread
+- Exposes both backends through one renderer interface so the report
+  builder does not depend on how charts are produced
+
+The vector backend is the default: it avoids the PNG encode/decode
+round trip entirely and keeps the generated PDFs small and sharp at
+any zoom level. The raster backend is kept for visual parity with the
+original Seaborn-styled report.
+"""
+
+# Importing Libraries
+import io
+import threading
+
+import matplotlib
+import seaborn as sns
+import pandas as pd
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from reportlab.lib import colors
+from reportlab.platypus import Image
+from reportlab.graphics.shapes import Drawing, Group, Rect, String, Line
+from reportlab.graphics.charts.linecharts import HorizontalLineChart
+from reportlab.graphics.charts.barcharts import VerticalBarChart
+from reportlab.graphics.charts.piecharts import Pie
+from reportlab.graphics.charts.legends import Legend
+from reportlab.graphics.widgets.markers import makeMarker
+
+matplotlib.use("Agg")
+matplotlib.style.use("seaborn-v0_8")
+
+# Size (in PDF points) of every chart placed in the report
+CHART_WIDTH = 400
+CHART_HEIGHT = 250
+
+# Colour palette shared by every chart of a report
+COLOR_PALETTE = ["#1f77b4", "#2ca02c", "#ff7f0e", "#d62728", "#9467bd"]
+
+# YlGnBu colour ramp used by the activity heatmap
+HEATMAP_RAMP = [
+    "#ffffd9",
+    "#edf8b1",
+    "#c7e9b4",
+    "#7fcdbb",
+    "#41b6c4",
+    "#1d91c0",
+    "#225ea8",
+    "#253494",
+    "#081d58",
+]
+
+def _ramp_color(value, vmax):
+    """
+    Map a value onto the heatmap colour ramp.
+
+    Args:
+        value (float): Cell value
+        vmax (float): Largest value of the heatmap
+
+    Returns:
+        reportlab.lib.colors.Color: Interpolated cell colour
+    """
+
+    if vmax <= 0:
+        return colors.HexColor(HEATMAP_RAMP[0])
+
+    position = max(0.0, min(1.0, value / vmax)) * (len(HEATMAP_RAMP) - 1)
+    low = int(position)
+    high = min(low + 1, len(HEATMAP_RAMP) - 1)
+    fraction = position - low
+
+    return colors.linearlyInterpolatedColor(
+        colors.HexColor(HEATMAP_RAMP[low]),
+        colors.HexColor(HEATMAP_RAMP[high]),
+        0,
+        1,
+        fraction,
+    )
+
+class VectorChartRenderer:
+    """
+    VectorChartRenderer
+
+    Builds report charts as ReportLab drawings.
+
+    Drawings are ReportLab flowables, so they are placed straight into
+    the PDF without any intermediate image encoding.
+    """
+
+    name = "vector"
+
+    def _title(self, drawing, text, color=colors.black):
+        """Add a bold chart title to the top of a drawing."""
+
+        drawing.add(
+            String(
+                CHART_WIDTH / 2,
+                CHART_HEIGHT - 16,
+                text,
+                fontName="Helvetica-Bold",
+                fontSize=12,
+                fillColor=color,
+                textAnchor="middle",
+            )
+        )
+
+    def _legend(self, drawing, labels, x):
+        """Add a colour legend for the report metrics."""
+
+        legend = Legend()
+        legend.x = x
+        legend.y = CHART_HEIGHT - 40
+        legend.fontName = "Helvetica"
+        legend.fontSize = 7
+        legend.boxAnchor = "nw"
+        legend.columnMaximum = len(labels)
+        legend.dx = 6
+        legend.dy = 6
+        legend.colorNamePairs = [
+            (colors.HexColor(color), label)
+            for color, label in zip(COLOR_PALETTE, labels)
+        ]
+        drawing.add(legend)
+
+    def _category_axis(self, chart, periods):
+        """Apply the shared rotated period labels to a category axis."""
+
+        chart.categoryAxis.categoryNames = list(periods)
+        chart.categoryAxis.labels.angle = 45
+        chart.categoryAxis.labels.boxAnchor = "ne"
+        chart.categoryAxis.labels.fontName = "Helvetica"
+        chart.categoryAxis.labels.fontSize = 6
+        chart.valueAxis.labels.fontName = "Helvetica"
+        chart.valueAxis.labels.fontSize = 7
+        chart.valueAxis.gridStrokeColor = colors.lightgrey
+        chart.valueAxis.gridStrokeDashArray = (2, 2)
+        chart.valueAxis.visibleGrid = True
+
+    def metric_chart(self, periods, values, title, color):
+        """
+        Build a single metric trend chart with its average line.
+
+        Args:
+            periods (list[str]): Sorted period identifiers
+            values (list[int]): Metric value for each period
+            title (str): Metric name used as chart title
+            color (str): Hex colour of the metric
+
+        Returns:
+            reportlab.graphics.shapes.Drawing: Chart drawing
+        """
+
+        drawing = Drawing(CHART_WIDTH, CHART_HEIGHT)
+        avg = sum(values) / len(values) if values else 0
+
+        chart = HorizontalLineChart()
+        chart.x = 45
+        chart.y = 55
+        chart.width = CHART_WIDTH - 70
+        chart.height = CHART_HEIGHT - 90
+        chart.data = [list(values) or [0], [avg] * max(len(values), 1)]
+        chart.joinedLines = 1
+        chart.lines[0].strokeColor = colors.HexColor(color)
+        chart.lines[0].strokeWidth = 2
+        chart.lines[0].symbol = makeMarker("FilledCircle")
+        chart.lines[0].symbol.fillColor = colors.HexColor(color)
+        chart.lines[0].symbol.size = 4
+        chart.lines[1].strokeColor = colors.grey
+        chart.lines[1].strokeDashArray = (4, 3)
+        chart.lineLabelFormat = "values"
+        chart.lineLabelArray = [
+            [str(v) for v in values] or [""],
+            [""] * max(len(values), 1),
+        ]
+        chart.lineLabels.fontName = "Helvetica"
+        chart.lineLabels.fontSize = 6
+        chart.lineLabelNudge = 6
+        chart.valueAxis.valueMin = 0
+        self._category_axis(chart, periods)
+        drawing.add(chart)
+
+        self._title(drawing, title, colors.HexColor(color))
+        drawing.add(
+            String(
+                CHART_WIDTH - 20,
+                CHART_HEIGHT - 30,
+                f"Avg: {avg:.1f}",
+                fontName="Helvetica",
+                fontSize=7,
+                fillColor=colors.grey,
+                textAnchor="end",
+            )
+        )
+
+        return drawing
+
+    def combined_chart(self, periods, metric_values):
+        """
+        Build the chart overlaying every metric trend.
+
+        Args:
+            periods (list[str]): Sorted period identifiers
+            metric_values (dict[str, list[int]]): Values per metric
+
+        Returns:
+            reportlab.graphics.shapes.Drawing: Chart drawing
+        """
+
+        drawing = Drawing(CHART_WIDTH, CHART_HEIGHT)
+
+        chart = HorizontalLineChart()
+        chart.x = 45
+        chart.y = 55
+        chart.width = CHART_WIDTH - 150
+        chart.height = CHART_HEIGHT - 90
+        chart.data = [list(vals) or [0] for vals in metric_values.values()]
+        chart.joinedLines = 1
+        chart.valueAxis.valueMin = 0
+
+        for i, color in enumerate(COLOR_PALETTE[: len(metric_values)]):
+            chart.lines[i].strokeColor = colors.HexColor(color)
+            chart.lines[i].strokeWidth = 2
+            chart.lines[i].symbol = makeMarker("FilledCircle")
+            chart.lines[i].symbol.fillColor = colors.HexColor(color)
+            chart.lines[i].symbol.size = 3
+
+        self._category_axis(chart, periods)
+        drawing.add(chart)
+
+        self._title(drawing, "All Metrics Combined")
+        self._legend(drawing, list(metric_values.keys()), CHART_WIDTH - 95)
+
+        return drawing
+
+    def stacked_chart(self, periods, metric_values):
+        """
+        Build the monthly contribution breakdown as a stacked bar chart.
+
+        Args:
+            periods (list[str]): Sorted period identifiers
+            metric_values (dict[str, list[int]]): Values per metric
+
+        Returns:
+            reportlab.graphics.shapes.Drawing: Chart drawing
+        """
+
+        drawing = Drawing(CHART_WIDTH, CHART_HEIGHT)
+
+        chart = VerticalBarChart()
+        chart.x = 45
+        chart.y = 55
+        chart.width = CHART_WIDTH - 150
+        chart.height = CHART_HEIGHT - 90
+        chart.data = [list(vals) or [0] for vals in metric_values.values()]
+        chart.categoryAxis.style = "stacked"
+        chart.barSpacing = 0
+        chart.groupSpacing = 2
+        chart.valueAxis.valueMin = 0
+
+        for i, color in enumerate(COLOR_PALETTE[: len(metric_values)]):
+            chart.bars[i].fillColor = colors.HexColor(color)
+            chart.bars[i].strokeColor = None
+
+        self._category_axis(chart, periods)
+        drawing.add(chart)
+
+        self._title(drawing, "Monthly Contribution Breakdown")
+        self._legend(drawing, list(metric_values.keys()), CHART_WIDTH - 95)
+
+        return drawing
+
+    def share_chart(self, metric_values):
+        """
+        Build the overall contribution share pie chart.
+
+        Args:
+            metric_values (dict[str, list[int]]): Values per metric
+
+        Returns:
+            reportlab.graphics.shapes.Drawing: Chart drawing
+        """
+
+        drawing = Drawing(CHART_WIDTH, CHART_HEIGHT)
+        self._title(drawing, "Overall Contribution Share")
+
+        totals = [sum(vals) for vals in metric_values.values()]
+        grand_total = sum(totals)
+
+        if grand_total <= 0:
+            drawing.add(
+                String(
+                    CHART_WIDTH / 2,
+                    CHART_HEIGHT / 2,
+                    "No Data Available",
+                    fontName="Helvetica",
+                    fontSize=14,
+                    fillColor=colors.grey,
+                    textAnchor="middle",
+                )
+            )
+            return drawing
+
+        pie = Pie()
+        pie.x = CHART_WIDTH / 2 - 85
+        pie.y = 25
+        pie.width = 170
+        pie.height = 170
+        pie.data = totals
+        pie.startAngle = 140
+        pie.direction = "anticlockwise"
+        pie.labels = [
+            f"{metric} {total / grand_total * 100:.1f}%" if total else ""
+            for metric, total in zip(metric_values.keys(), totals)
+        ]
+        pie.simpleLabels = 0
+        pie.sideLabels = 1
+        pie.slices.fontName = "Helvetica"
+        pie.slices.fontSize = 7
+        pie.slices.strokeColor = colors.white
+
+        for i, color in enumerate(COLOR_PALETTE[: len(totals)]):
+            pie.slices[i].fillColor = colors.HexColor(color)
+
+        drawing.add(pie)
+
+        return drawing
+
+    def heatmap_chart(self, periods, metric_values):
+        """
+        Build the annotated metric × period activity heatmap.
+
+        Args:
+            periods (list[str]): Sorted period identifiers
+            metric_values (dict[str, list[int]]): Values per metric
+
+        Returns:
+            reportlab.graphics.shapes.Drawing: Chart drawing
+        """
+
+        drawing = Drawing(CHART_WIDTH, CHART_HEIGHT)
+        self._title(drawing, "Activity Intensity Heatmap")
+
+        metrics = list(metric_values.keys())
+        left, bottom = 85, 55
+        grid_width = CHART_WIDTH - left - 10
+        grid_height = CHART_HEIGHT - bottom - 30
+
+        if not periods or not metrics:
+            return drawing
+
+        cell_w = grid_width / len(periods)
+        cell_h = grid_height / len(metrics)
+        vmax = max((max(vals) for vals in metric_values.values() if vals), default=0)
+
+        for row, metric in enumerate(metrics):
+            y = bottom + grid_height - (row + 1) * cell_h
+
+            drawing.add(
+                String(
+                    left - 4,
+                    y + cell_h / 2 - 3,
+                    metric,
+                    fontName="Helvetica",
+                    fontSize=7,
+                    textAnchor="end",
+                )
+            )
+
+            for col, value in enumerate(metric_values[metric]):
+                fill = _ramp_color(value, vmax)
+                drawing.add(
+                    Rect(
+                        left + col * cell_w,
+                        y,
+                        cell_w,
+                        cell_h,
+                        fillColor=fill,
+                        strokeColor=colors.white,
+                        strokeWidth=0.5,
+                    )
+                )
+                # Light text on dark cells, dark text on light cells
+                drawing.add(
+                    String(
+                        left + (col + 0.5) * cell_w,
+                        y + cell_h / 2 - 2,
+                        str(value),
+                        fontName="Helvetica",
+                        fontSize=5,
+                        fillColor=(
+                            colors.white
+                            if vmax and value / vmax > 0.5
+                            else colors.black
+                        ),
+                        textAnchor="middle",
+                    )
+                )
+
+        for col, period in enumerate(periods):
+            x = left + (col + 0.5) * cell_w
+            drawing.add(Line(x, bottom, x, bottom - 2, strokeColor=colors.grey))
+            label = String(
+                x, bottom - 6, period, fontName="Helvetica", fontSize=5, textAnchor="end"
+            )
+            drawing.add(_rotated(label, 45))
+
+        return drawing
+
+def _rotated(string, angle):
+    """
+    Wrap a String into a rotated group anchored at the string position.
+
+    Args:
+        string (reportlab.graphics.shapes.String): Label to rotate
+        angle (float): Rotation in degrees
+
+    Returns:
+        reportlab.graphics.shapes.Group: Rotated label
+    """
+
+    x, y = string.x, string.y
+    string.x, string.y = 0, 0
+    group = Group(string)
+    group.translate(x, y)
+    group.rotate(angle)
+
+    return group
+
+class RasterChartRenderer:
+    """
+    RasterChartRenderer
+
+    Renders report charts as PNG images with Matplotlib and Seaborn.
+
+    A single Agg figure and canvas is created per worker thread and
+    cleared between charts, avoiding pyplot's global figure manager and
+    the cost of creating a new figure for every chart.
+    """
+
+    name = "raster"
+
+    _local = threading.local()
+
+    def _figure(self, width, height):
+        """
+        Return the cleared, resized figure owned by the current thread.
+        """
+
+        fig = getattr(self._local, "figure", None)
+
+        if fig is None:
+            fig = Figure()
+            FigureCanvasAgg(fig)
+            self._local.figure = fig
+
+        fig.clf()
+        fig.set_size_inches(width, height)
+
+        return fig
+
+    def _to_image(self, fig, **layout):
+        """Encode the figure as PNG and wrap it as a ReportLab Image."""
+
+        fig.tight_layout(**layout)
+        buf = io.BytesIO()
+        fig.savefig(buf, format="PNG")
+        buf.seek(0)
+
+        return Image(buf, width=CHART_WIDTH, height=CHART_HEIGHT)
+
+    def metric_chart(self, periods, values, title, color):
+        """Render a single metric trend chart with its average line."""
+
+        fig = self._figure(8, 4)
+        ax = fig.add_subplot()
+        ax.plot(periods, values, marker="o", color=color, linewidth=2)
+        avg = sum(values) / len(values) if values else 0
+        ax.axhline(
+            avg, linestyle="--", color="gray", alpha=0.7, label=f"Avg: {avg:.1f}"
+        )
+        ax.set_title(title, fontsize=14, fontweight="bold", color=color)
+        ax.set_xlabel("Period")
+        ax.set_ylabel(title)
+        ax.grid(True, linestyle="--", alpha=0.6)
+        ax.tick_params(axis="x", labelrotation=45)
+        for i, val in enumerate(values):
+            ax.text(i, val + (max(values) * 0.05), str(val), ha="center", fontsize=8)
+        ax.legend()
+
+        return self._to_image(fig)
+
+    def combined_chart(self, periods, metric_values):
+        """Render the chart overlaying every metric trend."""
+
+        fig = self._figure(8, 4)
+        ax = fig.add_subplot()
+        for (metric, vals), color in zip(metric_values.items(), COLOR_PALETTE):
+            ax.plot(periods, vals, marker="o", linewidth=2, label=metric, color=color)
+        ax.set_title("All Metrics Combined", fontsize=14, fontweight="bold")
+        ax.set_xlabel("Period")
+        ax.set_ylabel("Value")
+        ax.grid(True, linestyle="--", alpha=0.6)
+        ax.tick_params(axis="x", labelrotation=45)
+        ax.legend(bbox_to_anchor=(1.05, 1), loc="upper left")
+
+        return self._to_image(fig, rect=[0, 0, 0.8, 1])
+
+    def stacked_chart(self, periods, metric_values):
+        """Render the monthly contribution breakdown as stacked bars."""
+
+        fig = self._figure(8, 4)
+        ax = fig.add_subplot()
+        bottom_vals = [0] * len(periods)
+        for (metric, vals), color in zip(metric_values.items(), COLOR_PALETTE):
+            ax.bar(periods, vals, bottom=bottom_vals, label=metric, color=color)
+            bottom_vals = [b + v for b, v in zip(bottom_vals, vals)]
+        ax.set_title("Monthly Contribution Breakdown", fontsize=14, fontweight="bold")
+        ax.legend(bbox_to_anchor=(1.05, 1), loc="upper left")
+        ax.tick_params(axis="x", labelrotation=45)
+
+        return self._to_image(fig, rect=[0, 0, 0.8, 1])
+
+    def share_chart(self, metric_values):
+        """Render the overall contribution share pie chart."""
+
+        totals = [sum(vals) for vals in metric_values.values()]
+        fig = self._figure(6, 6)
+        ax = fig.add_subplot()
+        if sum(totals) > 0:
+            ax.pie(
+                totals,
+                labels=list(metric_values.keys()),
+                autopct="%1.1f%%",
+                colors=COLOR_PALETTE,
+                startangle=140,
+            )
+        else:
+            ax.text(
+                0.5,
+                0.5,
+                "No Data Available",
+                ha="center",
+                va="center",
+                fontsize=14,
+                color="gray",
+            )
+            ax.axis("off")
+        ax.set_title("Overall Contribution Share", fontsize=14, fontweight="bold")
+
+        buf = io.BytesIO()
+        fig.savefig(buf, format="PNG")
+        buf.seek(0)
+
+        return Image(buf, width=CHART_WIDTH, height=CHART_HEIGHT)
+
+    def heatmap_chart(self, periods, metric_values):
+        """Render the annotated metric × period activity heatmap."""
+
+        heatmap_data = pd.DataFrame(metric_values, index=periods).T
+        fig = self._figure(8, 4)
+        ax = fig.add_subplot()
+        sns.heatmap(heatmap_data, annot=True, fmt="g", cmap="YlGnBu", ax=ax)
+        ax.set_title("Activity Intensity Heatmap", fontsize=14, fontweight="bold")
+        ax.tick_params(axis="x", labelrotation=45)
+        ax.tick_params(axis="y", labelrotation=0)
+
+        return self._to_image(fig)
+
+# Available chart backends keyed by name
+CHART_RENDERERS = {
+    VectorChartRenderer.name: VectorChartRenderer(),
+    RasterChartRenderer.name: RasterChartRenderer(),
+}
+
+def get_chart_renderer(backend):
+    """
+    Return the chart renderer registered for a backend name.
+
+    Unknown names fall back to the vector backend.
+
+    Args:
+        backend (str): Backend name ('vector' or 'raster')
+
+    Returns:
+        VectorChartRenderer | RasterChartRenderer: Chart renderer
+    """
+
+    return CHART_RENDERERS.get(backend, CHART_RENDERERS[VectorChartRenderer.name])
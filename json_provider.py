@@ -0,0 +1,107 @@
+"""
+json_provider.py
+
+Provides fast JSON serialization for Plotly figures and API payloads.
+
+Figures and Flask JSON responses are encoded with orjson (native NumPy
+arrays and scalars, UTF-8 output) when it is installed, and with the
+standard library otherwise. Both paths produce the same JSON values:
+figures follow plotly.utils.PlotlyJSONEncoder (NaN and Infinity become
+null) and responses follow Flask's default provider (sorted keys, HTTP
+dates).
+"""
+import json
+
+from flask.json.provider import DefaultJSONProvider
+from plotly.utils import PlotlyJSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Serializer used for figures and responses ("orjson" or "json")
+JSON_ENGINE = "orjson" if orjson is not None else "json"
+
+# json.dumps arguments FastJSONProvider maps to orjson options
+ORJSON_ARGUMENTS = {"sort_keys", "indent", "separators", "ensure_ascii"}
+
+# Handles the values orjson does not encode natively (plotly objects,
+# pandas objects, non-contiguous or object NumPy arrays, ...)
+_plotly_default = PlotlyJSONEncoder().default
+
+if orjson is not None:
+    FIGURE_OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+
+    RESPONSE_OPTIONS = (
+        orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+
+def dumps_figure_json(figure):
+    """
+    Serialize a figure with the standard library (PlotlyJSONEncoder).
+
+    Args:
+        figure (FigureSpec | plotly.graph_objects.Figure | dict): Figure
+
+    Returns:
+        str: Figure JSON
+    """
+
+    return json.dumps(figure, cls=PlotlyJSONEncoder)
+
+
+def dumps_figure_orjson(figure):
+    """
+    Serialize a figure with orjson.
+
+    Args:
+        figure (FigureSpec | plotly.graph_objects.Figure | dict): Figure
+
+    Returns:
+        str: Figure JSON
+    """
+
+    return orjson.dumps(figure, default=_plotly_default, option=FIGURE_OPTIONS).decode()
+
+
+# Figure serializer used by the routes
+dumps_figure = dumps_figure_orjson if orjson is not None else dumps_figure_json
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider encoding responses with orjson when available.
+
+    Output is compact (or indented by 2) UTF-8 whatever the separators
+    and ensure_ascii arguments. Calls with other arguments (a custom
+    encoder class, another indentation, ...) use the default provider.
+    """
+
+    def dumps(self, obj, **kwargs):
+        """Serialize data as JSON to a string."""
+
+        indent = kwargs.get("indent")
+
+        if orjson is None or set(kwargs) - ORJSON_ARGUMENTS or indent not in (None, 2):
+            return super().dumps(obj, **kwargs)
+
+        option = RESPONSE_OPTIONS
+
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+
+def init_json_provider(app):
+    """Encode the JSON responses of the app with FastJSONProvider."""
+
+    app.json = FastJSONProvider(app)
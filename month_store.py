@@ -0,0 +1,370 @@
+# month_store.py
+
+"""
+Shared typed loader for the monthly coc-data files.
+
+Clan member, former member, monthly analysis and top contributor files
+are published as JSON rows with every number written as a string. This
+module parses a file once into typed columns, validates it against the
+columns its kind must carry and caches the result, so the graphs, the
+GitHub API routes and the chatbot share one conversion.
+
+Responsibilities:
+- Fetch a month file and validate its columns
+- Store integer columns (srno and the metrics) as int32 arrays with a
+  validity mask, and war / status as categoricals
+- Provide the table as a DataFrame (graphs) and as typed rows (GitHub
+  API, chatbot)
+- Cache parsed tables per URL with a time-to-live
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from itertools import chain
+
+import numpy as np
+import pandas as pd
+import requests
+
+from performance_store import METRIC_KEYS
+
+# Month file kind → columns every file of the kind must carry
+MONTH_FILE_COLUMNS = {
+    "members": ("name", "status", "war", *METRIC_KEYS),
+    "former": ("name", *METRIC_KEYS),
+    "analysis": ("name", *METRIC_KEYS),
+    "contributors": ("name",),
+}
+
+# Whole-number columns, parsed to int32
+INT_COLUMNS = ("srno", *METRIC_KEYS)
+
+# Low-cardinality text columns, parsed to categoricals
+CATEGORY_COLUMNS = ("war", "status")
+
+INT32 = np.iinfo(np.int32)
+
+# Seconds a parsed file is served before it is fetched again
+MONTH_FILE_TTL = 3600
+
+# Maximum number of parsed files kept in memory
+MONTH_FILE_CACHE_SIZE = 32
+
+# Seconds to wait for GitHub
+FETCH_TIMEOUT = 10
+
+
+class MonthFileError(ValueError):
+    """A month file is not valid JSON or lacks a column of its kind."""
+
+
+class MonthFileMissing(MonthFileError):
+    """
+    A month file could not be downloaded.
+
+    Attributes:
+        url (str): URL of the file
+        status_code (int): HTTP status of the reply
+    """
+
+    def __init__(self, url, status_code):
+        super().__init__(f"{url} returned HTTP {status_code}")
+        self.url = url
+        self.status_code = status_code
+
+
+def _to_int(value):
+    """Whole number of a published value, None when it has none."""
+
+    if isinstance(value, float):
+        number = int(value) if value.is_integer() else None
+    else:
+        try:
+            number = int(value)
+        except (TypeError, ValueError):
+            return None
+
+    if number is None or not INT32.min <= number <= INT32.max:
+        return None
+
+    return number
+
+
+def _parse_ints(raw):
+    """
+    Parse the values of an integer column.
+
+    Values that are missing, not numbers, not whole numbers or outside
+    the int32 range are marked invalid (stored as 0).
+
+    Args:
+        raw (list): Column values as published
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray]: int32 values and validity mask
+    """
+
+    values = None
+
+    # Fast path: every value is an integer or an integer string
+    if not any(isinstance(value, float) for value in raw):
+        try:
+            values = np.fromiter(map(int, raw), dtype=np.int64, count=len(raw))
+        except (TypeError, ValueError, OverflowError):
+            pass
+
+    if values is not None:
+        valid = np.ones(len(values), dtype=bool)
+    else:
+        parsed = [_to_int(value) for value in raw]
+        valid = np.array([value is not None for value in parsed], dtype=bool)
+        values = np.array(
+            [0 if value is None else value for value in parsed], dtype=np.int64
+        )
+
+    valid &= (values >= INT32.min) & (values <= INT32.max)
+
+    return np.where(valid, values, 0).astype(np.int32), valid
+
+
+class MonthTable:
+    """
+    MonthTable
+
+    Typed, read-only columns of one month file.
+
+    Attributes:
+        kind (str): Month file kind (see MONTH_FILE_COLUMNS)
+        columns (list[str]): Column names, in file order
+        names (list[str]): Player name of every row
+        ints (dict): Integer column → (int32 values, validity mask)
+        categories (dict): Categorical column → pandas.Categorical
+        other (dict): Remaining column → list of published values
+    """
+
+    def __init__(self, kind, columns, names, ints, categories, other):
+        self.kind = kind
+        self.columns = columns
+        self.names = names
+        self.ints = ints
+        self.categories = categories
+        self.other = other
+        self._frame = None
+        self._records = None
+
+    def __len__(self):
+        return len(self.names)
+
+    def total(self, column):
+        """
+        Sum of the valid values of an integer column (0 when absent).
+        """
+
+        if column not in self.ints:
+            return 0
+
+        values, valid = self.ints[column]
+
+        return int(values[valid].sum(dtype=np.int64))
+
+    def _column_values(self, column):
+        """Values of a column as Python objects, None where missing."""
+
+        if column in self.ints:
+            values, valid = self.ints[column]
+
+            if valid.all():
+                return values.tolist()
+
+            return [
+                value if ok else None
+                for value, ok in zip(values.tolist(), valid.tolist())
+            ]
+
+        if column in self.categories:
+            return [
+                None if value != value else value
+                for value in np.asarray(self.categories[column], dtype=object)
+            ]
+
+        if column == "name":
+            return self.names
+
+        return self.other[column]
+
+    def frame(self):
+        """
+        The table as a DataFrame, built once and shared: callers must not
+        modify it.
+
+        Integer columns are int32, or float64 with NaN for columns that
+        have missing values; war / status are categoricals.
+
+        Returns:
+            pandas.DataFrame: One row per player, columns in file order
+        """
+
+        if self._frame is None:
+            data = {}
+
+            for column in self.columns:
+                if column in self.ints:
+                    values, valid = self.ints[column]
+                    data[column] = (
+                        values if valid.all() else np.where(valid, values, np.nan)
+                    )
+                elif column in self.categories:
+                    data[column] = self.categories[column]
+                else:
+                    data[column] = self._column_values(column)
+
+            self._frame = pd.DataFrame(data, columns=self.columns)
+
+        return self._frame
+
+    def records(self):
+        """
+        The table as JSON-ready rows, built once and shared: callers must
+        not modify them.
+
+        Integers are ints and missing values None, in every row.
+
+        Returns:
+            list[dict]: One dictionary per player, keys in file order
+        """
+
+        if self._records is None:
+            columns = [self._column_values(column) for column in self.columns]
+            self._records = [dict(zip(self.columns, row)) for row in zip(*columns)]
+
+        return self._records
+
+
+def parse_month_file(rows, kind):
+    """
+    Parse the JSON rows of a month file into a MonthTable.
+
+    Args:
+        rows (list[dict]): Parsed JSON content of the file
+        kind (str): Month file kind (see MONTH_FILE_COLUMNS)
+
+    Returns:
+        MonthTable: Typed columns of the file
+
+    Raises:
+        MonthFileError: When the content is not a list of objects or lacks
+            a column of its kind
+    """
+
+    if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+        raise MonthFileError(f"{kind} file is not a list of JSON objects")
+
+    columns = list(dict.fromkeys(chain.from_iterable(rows)))
+
+    missing = [column for column in MONTH_FILE_COLUMNS[kind] if column not in columns]
+
+    if rows and missing:
+        raise MonthFileError(f"{kind} file lacks columns: {', '.join(missing)}")
+
+    ints = {}
+    categories = {}
+    other = {}
+
+    for column in columns:
+        raw = [row.get(column) for row in rows]
+
+        if column in INT_COLUMNS:
+            ints[column] = _parse_ints(raw)
+        elif column in CATEGORY_COLUMNS:
+            categories[column] = pd.Categorical(raw)
+        else:
+            other[column] = raw
+
+    names = other.pop("name", [None] * len(rows))
+
+    return MonthTable(kind, columns, names, ints, categories, other)
+
+
+# (kind, URL) → (expiry, MonthTable), most recently used last
+_tables = OrderedDict()
+
+_lock = threading.Lock()
+
+
+def _cached_table(key):
+    """Return a cached table, or None when absent or expired."""
+
+    with _lock:
+        entry = _tables.get(key)
+
+        if entry is None:
+            return None
+
+        if time.monotonic() >= entry[0]:
+            del _tables[key]
+            return None
+
+        _tables.move_to_end(key)
+        return entry[1]
+
+
+def _store_table(key, table):
+    """Cache a parsed table, evicting the least recently used ones."""
+
+    with _lock:
+        _tables[key] = (time.monotonic() + MONTH_FILE_TTL, table)
+        _tables.move_to_end(key)
+
+        while len(_tables) > MONTH_FILE_CACHE_SIZE:
+            _tables.popitem(last=False)
+
+
+def clear_month_cache():
+    """Drop every cached month file."""
+
+    with _lock:
+        _tables.clear()
+
+
+def load_month_file(url, kind):
+    """
+    Fetch, parse and cache a month file.
+
+    Parsed tables are cached per URL for MONTH_FILE_TTL seconds and shared
+    between requests.
+
+    Args:
+        url (str): Raw GitHub URL of the file
+        kind (str): Month file kind (see MONTH_FILE_COLUMNS)
+
+    Returns:
+        MonthTable: Typed columns of the file
+
+    Raises:
+        MonthFileMissing: When GitHub does not return the file
+        MonthFileError: When the file is not valid JSON or lacks a column
+        requests.exceptions.RequestException: When GitHub is unreachable
+    """
+
+    table = _cached_table((kind, url))
+
+    if table is not None:
+        return table
+
+    response = requests.get(url, timeout=FETCH_TIMEOUT)
+
+    if response.status_code != 200:
+        raise MonthFileMissing(url, response.status_code)
+
+    try:
+        rows = response.json()
+    except ValueError as error:
+        raise MonthFileError(
+            f"Invalid JSON response from GitHub: {response.text[:200]}"
+        ) from error
+
+    table = parse_month_file(rows, kind)
+    _store_table((kind, url), table)
+
+    return table
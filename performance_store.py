@@ -0,0 +1,458 @@
+# performance_store.py
+
+"""
+Shared columnar store for the Clan Monthly Performance dataset.
+
+The dataset is published as a wide table with one column per metric and
+period (e.g. `warattack_JAN-FEB_2026`). This module loads it once and
+converts it into a NumPy cube so the dashboard, player reports and AI
+predictions can slice values instead of re-parsing column names.
+
+Responsibilities:
+- Fetch the Clan Monthly Performance JSON
+- Build a player × metric × period int32 cube with a validity mask
+- Keep a chronologically sorted period index
+- Version every load so derived caches can detect stale data
+- Revalidate the fetched dataset every PERFORMANCE_CUBE_TTL seconds
+  (conditional GET in a background thread) and reload it when the
+  published file changed
+- Notify registered listeners when the dataset is reloaded
+"""
+
+import hashlib
+import io
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import requests
+
+from constants import CLAN_MONTHLY_PERFORMANCE_RANGE
+
+# Dataset
+JSON_URL = (
+    "https://raw.githubusercontent.com/"
+    "Lightning-President-9/ClanDataRepo/"
+    "refs/heads/main/"
+    "Clan%20Members/"
+    "Clan%20Monthly%20Performance%20JSON/"
+    f"clan_monthly_performance_{CLAN_MONTHLY_PERFORMANCE_RANGE}.json"
+)
+
+# Seconds the fetched dataset is served before it is revalidated
+PERFORMANCE_CUBE_TTL = 3600
+
+# Seconds before a failed revalidation is retried
+PERFORMANCE_RETRY_DELAY = 60
+
+# Seconds to wait for GitHub
+FETCH_TIMEOUT = 10
+
+# Metric column prefixes, in cube order
+METRIC_KEYS = (
+    "warattack",
+    "clancapital",
+    "clangames",
+    "clangamesmaxed",
+    "clanscore",
+)
+
+# Placeholder used by the dataset for months a player was not in the clan
+MISSING_VALUE = -1
+
+MONTH_MAP = {
+    "JAN": 1,
+    "FEB": 2,
+    "MAR": 3,
+    "APR": 4,
+    "MAY": 5,
+    "JUN": 6,
+    "JUL": 7,
+    "AUG": 8,
+    "SEP": 9,
+    "OCT": 10,
+    "NOV": 11,
+    "DEC": 12,
+}
+
+
+def period_sort_key(period):
+    """
+    Generate a chronological sorting key for a period identifier.
+
+    Cross-year ranges such as DEC-JAN_2025 start in the previous year.
+    Unparseable periods sort last.
+
+    Args:
+        period (str): Period identifier (e.g. 'NOV-DEC_2024')
+
+    Returns:
+        datetime: Start date of the period
+    """
+
+    try:
+        part, year = period.upper().split("_")
+        start_month, end_month = part.split("-")
+        year = int(year)
+
+        if start_month == "DEC" and end_month == "JAN":
+            year -= 1
+
+        return datetime(year, MONTH_MAP[start_month], 1)
+
+    except Exception:
+        return datetime.max
+
+
+class PerformanceCube:
+    """
+    PerformanceCube
+
+    Columnar view of the Clan Monthly Performance dataset.
+
+    Attributes:
+        frame (pandas.DataFrame): Original wide dataset
+        names (list[str]): Player name of every cube row
+        metrics (tuple[str]): Metric keys along the second axis
+        periods (list[str]): Periods along the third axis, oldest first
+        values (numpy.ndarray): int32 array (players, metrics, periods),
+            MISSING_VALUE where a player has no data
+        valid (numpy.ndarray): Boolean mask of present values
+        version (int): Load counter of the dataset
+    """
+
+    def __init__(self, frame, version=0):
+        """
+        Convert a wide performance table into the cube.
+
+        Args:
+            frame (pandas.DataFrame): Wide Clan Monthly Performance table
+            version (int): Version assigned to this dataset
+        """
+
+        self.frame = frame
+        self.version = version
+        self.names = frame["name"].tolist()
+        self.metrics = METRIC_KEYS
+
+        # Map every "<metric>_<period>" column to its cube position
+        columns = {}
+        periods = set()
+
+        for column in frame.columns:
+            metric, _, period = column.partition("_")
+
+            if metric in METRIC_KEYS and period:
+                columns[column] = (metric, period)
+                periods.add(period)
+
+        self.periods = sorted(periods, key=period_sort_key)
+
+        self.player_index = {}
+        for row, name in enumerate(self.names):
+            self.player_index.setdefault(name, row)
+
+        self.metric_index = {metric: i for i, metric in enumerate(self.metrics)}
+        self.period_index = {period: i for i, period in enumerate(self.periods)}
+
+        values = np.full(
+            (len(self.names), len(self.metrics), len(self.periods)),
+            MISSING_VALUE,
+            dtype=np.int32,
+        )
+
+        for column, (metric, period) in columns.items():
+            series = pd.to_numeric(frame[column], errors="coerce")
+            values[:, self.metric_index[metric], self.period_index[period]] = (
+                series.fillna(MISSING_VALUE).to_numpy()
+            )
+
+        self.values = values
+        self.valid = values != MISSING_VALUE
+
+    def _metric_position(self, metric):
+        """Return the cube position of a metric key or column prefix."""
+
+        return self.metric_index[metric.rstrip("_")]
+
+    def player_row(self, name):
+        """
+        Return the cube row of a player (first match), or None.
+        """
+
+        return self.player_index.get(name)
+
+    def metric_matrix(self, metric):
+        """
+        Return values and validity of one metric for every player.
+
+        Args:
+            metric (str): Metric key or column prefix (e.g. 'warattack_')
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray]: (players, periods) values
+            and validity mask
+        """
+
+        position = self._metric_position(metric)
+
+        return self.values[:, position, :], self.valid[:, position, :]
+
+    def player_matrix(self, name):
+        """
+        Return values and validity of every metric for one player.
+
+        Args:
+            name (str): Player name
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray] or None: (metrics, periods)
+            values and validity mask
+        """
+
+        row = self.player_row(name)
+
+        if row is None:
+            return None
+
+        return self.values[row], self.valid[row]
+
+    def contributions(self):
+        """
+        Return values with missing months counted as 0.
+
+        Returns:
+            numpy.ndarray: int32 array (players, metrics, periods)
+        """
+
+        return np.clip(self.values, 0, None)
+
+
+# Currently loaded cube (fetched on first use)
+_cube = None
+
+_version = 0
+
+_lock = threading.Lock()
+
+_first_load_lock = threading.Lock()
+
+# Callbacks run with the new cube whenever a loaded cube is replaced
+_reload_listeners = []
+
+# Validators of the fetched dataset (ETag, Last-Modified, body digest),
+# None when the cube was loaded from a given frame
+_validators = None
+
+# Monotonic time after which the fetched dataset is revalidated
+_expires = None
+
+# Held by the thread revalidating the dataset
+_refresh_lock = threading.Lock()
+
+
+def on_cube_reload(callback):
+    """
+    Register a callback run after every reload of the dataset.
+
+    The first load is not a reload: callbacks only run when a loaded
+    cube is replaced, in the thread that reloaded it.
+
+    Args:
+        callback (callable): Called with the new PerformanceCube
+
+    Returns:
+        callable: The callback (usable as a decorator)
+    """
+
+    _reload_listeners.append(callback)
+
+    return callback
+
+
+def _validators_of(response):
+    """Return the (ETag, Last-Modified, body digest) of a dataset reply."""
+
+    return (
+        response.headers.get("ETag"),
+        response.headers.get("Last-Modified"),
+        hashlib.sha256(response.content).hexdigest(),
+    )
+
+
+def _fetch_dataset(headers=None):
+    """
+    GET the published dataset.
+
+    Raises:
+        requests.exceptions.RequestException: When GitHub is unreachable
+            or answers with an error
+    """
+
+    response = requests.get(JSON_URL, headers=headers, timeout=FETCH_TIMEOUT)
+    response.raise_for_status()
+
+    return response
+
+
+def _read_dataset(response):
+    """Parse a dataset reply into the wide table."""
+
+    return pd.read_json(io.StringIO(response.text))
+
+
+def load_performance_cube(frame=None):
+    """
+    (Re)load the dataset and replace the shared cube.
+
+    A fetched dataset is revalidated after PERFORMANCE_CUBE_TTL seconds
+    (see get_performance_cube); a given frame is kept until the next
+    explicit load.
+
+    Args:
+        frame (pandas.DataFrame, optional): Dataset to use instead of
+            fetching JSON_URL
+
+    Returns:
+        PerformanceCube: Newly loaded cube
+    """
+
+    validators = None
+
+    if frame is None:
+        response = _fetch_dataset()
+        frame = _read_dataset(response)
+        validators = _validators_of(response)
+
+    return _replace_cube(frame, validators)
+
+
+def _replace_cube(frame, validators):
+    """Install a new cube version and notify the reload listeners."""
+
+    global _cube, _version, _validators, _expires
+
+    with _lock:
+        reloaded = _cube is not None
+        _version += 1
+        _cube = cube = PerformanceCube(frame, _version)
+        _validators = validators
+        _expires = (
+            time.monotonic() + PERFORMANCE_CUBE_TTL if validators else None
+        )
+
+    if reloaded:
+        for callback in list(_reload_listeners):
+            callback(cube)
+
+    return cube
+
+
+def _postpone(delay, validators=None):
+    """
+    Serve the current cube for another delay seconds, optionally with
+    the validators of an unchanged reply.
+    """
+
+    global _validators, _expires
+
+    with _lock:
+        if _expires is not None:
+            _expires = time.monotonic() + delay
+
+            if validators:
+                _validators = validators
+
+
+def _revalidate(validators):
+    """
+    Conditional GET of the dataset; reload the cube when it changed.
+
+    An unchanged file (304, or the same body digest) keeps the current
+    cube and its version. Failures keep it too and are retried after
+    PERFORMANCE_RETRY_DELAY seconds.
+    """
+
+    etag, last_modified, digest = validators
+    headers = {}
+
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    try:
+        response = _fetch_dataset(headers)
+
+        if response.status_code == 304:
+            _postpone(PERFORMANCE_CUBE_TTL)
+            return
+
+        fetched = _validators_of(response)
+
+        if fetched[2] == digest:
+            _postpone(PERFORMANCE_CUBE_TTL, fetched)
+            return
+
+        frame = _read_dataset(response)
+
+    except (requests.RequestException, ValueError):
+        # Keep serving the current cube while the source is unavailable
+        _postpone(PERFORMANCE_RETRY_DELAY)
+        return
+
+    _replace_cube(frame, fetched)
+
+
+def _refresh_in_background():
+    """Revalidate the fetched dataset once its TTL has expired."""
+
+    if not _refresh_lock.acquire(blocking=False):
+        return
+
+    with _lock:
+        validators = _validators
+        due = _expires is not None and time.monotonic() >= _expires
+
+    if not due:
+        _refresh_lock.release()
+        return
+
+    def refresh():
+        try:
+            _revalidate(validators)
+        finally:
+            _refresh_lock.release()
+
+    threading.Thread(
+        target=refresh,
+        name="performance-cube-refresh",
+        daemon=True,
+    ).start()
+
+
+def get_performance_cube():
+    """
+    Return the shared cube, loading the dataset on first use.
+
+    Once the fetched dataset is older than PERFORMANCE_CUBE_TTL, the
+    current cube keeps being returned while a background thread
+    revalidates it; a changed file is reloaded under a new version,
+    which rolls over every version-keyed cache and runs the reload
+    listeners.
+
+    Returns:
+        PerformanceCube: Current cube
+    """
+
+    if _cube is None:
+        with _first_load_lock:
+            if _cube is None:
+                load_performance_cube()
+
+    elif _expires is not None and time.monotonic() >= _expires:
+        _refresh_in_background()
+
+    return _cube
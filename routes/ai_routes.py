@@ -8,7 +8,8 @@ analytics including performance prediction and player clustering.
 
 Responsibilities:
 • AI prediction visualization routes
-• Player clustering visualization routes
+• Player clustering visualization routes (figures loaded lazily)
+• Cluster assignment JSON APIs (per month and joint trajectories)
 • Integration with AI service layer
 • Graph serialization for frontend rendering
 
@@ -17,12 +18,12 @@ Acts as the presentation layer between AI service modules and UI templates.
 
 Features Provided:
 • Clan performance forecasting using ML models
-• Player clustering using KMeans
+• Player clustering using KMeans (precomputed once per month file)
 • Plotly graph serialization
 • Month based filtering for cluster analysis
 
 Dependencies:
-• ai_service → AI prediction logic
+• ai_service → AI prediction logic and cluster assignments
 • graph_service → Clustering logic
 • Plotly → Graph visualization
 • Flask Blueprint → Modular routing
@@ -31,15 +32,21 @@ Design Pattern:
 Blueprint based modular routing with service layer abstraction.
 """
 
-from flask import Blueprint, render_template, request
-import json
-import plotly
+from flask import Blueprint, Response, jsonify, render_template, request, url_for
 
-from services.ai_service import get_apg
+from json_provider import dumps_figure
+
+from services.ai_service import (
+    get_apg,
+    get_cluster_assignments,
+    get_trajectory_clusters,
+)
 from services.graph_service import get_mcg
 
 from constants import LATEST_MONTH_RANGE
 
+from limiter_config import limiter
+
 # Blueprint for AI related routes.
 # Groups prediction and clustering endpoints under one module.
 ai_bp = Blueprint("ai", __name__)
@@ -73,7 +80,7 @@ def prediction():
     graphs = apg.forecast_all()
 
     # Convert Plotly figures into JSON format for frontend rendering
-    graphJSON = [json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder) for fig in graphs]
+    graphJSON = [dumps_figure(fig) for fig in graphs]
 
     return render_template(
         "/graph-pages/ai-prediction-graph.html",
@@ -89,14 +96,18 @@ def cluster():
     Purpose:
     Groups clan members based on performance metrics using
     clustering algorithms and visualizes the clusters.
+    Figures are not embedded: the page only receives one
+    cluster_figure URL per figure and loads each figure as it
+    scrolls into view.
 
     Features:
     • Month based clustering analysis
     • Scatter plot visualization
     • Performance grouping
+    • Contribution trajectory clusters of the whole history
 
     Workflow:
-    Request → Data load → Clustering → Graph generation → UI rendering
+    Request → Data load → Persisted clusters → Figure URLs → UI rendering
 
     Query Parameters:
         month-year (str):
@@ -113,16 +124,209 @@ def cluster():
     # Get selected month or fallback to latest month range
     month = request.args.get("month-year", LATEST_MONTH_RANGE)
 
-    mcg.update_and_load_data(month)
+    # The graph instance is shared between requests
+    with mcg.lock:
+        mcg.update_and_load_data(month)
 
-    graphs = mcg.create_scatter_plots()
+        # Month scatter plots, then the trajectory clusters of the
+        # whole history
+        figure_urls = [
+            url_for("ai.cluster_figure", family=family, index=index)
+            for family in mcg.schema.families
+            for index in range(mcg.figure_count(family))
+        ]
 
-    graphJSON = [json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder) for fig in graphs]
+        message = mcg.message
 
     return render_template(
         "./graph-pages/mem-month-graph.html",
-        graphJSON_list=graphJSON,
+        figure_urls=figure_urls,
         month_year=month,
         graph_name="AI Cluster",
-        message=mcg.message,
-    )
\ No newline at end of file
+        message=message,
+    )
+
+@ai_bp.route("/ai/cluster/<family>/figure/<int:index>/")
+def cluster_figure(family, index):
+    """
+    Single cluster figure endpoint.
+
+    Purpose:
+    Builds one figure of the clustering page, requested lazily
+    by the page as the figure scrolls into view.
+
+    Parameters:
+        family (str):
+            Chart family (scatter_plots or trajectory_plots).
+
+        index (int):
+            Position of the figure on the page.
+
+    Query Parameters:
+        month-year (str):
+            Month range of the page (defaults as cluster). Ignored by
+            trajectory_plots, which cover the whole history.
+
+    Error Handling:
+    Returns a JSON 404 for an invalid chart family or figure index.
+
+    Returns:
+        Plotly figure JSON ({"data": ..., "layout": ...}).
+    """
+
+    mcg = get_mcg()
+
+    if family not in mcg.schema.families:
+        return jsonify({"error": "Unknown graph type"}), 404
+
+    month = request.args.get("month-year", LATEST_MONTH_RANGE)
+
+    try:
+        # Trajectory figures cover the whole history: no month to load
+        if family == "trajectory_plots":
+            figure = mcg.render_figure(family, index)
+        else:
+            with mcg.lock:
+                mcg.update_and_load_data(month)
+                figure = mcg.render_figure(family, index)
+    except IndexError:
+        return jsonify({"error": "Unknown figure"}), 404
+
+    return Response(
+        dumps_figure(figure),
+        mimetype="application/json",
+    )
+
+@ai_bp.route("/api/ai/cluster/<month_year>/")
+@limiter.limit("10 per minute")
+def cluster_api(month_year):
+    """
+    Member Cluster Assignments JSON
+    ---
+    tags:
+      - AI
+
+    parameters:
+
+      - name: month_year
+        in: path
+        type: string
+        description: Month range (e.g. NOV-DEC_2025)
+
+    responses:
+
+      200:
+        description: KMeans activity clusters of the month, computed once
+          per month file
+
+        schema:
+
+          type: object
+
+          properties:
+
+            month:
+              type: string
+              example: NOV-DEC_2025
+
+            digest:
+              type: string
+              description: SHA-256 of the clustered content
+
+            model:
+              type: string
+              example: kmeans-standardized-silhouette
+
+            k:
+              type: integer
+              description: Number of clusters, chosen by silhouette score
+              example: 3
+
+            silhouette:
+              type: array
+              items:
+                type: object
+                properties:
+                  k:
+                    type: integer
+                    example: 3
+                  score:
+                    type: number
+                    example: 0.41
+
+            features:
+              type: array
+              items:
+                type: string
+
+            clusters:
+              type: array
+              items:
+                type: object
+                properties:
+                  cluster:
+                    type: integer
+                    example: 0
+                  label:
+                    type: string
+                    example: Highly Active
+                  centroid:
+                    type: object
+
+            assignments:
+              type: array
+              items:
+                type: object
+                properties:
+                  name:
+                    type: string
+                    example: KAI HIWATARI
+                  cluster:
+                    type: integer
+                    example: 0
+                  label:
+                    type: string
+                    example: Highly Active
+      404:
+        description: Data not found
+    """
+
+    return get_cluster_assignments(month_year.upper())
+
+@ai_bp.route("/api/ai/cluster/trajectories/")
+@limiter.limit("5 per minute")
+def cluster_trajectories_api():
+    """
+    Member Cluster Trajectories JSON
+    ---
+    tags:
+      - AI
+
+    parameters:
+
+      - name: months
+        in: query
+        type: string
+        required: false
+        description: Comma-separated month ranges of the performance
+          history (defaults to the whole history); other months are
+          ignored
+        example: SEP-OCT_2025,OCT-NOV_2025,NOV-DEC_2025
+
+    responses:
+
+      200:
+        description: Activity clusters of the months fitted jointly (one
+          row per player and month), in the format of the monthly
+          cluster API; every assignment also carries its month
+      404:
+        description: No month of the history is available
+    """
+
+    months = [
+        month.strip().upper()
+        for month in request.args.get("months", "").split(",")
+        if month.strip()
+    ]
+
+    return get_trajectory_clusters(months or None)
@@ -23,6 +23,8 @@ Features:
 
 Endpoints Provided:
 • /api/chatbot/ → Main chatbot query processing endpoint (POST)
+• /api/chatbot/batch/ → Several chatbot queries in one request (POST)
+• /api/chatbot/stream/ → Chatbot reply streamed as Server-Sent Events (POST)
 • /ai/chat/ → Chatbot web interface route
 
 Workflow:
@@ -44,9 +46,16 @@ This module belongs to the interaction layer and acts as the bridge
 between user requests and the chatbot processing engine.
 """
 
-from flask import Blueprint, jsonify, request, render_template
+import json
 
-from chatbot.chat_controller import handle_chat
+from flask import Blueprint, Response, jsonify, request, render_template, stream_with_context
+
+from chatbot.chat_controller import (
+    BATCH_MAX_MESSAGES,
+    handle_chat,
+    handle_chat_batch,
+    handle_chat_stream,
+)
 
 from limiter_config import limiter
 
@@ -124,6 +133,176 @@ def chatbot():
 
     return jsonify(response)
 
+@chatbot_bp.route("/api/chatbot/batch/", methods=["POST"])
+@limiter.limit("10 per minute")
+def chatbot_batch():
+
+    """
+    Chatbot Batch Query API
+
+    Answers up to 20 messages in one request. Messages querying the same
+    dataset (domain and month) share a single fetch.
+    ---
+    tags:
+      - Chatbot
+
+    parameters:
+      - name: body
+        in: body
+        required: true
+
+        schema:
+          type: object
+
+          properties:
+
+            messages:
+              type: array
+
+              items:
+                type: string
+
+              example: ["top 10 clanscore in APR 2025", "average warattack in APR 2025"]
+
+    responses:
+
+      200:
+
+        description: One chatbot response per message, in order
+
+        schema:
+
+          type: object
+
+          properties:
+
+            replies:
+
+              type: array
+
+              items:
+
+                type: object
+
+                properties:
+
+                  reply:
+                    type: string
+
+                  source:
+                    type: string
+
+                  suggestions:
+
+                    type: array
+
+                    items:
+                      type: string
+
+      400:
+        description: Missing, empty or too many messages
+
+      429:
+        description: Too many requests (rate limit exceeded)
+    """
+
+    payload = request.get_json(silent=True) or {}
+
+    messages = payload.get("messages")
+
+    if (
+        not isinstance(messages, list)
+        or not messages
+        or len(messages) > BATCH_MAX_MESSAGES
+        or not all(isinstance(message, str) for message in messages)
+    ):
+
+        return (
+            jsonify(
+                {
+                    "error": (
+                        "'messages' must be a list of 1 to "
+                        f"{BATCH_MAX_MESSAGES} strings"
+                    ),
+                    "replies": [],
+                }
+            ),
+            400,
+        )
+
+    return jsonify({"replies": handle_chat_batch(messages)})
+
+@chatbot_bp.route("/api/chatbot/stream/", methods=["POST"])
+@limiter.limit("10 per minute")
+def chatbot_stream():
+
+    """
+    Chatbot Streaming Query API
+
+    Same request as /api/chatbot/, but the reply is streamed as
+    Server-Sent Events while it is being built:
+
+    • event "chunk" → {"text": "..."} (next piece of the reply)
+    • event "done" → {"source": ..., "suggestions": [...]}
+
+    Joining the text of every chunk gives the full reply.
+    ---
+    tags:
+      - Chatbot
+
+    produces:
+      - text/event-stream
+
+    parameters:
+      - name: body
+        in: body
+        required: true
+
+        schema:
+          type: object
+
+          properties:
+
+            message:
+              type: string
+
+              example: list all clan members in feb 2026
+
+    responses:
+
+      200:
+        description: Reply sections as a text/event-stream
+
+      400:
+        description: Message too long
+
+      429:
+        description: Too many requests (rate limit exceeded)
+    """
+
+    payload = request.get_json(silent=True) or {}
+
+    message = payload.get("message", "")
+
+    if len(message) > 500:
+
+        return (
+            jsonify({"reply": "Message too long", "source": None, "suggestions": []}),
+            400,
+        )
+
+    def events():
+
+        for event, data in handle_chat_stream(message):
+
+            yield f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+    return Response(
+        stream_with_context(events()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 @chatbot_bp.route("/ai/chat/")
 def chat():
     """
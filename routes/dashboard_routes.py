@@ -41,10 +41,11 @@ def player_dashboard(player):
     if player not in players:
         return render_template("/error-pages/404.html"), 404
 
-    dashboard = get_dashboard_data(player)
+    payload = get_dashboard_data(player)
 
     return render_template(
         "/dashboard-pages/player_dashboard.html",
         player=player,
-        dashboard=dashboard,
+        dashboard=payload["data"],
+        dashboard_json=payload["json"],
     )
\ No newline at end of file
@@ -35,6 +35,7 @@ Endpoints Provided:
 
 Dependencies:
 • services.github_service → GitHub data fetching logic
+  (monthly files typed by month_store)
 • Flask Blueprint → Modular routing
 • JSON datasets → Remote data storage
 
@@ -51,7 +52,7 @@ an integration point between remote GitHub storage and the application.
 
 from flask import Blueprint
 
-from services.github_service import fetch_github_json
+from services.github_service import fetch_github_json, fetch_month_json
 
 from limiter_config import limiter
 
@@ -136,7 +137,7 @@ def clan_members(month, year):
 
     url = f"https://raw.githubusercontent.com/Lightning-President-9/ClanDataRepo/main/Clan%20Members/JSON/{month}_{year}.json"
 
-    return fetch_github_json(url)
+    return fetch_month_json(url, "members")
 
 @github_api_bp.route("/api/github/monthly-analysis/<start>/<end>/<int:year>/")
 @limiter.limit("10 per minute")
@@ -208,7 +209,7 @@ def monthly(start, end, year):
 
     url = f"https://raw.githubusercontent.com/Lightning-President-9/ClanDataRepo/main/Clan%20Members/Monthly%20Analysis%20JSON/data_{start}-{end}_{year}.json"
 
-    return fetch_github_json(url)
+    return fetch_month_json(url, "analysis")
 
 @github_api_bp.route("/api/github/clan-performance/<month>/<int:year>/")
 @limiter.limit("10 per minute")
@@ -352,7 +353,7 @@ def former(month, year):
 
     url = f"https://raw.githubusercontent.com/Lightning-President-9/ClanDataRepo/main/Former%20Clan%20Members/JSON/{month}_{year}.json"
 
-    return fetch_github_json(url)
+    return fetch_month_json(url, "former")
 
 @github_api_bp.route("/api/github/top-contributors/<month>/<int:year>/")
 @limiter.limit("10 per minute")
@@ -403,4 +404,4 @@ def contributors(month, year):
 
     url = f"https://raw.githubusercontent.com/Lightning-President-9/ClanDataRepo/main/Top%20Clan%20Contributors/JSON/{month}_{year}.json"
 
-    return fetch_github_json(url)
\ No newline at end of file
+    return fetch_month_json(url, "contributors")
\ No newline at end of file
@@ -14,6 +14,7 @@ Responsibilities:
 • Handle month-based filtering
 • Serialize Plotly figures for frontend rendering
 • Support multiple graph types through a generic handler
+• Serve graph page figures one at a time for lazy loading
 
 Features:
 • Member performance graphs
@@ -22,6 +23,7 @@ Features:
 • All-month trend analysis
 • Dynamic graph type selection
 • Plotly interactive visualization support
+• On-demand figure JSON endpoint (lazy loading)
 
 Graph Types Supported:
 • Bar charts
@@ -51,9 +53,9 @@ Architecture Layer:
 Presentation layer connecting graph services to UI templates.
 """
 
-from flask import Blueprint, render_template, request
-import json
-import plotly
+from flask import Blueprint, Response, jsonify, render_template, request, url_for
+
+from json_provider import dumps_figure
 
 from services.graph_service import get_cmg, get_fmg, get_mag, get_amg
 
@@ -141,27 +143,44 @@ def all_month_analysis():
     • Fetch clan dataset
     • Process into dataframe
     • Generate multiple graph types
-    • Generate heatmaps
+    • Generate heatmaps from the performance cube
     • Serialize Plotly figures
 
+    Query Parameters:
+        players (str): "active" (current members, default) or "all"
+        start (str): First period of the heatmaps (e.g. JAN-FEB_2025)
+        end (str): Last period of the heatmaps
+        last (int): Keep only the last N periods
+        aggregate (str): "period" (default) or "quarter"
+
     Returns:
         All month analysis dashboard.
+        Returns 404 for an unknown heatmap selection or period.
     """
 
     amg = get_amg()
 
+    try:
+        heatmaps = amg.generate_heatmap_figures(
+            players=request.args.get("players", "active"),
+            start=request.args.get("start", "").upper() or None,
+            end=request.args.get("end", "").upper() or None,
+            last=request.args.get("last", type=int),
+            aggregate=request.args.get("aggregate", "period"),
+        )
+    except ValueError:
+        return render_template("/error-pages/404.html"), 404
+
     clan_data = amg.fetch_data()
 
     df = amg.process_data(clan_data)
 
     plots = amg.plot_graphs(df)
 
-    heatmaps = amg.generate_heatmap_figures()
-
     all_graphs = plots + heatmaps
 
     graphJSON = [
-        json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder) for fig in all_graphs
+        dumps_figure(fig) for fig in all_graphs
     ]
 
     return render_template(
@@ -170,14 +189,68 @@ def all_month_analysis():
         graph_name="All Month Analysis",
     )
 
+def _select_graph(obj):
+    """
+    Resolve the graph service, month and page template of a dataset type.
+
+    Parameters:
+        obj (str):
+            Dataset type (mem, fmem or mag).
+
+    Returns:
+        tuple | None:
+            (graph, month, template), or None for an unknown dataset type.
+            The month is read from the month-year query parameter.
+    """
+
+    if obj == "mem":
+
+        return (
+            get_cmg(),
+            request.args.get("month-year", LATEST_MONTH),
+            "./graph-pages/graph.html",
+        )
+
+    if obj == "fmem":
+
+        return (
+            get_fmg(),
+            request.args.get("month-year", LATEST_MONTH),
+            "./graph-pages/graph.html",
+        )
+
+    if obj == "mag":
+
+        return (
+            get_mag(),
+            request.args.get("month-year", LATEST_MONTH_RANGE),
+            "./graph-pages/mem-month-graph.html",
+        )
+
+    return None
+
+def _graph_family(graph, gtype):
+    """
+    Chart family of a URL graph type, or None when the graph
+    does not offer it.
+    """
+
+    method = GRAPH_METHODS.get(gtype)
+
+    if not method or not hasattr(graph, method):
+        return None
+
+    return method[len("create_"):]
+
 @graph_bp.route("/graph/<obj>/<gtype>/")
 def graph_handler(obj, gtype):
     """
-    Generic graph rendering controller.
+    Generic graph page controller.
 
     Purpose:
-    Handles dynamic graph generation based on dataset type
-    and requested graph visualization.
+    Renders the page of a dataset type and graph visualization.
+    Figures are not embedded: the page only receives one graph_figure
+    URL per figure and loads each figure as it scrolls into view.
 
     Parameters:
         obj (str):
@@ -192,64 +265,102 @@ def graph_handler(obj, gtype):
     Workflow:
     • Select correct graph service
     • Load month data
-    • Resolve graph method dynamically
-    • Generate figures
-    • Serialize graphs
+    • Resolve chart family
+    • Count figures and build their URLs
     • Render template
 
     Error Handling:
-    Returns 404 if invalid dataset type provided.
+    Returns 404 if invalid dataset or graph type provided.
 
     Returns:
         Rendered graph visualization page.
     """
 
-    if obj == "mem":
+    selected = _select_graph(obj)
+
+    if selected is None:
+        return render_template("/error-pages/404.html"), 404
 
-        graph = get_cmg()
+    graph, month, template = selected
 
-        month = request.args.get("month-year", LATEST_MONTH)
+    with graph.lock:
 
-        template = "./graph-pages/graph.html"
+        # Load data for selected month
+        graph.update_and_load_data(month)
 
-    elif obj == "fmem":
+        family = _graph_family(graph, gtype)
 
-        graph = get_fmg()
+        if family is None:
+            return render_template("/error-pages/404.html"), 404
 
-        month = request.args.get("month-year", LATEST_MONTH)
+        figure_urls = [
+            url_for("graph.graph_figure", obj=obj, gtype=gtype, index=index)
+            for index in range(graph.figure_count(family))
+        ]
 
-        template = "./graph-pages/graph.html"
+        message = graph.message
 
-    elif obj == "mag":
+    return render_template(
+        template,
+        month_year=month,
+        figure_urls=figure_urls,
+        graph_name=f"{obj} {gtype}",
+        message=message,
+    )
 
-        graph = get_mag()
+@graph_bp.route("/graph/<obj>/<gtype>/figure/<int:index>/")
+def graph_figure(obj, gtype, index):
+    """
+    Single graph figure endpoint.
 
-        month = request.args.get("month-year", LATEST_MONTH_RANGE)
+    Purpose:
+    Builds one figure of a graph page, requested lazily by the page
+    as the figure scrolls into view.
 
-        template = "./graph-pages/mem-month-graph.html"
+    Parameters:
+        obj (str):
+            Dataset type (mem, fmem or mag).
 
-    else:
+        gtype (str):
+            Graph visualization type.
 
-        return render_template("/error-pages/404.html"), 404
+        index (int):
+            Position of the figure on the page.
 
-    # Load data for selected month
-    graph.update_and_load_data(month)
+    Query Parameters:
+        month-year (str):
+            Month of the page (defaults as graph_handler).
 
-    # Resolve graph generation method dynamically
-    method = GRAPH_METHODS.get(gtype)
+    Error Handling:
+    Returns a JSON 404 for an invalid dataset type, graph type
+    or figure index.
 
-    if not method or not hasattr(graph, method):
-        return render_template("/error-pages/404.html"), 404
+    Returns:
+        Plotly figure JSON ({"data": ..., "layout": ...}).
+    """
 
-    # Execute graph creation method
-    figures = getattr(graph, method)()
+    selected = _select_graph(obj)
 
-    graphJSON = [json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder) for fig in figures]
+    if selected is None:
+        return jsonify({"error": "Unknown dataset type"}), 404
 
-    return render_template(
-        template,
-        month_year=month,
-        graphJSON_list=graphJSON,
-        graph_name=f"{obj} {gtype}",
-        message=graph.message,
-    )
\ No newline at end of file
+    graph, month, _ = selected
+
+    with graph.lock:
+
+        graph.update_and_load_data(month)
+
+        family = _graph_family(graph, gtype)
+
+        if family is None:
+            return jsonify({"error": "Unknown graph type"}), 404
+
+        try:
+            figure = graph.render_figure(family, index)
+        except IndexError:
+            return jsonify({"error": "Unknown figure"}), 404
+
+    return Response(
+        dumps_figure(figure),
+        mimetype="application/json",
+    )
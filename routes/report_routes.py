@@ -12,31 +12,50 @@ Responsibilities:
 • Validate player availability
 • Generate player performance reports
 • Provide downloadable PDF files
+• Stream clan-wide reports as a ZIP archive or combined PDF
 • Handle invalid player requests
 
 Features:
 • Player directory for report selection
 • Dynamic PDF report generation
 • Secure file download handling
+• Streamed multi-player downloads
 • Error handling for invalid players
 
 Endpoints Provided:
 • /player-report/ → Player report selection page
 • /player-report/<player>/ → Download player report
+• /clan-report/ → Stream reports for selected (or all) players
 
 Dependencies:
 • services.report_service → Report generation logic
 • Flask Blueprint → Modular routing
 • send_file → File download handling
+• stream_with_context → Chunked report streaming
 
 Architecture Layer:
 Presentation layer connecting report generation services to UI
 and download endpoints.
 """
 
-from flask import Blueprint, render_template, send_file
-
-from services.report_service import get_all_players, generate_report
+from flask import (
+    Blueprint,
+    Response,
+    jsonify,
+    render_template,
+    request,
+    send_file,
+    stream_with_context,
+)
+
+from services.report_service import (
+    CLAN_PDF_MAX_PLAYERS,
+    get_all_players,
+    generate_report,
+    generate_clan_report,
+)
+
+from limiter_config import limiter
 
 # Blueprint for player report related routes.
 # Handles report viewing and downloading functionality.
@@ -63,6 +82,81 @@ def reports():
 
     return render_template("/graph-pages/player-report.html", players=players)
 
+@report_bp.route("/clan-report/")
+@limiter.limit("2 per minute")
+def download_clan():
+    """
+    Clan-wide report download route.
+
+    Purpose:
+    Streams performance reports for several players in one download,
+    either as a ZIP archive of individual PDFs or as one combined PDF.
+    Served outside /player-report/ so that no player name can collide
+    with it.
+
+    Query Parameters:
+        player (str, repeatable):
+            Player names to include. Defaults to every player.
+
+        format (str):
+            "zip" (default) or "pdf". The combined PDF is built in full
+            before it is sent and covers at most CLAN_PDF_MAX_PLAYERS
+            players; the ZIP archive is streamed report by report and
+            suits any number of players.
+
+    Validation:
+    • Returns 404 page if any player is unknown
+    • Returns 404 page if the format is unsupported
+    • Returns 413 if a combined PDF is requested for too many players
+
+    Workflow:
+    • Validate players and format
+    • Build the report chunk generator
+    • Stream chunks to the client as they are produced
+
+    Returns:
+        Streamed ZIP/PDF download or error page.
+    """
+
+    players = get_all_players()
+
+    selected = request.args.getlist("player") or list(players)
+
+    fmt = request.args.get("format", "zip").lower()
+
+    if any(player not in players for player in selected):
+
+        return render_template("/error-pages/404.html"), 404
+
+    if fmt == "pdf" and len(selected) > CLAN_PDF_MAX_PLAYERS:
+
+        return (
+            jsonify(
+                {
+                    "error": (
+                        f"A combined PDF covers at most {CLAN_PDF_MAX_PLAYERS} "
+                        "players, use format=zip for larger exports"
+                    )
+                }
+            ),
+            413,
+        )
+
+    try:
+        chunks, mimetype = generate_clan_report(selected, fmt)
+
+    except ValueError:
+
+        return render_template("/error-pages/404.html"), 404
+
+    return Response(
+        stream_with_context(chunks),
+        mimetype=mimetype,
+        headers={
+            "Content-Disposition": f"attachment; filename=ancient_ruins_reports.{fmt}"
+        },
+    )
+
 @report_bp.route("/player-report/<player>/")
 def download(player):
     """
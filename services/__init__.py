@@ -35,13 +35,18 @@ Graph Services:
 
 AI Services:
 • get_apg → AI prediction graph service
+• get_cluster_assignments → Persisted member cluster assignments
+• get_trajectory_clusters → Joint player × month cluster assignments
+• warm_cluster_cache → Background precompute of every month's clusters
 
 Report Services:
 • get_all_players → Player listing service
 • generate_report → Player PDF report service
+• generate_clan_report → Streamed multi-player report service
 
 GitHub Services:
 • fetch_github_json → Remote JSON data fetcher
+• fetch_month_json → Typed monthly file fetcher
 
 Design Pattern:
 Service aggregation pattern for clean architecture.
@@ -52,11 +57,16 @@ Service layer abstraction between routes and data/processing modules.
 
 from .graph_service import get_cmg, get_fmg, get_mag, get_amg, get_mcg
 
-from .ai_service import get_apg
+from .ai_service import (
+    get_apg,
+    get_cluster_assignments,
+    get_trajectory_clusters,
+    warm_cluster_cache,
+)
 
-from .report_service import get_all_players, generate_report
+from .report_service import get_all_players, generate_report, generate_clan_report
 
-from .github_service import fetch_github_json
+from .github_service import fetch_github_json, fetch_month_json
 
 # Explicitly defines public service functions available for import.
 # Prevents unintended internal functions from being exposed.
@@ -67,7 +77,12 @@ __all__ = [
     "get_amg",
     "get_mcg",
     "get_apg",
+    "get_cluster_assignments",
+    "get_trajectory_clusters",
+    "warm_cluster_cache",
     "get_all_players",
     "generate_report",
+    "generate_clan_report",
     "fetch_github_json",
+    "fetch_month_json",
 ]
\ No newline at end of file
@@ -9,12 +9,17 @@ AI prediction engine exists during the application runtime.
 
 Responsibilities:
 • Provide access to AI prediction graph service
+• Serve the persisted KMeans cluster assignments of a month
+• Serve joint player × month cluster trajectories
+• Precompute the clusters of every month in a background thread, in
+  one process of the deployment
 • Manage object creation efficiently
 • Prevent redundant object initialization
 • Support performance optimization through reuse
 
 Service Provided:
 • AIPredictionGraph → AI forecasting and prediction visualization engine
+• MemberClusterGraph clusters → Precomputed activity clusters per month
 
 Design Pattern:
 Singleton pattern to maintain a single shared instance of the
@@ -24,7 +29,17 @@ Architecture Layer:
 Service layer connecting AI graph processing modules with route handlers.
 """
 
+import threading
+
+from cluster_store import claim_warmup
 from graphs import AIPredictionGraph
+from graphs.member_cluster_graph import precompute_clusters, trajectory_clusters
+from performance_store import get_performance_cube, period_sort_key
+
+from .graph_service import get_mcg
+
+# Maximum number of months clustered jointly (the latest ones are kept)
+TRAJECTORY_MAX_MONTHS = 60
 
 # Singleton instance holder for AI Prediction Graph.
 # Initialized only when first requested.
@@ -54,4 +69,125 @@ def get_apg():
     if apg is None:
         apg = AIPredictionGraph()
 
-    return apg
\ No newline at end of file
+    return apg
+
+def get_cluster_assignments(month_year):
+    """
+    Get the KMeans cluster assignments of a month.
+
+    Purpose:
+    Serves the clusters persisted by cluster_store for the member
+    cluster graph, so other tools can consume them without
+    re-clustering.
+
+    Workflow:
+    • Load the month through the member cluster graph
+    • Reuse the persisted clusters (fitted only if the file changed)
+    • Return them as JSON-ready data
+
+    Parameters:
+        month_year (str):
+            Month range identifier (e.g. NOV-DEC_2025).
+
+    Returns:
+        dict:
+            Month, content digest, chosen k and silhouette scores,
+            clusters (label and centroid) and per-player assignments.
+
+        tuple:
+            Error dictionary and 404 when the month is not available.
+    """
+
+    mcg = get_mcg()
+
+    with mcg.lock:
+        mcg.update_and_load_data(month_year)
+
+        if mcg.month_year != month_year:
+            return {"error": "Data not found", "month": month_year}, 404
+
+        return mcg.clusters.to_dict()
+
+def cluster_months():
+    """
+    Month ranges of the Clan Monthly Performance history, oldest first.
+
+    Returns:
+        list[str]:
+            Month range identifiers (e.g. NOV-DEC_2025).
+    """
+
+    return list(get_performance_cube().periods)
+
+def get_trajectory_clusters(months=None):
+    """
+    Get the joint cluster assignments of several months.
+
+    Purpose:
+    Clusters every (player, month) row of the selected months with one
+    model, so a player's activity tier can be followed over time.
+    Results are persisted like the monthly clusters.
+
+    Only months of the performance history (cluster_months) are
+    clustered, at most the latest TRAJECTORY_MAX_MONTHS of them: every
+    month costs a month file load, so unknown months are dropped
+    before anything is fetched.
+
+    Parameters:
+        months (list[str] | None):
+            Month ranges to cluster. Defaults to the whole history.
+
+    Returns:
+        dict:
+            Joint clusters; every assignment carries its month.
+
+        tuple:
+            Error dictionary and 404 when no month is available.
+    """
+
+    known = cluster_months()
+
+    if months is not None:
+        requested = set(months)
+        known = [month for month in known if month in requested]
+
+    months = sorted(known, key=period_sort_key)[-TRAJECTORY_MAX_MONTHS:]
+
+    if not months:
+        return {"error": "Data not found", "months": []}, 404
+
+    clusters = trajectory_clusters(months, get_mcg().ks)
+
+    if clusters is None:
+        return {"error": "Data not found", "months": months}, 404
+
+    return clusters.to_dict()
+
+def warm_cluster_cache():
+    """
+    Precompute the clusters of every month and of the whole history.
+
+    Purpose:
+    Runs the clustering once per month file ahead of the first
+    /ai/cluster/ request, in a background thread. Only the process
+    holding the cluster_store warm-up lock runs it; the other workers
+    read the persisted results.
+
+    Returns:
+        threading.Thread | None:
+            Started daemon thread, or None when another process
+            precomputes the clusters.
+    """
+
+    if not claim_warmup():
+        return None
+
+    thread = threading.Thread(
+        target=lambda: precompute_clusters(cluster_months(), get_mcg().ks),
+        name="cluster-cache-warmup",
+        daemon=True,
+    )
+
+    thread.start()
+
+    return thread
@@ -6,8 +6,13 @@ Service layer for the Interactive Player Dashboard.
 Responsibilities:
 • Retrieve available players
 • Retrieve dashboard-pages data
+• Reload the dataset on demand (refresh_dashboard_data)
 • Keep routes independent of graph/data modules
 
+Dashboards are cached per dataset version. performance_store revalidates
+the dataset every hour; a changed file is reloaded under a new version
+and the dashboard cache is re-warmed (see player_dashboard).
+
 Architecture:
 Route
     ↓
@@ -16,21 +21,36 @@ Dashboard Service
 Graph/Data Layer
 """
 
-from dashboard.player_dashboard import build_dashboard
+from dashboard.player_data import load_dataframe
+from dashboard.player_dashboard import get_dashboard_payload
 
 
 def get_dashboard_data(player):
     """
     Returns complete dashboard data for one player.
 
+    Served from the per-player cache of the current dataset version.
+
     Parameters
     ----------
     player : str
 
     Returns
     -------
-    dict
-        Dashboard data dictionary.
+    dict or None
+        data : Dashboard data dictionary.
+        json : HTML-safe serialized dashboard.
+    """
+
+    return get_dashboard_payload(player)
+
+
+def refresh_dashboard_data():
+    """
+    Reloads the dashboard dataset without waiting for its TTL.
+
+    Reloading drops the cached dashboards of the previous dataset version
+    and re-warms the cache in the background (see player_dashboard).
     """
 
-    return build_dashboard(player)
\ No newline at end of file
+    load_dataframe()
@@ -5,9 +5,11 @@ GitHub data fetching service module for the Ancient Ruins Clan Analytics system.
 
 This module provides utility functions to retrieve JSON datasets from
 remote GitHub repositories and perform basic data normalization.
+Monthly files go through the shared typed loader (month_store).
 
 Responsibilities:
 • Fetch remote JSON datasets from GitHub
+• Serve typed, validated and cached monthly files
 • Convert numeric string values into integers
 • Provide cleaned data to route modules
 • Handle external data integration
@@ -20,6 +22,7 @@ Features:
 
 Dependencies:
 • requests → HTTP client for fetching remote data
+• month_store → Typed month file loader
 
 Design Considerations:
 • Keeps data fetching logic separate from route logic
@@ -32,6 +35,8 @@ Service layer responsible for external data integration.
 
 import requests
 
+from month_store import MonthFileError, MonthFileMissing, load_month_file
+
 def fetch_github_json(url):
     """
     Fetch JSON data from GitHub and normalize numeric values.
@@ -81,4 +86,46 @@ def fetch_github_json(url):
             if isinstance(value, str) and value.isdigit():
                 player[key] = int(value)
 
-    return data
\ No newline at end of file
+    return data
+
+def fetch_month_json(url, kind):
+    """
+    Fetch a monthly file from GitHub as typed rows.
+
+    Purpose:
+    Serves clan member, former member, monthly analysis and top
+    contributor files through the shared typed loader, so the API
+    returns the same types as the graphs and the chatbot use.
+
+    Parameters:
+        url (str):
+            Raw GitHub JSON file URL.
+
+        kind (str):
+            Month file kind (members, former, analysis or contributors).
+
+    Workflow:
+    • Load the file through month_store (cached)
+    • Validate its columns
+    • Return integers as ints and missing values as null
+
+    Returns:
+        list:
+            List of dictionaries containing typed data.
+    """
+
+    try:
+        table = load_month_file(url, kind)
+    except MonthFileMissing as error:
+        return {
+            "error": "Data not found",
+            "status_code": error.status_code,
+            "url": url
+        }, 404
+    except MonthFileError as error:
+        return {
+            "error": "Invalid month file from GitHub",
+            "detail": str(error)
+        }, 500
+
+    return table.records()
@@ -10,16 +10,21 @@ between route handlers and report generation logic.
 Responsibilities:
 • Provide list of available players
 • Generate player performance reports
+• Stream combined reports for several players
 • Act as an interface between routes and report generators
 • Maintain separation of concerns
 
 Services Provided:
 • Player listing service
 • Player PDF report generation service
+• Clan-wide streamed report service (ZIP or single PDF)
 
 Dependencies:
 • graphs.get_players → Retrieves available player names
 • graphs.generate_player_report → Creates player PDF reports
+• graphs.iter_clan_report_zip → Streams a ZIP of player reports
+• graphs.iter_clan_report_pdf → Streams a combined PDF report
+• graphs.CLAN_PDF_MAX_PLAYERS → Player limit of a combined PDF report
 
 Design Pattern:
 Service wrapper pattern to decouple routes from direct graph module access.
@@ -30,6 +35,14 @@ Service layer connecting route controllers with report generation logic.
 
 from graphs import get_players
 from graphs import generate_player_report
+from graphs import iter_clan_report_zip, iter_clan_report_pdf
+from graphs import CLAN_PDF_MAX_PLAYERS
+
+# Streamed clan report formats mapped to their generator and mimetype.
+CLAN_REPORT_FORMATS = {
+    "zip": (iter_clan_report_zip, "application/zip"),
+    "pdf": (iter_clan_report_pdf, "application/pdf"),
+}
 
 def get_all_players():
     """
@@ -61,4 +74,45 @@ def generate_report(player):
             Generated PDF report buffer.
     """
 
-    return generate_player_report(player)
\ No newline at end of file
+    return generate_player_report(player)
+
+def generate_clan_report(players, fmt="zip"):
+    """
+    Generate a streamed report for several players.
+
+    Purpose:
+    Produces either a ZIP archive with one PDF per player, yielded
+    report by report, or a single combined PDF of at most
+    CLAN_PDF_MAX_PLAYERS players, yielded once the whole document has
+    been built.
+
+    Parameters:
+        players (list):
+            Player names to include.
+
+        fmt (str):
+            Output format, "zip" or "pdf".
+
+    Returns:
+        tuple:
+            (chunk generator, mimetype)
+
+    Raises:
+        ValueError:
+            If the format is not supported, or a combined PDF is
+            requested for more than CLAN_PDF_MAX_PLAYERS players.
+    """
+
+    if fmt not in CLAN_REPORT_FORMATS:
+
+        raise ValueError(f"Unsupported report format: {fmt}")
+
+    if fmt == "pdf" and len(players) > CLAN_PDF_MAX_PLAYERS:
+
+        raise ValueError(
+            f"A combined PDF covers at most {CLAN_PDF_MAX_PLAYERS} players"
+        )
+
+    generator, mimetype = CLAN_REPORT_FORMATS[fmt]
+
+    return generator(players), mimetype
@@ -45,7 +45,7 @@ async function sendMessage() {
 	input.value = "";
 
 	try {
-		const res = await fetch("/api/chatbot/", {
+		const res = await fetch("/api/chatbot/stream/", {
 			method: "POST",
 			headers: {
 				"Content-Type": "application/json"
@@ -55,8 +55,16 @@ async function sendMessage() {
 			})
 		});
 
-		const data = await res.json();
-		addBotMessage(data.reply, data.source, data.suggestions);
+		const type = res.headers.get("Content-Type") || "";
+
+		// Errors (too long, rate limited) still come back as one JSON body
+		if (!res.ok || !res.body || !type.startsWith("text/event-stream")) {
+			const data = await res.json();
+			addBotMessage(data.reply, data.source, data.suggestions);
+			return;
+		}
+
+		await readBotStream(res);
 
 	} catch {
 		addBotMessage("Error connecting to server, please try again later.", null, []);
@@ -83,7 +91,7 @@ function addUserMessage(text) {
 }
 
 // BOT MESSAGE
-function addBotMessage(reply, source, suggestions) {
+function createBotMessage() {
 	const box = document.getElementById("chat-box");
 	const id = "b_" + Date.now();
 
@@ -100,6 +108,19 @@ function addBotMessage(reply, source, suggestions) {
 	box.appendChild(div);
 	box.scrollTop = box.scrollHeight;
 
+	return {
+		div,
+		content: document.getElementById(id)
+	};
+}
+
+function addBotMessage(reply, source, suggestions) {
+	const box = document.getElementById("chat-box");
+	const {
+		div,
+		content
+	} = createBotMessage();
+
 	// Store clean data for PDF
 	chatTranscript.push({
 		role: "bot",
@@ -108,14 +129,128 @@ function addBotMessage(reply, source, suggestions) {
 	});
 
 	setTimeout(() => {
-		renderLines(reply || "", document.getElementById(id), () => {
+		renderLines(reply || "", content, () => {
 			appendSourceAndSuggestions(div, source, suggestions);
 			box.scrollTop = box.scrollHeight;
 		});
 	}, 300);
 }
 
+// STREAMED BOT MESSAGE (Server-Sent Events)
+async function readBotStream(res) {
+	const box = document.getElementById("chat-box");
+	const {
+		div,
+		content
+	} = createBotMessage();
+
+	const reader = res.body.getReader();
+	const decoder = new TextDecoder();
+
+	let buffer = ""; // received SSE text not parsed yet
+	let pending = ""; // reply text after the last complete line
+	let reply = "";
+	let live = null; // row showing the incomplete last line
+	let meta = {};
+
+	function showLine(text) {
+		const row = renderLine(text);
+		live ? live.replaceWith(row) : content.appendChild(row);
+		return row;
+	}
+
+	function onChunk(text) {
+		reply += text;
+		pending += text;
+
+		const lines = pending.split("\n");
+		pending = lines.pop();
+
+		lines.forEach(line => {
+			showLine(line);
+			live = null;
+		});
+
+		if (pending) live = showLine(pending);
+		smartScroll(box);
+	}
+
+	while (true) {
+		const {
+			value,
+			done
+		} = await reader.read();
+		if (done) break;
+
+		buffer += decoder.decode(value, {
+			stream: true
+		});
+
+		let end;
+		while ((end = buffer.indexOf("\n\n")) !== -1) {
+			const event = parseSseEvent(buffer.slice(0, end));
+			buffer = buffer.slice(end + 2);
+
+			if (!event) continue;
+			if (event.type === "chunk") onChunk(event.data.text);
+			if (event.type === "done") meta = event.data;
+		}
+	}
+
+	if (!reply) content.appendChild(renderLine(""));
+
+	// Store clean data for PDF
+	chatTranscript.push({
+		role: "bot",
+		text: reply,
+		source: meta.source || null
+	});
+
+	appendSourceAndSuggestions(div, meta.source, meta.suggestions);
+	box.scrollTop = box.scrollHeight;
+}
+
+function parseSseEvent(block) {
+	let type = "message";
+	let data = "";
+
+	block.split("\n").forEach(line => {
+		if (line.startsWith("event:")) type = line.slice(6).trim();
+		if (line.startsWith("data:")) data += line.slice(5).trim();
+	});
+
+	if (!data) return null;
+
+	try {
+		return {
+			type,
+			data: JSON.parse(data)
+		};
+	} catch {
+		return null;
+	}
+}
+
 // COMPACT RENDERING
+function renderLine(text) {
+	const line = text.trim();
+	const row = document.createElement("div");
+	row.style.margin = "2px 0";
+
+	if (/^\d+\s*:/.test(line)) {
+		const [v, rest] = line.split(":");
+		row.innerHTML = `<strong>${escapeHtml(v)}:</strong> ${escapeHtml(rest.trim())}`;
+	} else {
+		row.innerHTML = DOMPurify.sanitize(
+			window.marked ?
+			marked.parseInline(line || " ") :
+			escapeHtml(line || " ")
+		);
+	}
+
+	return row;
+}
+
 function renderLines(text, container, done) {
 	const lines = text.split("\n");
 	let i = 0;
@@ -127,22 +262,7 @@ function renderLines(text, container, done) {
 			return;
 		}
 
-		const line = lines[i].trim();
-		const row = document.createElement("div");
-		row.style.margin = "2px 0";
-
-		if (/^\d+\s*:/.test(line)) {
-			const [v, rest] = line.split(":");
-			row.innerHTML = `<strong>${escapeHtml(v)}:</strong> ${escapeHtml(rest.trim())}`;
-		} else {
-			row.innerHTML = DOMPurify.sanitize(
-				window.marked ?
-				marked.parseInline(line || " ") :
-				escapeHtml(line || " ")
-			);
-		}
-
-		container.appendChild(row);
+		container.appendChild(renderLine(lines[i]));
 		smartScroll(box);
 
 		i++;
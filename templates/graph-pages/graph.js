@@ -1,17 +1,56 @@
-let graphJSON_list = {{ graphJSON_list | tojson | safe }};
+let figureUrls = {{ figure_urls | tojson }};
+let monthYear = {{ month_year | tojson }};
 let container = document.getElementById('charts-container');
 
-function renderCharts(graphJSON_list) {
+function loadChart(chartDiv) {
+	fetch(chartDiv.dataset.url + '?month-year=' + encodeURIComponent(monthYear))
+		.then(response => {
+			if (!response.ok) {
+				throw new Error('HTTP ' + response.status);
+			}
+			return response.json();
+		})
+		.then(graph => {
+			chartDiv.classList.remove('chart-placeholder');
+			Plotly.newPlot(chartDiv.id, graph.data, graph.layout, {
+				responsive: true
+			});
+		})
+		.catch(() => {
+			chartDiv.textContent = 'Failed to load graph.';
+		});
+}
+
+// Charts are fetched and drawn only when they come near the viewport
+function renderCharts(figureUrls) {
 	container.innerHTML = '';
-	graphJSON_list.forEach((graphJSON, index) => {
+	let observer = null;
+
+	if ('IntersectionObserver' in window) {
+		observer = new IntersectionObserver((entries) => {
+			entries.forEach(entry => {
+				if (entry.isIntersecting) {
+					observer.unobserve(entry.target);
+					loadChart(entry.target);
+				}
+			});
+		}, {
+			rootMargin: '200px 0px'
+		});
+	}
+
+	figureUrls.forEach((url, index) => {
 		let chartDiv = document.createElement('div');
 		chartDiv.id = 'chart' + (index + 1);
-		chartDiv.classList.add('chart');
+		chartDiv.dataset.url = url;
+		chartDiv.classList.add('chart', 'chart-placeholder');
 		container.appendChild(chartDiv);
-		let graph = JSON.parse(graphJSON);
-		Plotly.newPlot(chartDiv.id, graph.data, graph.layout, {
-			responsive: true
-		});
+
+		if (observer) {
+			observer.observe(chartDiv);
+		} else {
+			loadChart(chartDiv);
+		}
 	});
 }
 
@@ -37,4 +76,4 @@ document.getElementById('fetch-button').addEventListener('click', function(event
 	form.submit();
 });
 
-renderCharts(graphJSON_list);
\ No newline at end of file
+renderCharts(figureUrls);
\ No newline at end of file